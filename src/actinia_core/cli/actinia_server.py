@@ -5,7 +5,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -20,15 +20,15 @@ run behind the uwsgi application server.
 
 import argparse
 import os
-from actinia_core.endpoints import create_endpoints
-from actinia_core.core.common.app import flask_app
-from actinia_core.core.common.config import global_config, DEFAULT_CONFIG_PATH
-from actinia_core.core.common.kvdb_interface import connect
-from actinia_core.core.common.process_queue import create_process_queue
+import sys
+from actinia_core.core.startup_profile import (
+    format_startup_profile,
+    profile_startup,
+)
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -63,8 +63,39 @@ def main():
         help="Set True to activate debugging",
     )
 
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the import time of each module and the maximum resident "
+        "set size of the application startup and exit",
+    )
+
+    parser.add_argument(
+        "--profile-limit",
+        type=int,
+        required=False,
+        default=30,
+        help="The number of modules with the largest import time that are "
+        "printed with --profile-startup",
+    )
+
     args = parser.parse_args()
 
+    if args.profile_startup is True:
+        print(format_startup_profile(profile_startup(), args.profile_limit))
+        sys.exit(0)
+
+    # The application is imported after the arguments were parsed, so that
+    # the startup profile is not affected by the import of the server
+    from actinia_core.endpoints import create_endpoints
+    from actinia_core.core.common.app import flask_app
+    from actinia_core.core.common.config import (
+        global_config,
+        DEFAULT_CONFIG_PATH,
+    )
+    from actinia_core.core.common.kvdb_interface import connect
+    from actinia_core.core.common.process_queue import create_process_queue
+
     if os.path.exists(DEFAULT_CONFIG_PATH) is True and os.path.isfile(
         DEFAULT_CONFIG_PATH
     ):
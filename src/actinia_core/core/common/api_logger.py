@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2025 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -15,12 +15,18 @@ Actinia Core REST API call logging
 """
 
 from datetime import datetime
+import atexit
+import os
 import pickle
+import queue
 from functools import wraps
+from threading import Lock, Thread
 from flask import g, abort, request
 import platform
+from actinia_core.core.common.config import global_config
 from actinia_core.core.kvdb_api_log import kvdb_api_log_interface
 from actinia_core.core.kvdb_fluentd_logger_base import KvdbFluentLoggerBase
+from actinia_core.core.logging_interface import log
 
 try:
     from fluent import sender
@@ -33,7 +39,7 @@ except Exception:
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Carmen Tawalika, Anika Weinmann"
-__copyright__ = "Copyright 2016-2025, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -42,7 +48,9 @@ def log_api_call(f):
     """This decorator function logs API calls
 
     It stores the request information, user and host id in a
-    database list identified by the user name
+    database list identified by the user name. If LOG_API_CALL_ASYNC is
+    set, the entry is only created in the request thread and written by
+    the background thread of the api_log_writer.
 
     Args:
         f (func): The function to wrap
@@ -58,10 +66,14 @@ def log_api_call(f):
         if g.user is None:
             abort(401)
 
-        logger = ApiLogger()
         user_id = g.user.get_id()
 
-        logger.add_entry(user_id=user_id, http_request=request)
+        if global_config.LOG_API_CALL_ASYNC is True:
+            api_log_writer.put(
+                ApiLogger.create_entry(user_id=user_id, http_request=request)
+            )
+        else:
+            ApiLogger().add_entry(user_id=user_id, http_request=request)
 
         return f(*args, **kwargs)
 
@@ -75,27 +87,22 @@ class ApiLogger(KvdbFluentLoggerBase):
         KvdbFluentLoggerBase.__init__(
             self, config=config, user_id=user_id, fluent_sender=fluent_sender
         )
+        if config is None:
+            config = global_config
+        self.maxlen = int(config.LOG_API_CALL_MAXLEN)
+        self.counter_expiration = int(config.LOG_API_CALL_COUNTER_EXPIRE)
 
-    def add_entry(self, user_id, http_request):
-        """Add an API call entry to the database
+    @staticmethod
+    def create_entry(user_id, http_request):
+        """Create an API call entry from the http request
 
         Args:
             user_id (str): The user id of the API log
             http_request: The http request object
 
-
-            example = {
-                "endpoint": "asyncephemeralresource",
-                "method": "POST",
-                "path": "/projects/nc_spm_08/processing_async",
-                "request_url": "http://localhost/projects/nc_spm_08/"
-                "processing_async"
-              }
-
-
         Returns:
-            int:
-            The index of the new entry in the api log list
+            dict:
+            The API log entry
 
         """
         api_info = {
@@ -107,7 +114,7 @@ class ApiLogger(KvdbFluentLoggerBase):
             "request_url": http_request.url,
         }
 
-        entry = {
+        return {
             "time_stamp": datetime.now(),
             "node": platform.node(),
             "api_info": api_info,
@@ -117,15 +124,78 @@ class ApiLogger(KvdbFluentLoggerBase):
             "logger": "api_logger",
         }
 
+    def add_entry(self, user_id, http_request):
+        """Add an API call entry to the database
+
+        Args:
+            user_id (str): The user id of the API log
+            http_request: The http request object
+
+
+            example = {
+                "endpoint": "asyncephemeralresource",
+                "method": "POST",
+                "path": "/projects/nc_spm_08/processing_async",
+                "request_url": "http://localhost/projects/nc_spm_08/"
+                "processing_async"
+              }
+
+
+        Returns:
+            int:
+            The index of the new entry in the api log list
+
+        """
+        entry = self.create_entry(user_id=user_id, http_request=http_request)
+
         # Serialize the entry
         pentry = pickle.dumps(entry)
 
-        kvdb_return = bool(self.db.add(user_id, pentry))
+        kvdb_return = bool(
+            self.db.add(
+                user_id,
+                pentry,
+                endpoint=entry["api_info"]["endpoint"],
+                maxlen=self.maxlen,
+                counter_expiration=self.counter_expiration,
+            )
+        )
 
         entry["time_stamp"] = str(entry["time_stamp"])
         self.send_to_logger("API_LOG", entry)
         return kvdb_return
 
+    def add_entries(self, entries):
+        """Add several API call entries to the database with a single
+        pipelined request
+
+        Args:
+            entries (list): A list of API log entries created with
+                            create_entry()
+
+        Returns:
+            bool:
+            True for success, False otherwise
+
+        """
+        kvdb_return = self.db.add_many(
+            [
+                (
+                    entry["user_id"],
+                    pickle.dumps(entry),
+                    entry["api_info"]["endpoint"],
+                )
+                for entry in entries
+            ],
+            maxlen=self.maxlen,
+            counter_expiration=self.counter_expiration,
+        )
+
+        for entry in entries:
+            entry["time_stamp"] = str(entry["time_stamp"])
+            self.send_to_logger("API_LOG", entry)
+        return all(kvdb_return)
+
     def list(self, user_id, start, end):
         """
         Return a list of api log entries
@@ -159,6 +229,79 @@ class ApiLogger(KvdbFluentLoggerBase):
 
         return result_list
 
+    def list_page(
+        self, user_id, count, before=None, start_time=None, end_time=None
+    ):
+        """Return a page of api log entries, newest first
+
+        Each entry contains its stream id as "api_log_id", the next page
+        starts before the id of the last entry.
+
+        Args:
+            user_id (str): The user id of the API log
+            count (int): The maximum number of entries of the page
+            before (str): Only entries older than this api log id are
+                          returned
+            start_time (float): Only entries newer than this POSIX time
+                                stamp are returned
+            end_time (float): Only entries older than this POSIX time stamp
+                              are returned
+
+        Returns:
+            (list, str):
+            A list of log entries and the api log id for the next page or
+            None if this is the last page
+
+        """
+        max_id = "+"
+        min_id = "-"
+        if before is not None:
+            max_id = "(%s" % before
+        elif end_time is not None:
+            max_id = self.db.time_to_stream_id(end_time)
+        if start_time is not None:
+            min_id = self.db.time_to_stream_id(start_time)
+
+        result_list = []
+        for stream_id, pentry in self.db.range(
+            user_id, max_id=max_id, min_id=min_id, count=count
+        ):
+            entry = pickle.loads(pentry)
+            entry["api_log_id"] = stream_id
+            result_list.append(entry)
+
+        next_id = None
+        if len(result_list) == count:
+            next_id = result_list[-1]["api_log_id"]
+        return result_list, next_id
+
+    def count(self, user_id, day=None):
+        """Return the number of api calls per endpoint of a user and day
+
+        Args:
+            user_id (str): The user id of the API log
+            day (str): The day as YYYY-MM-DD, today (UTC) if None
+
+        Returns:
+            dict:
+            The number of api calls per endpoint
+
+        """
+        return self.db.count(user_id, day)
+
+    def count_endpoints(self, day=None):
+        """Return the number of api calls per endpoint of all users and a day
+
+        Args:
+            day (str): The day as YYYY-MM-DD, today (UTC) if None
+
+        Returns:
+            dict:
+            The number of api calls per endpoint
+
+        """
+        return self.db.count_endpoints(day)
+
     def trim(self, user_id, start, end):
         """Remove all api log entries that are outside the specified indices
 
@@ -200,3 +343,141 @@ class ApiLogger(KvdbFluentLoggerBase):
         """
 
         return self.db.size(user_id)
+
+
+class ApiLogWriter(object):
+    """Write API log entries asynchronously
+
+    The entries are put into a bounded in-process queue that is drained by
+    a background thread. The thread writes the entries in batches with
+    pipelined kvdb requests and sends them to fluentd, so that the request
+    latency does not depend on the kvdb or fluentd latency.
+
+    If the queue is full the entry is dropped and counted (policy "drop")
+    or the request waits until the queue has space (policy "block").
+    """
+
+    def __init__(self, config=None):
+        if config is None:
+            config = global_config
+        self.config = config
+        self.queue = None
+        self.thread = None
+        self.pid = None
+        self.dropped = 0
+        self.lock = Lock()
+
+    def _start(self):
+        """Create the queue and start the background thread
+
+        The thread is (re)started lazily, so that forked worker processes
+        get their own queue and thread.
+        """
+        with self.lock:
+            if self.pid == os.getpid() and self.thread.is_alive():
+                return
+            self.queue = queue.Queue(
+                maxsize=max(int(self.config.LOG_API_CALL_QUEUE_SIZE), 1)
+            )
+            self.pid = os.getpid()
+            self.dropped = 0
+            self.thread = Thread(
+                target=self._run,
+                args=(self.queue,),
+                name="api_log_writer",
+                daemon=True,
+            )
+            self.thread.start()
+
+    def put(self, entry):
+        """Put an API log entry into the queue of the background thread
+
+        Args:
+            entry (dict): The API log entry created with
+                          ApiLogger.create_entry()
+
+        Returns:
+            bool:
+            True if the entry was queued, False if it was dropped
+
+        """
+        if self.pid != os.getpid() or not self.thread.is_alive():
+            self._start()
+
+        if self.config.LOG_API_CALL_QUEUE_POLICY == "block":
+            self.queue.put(entry)
+            return True
+
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                log.warning(
+                    "API log queue is full, %i API log entries were "
+                    "dropped" % dropped
+                )
+            return False
+        return True
+
+    def get_dropped(self):
+        """Return the number of dropped API log entries of this process
+
+        Returns:
+            int:
+            The number of dropped entries
+
+        """
+        return self.dropped
+
+    def _run(self, entry_queue):
+        """Drain the queue and write the entries in batches
+
+        Args:
+            entry_queue: The queue to drain, a None entry stops the thread
+
+        """
+        logger = ApiLogger(config=self.config)
+        batch_size = max(int(self.config.LOG_API_CALL_BATCH_SIZE), 1)
+        stop = False
+        while stop is False:
+            entries = [entry_queue.get()]
+            while len(entries) < batch_size:
+                try:
+                    entries.append(entry_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in entries:
+                stop = True
+                entries = [entry for entry in entries if entry is not None]
+            if entries:
+                try:
+                    logger.add_entries(entries)
+                except Exception as e:
+                    log.error(
+                        "Unable to write %i API log entries: %s"
+                        % (len(entries), str(e))
+                    )
+
+    def stop(self, timeout=5):
+        """Write all queued entries and stop the background thread
+
+        Args:
+            timeout (int): The number of seconds to wait for the thread
+
+        """
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        if self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            self.thread.join(timeout)
+
+
+# The API log writer instance of this process
+api_log_writer = ApiLogWriter()
+atexit.register(api_log_writer.stop)
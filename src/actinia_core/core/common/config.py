@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -22,7 +22,7 @@ from json import load as json_load
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -269,6 +269,16 @@ class Configuration(object):
         self.GRASS_MODULES_XML_PATH = os.path.join(
             self.GRASS_GIS_BASE, "gui", "wxpython", "xml", "module_items.xml"
         )
+        # The directory of the module interface catalogs of the GRASS builds
+        self.GRASS_MODULE_CATALOG_DIR = "%s/actinia/module_catalog" % home
+        # The file that caches the GRASS GIS version, shared by all
+        # processes of a node
+        self.GRASS_VERSION_CACHE_FILE = (
+            "%s/actinia/grass_version_cache.json" % home
+        )
+        # If True, Python based GRASS modules of a job are run in a
+        # long-lived Python session that imports the GRASS libraries once
+        self.GRASS_PYTHON_SESSION = False
         # The path to the activation script of the python2 venv (old)
         self.GRASS_VENV = (
             "%s/src/actinia/grass_venv/bin/activate_this.py" % home
@@ -287,6 +297,17 @@ class Configuration(object):
         self.PROCESS_TIME_LIMT = 600
         # Maximum number of processes in a process chain
         self.PROCESS_NUM_LIMIT = 1000
+        # Maximum number of independent steps of a process chain that run
+        # concurrently, limited by the available cores. 1 runs all steps
+        # sequentially
+        self.PROCESS_CHAIN_PARALLEL_STEPS = 1
+        # The number of bytes of stdout and stderr of a process chain step
+        # that are kept in memory, larger outputs are spilled to a temporary
+        # file
+        self.STDOUT_MEMORY_LIMIT = 1048576
+        # If True, process chain steps whose stdout is only the stdin of
+        # the next step run concurrently connected by an OS pipe
+        self.PROCESS_CHAIN_STREAMING = False
         # The number of queues that process jobs
         self.NUMBER_OF_WORKERS = 3
 
@@ -297,8 +318,31 @@ class Configuration(object):
         self.CHECK_CREDENTIALS = True
         # CHECK_LIMITS: If set False all limit checks are disabled
         self.CHECK_LIMITS = True
+        # PROCESS_VALIDATION_IN_PROCESS: If set True process chains are
+        # validated by the API process, only validations that require the
+        # GRASS database of the workers are enqueued as job
+        self.PROCESS_VALIDATION_IN_PROCESS = True
         # LOG_API_CALL: If set False the API calls are not logged
         self.LOG_API_CALL = True
+        # LOG_API_CALL_ASYNC: If set True the API calls are written to the
+        # kvdb and fluentd by a background thread and not by the request
+        self.LOG_API_CALL_ASYNC = True
+        # LOG_API_CALL_QUEUE_SIZE: Maximum number of API log entries that
+        # wait in the in-process queue of the background thread
+        self.LOG_API_CALL_QUEUE_SIZE = 10000
+        # LOG_API_CALL_QUEUE_POLICY: What to do if the queue is full:
+        # "drop" the entry (and count it) or "block" the request until the
+        # queue has space
+        self.LOG_API_CALL_QUEUE_POLICY = "drop"
+        # LOG_API_CALL_BATCH_SIZE: Maximum number of API log entries that are
+        # written in a single pipelined kvdb request
+        self.LOG_API_CALL_BATCH_SIZE = 100
+        # LOG_API_CALL_MAXLEN: Approximate maximum number of API log entries
+        # that are kept for each user
+        self.LOG_API_CALL_MAXLEN = 10000
+        # LOG_API_CALL_COUNTER_EXPIRE: Expiration time in seconds of the
+        # daily API call counters, default 400 days
+        self.LOG_API_CALL_COUNTER_EXPIRE = 34560000
         # LOGIN_REQUIRED: If set False, login is not required
         self.LOGIN_REQUIRED = True
         # FORCE_HTTPS_URLS: Force the use of https in response urls that
@@ -310,6 +354,19 @@ class Configuration(object):
         self.ENDPOINTS_CONFIG = None
         # AUTHENTICATION: If set False no authentication is needed
         self.AUTHENTICATION = True
+        # USER_CACHE_TTL: Number of seconds the credentials of a user are
+        # cached in each process, modifications of users invalidate the
+        # cache via kvdb pub/sub. Set 0 to disable the cache.
+        self.USER_CACHE_TTL = 30
+        # BASIC_AUTH_CACHE: If set True successful password verifications
+        # are cached in each process to avoid the slow password hashing on
+        # every request with basic authentication
+        self.BASIC_AUTH_CACHE = False
+        # BASIC_AUTH_CACHE_TTL: Number of seconds a password verification is
+        # cached
+        self.BASIC_AUTH_CACHE_TTL = 60
+        # BASIC_AUTH_CACHE_SIZE: Maximum number of cached verifications
+        self.BASIC_AUTH_CACHE_SIZE = 1024
 
         """
         KEYCLOAK: has only to be set if keycloak server is configured with
@@ -328,6 +385,11 @@ class Configuration(object):
         self.KEYCLOAK_CLIENT_ID = None
         self.KEYCLOAK_REALM = None
         self.KEYCLOAK_CLIENT_SECRET_KEY = None
+        # Number of seconds after which the signing keys of the keycloak
+        # realm are refreshed in the background
+        self.KEYCLOAK_KEYS_REFRESH_INTERVAL = 3600
+        # Maximum number of verified tokens that are cached until they expire
+        self.KEYCLOAK_TOKEN_CACHE_SIZE = 1024
 
         """
         KVDB
@@ -341,6 +403,12 @@ class Configuration(object):
         # Default expire time is 10 days for resource logs, that are used for
         # calculating the price of resource usage
         self.KVDB_RESOURCE_EXPIRE_TIME = 864000
+        # Account the resource usage per user and day when a resource reaches
+        # a terminal state
+        self.KVDB_ACCOUNTING = True
+        # Expiration time in seconds of the daily resource usage aggregates,
+        # default is 400 days
+        self.KVDB_ACCOUNTING_EXPIRE_TIME = 34560000
         # The hostname of the kvdb work queue server
         self.KVDB_QUEUE_SERVER_URL = "127.0.0.1"
         # The port of the kvdb work queue server
@@ -411,6 +479,12 @@ class Configuration(object):
         self.DOWNLOAD_CACHE = "/tmp/download_cache"
         # The quota of the download cache in Gigabit
         self.DOWNLOAD_CACHE_QUOTA = 100
+        # The number of files that are downloaded concurrently for the
+        # imports of a process chain
+        self.DOWNLOAD_PARALLEL = 4
+        # The number of attempts to download a file, interrupted downloads
+        # are resumed
+        self.DOWNLOAD_RETRIES = 5
         # If True the interim results (temporary mapset) are saved
         self.SAVE_INTERIM_RESULTS = False
         self.SAVE_INTERIM_RESULTS_ENDPOINTS_CFG = None
@@ -420,6 +494,23 @@ class Configuration(object):
             "AsyncPersistentResource".lower(): "AsyncPersistentResource",
         }
         self.INCLUDE_ADDITIONAL_MAPSET_PATTERN = None
+        # If True the snapshots of the interim results are completed in a
+        # background thread while the next step of the process chain runs
+        self.SAVE_INTERIM_RESULTS_IN_BACKGROUND = True
+        # The number of the last steps of a process chain whose interim
+        # results are kept
+        self.INTERIM_RESULTS_KEEP_STEPS = 1
+        # The size quota of the interim results of each user in Gibibyte,
+        # 0 for no quota
+        self.INTERIM_RESULTS_QUOTA = 0
+        # The number of seconds after which interim results that were not
+        # updated are removed, 0 for no age limit
+        self.INTERIM_RESULTS_MAX_AGE = 0
+        # The interval in seconds in which the janitor applies the quota and
+        # the age limit to the interim results, 0 disables the janitor. Only
+        # one janitor process per GRASS_RESOURCE_DIR is active, interim
+        # results of running jobs are never removed.
+        self.INTERIM_RESULTS_JANITOR_INTERVAL = 600
 
         """
         LOGGING
@@ -535,22 +626,73 @@ class Configuration(object):
         config.set(
             "GRASS", "GRASS_MODULES_XML_PATH", self.GRASS_MODULES_XML_PATH
         )
+        config.set(
+            "GRASS", "GRASS_MODULE_CATALOG_DIR", self.GRASS_MODULE_CATALOG_DIR
+        )
+        config.set(
+            "GRASS", "GRASS_VERSION_CACHE_FILE", self.GRASS_VERSION_CACHE_FILE
+        )
+        config.set(
+            "GRASS", "GRASS_PYTHON_SESSION", str(self.GRASS_PYTHON_SESSION)
+        )
         config.set("GRASS", "GRASS_VENV", self.GRASS_VENV)
 
         config.add_section("LIMITS")
         config.set("LIMITS", "MAX_CELL_LIMIT", str(self.MAX_CELL_LIMIT))
         config.set("LIMITS", "PROCESS_TIME_LIMT", str(self.PROCESS_TIME_LIMT))
         config.set("LIMITS", "PROCESS_NUM_LIMIT", str(self.PROCESS_NUM_LIMIT))
+        config.set(
+            "LIMITS",
+            "PROCESS_CHAIN_PARALLEL_STEPS",
+            str(self.PROCESS_CHAIN_PARALLEL_STEPS),
+        )
+        config.set(
+            "LIMITS", "STDOUT_MEMORY_LIMIT", str(self.STDOUT_MEMORY_LIMIT)
+        )
+        config.set(
+            "LIMITS",
+            "PROCESS_CHAIN_STREAMING",
+            str(self.PROCESS_CHAIN_STREAMING),
+        )
 
         config.add_section("API")
         config.set("API", "CHECK_CREDENTIALS", str(self.CHECK_CREDENTIALS))
         config.set("API", "CHECK_LIMITS", str(self.CHECK_LIMITS))
+        config.set(
+            "API",
+            "PROCESS_VALIDATION_IN_PROCESS",
+            str(self.PROCESS_VALIDATION_IN_PROCESS),
+        )
         config.set("API", "LOG_API_CALL", str(self.LOG_API_CALL))
+        config.set("API", "LOG_API_CALL_ASYNC", str(self.LOG_API_CALL_ASYNC))
+        config.set(
+            "API", "LOG_API_CALL_QUEUE_SIZE", str(self.LOG_API_CALL_QUEUE_SIZE)
+        )
+        config.set(
+            "API", "LOG_API_CALL_QUEUE_POLICY", self.LOG_API_CALL_QUEUE_POLICY
+        )
+        config.set(
+            "API", "LOG_API_CALL_BATCH_SIZE", str(self.LOG_API_CALL_BATCH_SIZE)
+        )
+        config.set("API", "LOG_API_CALL_MAXLEN", str(self.LOG_API_CALL_MAXLEN))
+        config.set(
+            "API",
+            "LOG_API_CALL_COUNTER_EXPIRE",
+            str(self.LOG_API_CALL_COUNTER_EXPIRE),
+        )
         config.set("API", "LOGIN_REQUIRED", str(self.LOGIN_REQUIRED))
         config.set("API", "FORCE_HTTPS_URLS", str(self.FORCE_HTTPS_URLS))
         config.set("API", "PLUGINS", str(self.PLUGINS))
         config.set("API", "ENDPOINTS_CONFIG", str(self.ENDPOINTS_CONFIG))
         config.set("API", "AUTHENTICATION", str(self.AUTHENTICATION))
+        config.set("API", "USER_CACHE_TTL", str(self.USER_CACHE_TTL))
+        config.set("API", "BASIC_AUTH_CACHE", str(self.BASIC_AUTH_CACHE))
+        config.set(
+            "API", "BASIC_AUTH_CACHE_TTL", str(self.BASIC_AUTH_CACHE_TTL)
+        )
+        config.set(
+            "API", "BASIC_AUTH_CACHE_SIZE", str(self.BASIC_AUTH_CACHE_SIZE)
+        )
 
         config.add_section("KEYCLOAK")
         config.set(
@@ -588,6 +730,16 @@ class Configuration(object):
             "KEYCLOAK_CLIENT_SECRET_KEY",
             str(self.KEYCLOAK_CLIENT_SECRET_KEY),
         )
+        config.set(
+            "KEYCLOAK",
+            "KEYS_REFRESH_INTERVAL",
+            str(self.KEYCLOAK_KEYS_REFRESH_INTERVAL),
+        )
+        config.set(
+            "KEYCLOAK",
+            "TOKEN_CACHE_SIZE",
+            str(self.KEYCLOAK_TOKEN_CACHE_SIZE),
+        )
 
         config.add_section("KVDB")
         config.set("KVDB", "KVDB_SERVER_URL", self.KVDB_SERVER_URL)
@@ -598,6 +750,12 @@ class Configuration(object):
             "KVDB_RESOURCE_EXPIRE_TIME",
             str(self.KVDB_RESOURCE_EXPIRE_TIME),
         )
+        config.set("KVDB", "KVDB_ACCOUNTING", str(self.KVDB_ACCOUNTING))
+        config.set(
+            "KVDB",
+            "KVDB_ACCOUNTING_EXPIRE_TIME",
+            str(self.KVDB_ACCOUNTING_EXPIRE_TIME),
+        )
         config.set("KVDB", "WORKER_LOGFILE", str(self.WORKER_LOGFILE))
 
         config.add_section("QUEUE")
@@ -627,6 +785,8 @@ class Configuration(object):
         config.set(
             "MISC", "DOWNLOAD_CACHE_QUOTA", str(self.DOWNLOAD_CACHE_QUOTA)
         )
+        config.set("MISC", "DOWNLOAD_PARALLEL", str(self.DOWNLOAD_PARALLEL))
+        config.set("MISC", "DOWNLOAD_RETRIES", str(self.DOWNLOAD_RETRIES))
         config.set("MISC", "TMP_WORKDIR", self.TMP_WORKDIR)
         config.set("MISC", "SECRET_KEY", self.SECRET_KEY)
         config.set(
@@ -648,6 +808,29 @@ class Configuration(object):
             "INCLUDE_ADDITIONAL_MAPSET_PATTERN",
             str(self.INCLUDE_ADDITIONAL_MAPSET_PATTERN),
         )
+        config.set(
+            "MISC",
+            "SAVE_INTERIM_RESULTS_IN_BACKGROUND",
+            str(self.SAVE_INTERIM_RESULTS_IN_BACKGROUND),
+        )
+        config.set(
+            "MISC",
+            "INTERIM_RESULTS_KEEP_STEPS",
+            str(self.INTERIM_RESULTS_KEEP_STEPS),
+        )
+        config.set(
+            "MISC", "INTERIM_RESULTS_QUOTA", str(self.INTERIM_RESULTS_QUOTA)
+        )
+        config.set(
+            "MISC",
+            "INTERIM_RESULTS_MAX_AGE",
+            str(self.INTERIM_RESULTS_MAX_AGE),
+        )
+        config.set(
+            "MISC",
+            "INTERIM_RESULTS_JANITOR_INTERVAL",
+            str(self.INTERIM_RESULTS_JANITOR_INTERVAL),
+        )
 
         config.add_section("LOGGING")
         config.set("LOGGING", "LOG_INTERFACE", self.LOG_INTERFACE)
@@ -748,6 +931,18 @@ class Configuration(object):
                     self.GRASS_MODULES_XML_PATH = config.get(
                         "GRASS", "GRASS_MODULES_XML_PATH"
                     )
+                if config.has_option("GRASS", "GRASS_MODULE_CATALOG_DIR"):
+                    self.GRASS_MODULE_CATALOG_DIR = config.get(
+                        "GRASS", "GRASS_MODULE_CATALOG_DIR"
+                    )
+                if config.has_option("GRASS", "GRASS_VERSION_CACHE_FILE"):
+                    self.GRASS_VERSION_CACHE_FILE = config.get(
+                        "GRASS", "GRASS_VERSION_CACHE_FILE"
+                    )
+                if config.has_option("GRASS", "GRASS_PYTHON_SESSION"):
+                    self.GRASS_PYTHON_SESSION = config.getboolean(
+                        "GRASS", "GRASS_PYTHON_SESSION"
+                    )
                 if config.has_option("GRASS", "GRASS_VENV"):
                     self.GRASS_VENV = config.get("GRASS", "GRASS_VENV")
                 if config.has_option(
@@ -774,6 +969,18 @@ class Configuration(object):
                     self.PROCESS_NUM_LIMIT = config.getint(
                         "LIMITS", "PROCESS_NUM_LIMIT"
                     )
+                if config.has_option("LIMITS", "PROCESS_CHAIN_PARALLEL_STEPS"):
+                    self.PROCESS_CHAIN_PARALLEL_STEPS = config.getint(
+                        "LIMITS", "PROCESS_CHAIN_PARALLEL_STEPS"
+                    )
+                if config.has_option("LIMITS", "STDOUT_MEMORY_LIMIT"):
+                    self.STDOUT_MEMORY_LIMIT = config.getint(
+                        "LIMITS", "STDOUT_MEMORY_LIMIT"
+                    )
+                if config.has_option("LIMITS", "PROCESS_CHAIN_STREAMING"):
+                    self.PROCESS_CHAIN_STREAMING = config.getboolean(
+                        "LIMITS", "PROCESS_CHAIN_STREAMING"
+                    )
 
             if config.has_section("API"):
                 if config.has_option("API", "CHECK_CREDENTIALS"):
@@ -784,10 +991,38 @@ class Configuration(object):
                     self.CHECK_LIMITS = config.getboolean(
                         "API", "CHECK_LIMITS"
                     )
+                if config.has_option("API", "PROCESS_VALIDATION_IN_PROCESS"):
+                    self.PROCESS_VALIDATION_IN_PROCESS = config.getboolean(
+                        "API", "PROCESS_VALIDATION_IN_PROCESS"
+                    )
                 if config.has_option("API", "LOG_API_CALL"):
                     self.LOG_API_CALL = config.getboolean(
                         "API", "LOG_API_CALL"
                     )
+                if config.has_option("API", "LOG_API_CALL_ASYNC"):
+                    self.LOG_API_CALL_ASYNC = config.getboolean(
+                        "API", "LOG_API_CALL_ASYNC"
+                    )
+                if config.has_option("API", "LOG_API_CALL_QUEUE_SIZE"):
+                    self.LOG_API_CALL_QUEUE_SIZE = config.getint(
+                        "API", "LOG_API_CALL_QUEUE_SIZE"
+                    )
+                if config.has_option("API", "LOG_API_CALL_QUEUE_POLICY"):
+                    self.LOG_API_CALL_QUEUE_POLICY = config.get(
+                        "API", "LOG_API_CALL_QUEUE_POLICY"
+                    )
+                if config.has_option("API", "LOG_API_CALL_BATCH_SIZE"):
+                    self.LOG_API_CALL_BATCH_SIZE = config.getint(
+                        "API", "LOG_API_CALL_BATCH_SIZE"
+                    )
+                if config.has_option("API", "LOG_API_CALL_MAXLEN"):
+                    self.LOG_API_CALL_MAXLEN = config.getint(
+                        "API", "LOG_API_CALL_MAXLEN"
+                    )
+                if config.has_option("API", "LOG_API_CALL_COUNTER_EXPIRE"):
+                    self.LOG_API_CALL_COUNTER_EXPIRE = config.getint(
+                        "API", "LOG_API_CALL_COUNTER_EXPIRE"
+                    )
                 if config.has_option("API", "LOGIN_REQUIRED"):
                     self.LOGIN_REQUIRED = config.getboolean(
                         "API", "LOGIN_REQUIRED"
@@ -808,6 +1043,22 @@ class Configuration(object):
                     self.AUTHENTICATION = config.getboolean(
                         "API", "AUTHENTICATION"
                     )
+                if config.has_option("API", "USER_CACHE_TTL"):
+                    self.USER_CACHE_TTL = config.getint(
+                        "API", "USER_CACHE_TTL"
+                    )
+                if config.has_option("API", "BASIC_AUTH_CACHE"):
+                    self.BASIC_AUTH_CACHE = config.getboolean(
+                        "API", "BASIC_AUTH_CACHE"
+                    )
+                if config.has_option("API", "BASIC_AUTH_CACHE_TTL"):
+                    self.BASIC_AUTH_CACHE_TTL = config.getint(
+                        "API", "BASIC_AUTH_CACHE_TTL"
+                    )
+                if config.has_option("API", "BASIC_AUTH_CACHE_SIZE"):
+                    self.BASIC_AUTH_CACHE_SIZE = config.getint(
+                        "API", "BASIC_AUTH_CACHE_SIZE"
+                    )
 
             if config.has_section("KEYCLOAK"):
                 if config.has_option("KEYCLOAK", "CONFIG_PATH"):
@@ -829,6 +1080,14 @@ class Configuration(object):
                     self.KEYCLOAK_ATTR_PREFIX = config.get(
                         "KEYCLOAK", "ATTR_PREFIX"
                     )
+                if config.has_option("KEYCLOAK", "KEYS_REFRESH_INTERVAL"):
+                    self.KEYCLOAK_KEYS_REFRESH_INTERVAL = config.getint(
+                        "KEYCLOAK", "KEYS_REFRESH_INTERVAL"
+                    )
+                if config.has_option("KEYCLOAK", "TOKEN_CACHE_SIZE"):
+                    self.KEYCLOAK_TOKEN_CACHE_SIZE = config.getint(
+                        "KEYCLOAK", "TOKEN_CACHE_SIZE"
+                    )
 
             # REDIS - deprecated in future
             if config.has_section("REDIS") and not config.has_section("KVDB"):
@@ -866,6 +1125,14 @@ class Configuration(object):
                     self.KVDB_RESOURCE_EXPIRE_TIME = config.getint(
                         "KVDB", "KVDB_RESOURCE_EXPIRE_TIME"
                     )
+                if config.has_option("KVDB", "KVDB_ACCOUNTING"):
+                    self.KVDB_ACCOUNTING = config.getboolean(
+                        "KVDB", "KVDB_ACCOUNTING"
+                    )
+                if config.has_option("KVDB", "KVDB_ACCOUNTING_EXPIRE_TIME"):
+                    self.KVDB_ACCOUNTING_EXPIRE_TIME = config.getint(
+                        "KVDB", "KVDB_ACCOUNTING_EXPIRE_TIME"
+                    )
                 if config.has_option("KVDB", "WORKER_LOGFILE"):
                     self.WORKER_LOGFILE = config.get("KVDB", "WORKER_LOGFILE")
 
@@ -935,6 +1202,14 @@ class Configuration(object):
                     self.DOWNLOAD_CACHE_QUOTA = config.getint(
                         "MISC", "DOWNLOAD_CACHE_QUOTA"
                     )
+                if config.has_option("MISC", "DOWNLOAD_PARALLEL"):
+                    self.DOWNLOAD_PARALLEL = config.getint(
+                        "MISC", "DOWNLOAD_PARALLEL"
+                    )
+                if config.has_option("MISC", "DOWNLOAD_RETRIES"):
+                    self.DOWNLOAD_RETRIES = config.getint(
+                        "MISC", "DOWNLOAD_RETRIES"
+                    )
                 if config.has_option("MISC", "TMP_WORKDIR"):
                     self.TMP_WORKDIR = config.get("MISC", "TMP_WORKDIR")
                 if config.has_option("MISC", "SECRET_KEY"):
@@ -973,6 +1248,32 @@ class Configuration(object):
                     self.INCLUDE_ADDITIONAL_MAPSET_PATTERN = config.get(
                         "MISC", "INCLUDE_ADDITIONAL_MAPSET_PATTERN"
                     )
+                if config.has_option(
+                    "MISC", "SAVE_INTERIM_RESULTS_IN_BACKGROUND"
+                ):
+                    self.SAVE_INTERIM_RESULTS_IN_BACKGROUND = (
+                        config.getboolean(
+                            "MISC", "SAVE_INTERIM_RESULTS_IN_BACKGROUND"
+                        )
+                    )
+                if config.has_option("MISC", "INTERIM_RESULTS_KEEP_STEPS"):
+                    self.INTERIM_RESULTS_KEEP_STEPS = config.getint(
+                        "MISC", "INTERIM_RESULTS_KEEP_STEPS"
+                    )
+                if config.has_option("MISC", "INTERIM_RESULTS_QUOTA"):
+                    self.INTERIM_RESULTS_QUOTA = config.getint(
+                        "MISC", "INTERIM_RESULTS_QUOTA"
+                    )
+                if config.has_option("MISC", "INTERIM_RESULTS_MAX_AGE"):
+                    self.INTERIM_RESULTS_MAX_AGE = config.getint(
+                        "MISC", "INTERIM_RESULTS_MAX_AGE"
+                    )
+                if config.has_option(
+                    "MISC", "INTERIM_RESULTS_JANITOR_INTERVAL"
+                ):
+                    self.INTERIM_RESULTS_JANITOR_INTERVAL = config.getint(
+                        "MISC", "INTERIM_RESULTS_JANITOR_INTERVAL"
+                    )
 
             if config.has_section("LOGGING"):
                 if config.has_option("LOGGING", "LOG_INTERFACE"):
@@ -15,8 +15,6 @@ Storage base class
 """
 
 import os
-from google.cloud import bigquery
-from google.cloud import storage
 import xml.etree.ElementTree as eTree
 from .exceptions import GoogleCloudAPIError
 import dateutil.parser as dtparser
@@ -271,6 +269,10 @@ class GoogleSatelliteBigQueryInterface(object):
         }
 
     def _start_clients(self):
+        # google.cloud is imported on first use, it is slow to import
+        from google.cloud import bigquery
+        from google.cloud import storage
+
         self.bigquery_client = bigquery.Client()
         self.storage_client = storage.Client()
 
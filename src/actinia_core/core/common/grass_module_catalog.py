@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Indexed catalog of the GRASS module interfaces
+
+The interface descriptions of all GRASS modules and addons are parsed once
+and stored as JSON file, keyed by the GRASS build. Module descriptions of
+process chains are validated against the catalog without running modules.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from threading import Lock, Thread
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.grass_init import GrassModuleRunner
+from actinia_core.core.logging_interface import log
+from .config import global_config
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The file names of GRASS modules, e.g. r.univar or t.rast.algebra
+MODULE_NAME_PATTERN = re.compile(r"^[a-z0-9]{1,3}\.[a-z0-9_.]+$")
+
+# The version of the catalog file format
+CATALOG_FORMAT = 1
+
+# The number of seconds after which the build key is computed again, hence
+# installed addons are detected
+BUILD_KEY_CHECK_INTERVAL = 60
+
+# Runs --interface-description of all modules given as arguments in a GRASS
+# session and writes the descriptions as JSON to the file of the first
+# argument
+_DESCRIBE_SCRIPT = """
+import json, subprocess, sys
+from concurrent.futures import ThreadPoolExecutor
+
+def describe(name):
+    p = subprocess.run([name, "--interface-description"], capture_output=True)
+    if p.returncode != 0:
+        return name, None
+    return name, p.stdout.decode("utf-8", "replace")
+
+with ThreadPoolExecutor(8) as pool:
+    result = dict(pool.map(describe, sys.argv[2:]))
+with open(sys.argv[1], "w") as f:
+    json.dump(result, f)
+"""
+
+
+def parse_interface_description(xml_text):
+    """Parse the --interface-description output of a GRASS module
+
+    Args:
+        xml_text (str): The XML interface description
+
+    Returns:
+        dict:
+        The catalog entry with name, description, keywords, parameters,
+        flags and the nprocs and memory support
+    """
+    task = ET.fromstring(xml_text)
+
+    def text(element, tag):
+        child = element.find(tag)
+        if child is None or child.text is None:
+            return ""
+        return child.text.strip()
+
+    parameters = {}
+    for param in task.iter("parameter"):
+        entry = {
+            "type": param.get("type", "string"),
+            "required": param.get("required") == "yes",
+            "multiple": param.get("multiple") == "yes",
+            "description": text(param, "description"),
+        }
+        key_desc = [item.text for item in param.iter("item") if item.text]
+        if key_desc:
+            entry["key_desc"] = key_desc
+        if param.find("default") is not None:
+            entry["default"] = text(param, "default")
+        values = [
+            value.text.strip()
+            for value in param.findall("values/value/name")
+            if value.text
+        ]
+        if values:
+            entry["values"] = values
+        gisprompt = param.find("gisprompt")
+        if gisprompt is not None:
+            entry["gisprompt"] = dict(gisprompt.attrib)
+        parameters[param.get("name")] = entry
+
+    flags = {}
+    for flag in task.iter("flag"):
+        flags[flag.get("name")] = {
+            "description": text(flag, "description"),
+            "suppress_required": flag.find("suppress_required") is not None,
+        }
+
+    return {
+        "name": task.get("name"),
+        "description": text(task, "description"),
+        "keywords": [
+            keyword.strip()
+            for keyword in text(task, "keywords").split(",")
+            if keyword.strip()
+        ],
+        "parameters": parameters,
+        "flags": flags,
+        "nprocs": "nprocs" in parameters,
+        "memory": "memory" in parameters,
+    }
+
+
+class GrassModuleCatalog(object):
+    """The catalog of the GRASS modules of a GRASS build
+
+    The catalog is loaded lazily from the catalog file of the current GRASS
+    build. Lookups are dictionary lookups, modules that are not in the
+    catalog are not validated.
+    """
+
+    def __init__(self, config=None):
+        """
+        Args:
+            config: The actinia configuration, the global configuration if
+                    None
+        """
+        self.config = config if config is not None else global_config
+        self._modules = None
+        self._build_key = None
+        self._build_key_time = 0
+        self._lock = Lock()
+        self._build_thread = None
+        self._listing = (None, [])
+
+    def get_module_dirs(self):
+        """Return the directories that contain GRASS modules and addons"""
+        dirs = []
+        for base in (self.config.GRASS_GIS_BASE, self.config.GRASS_ADDON_PATH):
+            for name in ("bin", "scripts"):
+                path = os.path.join(base, name)
+                if os.path.isdir(path):
+                    dirs.append(path)
+        return dirs
+
+    @property
+    def build_key(self):
+        """The key of the GRASS build: the GRASS installation, its version
+        and the modification times of the module and addon directories
+        """
+        return self._update_build_key()
+
+    def _update_build_key(self):
+        """Compute the build key again after BUILD_KEY_CHECK_INTERVAL, the
+        catalog is reloaded if the key changed or no catalog was loaded
+        """
+        now = time.monotonic()
+        if (
+            self._build_key is None
+            or now - self._build_key_time > BUILD_KEY_CHECK_INTERVAL
+        ):
+            build_key = self._compute_build_key()
+            if build_key != self._build_key or not self._modules:
+                self._modules = None
+            self._build_key = build_key
+            self._build_key_time = now
+        return self._build_key
+
+    def _compute_build_key(self):
+        digest = hashlib.sha256()
+        gisbase = os.path.realpath(self.config.GRASS_GIS_BASE)
+        digest.update(gisbase.encode())
+        try:
+            with open(
+                os.path.join(gisbase, "etc", "VERSIONNUMBER"), "rb"
+            ) as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+        for path in self.get_module_dirs():
+            digest.update(path.encode())
+            digest.update(str(os.stat(path).st_mtime_ns).encode())
+        return digest.hexdigest()[:24]
+
+    @property
+    def path(self):
+        """The path of the catalog file of the current GRASS build"""
+        return os.path.join(
+            self.config.GRASS_MODULE_CATALOG_DIR,
+            "module_catalog_%s.json" % self.build_key,
+        )
+
+    @property
+    def modules(self):
+        """The catalog entries by module name, empty if no catalog exists"""
+        self._update_build_key()
+        modules = self._modules
+        if modules is None:
+            with self._lock:
+                if self._modules is None:
+                    self._modules = self._load()
+                modules = self._modules
+        return modules
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                catalog = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if catalog.get("format") != CATALOG_FORMAT:
+            return {}
+        return catalog["modules"]
+
+    def invalidate(self):
+        """Recompute the build key and reload the catalog and the resolved
+        module paths, e.g. after an addon was installed
+        """
+        with self._lock:
+            self._build_key = None
+            self._modules = None
+        GrassModuleRunner.invalidate_module_paths()
+
+    def get(self, module_name):
+        """Return the catalog entry of a module
+
+        Args:
+            module_name (str): The name of the module
+
+        Returns:
+            dict:
+            The catalog entry, None if the module is not in the catalog
+        """
+        return self.modules.get(module_name)
+
+    def list_modules(self):
+        """Return the name, description and keywords of all modules sorted
+        by name, the listing is computed once for each loaded catalog
+        """
+        modules = self.modules
+        listing_modules, listing = self._listing
+        if listing_modules is not modules:
+            listing = [
+                {
+                    "id": name,
+                    "description": modules[name]["description"],
+                    "keywords": modules[name]["keywords"],
+                }
+                for name in sorted(modules)
+            ]
+            self._listing = (modules, listing)
+        return listing
+
+    def get_resource_hints(self, module_name):
+        """Return if a module supports the nprocs and memory parameters
+
+        Args:
+            module_name (str): The name of the module
+
+        Returns:
+            dict:
+            The nprocs and memory support, None if the module is unknown
+        """
+        entry = self.get(module_name)
+        if entry is None:
+            return None
+        return {"nprocs": entry["nprocs"], "memory": entry["memory"]}
+
+    def list_module_names(self):
+        """Return the names of all installed modules and addons"""
+        names = set()
+        for path in self.get_module_dirs():
+            for name in os.listdir(path):
+                if MODULE_NAME_PATTERN.match(name):
+                    names.add(name)
+        return sorted(names)
+
+    def build(self, describe_func=None):
+        """Parse the interface descriptions of all modules and write the
+        catalog file of the current GRASS build
+
+        Args:
+            describe_func (function): Returns the interface descriptions of
+                                      a list of module names as dict, by
+                                      default the modules are run in a
+                                      temporary GRASS project
+        """
+        self.invalidate()
+        if describe_func is None:
+            describe_func = self._describe_modules
+        descriptions = describe_func(self.list_module_names())
+        modules = {}
+        for name, xml_text in descriptions.items():
+            if not xml_text:
+                continue
+            try:
+                modules[name] = parse_interface_description(xml_text)
+            except ET.ParseError:
+                log.warning("Invalid interface description of %s" % name)
+
+        os.makedirs(self.config.GRASS_MODULE_CATALOG_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config.GRASS_MODULE_CATALOG_DIR, suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "format": CATALOG_FORMAT,
+                    "build_key": self.build_key,
+                    "modules": modules,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+        with self._lock:
+            self._modules = modules
+
+    def build_in_background(self):
+        """Build the catalog in a thread if the catalog file of the current
+        GRASS build does not exist
+
+        Returns:
+            Thread:
+            The build thread, None if the catalog exists or GRASS is not
+            installed
+        """
+        if os.path.isfile(self.path) or not self.get_module_dirs():
+            return None
+        if self._build_thread is None or not self._build_thread.is_alive():
+            self._build_thread = Thread(target=self._build_logged, daemon=True)
+            self._build_thread.start()
+        return self._build_thread
+
+    def _build_logged(self):
+        try:
+            self.build()
+            log.info("Built the GRASS module catalog %s" % self.path)
+        except Exception as e:
+            log.warning("Unable to build the GRASS module catalog: %s" % e)
+
+    def _describe_modules(self, module_names):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result_path = os.path.join(tmp_dir, "descriptions.json")
+            subprocess.run(
+                [
+                    self.config.GRASS_GIS_START_SCRIPT,
+                    "--tmp-project",
+                    "XY",
+                    "--exec",
+                    sys.executable,
+                    "-c",
+                    _DESCRIBE_SCRIPT,
+                    result_path,
+                    *module_names,
+                ],
+                capture_output=True,
+                check=True,
+            )
+            with open(result_path) as f:
+                return json.load(f)
+
+    def validate(self, module_descr, unchecked_values=None):
+        """Validate the parameters and flags of a module description of a
+        process chain
+
+        Modules that are not in the catalog are not validated. Values with
+        stdout references are not checked.
+
+        Args:
+            module_descr (dict): The module description
+            unchecked_values: The compiled pattern of values that are not
+                              checked, e.g. the slots of templates
+
+        Raises:
+            AsyncProcessError: If a parameter or flag is invalid
+        """
+        module_name = module_descr.get("module")
+        entry = self.get(module_name)
+        if entry is None or module_descr.get("interface-description") is True:
+            return
+        parameters = entry["parameters"]
+
+        flags = str(module_descr.get("flags", ""))
+        for flag in flags:
+            if flag not in entry["flags"]:
+                raise AsyncProcessError(
+                    "Unknown flag <%s> of module <%s>" % (flag, module_name)
+                )
+
+        names = set()
+        for key in ("inputs", "outputs"):
+            for param in module_descr.get(key, []):
+                name = param.get("param")
+                if name not in parameters:
+                    raise AsyncProcessError(
+                        "Unknown parameter <%s> of module <%s>"
+                        % (name, module_name)
+                    )
+                names.add(name)
+                value = param.get("value")
+                if (
+                    isinstance(value, str)
+                    and "::" not in value
+                    and (
+                        unchecked_values is None
+                        or not unchecked_values.search(value)
+                    )
+                ):
+                    _check_value(module_name, name, parameters[name], value)
+
+        if not any(
+            entry["flags"][flag]["suppress_required"] for flag in flags
+        ):
+            for name, definition in parameters.items():
+                # GRASS uses the default of a missing required parameter
+                if (
+                    definition["required"]
+                    and "default" not in definition
+                    and name not in names
+                ):
+                    raise AsyncProcessError(
+                        "Required parameter <%s> of module <%s> is missing"
+                        % (name, module_name)
+                    )
+
+
+def _check_value(module_name, name, definition, value):
+    """Check the type, the number of values and the options of a value"""
+    if value == "":
+        return
+    parts = value.split(",")
+    if not definition["multiple"] and len(parts) > max(
+        len(definition.get("key_desc", ())), 1
+    ):
+        if definition["type"] != "string":
+            raise AsyncProcessError(
+                "Parameter <%s> of module <%s> accepts a single value"
+                % (name, module_name)
+            )
+        return
+    if definition["type"] in ("integer", "float", "double"):
+        convert = int if definition["type"] == "integer" else float
+        for part in parts:
+            try:
+                convert(part.strip())
+            except ValueError:
+                raise AsyncProcessError(
+                    "Parameter <%s> of module <%s> requires %s values"
+                    % (name, module_name, definition["type"])
+                )
+    elif "values" in definition:
+        options = definition["values"]
+        if not definition["multiple"]:
+            parts = [value]
+        for part in parts:
+            # GRASS accepts unique prefixes of the options
+            if not any(option.startswith(part) for option in options):
+                raise AsyncProcessError(
+                    "Value <%s> of parameter <%s> of module <%s> is not one "
+                    "of %s" % (part, name, module_name, ", ".join(options))
+                )
+
+
+# The module catalog of the current GRASS build
+grass_module_catalog = GrassModuleCatalog()
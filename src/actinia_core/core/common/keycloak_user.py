@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -18,6 +18,13 @@ Possible TODOs: add list_all_users, delete, create_user (, exists).
         need to store keycloak admin credentials!
 """
 
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from threading import Lock, Thread
+
+import jwt
 from keycloak import KeycloakOpenID
 
 from actinia_core.core.common.user_base import (
@@ -27,11 +34,172 @@ from actinia_core.core.logging_interface import log
 from actinia_core.core.common.config import global_config
 
 __author__ = "Anika Weinmann"
-__copyright__ = "Copyright 2024, mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2024-2026, mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
 
+class KeycloakTokenVerifier(object):
+    """Local verification of keycloak tokens
+
+    The signing keys (JWKS) of the keycloak realm are fetched once and
+    refreshed in the background every KEYCLOAK_KEYS_REFRESH_INTERVAL seconds.
+    A token signed with an unknown key id triggers an immediate refresh to
+    support key rotation, at most once every min_fetch_interval seconds.
+    Verified token information is cached until the token expires, hence no
+    request to keycloak is required to verify a token.
+    """
+
+    def __init__(self, config=None, min_fetch_interval=10):
+        self.config = config
+        self.min_fetch_interval = min_fetch_interval
+        self._keys = {}
+        self._keys_lock = Lock()
+        self._last_fetch = None
+        self._tokens = OrderedDict()
+        self._tokens_lock = Lock()
+        self._refresher_pid = None
+
+    def _get_config(self):
+        return self.config if self.config is not None else global_config
+
+    def _fetch_keys(self):
+        """Fetch the JSON web key set of the keycloak realm
+
+        Returns:
+            dict:
+            The JSON web key set
+        """
+        config = self._get_config()
+        keycloak_openid = KeycloakOpenID(
+            server_url=config.KEYCLOAK_URL,
+            client_id=config.KEYCLOAK_CLIENT_ID,
+            realm_name=config.KEYCLOAK_REALM,
+            client_secret_key=config.KEYCLOAK_CLIENT_SECRET_KEY,
+        )
+        return keycloak_openid.certs()
+
+    def refresh_keys(self):
+        """Fetch the signing keys, the known keys are kept on errors
+
+        Returns:
+            bool:
+            True if the keys were fetched, False otherwise
+        """
+        with self._keys_lock:
+            self._last_fetch = time.monotonic()
+            try:
+                jwks = self._fetch_keys()
+            except Exception as e:
+                log.error("Unable to fetch the keycloak signing keys: %s" % e)
+                return False
+            keys = {}
+            for jwk in jwks.get("keys", []):
+                if jwk.get("use", "sig") != "sig":
+                    continue
+                try:
+                    keys[jwk.get("kid")] = jwt.PyJWK(jwk)
+                except jwt.exceptions.PyJWKError:
+                    continue
+            self._keys = keys
+        return True
+
+    def _start_refresher(self):
+        """Start the background refresh of the signing keys once per
+        process
+        """
+        pid = os.getpid()
+        if self._refresher_pid == pid:
+            return
+        self._refresher_pid = pid
+        Thread(
+            target=self._run_refresher,
+            name="KeycloakKeyRefresher",
+            daemon=True,
+        ).start()
+
+    def _run_refresher(self):
+        while True:
+            time.sleep(self._get_config().KEYCLOAK_KEYS_REFRESH_INTERVAL)
+            self.refresh_keys()
+
+    def get_key(self, kid):
+        """Return the signing key for a key id, unknown key ids trigger a
+        refresh of the keys
+
+        Args:
+            kid (str): The key id of the token header
+
+        Returns:
+            jwt.PyJWK:
+            The signing key or None if the key id is unknown
+        """
+        self._start_refresher()
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+        last_fetch = self._last_fetch
+        if (
+            last_fetch is None
+            or time.monotonic() - last_fetch >= self.min_fetch_interval
+        ):
+            self.refresh_keys()
+        return self._keys.get(kid)
+
+    def decode(self, token):
+        """Verify a token and return its information
+
+        Args:
+            token (str): The keycloak access token
+
+        Returns:
+            dict:
+            The token information or None if the token is not valid
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._tokens_lock:
+            entry = self._tokens.get(digest)
+            if entry is not None:
+                if entry[0] > now:
+                    self._tokens.move_to_end(digest)
+                    return entry[1]
+                del self._tokens[digest]
+
+        try:
+            header = jwt.get_unverified_header(token)
+            key = self.get_key(header.get("kid"))
+            if key is None:
+                return None
+            token_info = jwt.decode(
+                token,
+                key=key.key,
+                algorithms=[key.algorithm_name],
+                options={"verify_aud": False, "require": ["exp"]},
+            )
+        except jwt.exceptions.PyJWTError:
+            return None
+
+        # The token must be issued for actinia
+        client_id = self._get_config().KEYCLOAK_CLIENT_ID
+        audience = token_info.get("aud", [])
+        if isinstance(audience, str):
+            audience = [audience]
+        if client_id not in audience and token_info.get("azp") != client_id:
+            return None
+
+        config = self._get_config()
+        with self._tokens_lock:
+            self._tokens[digest] = (token_info["exp"], token_info)
+            while len(self._tokens) > config.KEYCLOAK_TOKEN_CACHE_SIZE:
+                self._tokens.popitem(last=False)
+        return token_info
+
+
+# The token verifier of this process
+keycloak_token_verifier = KeycloakTokenVerifier()
+
+
 def create_user_from_tokeninfo(token_info):
     """
     Function to create a keycloak user from the keycloak token.
@@ -137,27 +305,17 @@ class ActiniaKeycloakUser(ActiniaUserBase):
 
     @staticmethod
     def verify_keycloak_token(token):
-        keycloak_openid = KeycloakOpenID(
-            server_url=global_config.KEYCLOAK_URL,
-            client_id=global_config.KEYCLOAK_CLIENT_ID,
-            realm_name=global_config.KEYCLOAK_REALM,
-            client_secret_key=global_config.KEYCLOAK_CLIENT_SECRET_KEY,
-        )
-        KEYCLOAK_PUBLIC_KEY = (
-            "-----BEGIN PUBLIC KEY-----\n"
-            + keycloak_openid.public_key()
-            + "\n-----END PUBLIC KEY-----"
-        )
-        options = {
-            "verify_signature": True,
-            "verify_aud": True,
-            "verify_exp": True,
-        }
-        try:
-            token_info = keycloak_openid.decode_token(
-                token, key=KEYCLOAK_PUBLIC_KEY, options=options
-            )
-        except Exception:
+        """Verify a keycloak token locally with the cached signing keys
+
+        Args:
+            token (str): The keycloak access token
+
+        Returns:
+            ActiniaKeycloakUser:
+            The user of the token or None if the token is not valid
+        """
+        token_info = keycloak_token_verifier.decode(token)
+        if token_info is None:
             return None
         return create_user_from_tokeninfo(token_info)
 
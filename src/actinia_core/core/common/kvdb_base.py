@@ -4,62 +4,195 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 #######
 
 """
-Kvdb base class
+Kvdb base class and the process-wide registry of pooled kvdb clients
 """
 
+import os
+from threading import Lock
+
 import valkey
 from actinia_core.core.logging_interface import log
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
 
-class KvdbBaseInterface(object):
-    """
-    The base class for most kvdb database interfaces
-    """
-
-    def __init__(self):
-        self.connection_pool = None
-        self.kvdb_server = None
-
-    def connect(self, host="localhost", port=6379, password=None):
-        """Connect to a specific kvdb server
+class KvdbClient(object):
+    """A pooled kvdb client that is shared by all interfaces of a role
 
-        Args:
-            host (str): The host name or IP address
-            port (int): The port
-            password (str): The password
+    The client owns a connection pool and caches the registered LUA
+    scripts, so that the script SHA is only computed once per process and
+    the scripts are loaded lazily by EVALSHA on the server.
+    """
 
-        """
-        kwargs = dict()
+    def __init__(self, host, port, password=None):
+        kwargs = {}
         kwargs["host"] = host
         kwargs["port"] = port
         if password and password is not None:
             kwargs["password"] = password
+        self.host = host
+        self.port = port
         self.connection_pool = valkey.ConnectionPool(**kwargs)
         del kwargs
         self.kvdb_server = valkey.StrictValkey(
             connection_pool=self.connection_pool
         )
+        self.scripts = {}
+        self.script_lock = Lock()
+
+    def ping(self):
+        """Check the connection to the kvdb server and log errors"""
         try:
             self.kvdb_server.ping()
         except valkey.exceptions.ResponseError as e:
-            log.error("Could not connect to " + host, port, str(e))
+            log.error(
+                "Could not connect to %s:%s %s" % (self.host, self.port, e)
+            )
         except valkey.exceptions.AuthenticationError:
             log.error("Invalid password")
         except valkey.exceptions.ConnectionError as e:
             log.error(str(e))
 
+    def register_script(self, script):
+        """Register a LUA script once and return the cached script object
+
+        Args:
+            script (str): The LUA script
+
+        Returns:
+            valkey.commands.core.Script:
+            The callable script object
+        """
+        with self.script_lock:
+            if script not in self.scripts:
+                self.scripts[script] = self.kvdb_server.register_script(script)
+            return self.scripts[script]
+
     def disconnect(self):
         self.connection_pool.disconnect()
+
+
+# The registry of pooled kvdb clients, one client per role and server
+# (role, host, port, password) -> KvdbClient
+# The registry is bound to the process that created it and is reset after
+# a fork, so that child processes never share sockets with their parent.
+_kvdb_clients = {}
+_kvdb_clients_lock = Lock()
+_kvdb_clients_pid = os.getpid()
+
+
+def _reset_kvdb_clients_after_fork():
+    """Drop all inherited clients in a forked child process
+
+    The inherited sockets belong to the parent process and are not closed
+    here, the child creates new pools on first use.
+    """
+    global _kvdb_clients, _kvdb_clients_lock, _kvdb_clients_pid
+    _kvdb_clients = {}
+    _kvdb_clients_lock = Lock()
+    _kvdb_clients_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_kvdb_clients_after_fork)
+
+
+def get_kvdb_client(role, host, port, password=None):
+    """Return the process-wide pooled kvdb client of a role
+
+    The connection pool of a role is created and checked with a ping only
+    once per process and reused by all interfaces of this role afterwards.
+
+    Args:
+        role (str): The role of the client, for example "resources",
+                    "locks", "users", "api_log" or "queue"
+        host (str): The host name or IP address
+        port (int): The port
+        password (str): The password
+
+    Returns:
+        KvdbClient:
+        The pooled kvdb client
+    """
+    if _kvdb_clients_pid != os.getpid():
+        _reset_kvdb_clients_after_fork()
+
+    key = (role, host, str(port), password)
+    with _kvdb_clients_lock:
+        client = _kvdb_clients.get(key)
+        if client is None:
+            client = KvdbClient(host=host, port=port, password=password)
+            client.ping()
+            _kvdb_clients[key] = client
+    return client
+
+
+def close_kvdb_clients(role=None):
+    """Disconnect and remove the pooled kvdb clients
+
+    Args:
+        role (str): Only close the clients of this role, all clients are
+                    closed if None
+
+    """
+    with _kvdb_clients_lock:
+        for key in list(_kvdb_clients.keys()):
+            if role is None or key[0] == role:
+                _kvdb_clients.pop(key).disconnect()
+
+
+class KvdbBaseInterface(object):
+    """
+    The base class for most kvdb database interfaces
+    """
+
+    # The role of the pooled kvdb client that is used by the interface,
+    # interfaces without a role create their own connection pool
+    kvdb_role = None
+
+    def __init__(self):
+        self.connection_pool = None
+        self.kvdb_server = None
+        self.kvdb_client = None
+
+    def connect(self, host="localhost", port=6379, password=None):
+        """Connect to a specific kvdb server
+
+        Interfaces with a kvdb_role reuse the process-wide pooled client of
+        their role.
+
+        Args:
+            host (str): The host name or IP address
+            port (int): The port
+            password (str): The password
+
+        """
+        if self.kvdb_role is not None:
+            self.kvdb_client = get_kvdb_client(
+                self.kvdb_role, host, port, password
+            )
+        else:
+            self.kvdb_client = KvdbClient(host, port, password)
+            self.kvdb_client.ping()
+        self.connection_pool = self.kvdb_client.connection_pool
+        self.kvdb_server = self.kvdb_client.kvdb_server
+
+    def disconnect(self):
+        """Disconnect from the kvdb server
+
+        Pooled clients of a role are shared with other interfaces and are
+        kept open, use close_kvdb_clients() to close them.
+        """
+        if self.kvdb_role is None and self.connection_pool is not None:
+            self.connection_pool.disconnect()
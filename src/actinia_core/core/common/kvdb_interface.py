@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2022 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -15,16 +15,23 @@ Kvdb connection interface
 """
 
 import rq
-from valkey import Valkey
+from actinia_core.core.common.kvdb_base import (
+    close_kvdb_clients,
+    get_kvdb_client,
+)
 from actinia_core.core.kvdb_user import kvdb_user_interface
 from actinia_core.core.kvdb_api_log import kvdb_api_log_interface
+from actinia_core.core.kvdb_process_chain_template import (
+    kvdb_process_chain_template_interface,
+)
 from actinia_core.core.logging_interface import log
+from actinia_core.core.usage_accounting import run_job
 from .config import global_config
 from .process_queue import enqueue_job as enqueue_job_local
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Carmen Tawalika"
-__copyright__ = "Copyright 2016-2022, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -47,12 +54,17 @@ def connect(host, port, pw=None):
     """
     kvdb_user_interface.connect(host, port, pw)
     kvdb_api_log_interface.connect(host, port, pw)
+    kvdb_process_chain_template_interface.connect(host, port, pw)
 
 
 def disconnect():
-    """Disconnect all required kvdb interfaces"""
+    """Disconnect all required kvdb interfaces and close the pooled
+    kvdb clients of this process
+    """
     kvdb_user_interface.disconnect()
     kvdb_api_log_interface.disconnect()
+    kvdb_process_chain_template_interface.disconnect()
+    close_kvdb_clients()
 
 
 def __create_job_queue(queue_name):
@@ -70,12 +82,8 @@ def __create_job_queue(queue_name):
         port = global_config.KVDB_QUEUE_SERVER_PORT
         password = global_config.KVDB_QUEUE_SERVER_PASSWORD
 
-        kwargs = dict()
-        kwargs["host"] = host
-        kwargs["port"] = port
-        if password and password is not None:
-            kwargs["password"] = password
-        kvdb_conn = Valkey(**kwargs)
+        # All queues share the pooled client of the "queue" role
+        kvdb_conn = get_kvdb_client("queue", host, port, password).kvdb_server
 
         string = "Create queue %s with server %s:%s" % (queue_name, host, port)
         log.info(string)
@@ -101,6 +109,7 @@ def __enqueue_job_kvdb(queue, timeout, func, *args):
     if timeout > 2147483647:
         timeout = -1  # never exprire
     ret = queue.enqueue(
+        run_job,
         func,
         *args,
         job_timeout=timeout,
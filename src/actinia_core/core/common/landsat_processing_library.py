@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -22,7 +22,7 @@ from actinia_core.core.geodata_download_importer import (
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
@@ -277,13 +277,13 @@ class LandsatProcessing(GeoDataDownloadImportSupport):
         Storage.
 
         Check the download cache if the file already exists, to avoid redundant
-        downloads. The downloaded files will be stored in a temporary
-        directory. After the download of all files completes, the downloaded
-        files will be moved to the download cache. This avoids broken files in
-        case a download was interrupted or stopped by termination.
+        downloads. The files are downloaded into partial files in the
+        download cache and moved to their final name after they were
+        verified. This avoids broken files in case a download was interrupted
+        or stopped by termination, interrupted downloads are resumed.
 
-        This method uses wget to gather the landsat scenes from the Google
-        Cloud Storage landsat archive using public https address.
+        The landsat scenes are gathered from the Google Cloud Storage landsat
+        archive using public https address.
         """
 
         GeoDataDownloadImportSupport._setup(self)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Compiled user permissions for project, mapset and module access checks
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The roles that are allowed to access everything
+ADMIN_ROLES = frozenset(("admin", "superadmin"))
+
+# The maximum number of compiled permissions that are cached
+PERMISSION_CACHE_SIZE = 256
+
+
+class UserPermissions(object):
+    """Immutable permissions of a user compiled from the user credentials
+
+    The accessible modules and the accessible mapsets of each project are
+    stored as frozensets, hence each check is a single hash lookup.
+    Admin and superadmin roles are allowed to access everything.
+    """
+
+    __slots__ = ("datasets", "is_admin", "modules", "user_role")
+
+    def __init__(self, user_role, accessible_datasets, accessible_modules):
+        """
+        Args:
+            user_role (str): The role of the user
+            accessible_datasets (dict): The project:mapset list entries
+            accessible_modules (list): The accessible modules
+        """
+        object.__setattr__(self, "user_role", user_role)
+        object.__setattr__(self, "is_admin", user_role in ADMIN_ROLES)
+        object.__setattr__(
+            self, "modules", frozenset(accessible_modules or ())
+        )
+        object.__setattr__(
+            self,
+            "datasets",
+            {
+                project: frozenset(mapsets or ())
+                for project, mapsets in (accessible_datasets or {}).items()
+            },
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("UserPermissions are immutable")
+
+    @classmethod
+    def from_credentials(cls, user_credentials):
+        """Compile the permissions of a user credentials dictionary
+
+        Args:
+            user_credentials (dict): The user credentials dictionary
+
+        Returns:
+            UserPermissions:
+            The compiled permissions
+        """
+        permissions = user_credentials.get("permissions") or {}
+        return cls(
+            user_credentials.get("user_role"),
+            permissions.get("accessible_datasets"),
+            permissions.get("accessible_modules"),
+        )
+
+    def can_access_project(self, project_name):
+        """Check if the user is allowed to access a project
+
+        Args:
+            project_name (str): The name of the project
+
+        Returns:
+            bool:
+            True if access is allowed, False otherwise
+        """
+        return self.is_admin or project_name in self.datasets
+
+    def can_access_mapset(self, project_name, mapset_name):
+        """Check if the user is allowed to access a mapset of a project
+
+        Args:
+            project_name (str): The name of the project
+            mapset_name (str): The name of the mapset
+
+        Returns:
+            bool:
+            True if access is allowed, False otherwise
+        """
+        if self.is_admin:
+            return True
+        mapsets = self.datasets.get(project_name)
+        return mapsets is not None and mapset_name in mapsets
+
+    def can_use_module(self, module_name):
+        """Check if the user is allowed to run a module or executable
+
+        Args:
+            module_name (str): The name of the module or executable
+
+        Returns:
+            bool:
+            True if access is allowed, False otherwise
+        """
+        return self.is_admin or module_name in self.modules
+
+
+_permission_cache = OrderedDict()
+_permission_cache_lock = Lock()
+
+
+def get_user_permissions(user_credentials):
+    """Return the compiled permissions of a user credentials dictionary
+
+    The compiled permissions are cached for the identical credentials
+    dictionary, hence repeated checks with the same credentials, e.g. for
+    each module of a process chain, compile them only once. Credentials
+    must not be modified in place after they were checked.
+
+    Args:
+        user_credentials (dict): The user credentials dictionary
+
+    Returns:
+        UserPermissions:
+        The compiled permissions
+    """
+    key = id(user_credentials)
+    permissions = user_credentials.get("permissions")
+    with _permission_cache_lock:
+        entry = _permission_cache.get(key)
+        if (
+            entry is not None
+            and entry[0] is user_credentials
+            and entry[1] is permissions
+        ):
+            _permission_cache.move_to_end(key)
+            return entry[2]
+
+    compiled = UserPermissions.from_credentials(user_credentials)
+    with _permission_cache_lock:
+        # The credentials are referenced to keep their id unique
+        _permission_cache[key] = (user_credentials, permissions, compiled)
+        _permission_cache.move_to_end(key)
+        while len(_permission_cache) > PERMISSION_CACHE_SIZE:
+            _permission_cache.popitem(last=False)
+    return compiled
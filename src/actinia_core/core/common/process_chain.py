@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,16 +14,25 @@
 Process chain
 """
 
+import copy
 import os
+import re
 import requests
 
 from actinia_core.core.stac_importer_interface import STACImporter as STAC
 from .process_object import Process
+from actinia_core.core.utils import get_download_process
+from .process_graph import (
+    get_map_names,
+    is_barrier_module,
+    is_in_place_module,
+)
 from actinia_processing_lib.exceptions import AsyncProcessError
 from actinia_core.core.geodata_download_importer import (
     GeoDataDownloadImportSupport,
 )
 from .config import global_config
+from .grass_module_catalog import grass_module_catalog
 from .sentinel_processing_library import Sentinel2Processing
 from .landsat_processing_library import LandsatProcessing
 from .google_satellite_bigquery_interface import (
@@ -45,11 +54,50 @@ __author__ = (
     "Sören Gebbert, Carmen Tawalika, Guido Riembauer, Julia Haas,"
     " Anika Weinmann"
 )
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
 
+# References of stdout and stderr of a process in parameter values
+_STDOUT_REFERENCE = re.compile(
+    r"([^\s=+\-*/%(),:]+)::(?:stdout|stderr)(?:::[^\s+\-*:(),]+)?"
+)
+
+
+# The stdout/stderr method or filter after a process id in parameter values
+_STREAM_REFERENCE = re.compile(r"::([^\s+\-*:(),]*)")
+# The characters that separate a process id from the text in front of it
+_ID_DELIMITERS = frozenset(" \t\n=+*/%(),:")
+# Splits parameter values at the symbols that can surround map@mapset names
+_MAPSET_SPLIT = re.compile(r"[ *+\-/%$!:(){}&?#=^~<>\\,]+")
+
+# The GRASS modules that accept the character & in their parameters
+AMPERSAND_MODULES = (
+    "r.mapcalc",
+    "t.rast.mapcalc",
+    "t.rast.algebra",
+    "t.rast.bandcalc",
+)
+
+# The directory of the temporary files of compiled process lists, it is
+# replaced by new temporary files of the converter the list is applied to
+TEMP_FILE_PATH_SLOT = "__actinia_temp_file_path__"
+_TEMP_FILE_SLOT = re.compile(
+    re.escape(TEMP_FILE_PATH_SLOT) + r"/temp_file_\d+"
+)
+
+# The attributes of the converter that are filled by the conversion and are
+# stored with a compiled process list
+COMPILED_CONVERTER_STATE = (
+    "temporary_pc_files",
+    "required_mapsets",
+    "resource_export_list",
+    "output_parser_list",
+    "import_descr_list",
+)
+
+
 def get_param_stdin_part(text):
     """Function to get method and filter from parameter value"""
     for delimiter in ["::", " ", "+", "-", "*", ":", "(", ")", ","]:
@@ -57,6 +105,209 @@ def get_param_stdin_part(text):
     return text
 
 
+def get_data_flow_names(value):
+    """Return the names of the maps and files a parameter value refers to
+
+    File identifiers are returned as $file::id, references of stdout and
+    stderr outputs are removed.
+
+    Args:
+        value (str): The parameter value
+
+    Returns:
+        set:
+        The map and file names
+    """
+    value = str(value)
+    if "$file" in value and "::" in value:
+        return {"$file::%s" % value.split("::")[1]}
+    return get_map_names(_STDOUT_REFERENCE.sub(" ", value))
+
+
+def check_parameter_characters(exec_type, executable, params):
+    """Check for un-allowed characters in the parameter list of a process
+
+    Args:
+        exec_type (str): The executable type, grass or exec
+        executable (str): The name of the module or executable
+        params (list): The parameters of the process
+
+    Raises:
+        AsyncProcessError: If a parameter contains an un-allowed character
+    """
+    for entry in params:
+        if "&" not in entry:
+            continue
+        if exec_type == "grass":
+            if executable in AMPERSAND_MODULES:
+                continue
+            raise AsyncProcessError(
+                "Character '&' not allowed in "
+                "parameters for %s" % executable
+            )
+        raise AsyncProcessError(
+            "Character '&' not supported in process "
+            "description for %s" % executable
+        )
+
+
+def _substitute(node, replace):
+    """Return a node of a compiled process list with substituted strings,
+    the lists, dicts and process objects of the node are modified
+    """
+    if isinstance(node, str):
+        return replace(node)
+    if isinstance(node, Process):
+        for key, value in vars(node).items():
+            if key not in ("id", "exec_type", "executable"):
+                setattr(node, key, _substitute(value, replace))
+        return node
+    if isinstance(node, list):
+        node[:] = [_substitute(entry, replace) for entry in node]
+        return node
+    if isinstance(node, dict):
+        items = [
+            (_substitute(key, replace), _substitute(value, replace))
+            for key, value in node.items()
+        ]
+        node.clear()
+        node.update(items)
+        return node
+    if isinstance(node, (tuple, set)):
+        return type(node)(_substitute(entry, replace) for entry in node)
+    return node
+
+
+class CompiledProcessList(object):
+    """A process list that was converted once from a process chain and can
+    be used without converting the process chain again
+
+    Temporary files are located in TEMP_FILE_PATH_SLOT, the import
+    descriptions and the webhooks are handled when the list is applied to
+    the converter of the processing.
+    """
+
+    def __init__(self, process_list, state):
+        """
+        Args:
+            process_list (list): The process list without the download and
+                                 import processes
+            state (dict): The COMPILED_CONVERTER_STATE attributes of the
+                          converter after the conversion
+        """
+        self.process_list = process_list
+        self.state = state
+
+    def bind(self, process_chain, replace, process_ids, config=None):
+        """Create the process list of a process chain that differs from the
+        compiled one only in substituted parameter values
+
+        The modified modules are validated and their maps and required
+        mapsets are updated, like the conversion would do.
+
+        Args:
+            process_chain (dict): The process chain with the substituted
+                                  values
+            replace (function): The function that substitutes the values in
+                                a string of the compiled process list
+            process_ids (set): The ids of the processes with substituted
+                               values
+            config: The actinia configuration
+
+        Raises:
+            AsyncProcessError: If a substituted value is invalid
+
+        Returns:
+            CompiledProcessList:
+            The new compiled process list
+        """
+        compiled = copy.deepcopy(self)
+        _substitute(compiled.process_list, replace)
+        _substitute(compiled.state, replace)
+
+        converter = ProcessChainConverter(
+            config=config, required_mapsets=compiled.state["required_mapsets"]
+        )
+        converter.process_dict = {
+            process.id: process
+            for process in compiled.process_list
+            if isinstance(process, Process)
+        }
+        for module_descr in process_chain["list"]:
+            if module_descr["id"] not in process_ids:
+                continue
+            process = converter.process_dict.get(module_descr["id"])
+            if process is None:
+                continue
+            if process.exec_type == "grass":
+                grass_module_catalog.validate(module_descr)
+                (
+                    process.inputs,
+                    process.outputs,
+                    process.depends_on,
+                ) = converter._get_module_data_flow(
+                    module_descr, process.executable
+                )
+                for input in module_descr.get("inputs") or ():
+                    value = str(input["value"])
+                    if "::" not in value:
+                        converter._add_required_mapsets(value)
+            check_parameter_characters(
+                process.exec_type,
+                process.executable,
+                process.executable_params,
+            )
+        return compiled
+
+    def apply(self, converter):
+        """Add the compiled process list to a converter, as if the process
+        chain was converted by it
+
+        The compiled process list is modified, hence it can be applied once.
+
+        Args:
+            converter (ProcessChainConverter): The converter of the
+                                               processing
+
+        Returns:
+            list:
+            The process list including the download and import processes
+        """
+        temp_files = {}
+
+        def replace_temp_file(match):
+            if match.group(0) not in temp_files:
+                temp_files[match.group(0)] = (
+                    converter.generate_temp_file_path()
+                )
+            return temp_files[match.group(0)]
+
+        def replace(text):
+            if TEMP_FILE_PATH_SLOT not in text:
+                return text
+            return _TEMP_FILE_SLOT.sub(replace_temp_file, text)
+
+        _substitute(self.process_list, replace)
+        _substitute(self.state, replace)
+
+        converter.temporary_pc_files.update(self.state["temporary_pc_files"])
+        for mapset in self.state["required_mapsets"]:
+            if mapset not in converter.required_mapsets:
+                converter.required_mapsets.append(mapset)
+        converter.resource_export_list.extend(
+            self.state["resource_export_list"]
+        )
+        converter.output_parser_list.extend(self.state["output_parser_list"])
+        converter.import_descr_list.extend(self.state["import_descr_list"])
+        for process in self.process_list:
+            if isinstance(process, Process):
+                converter.process_dict[process.id] = process
+
+        downimp_list = converter._create_download_process_list()
+        downimp_list.extend(self.process_list)
+        return downimp_list
+
+
 class ProcessChainConverter(object):
     """
     Convert the process chain description into a process list that can be
@@ -140,11 +391,25 @@ class ProcessChainConverter(object):
         self.webhook_update = None
         self.webhook_auth = None
         self.stdin_num = 0
+        # The (url, destination path) tuples of all files to download
+        self.download_list = []
+        # The pattern of parameter values that are not validated with the
+        # module catalog, e.g. the slots of templates that are validated
+        # when values are bound
+        self.unchecked_values = None
 
     def process_chain_to_process_list(self, process_chain):
         if not process_chain:
             raise AsyncProcessError("Process chain is empty")
 
+        # Process chains of templates are converted when the template is
+        # registered
+        compiled = getattr(process_chain, "compiled_process_list", None)
+        if compiled is not None:
+            process_chain.compiled_process_list = None
+            self._set_webhooks(process_chain)
+            return compiled.apply(self)
+
         if "list" in process_chain and "version" in process_chain:
             return self._process_chain_to_process_list(process_chain)
         else:
@@ -168,8 +433,41 @@ class ProcessChainConverter(object):
              A list of ordered grass processes
 
         """
-        process_list = []
+        self._check_version_and_list(process_chain)
+        self._set_webhooks(process_chain)
+        process_list = self._create_process_list(process_chain)
+        downimp_list = self._create_download_process_list()
+        downimp_list.extend(process_list)
+
+        return downimp_list
+
+    def compile_process_chain(self, process_chain):
+        """Convert a process chain once into a process list that can be
+        used without converting the process chain again
+
+        The webhooks and the import descriptions are not processed, this is
+        done when the compiled process list is applied to the converter of
+        the processing. The temporary file path of this converter should
+        be TEMP_FILE_PATH_SLOT.
+
+        Args:
+            process_chain (dict): The process chain of version 1
+
+        Raises:
+            AsyncProcessError: If the process chain is invalid
+
+        Returns:
+            CompiledProcessList:
+            The compiled process list
+        """
+        self._check_version_and_list(process_chain)
+        process_list = self._create_process_list(process_chain)
+        return CompiledProcessList(
+            process_list,
+            {name: getattr(self, name) for name in COMPILED_CONVERTER_STATE},
+        )
 
+    def _check_version_and_list(self, process_chain):
         if "version" not in process_chain:
             raise AsyncProcessError(
                 "Version information is missing "
@@ -182,7 +480,8 @@ class ProcessChainConverter(object):
                 "in the process chain definition"
             )
 
-        # Check for the webhooks
+    def _set_webhooks(self, process_chain):
+        """Check and set the webhooks of a process chain"""
         if "webhooks" in process_chain:
             if "finished" in process_chain["webhooks"]:
                 self.webhook_finished = process_chain["webhooks"]["finished"]
@@ -200,6 +499,9 @@ class ProcessChainConverter(object):
                     self.webhook_update, process_chain, "update"
                 )
 
+    def _create_process_list(self, process_chain):
+        """Create the processes of the process chain entries"""
+        process_list = []
         for process_descr in process_chain["list"]:
             if "module" in process_descr:
                 module = self._create_module_process(process_descr)
@@ -216,10 +518,7 @@ class ProcessChainConverter(object):
                     "Unknown process description "
                     "in the process chain definition"
                 )
-        downimp_list = self._create_download_process_list()
-        downimp_list.extend(process_list)
-
-        return downimp_list
+        return process_list
 
     def _get_landsat_import_download_commands(self, entry):
         """Helper method to get the landsat import and download commands.
@@ -263,11 +562,11 @@ class ProcessChainConverter(object):
             scene_id=scene,
         )
 
-        download_commands, _ = lp.get_download_process_list()
+        lp.get_download_process_list()
+        self._add_to_download_list(lp.download_list)
         import_commands = lp.get_import_process_list()
         atcor_commands = lp.get_i_landsat_toar_process_list(atcor)
-        landsat_commands = download_commands
-        landsat_commands.extend(import_commands)
+        landsat_commands = import_commands
         landsat_commands.extend(atcor_commands)
 
         return landsat_commands
@@ -450,11 +749,8 @@ class ProcessChainConverter(object):
                     url,
                 ],
             )
-            (
-                download_commands,
-                import_file_info,
-            ) = gdis.get_download_process_list()
-            rvf_downimport_commands.extend(download_commands)
+            _, import_file_info = gdis.get_download_process_list()
+            self._add_to_download_list(gdis.download_list)
             input_source = import_file_info[0][2]
         else:
             input_source = url
@@ -570,6 +866,17 @@ class ProcessChainConverter(object):
                 )
         return rvf_downimport_commands
 
+    def _add_to_download_list(self, download_list):
+        """Helper method to add files to the download list, that is
+        downloaded by a single download stage before all imports.
+
+        Args:
+            download_list (list): A list of (url, destination path) tuples
+        """
+        for entry in download_list:
+            if entry not in self.download_list:
+                self.download_list.append(entry)
+
     def generate_temp_file_path(self):
         """
         Generate the path of a new unique temporary file that will be removed
@@ -635,6 +942,9 @@ class ProcessChainConverter(object):
             )
 
         module_name = module_descr["module"]
+        grass_module_catalog.validate(
+            module_descr, unchecked_values=self.unchecked_values
+        )
 
         if "inputs" in module_descr:
             self._add_grass_module_input_parameter_to_list(
@@ -665,22 +975,14 @@ class ProcessChainConverter(object):
         ):
             params.append("--interface-description")
 
-        # Check for un-allowed characters in the parameter list
-        for entry in params:
-            if "&" in entry and module_name not in (
-                "r.mapcalc",
-                "t.rast.mapcalc",
-                "t.rast.algebra",
-                "t.rast.bandcalc",
-            ):
-                raise AsyncProcessError(
-                    "Character '&' not allowed in "
-                    "parameters for %s" % module_name
-                )
+        check_parameter_characters("grass", module_name, params)
 
         if (
             module_name != "importer" and module_name != "exporter"
         ) or params == ["--interface-description"]:
+            inputs, outputs, depends_on = self._get_module_data_flow(
+                module_descr, module_name
+            )
             p = Process(
                 exec_type="grass",
                 executable=module_name,
@@ -688,6 +990,12 @@ class ProcessChainConverter(object):
                 stdin_source=stdin_func,
                 param_stdin_sources=param_stdin_funcs,
                 id=id,
+                inputs=inputs,
+                outputs=outputs,
+                depends_on=depends_on,
+                barrier=is_barrier_module(module_name)
+                or module_descr.get("barrier") is True,
+                stdout_parser=module_descr.get("stdout"),
             )
 
             self.process_dict[id] = p
@@ -695,6 +1003,46 @@ class ProcessChainConverter(object):
 
         return None
 
+    def _get_module_data_flow(self, module_descr, module_name):
+        """Helper method to get the maps and files a GRASS module reads and
+        writes and the processes it depends on, to run independent modules
+        of a process chain concurrently.
+
+        Args:
+            module_descr (dict): The module description
+            module_name (str): The name of the grass module
+
+        Returns:
+            tuple:
+            (inputs, outputs, depends_on) sets of map and file names and of
+            process ids
+        """
+        depends_on = set(module_descr.get("depends_on") or ())
+        if "stdin" in module_descr:
+            depends_on.add(module_descr["stdin"].split("::")[0])
+
+        inputs = set()
+        outputs = set()
+        for input in module_descr.get("inputs") or ():
+            ids, value = self._split_output_references(
+                str(input.get("value", ""))
+            )
+            depends_on.update(ids)
+            names = get_data_flow_names(value)
+            inputs.update(names)
+            # Expressions like the one of r.mapcalc contain their outputs
+            if "=" in value:
+                outputs.update(names)
+        for output in module_descr.get("outputs") or ():
+            ids, value = self._split_output_references(
+                str(output.get("value", ""))
+            )
+            depends_on.update(ids)
+            outputs.update(get_data_flow_names(value))
+        if is_in_place_module(module_name):
+            outputs.update(inputs)
+        return inputs, outputs, depends_on
+
     def _create_stdin_process(self, module_descr, id):
         """Helper methods to create stdin process.
 
@@ -726,49 +1074,127 @@ class ProcessChainConverter(object):
     def _create_param_stdin_process(self, param_stdin_funcs, param_val, param):
         """Helper methods to create parameter stdin process.
 
+        The references <id>::stdout and <id>::stderr of processes are
+        replaced by PARAM_STDIN_FUNC_<num> placeholders in a single pass over
+        the parameter value. An optional ::<filter> suffix is kept, it is
+        applied to the stdout/stderr when the process is executed.
+
         Args:
-            module_descr (dict): The module description
             param_stdin_funcs(dict): The dictionary with the stdout/stderr
                                      functions
             param_val(str): The value of parameter of the module
             param(str): The parameter name of the module
 
         Returns:
-            stdin_func(Process): An object of type Process that
-                                 contains the module name, the
-                                 parameter list and stdin definitions
-            filter(str): A string to filter stdout e.g. "max" for r.univar
+            str:
+            The parameter value with the placeholders of the stdout/stderr
+            functions
         """
-        for mod in self.process_dict:
-            p_splitted = param_val.split(f"{mod}::")
-            p_len = len(p_splitted)
-            for i in range(1, p_len):
-                object_id = mod
-                method = get_param_stdin_part(p_splitted[i])
-                rest_str = p_splitted[i].replace(method, "")
-                filter = None
-                if rest_str.startswith("::"):
-                    filter = get_param_stdin_part(rest_str)
-
-                if "stdout" == method:
-                    stdin_func = self.process_dict[object_id].get_stdout
-                elif "stderr" == method:
-                    stdin_func = self.process_dict[object_id].get_stderr
-                else:
-                    raise AsyncProcessError(
-                        f"The stdout or stderr flag in id {id} is missing"
-                    )
-                func_str = f"{object_id}::{method}"
-                func_name = f"PARAM_STDIN_FUNC_{self.stdin_num}"
-                if filter:
-                    func_str += f"::{filter}"
-                    param += f"::{filter}"
-
+        parts = []
+        last = 0
+        # Repeated references use the same function
+        func_names = {}
+        for match in _STREAM_REFERENCE.finditer(param_val):
+            object_id = self._get_referenced_process_id(
+                param_val, last, match.start()
+            )
+            if object_id is None:
+                continue
+            method = match.group(1)
+            if "stdout" == method:
+                stdin_func = self.process_dict[object_id].get_stdout
+            elif "stderr" == method:
+                stdin_func = self.process_dict[object_id].get_stderr
+            else:
+                raise AsyncProcessError(
+                    f"The stdout or stderr flag of parameter {param} "
+                    f"referring to id {object_id} is missing"
+                )
+            if (object_id, method) not in func_names:
+                func_names[(object_id, method)] = (
+                    f"PARAM_STDIN_FUNC_{self.stdin_num}"
+                )
                 param_stdin_funcs[self.stdin_num] = stdin_func
-                param_val = param_val.replace(func_str, func_name)
                 self.stdin_num += 1
+            parts.append(param_val[last : match.start() - len(object_id)])
+            parts.append(func_names[(object_id, method)])
+            last = match.end()
+        parts.append(param_val[last:])
+        return "".join(parts)
+
+    def _get_referenced_process_id(self, value, start, end):
+        """Return the id of an already created process that ends at the end
+        position of a parameter value
+
+        The longest known id of the characters before the end position that
+        are not separated by an operator is used, hence ids with hyphens
+        and expressions like a-b::stdout are both supported.
 
-        return param_val
+        Args:
+            value (str): The parameter value
+            start (int): The position the id can start at the earliest
+            end (int): The position of the :: in front of stdout/stderr
+
+        Returns:
+            str:
+            The process id, None if no known process is referenced
+        """
+        begin = end
+        while begin > start and value[begin - 1] not in _ID_DELIMITERS:
+            begin -= 1
+        for pos in range(begin, end):
+            if value[pos:end] in self.process_dict:
+                return value[pos:end]
+        return None
+
+    def _split_output_references(self, value):
+        """Split the references of stdout and stderr of already created
+        processes from a parameter value
+
+        Args:
+            value (str): The parameter value
+
+        Returns:
+            tuple:
+            (ids, value) the ids of the referenced processes and the
+            parameter value without the references
+        """
+        ids = set()
+        parts = []
+        last = 0
+        for match in _STREAM_REFERENCE.finditer(value):
+            if match.start() < last:
+                continue
+            object_id = self._get_referenced_process_id(
+                value, last, match.start()
+            )
+            if object_id is None:
+                continue
+            ids.add(object_id)
+            parts.append(value[last : match.start() - len(object_id)])
+            parts.append(" ")
+            last = match.end()
+            # The optional filter of the stdout
+            filter_match = _STREAM_REFERENCE.match(value, last)
+            if filter_match is not None:
+                last = filter_match.end()
+        parts.append(value[last:])
+        return ids, "".join(parts)
+
+    def _add_required_mapsets(self, value):
+        """Add the mapsets of all map@mapset names in a parameter value to
+        the list of required mapsets
+
+        Args:
+            value (str): The parameter value, e.g. an expression
+        """
+        if "@" not in value:
+            return
+        for entry in _MAPSET_SPLIT.split(value):
+            if "@" in entry:
+                mapset = entry.split("@")[1]
+                if mapset not in self.required_mapsets:
+                    self.required_mapsets.append(mapset)
 
     def _create_exec_process(self, module_descr):
         """Analyse a grass process description dict and create a Process
@@ -834,13 +1260,25 @@ class ProcessChainConverter(object):
 
                 params.append(param)
 
-        # Check for un-allowed characters in the parameter list
-        for entry in params:
-            if "&" in entry:
-                raise AsyncProcessError(
-                    "Character '&' not supported in process "
-                    "description for %s" % executable
-                )
+        check_parameter_characters("exec", executable, params)
+
+        # Executables may access any file, hence they run alone unless they
+        # are explicitly marked as no barrier. Then all referenced files
+        # are assumed to be read and written.
+        inputs = outputs = None
+        depends_on = set(module_descr.get("depends_on") or ())
+        if "stdin" in module_descr:
+            depends_on.add(module_descr["stdin"].split("::")[0])
+        if module_descr.get("barrier") is False:
+            inputs = set()
+            for search_string in module_descr.get("params") or ():
+                if "$file" in search_string and "::" in search_string:
+                    inputs.update(get_data_flow_names(search_string))
+                else:
+                    depends_on.update(
+                        self._split_output_references(search_string)[0]
+                    )
+            outputs = set(inputs)
 
         p = Process(
             exec_type="exec",
@@ -848,6 +1286,9 @@ class ProcessChainConverter(object):
             executable_params=params,
             stdin_source=stdin_func,
             id=id,
+            inputs=inputs,
+            outputs=outputs,
+            depends_on=depends_on,
         )
 
         self.process_dict[id] = p
@@ -863,6 +1304,7 @@ class ProcessChainConverter(object):
         """
 
         downimp_list = []
+        self.download_list = []
 
         if self.message_logger:
             self.message_logger.info(
@@ -928,6 +1370,12 @@ class ProcessChainConverter(object):
                 sentinel2_entries
             )
             downimp_list.extend(sentinel_commands)
+
+        # Download all files concurrently before the first import
+        if self.download_list:
+            downimp_list.insert(
+                0, get_download_process(self.download_list, self.config)
+            )
         return downimp_list
 
     # TODO: remove legacy methods and do no use them in actinia_core
@@ -995,48 +1443,7 @@ class ProcessChainConverter(object):
                     param = "%s=%s" % (key, module_descr["inputs"][key])
                     # Check for mapset in input name and append it
                     # to the list of required mapsets
-                    if "@" in str(module_descr["inputs"][key]):
-                        # Mapset names are after an @ symbol
-                        # Mapsets in expressions can be detected by replacing
-                        # the symbols like *, +, :, /, {, (,},], ... by spaces
-                        # and split the string by spaces, searching in each
-                        # substring for @
-
-                        symbols = [
-                            "*",
-                            "+",
-                            "-",
-                            "/",
-                            "%",
-                            "$",
-                            "!",
-                            ":",
-                            "(",
-                            ")",
-                            "{",
-                            "}",
-                            "&",
-                            "?",
-                            "#",
-                            "=",
-                            "^",
-                            "~",
-                            "<",
-                            ">",
-                            "\\",
-                        ]
-
-                        for symbol in symbols:
-                            search_string = search_string.replace(symbol, " ")
-
-                        search_strings = search_string.split(" ")
-
-                        for entry in search_strings:
-                            for subentry in entry.split(","):
-                                if "@" in subentry:
-                                    mapset = subentry.split("@")[1]
-                                    if mapset not in self.required_mapsets:
-                                        self.required_mapsets.append(mapset)
+                    self._add_required_mapsets(search_string)
 
                 parameters.append(param)
 
@@ -1266,44 +1673,7 @@ class ProcessChainConverter(object):
                 param = "%s=%s" % (param, value)
                 # Check for mapset in input name and append it,
                 # to the list of required mapsets
-                if "@" in str(value):
-                    # Mapset names are after an @ symbol
-                    # Mapsets in expressions can be detected by replacing the
-                    # symbols like *, +, :, /, {, (,},], ... by spaces and
-                    # split the string by spaces, searching in each substring
-                    # for @
-                    symbols = [
-                        "*",
-                        "+",
-                        "-",
-                        "/",
-                        "%",
-                        "$",
-                        "!",
-                        ":",
-                        "(",
-                        ")",
-                        "{",
-                        "}",
-                        "&",
-                        "?",
-                        "#",
-                        "=",
-                        "^",
-                        "~",
-                        "<",
-                        ">",
-                        "\\",
-                    ]
-                    for symbol in symbols:
-                        value = value.replace(symbol, " ")
-                    values = value.split(" ")
-                    for entry in values:
-                        for subentry in entry.split(","):
-                            if "@" in subentry:
-                                mapset = subentry.split("@")[1]
-                                if mapset not in self.required_mapsets:
-                                    self.required_mapsets.append(mapset)
+                self._add_required_mapsets(str(value))
             params.append(param)
 
     def _add_grass_module_output_parameter_to_list(
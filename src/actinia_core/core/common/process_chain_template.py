@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Prepared process chain templates
+
+A process chain template is a process chain with {{name}} placeholders. It
+is validated and converted into a process list once, with slots for the
+placeholders. Process chains are created from it by substituting the bound
+values into the compiled process list, hence they are not converted again
+by the worker.
+"""
+
+import copy
+import re
+from collections import OrderedDict
+from threading import Lock
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from .process_chain import ProcessChainConverter, TEMP_FILE_PATH_SLOT
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+TEMPLATE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# The slots of the placeholders in the compiled process list, they are
+# valid map names, hence the maps of the modules can be identified
+SLOT = "__actinia_slot_%i__"
+SLOT_PATTERN = re.compile(r"__actinia_slot_\d+__")
+
+# Entries of a process description that must not contain placeholders,
+# hence module permissions and references are checked once
+FIXED_KEYS = ("id", "module", "exe", "stdin", "evaluate", "depends_on")
+
+# The supported parameter types and the accepted python types
+PARAMETER_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+}
+
+# The maximum length of a bound string value
+MAX_VALUE_LENGTH = 4096
+
+# The maximum number of compiled templates that are cached per process
+TEMPLATE_CACHE_SIZE = 256
+
+
+class BoundProcessChain(dict):
+    """The process chain of a template with bound values
+
+    The compiled process list with the substituted values is used by the
+    process chain converter instead of converting the process chain.
+    """
+
+    def __init__(self, process_chain, compiled_process_list):
+        dict.__init__(self, process_chain)
+        self.compiled_process_list = compiled_process_list
+
+
+class ProcessChainTemplate(object):
+    """A validated and compiled process chain template
+
+    The positions of all placeholders are computed once and the process
+    chain is converted into a process list with slots for the placeholders.
+    Binding values copies only the lists and dicts on the path to a
+    substituted value, all other parts of the process chain are shared with
+    the template.
+    """
+
+    def __init__(
+        self, template_id, process_chain, parameters=None, config=None
+    ):
+        """
+        Args:
+            template_id (str): The unique id of the template
+            process_chain (dict): The process chain with placeholders
+            parameters (dict): The parameter definitions, the keys are the
+                               placeholder names, the values dicts with the
+                               optional entries type (string, number or
+                               integer), default and description. If None
+                               all placeholders are required strings.
+            config: The actinia configuration, the global configuration if
+                    None
+
+        Raises:
+            AsyncProcessError: If the template is invalid
+        """
+        if not isinstance(template_id, str) or not TEMPLATE_ID_PATTERN.match(
+            template_id
+        ):
+            raise AsyncProcessError(
+                "The template id must consist of 1 to 64 letters, digits, "
+                "underscores or hyphens"
+            )
+        self.template_id = template_id
+        self.process_chain = process_chain
+        self._validate_process_chain()
+
+        # The substitution tree: key -> subtree or the split value, the odd
+        # parts are the parameter names
+        self._slots = {}
+        names = set()
+        self._compile(process_chain, (), names)
+
+        if parameters is None:
+            parameters = {name: {"type": "string"} for name in names}
+        self.parameters = self._validate_parameters(parameters, names)
+        self.modules = sorted(
+            {
+                entry.get("module") or entry.get("exe")
+                for entry in process_chain["list"]
+                if "module" in entry or "exe" in entry
+            }
+        )
+        self.config = config
+        self._compile_process_list()
+
+    def to_dict(self):
+        """Return the template definition that can be stored and used to
+        recreate the template
+        """
+        return {
+            "id": self.template_id,
+            "process_chain": self.process_chain,
+            "parameters": self.parameters,
+        }
+
+    def _validate_process_chain(self):
+        process_chain = self.process_chain
+        if not isinstance(process_chain, dict):
+            raise AsyncProcessError("The process chain must be a dict")
+        if str(process_chain.get("version")) != "1":
+            raise AsyncProcessError(
+                "Templates require a process chain of version 1"
+            )
+        process_list = process_chain.get("list")
+        if not isinstance(process_list, list) or not process_list:
+            raise AsyncProcessError(
+                "List of processes to be executed is missing "
+                "in the process chain definition"
+            )
+
+        ids = set()
+        for entry in process_list:
+            if not isinstance(entry, dict) or "id" not in entry:
+                raise AsyncProcessError(
+                    "The <id> is missing from the process description."
+                )
+            process_id = entry["id"]
+            for key in FIXED_KEYS:
+                if key in entry and PLACEHOLDER_PATTERN.search(
+                    str(entry[key])
+                ):
+                    raise AsyncProcessError(
+                        "Placeholders are not allowed in <%s> of process id "
+                        "%s" % (key, process_id)
+                    )
+            if process_id in ids:
+                raise AsyncProcessError(
+                    "The process id %s is not unique" % process_id
+                )
+            if not any(key in entry for key in ("module", "exe", "evaluate")):
+                raise AsyncProcessError(
+                    "Unknown process description of id %s in the process "
+                    "chain definition" % process_id
+                )
+            if "stdin" in entry:
+                if "::" not in entry["stdin"]:
+                    raise AsyncProcessError(
+                        "The stdin option in id %s misses the ::" % process_id
+                    )
+                if entry["stdin"].split("::")[0] not in ids:
+                    raise AsyncProcessError(
+                        "The stdin option in id %s refers to an unknown or "
+                        "later process" % process_id
+                    )
+            for key in ("inputs", "outputs"):
+                if key not in entry:
+                    continue
+                if not isinstance(entry[key], list):
+                    raise AsyncProcessError(
+                        "%s in the process chain definition must be of type "
+                        "list" % key.capitalize()
+                    )
+                for param in entry[key]:
+                    if (
+                        not isinstance(param, dict)
+                        or "param" not in param
+                        or "value" not in param
+                    ):
+                        raise AsyncProcessError(
+                            "<param> or <value> is missing in %s description "
+                            "of process id: %s" % (key[:-1], process_id)
+                        )
+            ids.add(process_id)
+
+    def _compile(self, node, path, names):
+        """Collect the positions of all placeholders"""
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            if isinstance(node, str) and "{{" in node:
+                parts = PLACEHOLDER_PATTERN.split(node)
+                if len(parts) == 1:
+                    return
+                names.update(parts[1::2])
+                tree = self._slots
+                for key in path[:-1]:
+                    tree = tree.setdefault(key, {})
+                tree[path[-1]] = tuple(parts)
+            return
+
+        for key, value in items:
+            if isinstance(node, dict) and PLACEHOLDER_PATTERN.search(str(key)):
+                raise AsyncProcessError(
+                    "Placeholders are not allowed in keys of the process "
+                    "chain"
+                )
+            self._compile(value, path + (key,), names)
+
+    def _compile_process_list(self):
+        """Convert the process chain with the slots of the placeholders"""
+        self._slot_names = {
+            SLOT % num: name
+            for num, name in enumerate(sorted(self.parameters))
+        }
+        slots = {name: slot for slot, name in self._slot_names.items()}
+        # The converter adds entries to the output descriptions
+        process_chain = copy.deepcopy(
+            _render(self.process_chain, self._slots, slots)
+        )
+        converter = ProcessChainConverter(
+            config=self.config, temp_file_path=TEMP_FILE_PATH_SLOT
+        )
+        converter.unchecked_values = SLOT_PATTERN
+        self.compiled_process_list = converter.compile_process_chain(
+            process_chain
+        )
+        # The processes with slots
+        self._process_ids = {
+            self.process_chain["list"][num]["id"]
+            for num in self._slots.get("list", {})
+        }
+
+    @staticmethod
+    def _validate_parameters(parameters, names):
+        if not isinstance(parameters, dict):
+            raise AsyncProcessError("The parameters must be a dict")
+        unknown = names - set(parameters)
+        if unknown:
+            raise AsyncProcessError(
+                "The placeholders <%s> are not defined as parameters"
+                % ", ".join(sorted(unknown))
+            )
+        result = {}
+        for name, definition in parameters.items():
+            if name not in names:
+                raise AsyncProcessError(
+                    "The parameter <%s> is not used in the process chain"
+                    % name
+                )
+            definition = dict(definition or {})
+            definition.setdefault("type", "string")
+            if definition["type"] not in PARAMETER_TYPES:
+                raise AsyncProcessError(
+                    "Unsupported type <%s> of parameter <%s>, supported are "
+                    "%s"
+                    % (
+                        definition["type"],
+                        name,
+                        ", ".join(sorted(PARAMETER_TYPES)),
+                    )
+                )
+            if "default" in definition:
+                _check_value(name, definition["type"], definition["default"])
+            result[name] = definition
+        return result
+
+    def bind(self, bindings):
+        """Create a process chain by substituting the bound values
+
+        The parts of the process chain without placeholders are shared with
+        the template and must not be modified.
+
+        Args:
+            bindings (dict): The values of the parameters
+
+        Raises:
+            AsyncProcessError: If a binding is missing, unknown or invalid
+
+        Returns:
+            BoundProcessChain:
+            The process chain with the compiled process list
+        """
+        if bindings is None:
+            bindings = {}
+        if not isinstance(bindings, dict):
+            raise AsyncProcessError("The bindings must be a dict")
+        unknown = set(bindings) - set(self.parameters)
+        if unknown:
+            raise AsyncProcessError(
+                "Unknown template parameters <%s>" % ", ".join(sorted(unknown))
+            )
+
+        values = {}
+        for name, definition in self.parameters.items():
+            if name in bindings:
+                value = bindings[name]
+            elif "default" in definition:
+                value = definition["default"]
+            else:
+                raise AsyncProcessError(
+                    "The template parameter <%s> is missing" % name
+                )
+            _check_value(name, definition["type"], value)
+            values[name] = value
+
+        process_chain = _render(self.process_chain, self._slots, values)
+        compiled_process_list = self.compiled_process_list.bind(
+            process_chain,
+            lambda text: SLOT_PATTERN.sub(
+                lambda match: str(values[self._slot_names[match.group(0)]]),
+                text,
+            ),
+            self._process_ids,
+            self.config,
+        )
+        return BoundProcessChain(process_chain, compiled_process_list)
+
+
+def _check_value(name, parameter_type, value):
+    if isinstance(value, bool) or not isinstance(
+        value, PARAMETER_TYPES[parameter_type]
+    ):
+        raise AsyncProcessError(
+            "The template parameter <%s> must be of type %s"
+            % (name, parameter_type)
+        )
+    # Stream references and file identifiers would change the conversion
+    # of the process chain
+    if isinstance(value, str) and (
+        len(value) > MAX_VALUE_LENGTH
+        or "{{" in value
+        or "::" in value
+        or "$file" in value
+    ):
+        raise AsyncProcessError(
+            "Invalid value of the template parameter <%s>" % name
+        )
+
+
+def _render(node, slots, values):
+    """Copy the containers on the paths to the placeholders and substitute
+    the values"""
+    if isinstance(slots, tuple):
+        # The process chain converter expects string values
+        rendered = list(slots)
+        for i in range(1, len(slots), 2):
+            rendered[i] = str(values[slots[i]])
+        return "".join(rendered)
+
+    node = dict(node) if isinstance(node, dict) else list(node)
+    for key, subtree in slots.items():
+        node[key] = _render(node[key], subtree, values)
+    return node
+
+
+class ProcessChainTemplateCache(object):
+    """Process-wide cache of compiled templates
+
+    A template is identified by user id, template id and the version that
+    was assigned when it was stored. A changed version compiles the stored
+    template again.
+    """
+
+    def __init__(self, size=TEMPLATE_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, user_id, template_id, version, load_func):
+        """Return the compiled template
+
+        Args:
+            user_id (str): The id of the template owner
+            template_id (str): The template id
+            version (str): The current version of the stored template
+            load_func (function): Returns the stored template definition
+                                  (dict) if the template is not cached
+
+        Returns:
+            ProcessChainTemplate:
+            The compiled template
+        """
+        key = (user_id, template_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        definition = load_func()
+        template = ProcessChainTemplate(
+            definition["id"],
+            definition["process_chain"],
+            definition.get("parameters"),
+        )
+        with self._lock:
+            self._entries[key] = (version, template)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return template
+
+    def invalidate(self, user_id, template_id):
+        """Drop a template from the cache"""
+        with self._lock:
+            self._entries.pop((user_id, template_id), None)
+
+
+# The compiled templates of this process
+process_chain_template_cache = ProcessChainTemplateCache()
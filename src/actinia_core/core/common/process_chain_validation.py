@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Process chain validation without GRASS session
+
+The process chain is converted into a process list, the process limit, the
+module permissions and the required mapsets are checked in the calling
+process. These are the checks of the validation job, without creating a
+temporary GRASS database and without initializing GRASS.
+"""
+
+import os
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.rest.base.user_auth import (
+    check_project_mapset_module_access,
+)
+from .config import global_config
+from .process_chain import ProcessChainConverter
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class ProcessChainValidator(object):
+    """Validate process chains of a user in a project"""
+
+    def __init__(
+        self, user_credentials, user_group, project_name, config=None
+    ):
+        """
+        Args:
+            user_credentials (dict): The credentials of the user
+            user_group (str): The group of the user
+            project_name (str): The name of the project
+            config: The actinia configuration, the global configuration if
+                    None
+        """
+        self.user_credentials = user_credentials
+        self.project_name = project_name
+        self.config = config if config is not None else global_config
+        self.global_project_path = os.path.join(
+            self.config.GRASS_DATABASE, project_name
+        )
+        self.user_project_path = os.path.join(
+            self.config.GRASS_USER_DATABASE, user_group, project_name
+        )
+
+    def requires_worker(self, process_chain):
+        """Check if the validation must be performed by a worker
+
+        This is the case for process chains that are not JSON documents,
+        process chains with webhooks, that are called by the worker, and if
+        the GRASS database is not available in this process.
+
+        Args:
+            process_chain: The process chain of the request
+
+        Returns:
+            bool:
+            True if the validation must be enqueued
+        """
+        if not isinstance(process_chain, dict):
+            return True
+        if "webhooks" in process_chain:
+            return True
+        return not os.path.isdir(self.config.GRASS_DATABASE)
+
+    def validate(self, process_chain):
+        """Validate a process chain
+
+        Args:
+            process_chain (dict): The process chain
+
+        Raises:
+            AsyncProcessError: If the process chain is invalid
+
+        Returns:
+            list:
+            The list of Process objects
+        """
+        converter = ProcessChainConverter(config=self.config)
+        process_list = converter.process_chain_to_process_list(process_chain)
+
+        if not process_list and not converter.resource_export_list:
+            raise AsyncProcessError("Empty process chain, nothing to compute")
+
+        process_num_limit = self.user_credentials["permissions"][
+            "process_num_limit"
+        ]
+        if len(process_list) > process_num_limit:
+            raise AsyncProcessError(
+                "Process limit exceeded, a maximum of %i "
+                "processes are allowed in the process chain."
+                % process_num_limit
+            )
+
+        for process in process_list:
+            if process.exec_type not in ("grass", "exec"):
+                raise AsyncProcessError(
+                    "Wrong process description, type: %s "
+                    "module/executable: %s, args: %s"
+                    % (
+                        str(process.exec_type),
+                        str(process.executable),
+                        str(process.executable_params),
+                    )
+                )
+            if process.skip_permission_check is False:
+                resp = check_project_mapset_module_access(
+                    user_credentials=self.user_credentials,
+                    config=self.config,
+                    module_name=process.executable,
+                )
+                if resp is not None:
+                    raise AsyncProcessError(
+                        "Module or executable <%s> is not supported"
+                        % process.executable
+                    )
+
+        self._check_required_mapsets(converter.required_mapsets)
+        return process_list
+
+    def _check_required_mapsets(self, required_mapsets):
+        """Check that the required mapsets can be linked like the worker
+        links them into the temporary project
+        """
+        mapsets = list(required_mapsets)
+        if "PERMANENT" not in mapsets:
+            mapsets.append("PERMANENT")
+
+        is_global_project = os.path.isdir(self.global_project_path)
+        if not is_global_project and not os.path.isdir(self.user_project_path):
+            raise AsyncProcessError(
+                "Unable to access project <%s>" % self.project_name
+            )
+
+        for mapset in mapsets:
+            if (
+                is_global_project
+                and self._is_mapset(self.global_project_path, mapset)
+                and check_project_mapset_module_access(
+                    user_credentials=self.user_credentials,
+                    config=self.config,
+                    project_name=self.project_name,
+                    mapset_name=mapset,
+                )
+                is None
+            ):
+                continue
+            if self._is_mapset(self.user_project_path, mapset):
+                continue
+            raise AsyncProcessError(
+                "Unable to link all required mapsets into temporary project. "
+                "Missing or un-accessible mapset <%s> in project <%s>"
+                % (mapset, self.project_name)
+            )
+
+    def _is_mapset(self, project_path, mapset):
+        mapset_path = os.path.join(project_path, mapset)
+        if not os.path.isdir(mapset_path) or not os.access(
+            mapset_path, os.R_OK | os.X_OK
+        ):
+            return False
+        # A WIND file is required to be sure it is a mapset
+        if not os.path.isfile(os.path.join(mapset_path, "WIND")):
+            raise AsyncProcessError(
+                "Invalid mapset <%s> in project <%s>"
+                % (mapset, self.project_name)
+            )
+        return True
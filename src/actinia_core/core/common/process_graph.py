@@ -0,0 +1,478 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Dependency graph of a process list and a parallel executor of its steps
+"""
+
+import os
+import re
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from .config import global_config
+from .process_object import Process
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The prefix of the region files that are created for each concurrent step
+STEP_REGION_PREFIX = "actinia_step_region_"
+
+# Modules that change the state of the mapset for all following modules
+BARRIER_MODULES = ("r.mask", "r.mask.rast", "r.mask.vect")
+BARRIER_MODULE_PREFIXES = ("g.",)
+
+# Modules that modify their input maps in place
+IN_PLACE_MODULE_PREFIXES = (
+    "db.",
+    "r.category",
+    "r.colors",
+    "r.null",
+    "r.region",
+    "r.support",
+    "r.timestamp",
+    "t.register",
+    "t.shift",
+    "t.snap",
+    "t.support",
+    "t.unregister",
+    "v.build",
+    "v.colors",
+    "v.db.",
+    "v.support",
+    "v.timestamp",
+    "v.to.db",
+    "v.what.",
+)
+
+# Splits map names from expressions, e.g. of r.mapcalc
+_NAME_SPLIT = re.compile(r"[\s*+\-/%$!:(){}&?#=^~<>\\,|\[\]\"']+")
+_NUMBER = re.compile(r"^[0-9.eE]+$")
+# The separators between the basename and the suffix of maps that modules
+# like i.pca or r.texture derive from a basename
+_BASENAME_SEPARATORS = re.compile(r"[._]")
+
+
+def get_map_names(value):
+    """Return the names of the maps that are referenced in a parameter value
+
+    Mapset names are removed, the value is split at all symbols that can
+    occur in expressions. Hence the result may contain more names than the
+    module actually uses, which only adds dependencies.
+
+    Args:
+        value (str): The parameter value
+
+    Returns:
+        set:
+        The map names
+    """
+    names = set()
+    for token in _NAME_SPLIT.split(str(value)):
+        name = token.split("@", 1)[0]
+        if name and not _NUMBER.match(name):
+            names.add(name)
+    return names
+
+
+def get_data_flow_keys(names):
+    """Return the keys the data flow of maps is tracked with
+
+    Modules like i.pca or r.texture write maps like pca.1 or tex_ASM that
+    are derived from the basename of their output parameter. Hence each map
+    name is also tracked with all its prefixes in front of "." and "_", a
+    step that reads pca.1 depends on the step that writes pca. File
+    identifiers are tracked by their name only.
+
+    Args:
+        names (set): The map and file names
+
+    Returns:
+        set:
+        The names and their basenames
+    """
+    keys = set()
+    for name in names:
+        keys.add(name)
+        if name.startswith("$file::"):
+            continue
+        for match in _BASENAME_SEPARATORS.finditer(name):
+            if match.start() > 0:
+                keys.add(name[: match.start()])
+    return keys
+
+
+def is_barrier_module(module_name):
+    """Check if a GRASS module must run after all previous and before all
+    following modules of a process chain
+
+    Args:
+        module_name (str): The name of the module
+
+    Returns:
+        bool:
+        True if the module is a barrier
+    """
+    return module_name in BARRIER_MODULES or module_name.startswith(
+        BARRIER_MODULE_PREFIXES
+    )
+
+
+def is_in_place_module(module_name):
+    """Check if a GRASS module modifies its input maps
+
+    Args:
+        module_name (str): The name of the module
+
+    Returns:
+        bool:
+        True if the inputs of the module are modified
+    """
+    return module_name.startswith(IN_PLACE_MODULE_PREFIXES)
+
+
+def get_max_parallel_steps(config=None):
+    """Return the number of process chain steps that are allowed to run
+    concurrently, the configured number limited by the cores of the job
+
+    Args:
+        config: The actinia configuration object
+
+    Returns:
+        int:
+        The maximum number of concurrent steps
+    """
+    if config is None:
+        config = global_config
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(1, min(config.PROCESS_CHAIN_PARALLEL_STEPS, cores))
+
+
+def _get_output_owner(func):
+    """Return the process of a get_stdout or get_stderr method"""
+    owner = getattr(func, "__self__", None)
+    return owner if isinstance(owner, Process) else None
+
+
+def _is_stream_link(producer, consumer, references):
+    """Check if the stdout of a process can be streamed to the next one"""
+    return (
+        isinstance(producer, Process)
+        and isinstance(consumer, Process)
+        and producer.exec_type in ("grass", "exec")
+        and consumer.exec_type in ("grass", "exec")
+        and _get_output_owner(consumer.stdin_source) is producer
+        and getattr(consumer.stdin_source, "__func__", None)
+        is Process.get_stdout
+        # The stdout is not parsed and not used by other processes
+        and producer.stdout_parser is None
+        and references.get(id(producer), 0) == 1
+        # Parameter references are resolved before a process starts
+        and not producer.param_stdin_sources
+        and not consumer.param_stdin_sources
+    )
+
+
+def get_stream_pipelines(process_list):
+    """Group the steps of a process list into pipelines
+
+    A process whose stdout is only used as stdin of the next process is
+    grouped with it, hence both can run concurrently connected by an OS
+    pipe. Processes with parsed stdout or with references to their stdout
+    or stderr in parameters of other processes are not streamed.
+
+    Args:
+        process_list (list): The list of steps that were created by the
+                             process chain converter
+
+    Returns:
+        list:
+        Lists of steps in the order of the process list, each list with
+        more than one step is a pipeline
+    """
+    references = {}
+    for step in process_list:
+        if not isinstance(step, Process):
+            continue
+        funcs = [step.stdin_source]
+        funcs.extend((step.param_stdin_sources or {}).values())
+        for func in funcs:
+            owner = _get_output_owner(func)
+            if owner is not None:
+                references[id(owner)] = references.get(id(owner), 0) + 1
+
+    pipelines = []
+    for step in process_list:
+        if pipelines and _is_stream_link(pipelines[-1][-1], step, references):
+            pipelines[-1].append(step)
+        else:
+            pipelines.append([step])
+    return pipelines
+
+
+class ProcessGraph(object):
+    """The dependency graph of a process list
+
+    A step depends on
+        - the last barrier before it
+        - the last step that wrote one of its inputs or outputs
+        - all steps since that write that read one of its outputs
+        - the steps whose stdout or stderr it reads as stdin or in
+          parameters
+        - the steps that are referenced by id, e.g. by explicit ordering
+          hints
+
+    Maps are compared together with their basenames, see
+    get_data_flow_keys.
+
+    Barriers depend on all previous steps. Steps that are not Process
+    objects or that have unknown inputs or outputs are barriers.
+    """
+
+    def __init__(self, process_list):
+        """
+        Args:
+            process_list (list): The list of steps that were created by the
+                                 process chain converter
+        """
+        self.process_list = process_list
+        self.dependencies = []
+        self._positions = {}
+        self._build()
+
+    @staticmethod
+    def is_barrier(step):
+        """Check if a step must run alone
+
+        Args:
+            step: A step of the process list
+
+        Returns:
+            bool:
+            True if the step is a barrier
+        """
+        return (
+            not isinstance(step, Process)
+            or step.barrier is True
+            or step.inputs is None
+            or step.outputs is None
+        )
+
+    def _build(self):
+        # Ids of processes that are not part of the list, e.g. of importer
+        # definitions, are ignored
+        all_ids = {
+            step.id for step in self.process_list if isinstance(step, Process)
+        }
+        ids = {}
+        last_writer = {}
+        readers = {}
+        last_barrier = None
+        since_barrier = []
+        for index, step in enumerate(self.process_list):
+            self._positions[id(step)] = index
+
+        for index, step in enumerate(self.process_list):
+            deps = set()
+            if isinstance(step, Process):
+                for process_id in step.depends_on:
+                    if process_id in ids:
+                        deps.add(ids[process_id])
+                    elif process_id in all_ids:
+                        raise AsyncProcessError(
+                            "Process <%s> depends on the later process <%s>"
+                            % (step.id, process_id)
+                        )
+                deps.update(self._get_output_dependencies(index, step))
+
+            if self.is_barrier(step):
+                deps.update(since_barrier)
+                if last_barrier is not None:
+                    deps.add(last_barrier)
+                last_barrier = index
+                since_barrier = []
+                # All following steps depend on this barrier
+                last_writer = {}
+                readers = {}
+            else:
+                if last_barrier is not None:
+                    deps.add(last_barrier)
+                inputs = get_data_flow_keys(step.inputs)
+                outputs = get_data_flow_keys(step.outputs)
+                for name in inputs | outputs:
+                    if name in last_writer:
+                        deps.add(last_writer[name])
+                for name in outputs:
+                    deps.update(readers.get(name, ()))
+                for name in inputs:
+                    readers.setdefault(name, []).append(index)
+                for name in outputs:
+                    last_writer[name] = index
+                    readers[name] = []
+                since_barrier.append(index)
+
+            if isinstance(step, Process) and step.id is not None:
+                ids[step.id] = index
+            self.dependencies.append(deps)
+
+    def _get_output_dependencies(self, index, process):
+        """Return the positions of the steps whose stdout or stderr a
+        process reads as stdin or in its parameters
+
+        Raises:
+            AsyncProcessError: If a later step is referenced
+        """
+        funcs = [process.stdin_source]
+        funcs.extend((process.param_stdin_sources or {}).values())
+        deps = set()
+        for func in funcs:
+            owner = _get_output_owner(func)
+            if owner is None or id(owner) not in self._positions:
+                continue
+            position = self._positions[id(owner)]
+            if position >= index:
+                raise AsyncProcessError(
+                    "Process <%s> reads the output of the later process <%s>"
+                    % (process.id, owner.id)
+                )
+            deps.add(position)
+        return deps
+
+    def add_pipeline(self, pipeline):
+        """Schedule the steps of a pipeline together
+
+        The first step of a pipeline starts all its steps, see
+        get_stream_pipelines, hence it depends on the dependencies of all
+        steps. The following steps depend on the first step.
+
+        Args:
+            pipeline (list): The consecutive steps of the process list
+        """
+        indices = [self._positions[id(step)] for step in pipeline]
+        first = self.dependencies[indices[0]]
+        for index in indices[1:]:
+            first.update(self.dependencies[index].difference(indices))
+
+    def run(self, run_func, max_parallel=1, mapset_path=None, env=None):
+        """Run all steps of the process list
+
+        Independent steps run concurrently up to max_parallel steps. Each
+        concurrent Process gets its own environment, if mapset_path is set
+        the current region of the mapset is copied for each step and set
+        with WIND_OVERRIDE, hence a step is not affected by region changes
+        of other steps. Barriers run with the environment of the job and
+        modify the region of the mapset.
+
+        The first error stops the scheduling of new steps, the running steps
+        are finished and the error is raised.
+
+        Args:
+            run_func (function): The function that runs a step, called with
+                                 the step as argument. The environment of a
+                                 Process is set in its env attribute.
+            max_parallel (int): The maximum number of concurrent steps
+            mapset_path (str): The path of the mapset the steps run in
+            env (dict): The environment the step environments are derived
+                        from, the environment of this process by default
+
+        Returns:
+            list:
+            The results of run_func in the order of the process list
+        """
+        results = [None] * len(self.process_list)
+        if max_parallel <= 1:
+            for index, step in enumerate(self.process_list):
+                results[index] = run_func(step)
+            return results
+
+        done = set()
+        started = set()
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            while True:
+                if error is None:
+                    for index, step in enumerate(self.process_list):
+                        if len(running) >= max_parallel:
+                            break
+                        if index in started or not self.dependencies[
+                            index
+                        ].issubset(done):
+                            continue
+                        started.add(index)
+                        region = None
+                        if isinstance(step, Process):
+                            region = self._set_step_environment(
+                                index, step, mapset_path, env
+                            )
+                        future = executor.submit(run_func, step)
+                        running[future] = (index, region)
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index, region = running.pop(future)
+                    if region is not None:
+                        _remove_file(region)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                    done.add(index)
+
+        if error is not None:
+            raise error
+        return results
+
+    def _set_step_environment(self, index, process, mapset_path, env):
+        """Set the environment of a process and create its region
+
+        Returns:
+            str:
+            The path of the created region file, None if no region was
+            created
+        """
+        step_env = dict(os.environ if env is None else env)
+        region = None
+        wind = os.path.join(mapset_path, "WIND") if mapset_path else None
+        if (
+            wind is not None
+            and not self.is_barrier(process)
+            and os.path.isfile(wind)
+        ):
+            name = "%s%i" % (STEP_REGION_PREFIX, index)
+            windows = os.path.join(mapset_path, "windows")
+            os.makedirs(windows, exist_ok=True)
+            region = os.path.join(windows, name)
+            shutil.copyfile(wind, region)
+            step_env["WIND_OVERRIDE"] = name
+        else:
+            step_env.pop("WIND_OVERRIDE", None)
+        process.env = step_env
+        return region
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
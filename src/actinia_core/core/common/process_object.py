@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,9 +14,13 @@
 Kvdb server interface for API logging
 """
 
+import io
+
+from .process_stream import SpooledOutput
+
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
@@ -35,6 +39,11 @@ class Process(object):
         param_stdin_sources=None,
         skip_permission_check=False,
         id=None,
+        inputs=None,
+        outputs=None,
+        depends_on=None,
+        barrier=False,
+        stdout_parser=None,
     ):
         """
 
@@ -56,6 +65,19 @@ class Process(object):
                                             contain module he has no
                                             permissions to use.
             id (str): The unique id of the process
+            inputs (set): The names of the maps and files that are read by
+                          the process, None if unknown
+            outputs (set): The names of the maps and files that are written
+                           by the process, None if unknown
+            depends_on (set): The ids of processes that must finish before
+                              this process starts
+            barrier (boolean): Run the process after all previous and before
+                               all following processes, e.g. because it
+                               changes the region. Processes with unknown
+                               inputs or outputs are always barriers.
+            stdout_parser (dict): The stdout definition of the process chain
+                                  with id, format and delimiter entries, if
+                                  the stdout should be parsed
         """
 
         self.exec_type = exec_type
@@ -70,6 +92,14 @@ class Process(object):
         self.stderr = None
         self.skip_permission_check = skip_permission_check
         self.id = id
+        self.inputs = inputs
+        self.outputs = outputs
+        self.depends_on = set(depends_on or ())
+        self.barrier = barrier
+        self.stdout_parser = stdout_parser
+        # The environment the process should be run with, None to use the
+        # environment of the current process
+        self.env = None
 
     def set_stdouts(self, stdout, stderr):
         """Set the content of stdout and stderr of this process
@@ -77,17 +107,32 @@ class Process(object):
         Set this after the process has finished.
 
         Args:
-            stdout: The stdout string of this process
-            stderr: The stderr string of this process
+            stdout: The stdout string or SpooledOutput of this process
+            stderr: The stderr string or SpooledOutput of this process
         """
         self.stdout = stdout
         self.stderr = stderr
 
     def get_stdout(self):
-        return self.stdout
+        return _get_string(self.stdout)
 
     def get_stderr(self):
-        return self.stderr
+        return _get_string(self.stderr)
+
+    def open_stdout(self):
+        """Return a binary file object that reads stdout from the start
+
+        A spilled stdout is read from its temporary file and is not loaded
+        into memory, hence the file object can be used as stdin of a
+        following process.
+
+        Returns:
+            file:
+            The binary file object, the caller must close it
+        """
+        if isinstance(self.stdout, SpooledOutput):
+            return self.stdout.open()
+        return io.BytesIO((self.stdout or "").encode())
 
     def __str__(self):
         return (
@@ -97,3 +142,9 @@ class Process(object):
             + " "
             + str(self.executable_params)
         )
+
+
+def _get_string(output):
+    if isinstance(output, SpooledOutput):
+        return output.getvalue()
+    return output
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2025 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -29,6 +29,7 @@ from threading import Thread, Lock
 import atexit
 from actinia_core.core.resources_logger import ResourceLogger
 from actinia_core.core.logging_interface import log
+from actinia_core.core.usage_accounting import run_job
 
 has_fluent = False
 
@@ -44,7 +45,7 @@ except Exception:
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Carmen Tawalika, Anika Weinmann"
-__copyright__ = "Copyright 2016-2025, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 
 process_queue = Queue()
 process_queue_manager = None
@@ -147,7 +148,7 @@ class EnqueuedProcess(object):
     """
 
     def __init__(self, func, timeout, resource_logger, args):
-        self.process = Process(target=func, args=args)
+        self.process = Process(target=run_job, args=(func, *args))
         self.timeout = timeout
         self.config = args[0].config
         self.resource_id = args[0].resource_id
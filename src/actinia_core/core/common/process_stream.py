@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Streaming of process outputs with bounded memory
+
+The stdout and stderr of a process are read incrementally from its pipes.
+Only the first bytes are kept in memory, larger outputs are spilled to a
+temporary file. Stdout parsers consume the output line by line while the
+process is running.
+"""
+
+import codecs
+import io
+import json
+import os
+import signal
+import tempfile
+from threading import Thread
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from .config import global_config
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The number of bytes that are read from a pipe at once
+CHUNK_SIZE = 64 * 1024
+
+# The supported formats of the stdout parser
+STDOUT_PARSER_FORMATS = ("table", "list", "kv", "json")
+
+
+class SpooledOutput(object):
+    """The stdout or stderr of a process
+
+    The output is kept in memory up to memory_limit bytes, larger outputs
+    are moved to a temporary file that is removed when the output is closed
+    or garbage collected.
+    """
+
+    def __init__(self, memory_limit=None, directory=None):
+        """
+        Args:
+            memory_limit (int): The number of bytes that are kept in memory,
+                                STDOUT_MEMORY_LIMIT of the configuration by
+                                default
+            directory (str): The directory of the temporary file, the
+                             default temporary directory if None
+        """
+        if memory_limit is None:
+            memory_limit = global_config.STDOUT_MEMORY_LIMIT
+        self.memory_limit = memory_limit
+        self.directory = directory
+        self.size = 0
+        self._buffer = bytearray()
+        self._file = None
+
+    @property
+    def spilled(self):
+        """True if the output was moved to a temporary file"""
+        return self._file is not None
+
+    @property
+    def path(self):
+        """The path of the temporary file, None if the output is in memory"""
+        return self._file.name if self._file is not None else None
+
+    def write(self, data):
+        """Append bytes to the output
+
+        Args:
+            data (bytes): The bytes to append
+        """
+        if (
+            self._file is None
+            and len(self._buffer) + len(data) > self.memory_limit
+        ):
+            self._file = tempfile.NamedTemporaryFile(
+                mode="w+b", dir=self.directory, prefix="actinia_output_"
+            )
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        if self._file is not None:
+            self._file.write(data)
+        else:
+            self._buffer.extend(data)
+        self.size += len(data)
+
+    def consume(self, pipe, parser=None):
+        """Read a pipe until it is closed
+
+        Args:
+            pipe: A binary file object, e.g. the stdout of a subprocess
+            parser (StdoutParser): A parser that is fed with the decoded
+                                   output while it is read
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        read = getattr(pipe, "read1", pipe.read)
+        error = None
+        while True:
+            data = read(CHUNK_SIZE)
+            if not data:
+                break
+            self.write(data)
+            if parser is not None and error is None:
+                try:
+                    parser.feed(decoder.decode(data))
+                except AsyncProcessError as e:
+                    # The pipe is read to the end, hence the process is not
+                    # blocked by a full pipe
+                    error = e
+        if self._file is not None:
+            self._file.flush()
+        if error is not None:
+            raise error
+        if parser is not None:
+            parser.feed(decoder.decode(b"", final=True))
+
+    def open(self):
+        """Return a binary file object that reads the output from the start
+
+        Spilled outputs are read from the temporary file, hence the returned
+        file object can be used as stdin of another process.
+
+        Returns:
+            file:
+            The binary file object, the caller must close it
+        """
+        if self._file is not None:
+            self._file.flush()
+            return open(self._file.name, "rb")
+        return io.BytesIO(bytes(self._buffer))
+
+    def getvalue(self, size=None):
+        """Return the output as string
+
+        Args:
+            size (int): The maximum number of bytes that are returned, the
+                        complete output if None
+
+        Returns:
+            str:
+            The decoded output
+        """
+        with self.open() as f:
+            data = f.read() if size is None else f.read(size)
+        return data.decode(errors="replace")
+
+    def close(self):
+        """Remove the temporary file and the buffered output"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer = bytearray()
+
+    def __str__(self):
+        return self.getvalue()
+
+
+class OutputReader(Thread):
+    """Read the stdout or stderr pipe of a running process into a
+    SpooledOutput in a background thread
+
+    The pipe is closed when it was read to the end. An error of the parser
+    is stored in the error attribute.
+    """
+
+    def __init__(self, pipe, output, parser=None):
+        """
+        Args:
+            pipe: The binary file object of the read end of the pipe
+            output (SpooledOutput): The output that receives the data
+            parser (StdoutParser): A parser that is fed with the output
+        """
+        Thread.__init__(self, daemon=True)
+        self.pipe = pipe
+        self.output = output
+        self.parser = parser
+        self.error = None
+
+    def run(self):
+        try:
+            self.output.consume(self.pipe, self.parser)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.pipe.close()
+
+
+def create_pipe():
+    """Create an OS pipe
+
+    Returns:
+        tuple:
+        (read, write), the binary file objects of both ends of the pipe
+    """
+    read_fd, write_fd = os.pipe()
+    return open(read_fd, "rb"), open(write_fd, "wb")
+
+
+class StdoutParser(object):
+    """Incremental parser of the stdout of a process
+
+    Rows are parsed as soon as they are complete, hence the table, list and
+    kv results grow while the process is running. The results equal the
+    results of parsing the complete output at once: leading and trailing
+    empty rows are removed, each row is stripped. The json format requires
+    the complete output and is parsed when the parser is closed.
+    """
+
+    def __init__(self, format, delimiter):
+        """
+        Args:
+            format (str): The format of the output: table, list, kv or json
+            delimiter (str): The delimiter of the values of a row
+        """
+        if format not in STDOUT_PARSER_FORMATS:
+            raise AsyncProcessError("Wrong stdout parser format")
+        self.format = format
+        self.delimiter = delimiter
+        self.result = {} if format == "kv" else []
+        self._rest = ""
+        self._empty_rows = 0
+        self._started = False
+        self._text = []
+
+    @classmethod
+    def from_definition(cls, stdout_def):
+        """Create a parser of a stdout definition of a process chain
+
+        Args:
+            stdout_def (dict): The stdout definition with id, format and
+                               delimiter entries
+
+        Returns:
+            StdoutParser:
+            The parser
+        """
+        return cls(stdout_def["format"], stdout_def["delimiter"])
+
+    def feed(self, text):
+        """Parse the complete rows of a part of the output
+
+        Args:
+            text (str): The next part of the output
+        """
+        if self.format == "json":
+            self._text.append(text)
+            return
+        rows = (self._rest + text).split("\n")
+        self._rest = rows.pop()
+        for row in rows:
+            self._add_row(row)
+
+    def close(self):
+        """Parse the remaining output
+
+        Returns:
+            The parser result
+        """
+        if self.format == "json":
+            self.result = _parse_json("".join(self._text), self.delimiter)
+            self._text = []
+            return self.result
+        if self._rest:
+            self._add_row(self._rest)
+            self._rest = ""
+        if not self._started:
+            # An empty output results in a single empty row
+            self._append("")
+            self._started = True
+        return self.result
+
+    def _add_row(self, row):
+        row = row.strip()
+        if not row:
+            # Empty rows are added if a non-empty row follows
+            if self._started:
+                self._empty_rows += 1
+            return
+        for _ in range(self._empty_rows):
+            self._append("")
+        self._empty_rows = 0
+        self._started = True
+        self._append(row)
+
+    def _append(self, row):
+        if self.format == "table":
+            self.result.append(
+                [value.strip() for value in row.split(self.delimiter)]
+            )
+        elif self.format == "list":
+            self.result.append(row)
+        else:
+            if self.delimiter not in row:
+                raise AsyncProcessError(
+                    "Unable to parse the stdout row <%s> as key/value pair"
+                    % row[:100]
+                )
+            key, value = row.split(self.delimiter, 1)
+            self.result[key.strip()] = value.strip()
+
+
+def _parse_json(stdout, delimiter):
+    result = None
+    try:
+        result = {
+            i[0]: i[1]
+            for i in [
+                entry.split(delimiter, 1)
+                for entry in stdout.strip("\n").split("\n")
+            ]
+        }
+    except Exception:
+        try:
+            result = json.loads(stdout)
+        except Exception:
+            pass
+    if not result:
+        result = stdout
+    return result
+
+
+class PipelineProcess(object):
+    """The processes of a pipeline, the stdout of each process is connected
+    to the stdin of the next process with an OS pipe
+
+    The object provides the subset of the subprocess.Popen interface that
+    is used to wait for and terminate processes. The pipeline finished if
+    all processes finished.
+    """
+
+    def __init__(self, processes):
+        """
+        Args:
+            processes (list): The started processes in the order of the
+                              pipeline
+        """
+        self.processes = processes
+        self.returncode = None
+
+    @property
+    def returncodes(self):
+        """The return codes of the processes"""
+        return [proc.returncode for proc in self.processes]
+
+    def poll(self):
+        """Check if all processes finished
+
+        Returns:
+            int:
+            The return code of the pipeline, 0 if the pipeline was
+            successful, None if a process is running
+        """
+        if None in [proc.poll() for proc in self.processes]:
+            return None
+        returncodes = self.returncodes
+        if is_pipeline_success(returncodes):
+            self.returncode = 0
+        else:
+            self.returncode = next(
+                returncode
+                for returncode in reversed(returncodes)
+                if returncode != 0
+            )
+        return self.returncode
+
+    def kill(self):
+        """Kill all running processes"""
+        for proc in self.processes:
+            if proc.poll() is None:
+                proc.kill()
+
+    def wait(self):
+        """Wait for all processes
+
+        Returns:
+            int:
+            The return code of the pipeline
+        """
+        for proc in self.processes:
+            proc.wait()
+        return self.poll()
+
+
+def is_pipeline_success(returncodes):
+    """Check the return codes of a pipeline
+
+    Processes that were terminated by SIGPIPE, because the following
+    process did not read their complete output, are successful if the last
+    process was successful.
+
+    Args:
+        returncodes (list): The return codes of the processes
+
+    Returns:
+        bool:
+        True if the pipeline was successful
+    """
+    return returncodes[-1] == 0 and all(
+        returncode in (0, -signal.SIGPIPE) for returncode in returncodes[:-1]
+    )
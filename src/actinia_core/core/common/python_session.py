@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Persistent Python session for Python based GRASS modules
+
+A long-lived Python worker imports grass.script and grass.temporal once per
+job. Each Python module is run with runpy in a process forked from the
+worker, with its own argv, environment, working directory and stdio. Compiled
+modules are not run by the session.
+"""
+
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The maximum size of a request message that contains argv and environment
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+# The return code of a module whose session worker died
+WORKER_DIED_RETURNCODE = 255
+
+# The worker imports the GRASS Python libraries once and forks a process
+# for each request. Requests are received with the file descriptors of the
+# result socket and of stdin, stdout and stderr of the module. The pid and
+# the return code of the module are sent to the result socket.
+_WORKER_SCRIPT = """
+import json, os, runpy, select, signal, socket, sys, traceback
+
+for name in ("grass.script", "grass.temporal"):
+    try:
+        __import__(name)
+    except Exception:
+        pass
+
+control = socket.socket(fileno=int(sys.argv[1]))
+wakeup_r, wakeup_w = os.pipe()
+os.set_blocking(wakeup_w, False)
+signal.set_wakeup_fd(wakeup_w)
+signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+running = {}
+
+
+def run(request, fds):
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for fd in (control.fileno(), wakeup_r, wakeup_w, fds[0]):
+        os.close(fd)
+    for result in running.values():
+        result.close()
+    for target, fd in enumerate(fds[1:]):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    sys.argv = request["argv"]
+    sys.path.insert(0, os.path.dirname(request["argv"][0]))
+    code = 0
+    try:
+        runpy.run_path(request["argv"][0], run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    os._exit(code)
+
+
+def reap():
+    while running:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        result = running.pop(pid, None)
+        if result is not None:
+            code = os.waitstatus_to_exitcode(status)
+            try:
+                result.send(b"exit %i" % code)
+            except OSError:
+                pass
+            result.close()
+
+
+while True:
+    readable, _, _ = select.select([control, wakeup_r], [], [])
+    if wakeup_r in readable:
+        os.read(wakeup_r, 4096)
+        reap()
+    if control not in readable:
+        continue
+    data, fds, _, _ = socket.recv_fds(control, int(sys.argv[2]), 4)
+    if not data:
+        break
+    pid = os.fork()
+    if pid == 0:
+        run(json.loads(data), fds)
+    running[pid] = socket.socket(fileno=fds[0])
+    for fd in fds[1:]:
+        os.close(fd)
+    running[pid].send(b"pid %i" % pid)
+    reap()
+
+for pid, result in running.items():
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    result.close()
+"""
+
+
+def is_python_script(path, _cache={}):
+    """Check if an executable is a Python script by its shebang line
+
+    Args:
+        path (str): The path of the executable
+
+    Returns:
+        bool:
+        True if the file starts with a Python shebang
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    key = (path, stat.st_mtime_ns, stat.st_ino)
+    if key not in _cache:
+        try:
+            with open(path, "rb") as f:
+                first_line = f.readline(256)
+        except OSError:
+            return False
+        _cache[key] = first_line.startswith(b"#!") and b"python" in first_line
+    return _cache[key]
+
+
+class SessionProcess(object):
+    """A module that is run by the Python session
+
+    The object provides the subset of the subprocess.Popen interface that
+    is used to wait for and terminate GRASS modules.
+    """
+
+    def __init__(self, args, result_socket):
+        """
+        Args:
+            args (list): The module path and its arguments
+            result_socket (socket.socket): The socket that receives the pid
+                                           and the return code
+        """
+        self.args = args
+        self.returncode = None
+        self._result = result_socket
+        message = self._result.recv(64)
+        if not message.startswith(b"pid "):
+            self._result.close()
+            raise OSError("The Python session did not start the module")
+        self.pid = int(message.split()[1])
+
+    def _receive(self, timeout):
+        readable, _, _ = select.select([self._result], [], [], timeout)
+        if not readable:
+            return
+        message = self._result.recv(64)
+        if message.startswith(b"exit "):
+            self.returncode = int(message.split()[1])
+        else:
+            self.returncode = WORKER_DIED_RETURNCODE
+        self._result.close()
+
+    def poll(self):
+        """Return the return code or None if the module is running"""
+        if self.returncode is None:
+            self._receive(0)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """Wait for the module to finish
+
+        Args:
+            timeout (float): The number of seconds to wait, no timeout if None
+
+        Raises:
+            subprocess.TimeoutExpired: If the module is still running
+
+        Returns:
+            int:
+            The return code
+        """
+        if self.returncode is None:
+            self._receive(timeout)
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def send_signal(self, signum):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class PythonSession(object):
+    """A long-lived Python worker that runs Python based GRASS modules
+
+    The worker is started with the first module and stopped with close().
+    If the worker died, it is restarted with the next module.
+    """
+
+    def __init__(self, interpreter=None):
+        """
+        Args:
+            interpreter (str): The Python interpreter of the worker, the
+                               GRASS_PYTHON environment variable or the
+                               current interpreter if None
+        """
+        if interpreter is None:
+            interpreter = os.getenv("GRASS_PYTHON") or sys.executable
+        self.interpreter = interpreter
+        self._worker = None
+        self._control = None
+        self._lock = threading.Lock()
+
+    def _start(self, env):
+        control, worker_control = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        with worker_control:
+            self._worker = subprocess.Popen(
+                [
+                    self.interpreter,
+                    "-c",
+                    _WORKER_SCRIPT,
+                    str(worker_control.fileno()),
+                    str(MAX_MESSAGE_SIZE),
+                ],
+                pass_fds=(worker_control.fileno(),),
+                stdin=subprocess.DEVNULL,
+                env=env,
+            )
+        self._control = control
+
+    def run(self, args, stdin=None, stdout=None, stderr=None, env=None):
+        """Run a Python module in the session
+
+        Args:
+            args (list): The path of the Python module and its arguments
+            stdin (file): A file object that provides stdin, /dev/null
+                          if None
+            stdout (file): A file object that receives stdout
+            stderr (file): A file object that receives stderr
+            env (dict): The environment of the module, the current
+                        environment if None
+
+        Returns:
+            SessionProcess:
+            The running module
+        """
+        if env is None:
+            env = dict(os.environ)
+        request = json.dumps(
+            {"argv": list(args), "env": env, "cwd": os.getcwd()}
+        ).encode()
+        if len(request) > MAX_MESSAGE_SIZE:
+            raise OSError("The Python session request is too large")
+
+        result, worker_result = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        with open(os.devnull, "r+b") as devnull, worker_result:
+            fds = [worker_result.fileno()]
+            for stream in (stdin, stdout, stderr):
+                if stream is None or isinstance(stream, int):
+                    stream = devnull
+                fds.append(stream.fileno())
+            with self._lock:
+                if self._worker is None or self._worker.poll() is not None:
+                    self.close()
+                    self._start(env)
+                try:
+                    socket.send_fds(self._control, [request], fds)
+                except OSError:
+                    # The worker exited but was not yet reaped
+                    self.close()
+                    self._start(env)
+                    socket.send_fds(self._control, [request], fds)
+        try:
+            return SessionProcess(args, result)
+        except OSError:
+            self.close()
+            raise
+
+    def run_with_output(self, args, env=None):
+        """Run a Python module in the session and wait for it to finish
+
+        Args:
+            args (list): The path of the Python module and its arguments
+            env (dict): The environment of the module
+
+        Returns:
+            tuple:
+            (returncode, stdout, stderr) with decoded stdout and stderr
+        """
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            returncode = self.run(args, stdout=out, stderr=err, env=env).wait()
+            out.seek(0)
+            err.seek(0)
+            return returncode, out.read().decode(), err.read().decode()
+
+    def close(self):
+        """Stop the worker, running modules are killed"""
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+        if self._worker is not None:
+            try:
+                self._worker.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._worker.kill()
+                self._worker.wait()
+            self._worker = None
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -16,17 +16,23 @@ User management
 TODO: User update must be implemented
 """
 
+from copy import deepcopy
 from passlib.apps import custom_app_context as pwd_context
 import jwt
 from datetime import datetime, timezone, timedelta
 from actinia_core.core.common.config import global_config
+from actinia_core.core.common.permissions import get_user_permissions
+from actinia_core.core.common.user_cache import (
+    user_credential_cache,
+    verified_password_cache,
+)
 from actinia_core.core.kvdb_user import kvdb_user_interface
 from actinia_core.core.common.user_base import (
     ActiniaUserBase,
 )
 
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -41,8 +47,18 @@ class ActiniaUser(ActiniaUserBase):
 
     db = kvdb_user_interface
 
+    def _cached_credentials(self):
+        """Return the shared, possibly cached credentials of the user that
+        must not be modified
+
+        Returns:
+            dict:
+            The user credentials, empty if the user does not exist
+        """
+        return user_credential_cache.get(self.user_id, self.db)
+
     def read_from_db(self):
-        creds = self.db.get_credentials(self.user_id)
+        creds = self.get_credentials()
         self.user_role = self.get_role()
         self.user_group = self.get_group()
         self.password_hash = self.get_password_hash()
@@ -76,7 +92,7 @@ class ActiniaUser(ActiniaUserBase):
         if self.user_id is None:
             return False
 
-        return self.db.exists(self.user_id)
+        return bool(self._cached_credentials())
 
     def verify_password(self, password):
         """
@@ -89,7 +105,12 @@ class ActiniaUser(ActiniaUserBase):
             bool:
             True if success, False otherwise
         """
-        return pwd_context.verify(password, self.get_password_hash())
+        return verified_password_cache.verify(
+            self.user_id,
+            password,
+            self.get_password_hash(),
+            pwd_context.verify,
+        )
 
     def get_role(self):
         """Return the role from the database
@@ -98,7 +119,7 @@ class ActiniaUser(ActiniaUserBase):
             str:
             Return the role from the database
         """
-        return self.db.get_role(self.user_id)
+        return self._cached_credentials()["user_role"]
 
     def get_group(self):
         """Return the user group from the database
@@ -107,7 +128,7 @@ class ActiniaUser(ActiniaUserBase):
             str:
             Return the user group from the database
         """
-        return self.db.get_group(self.user_id)
+        return self._cached_credentials()["user_group"]
 
     def get_credentials(self):
         """Return the user credentials as a dictionary
@@ -116,7 +137,17 @@ class ActiniaUser(ActiniaUserBase):
             dict:
             Return the user credentials as a dictionary
         """
-        return self.db.get_credentials(self.user_id)
+        return deepcopy(self._cached_credentials())
+
+    def get_permissions(self):
+        """Return the compiled permissions of the user, they are compiled
+        once per cached credentials
+
+        Returns:
+            UserPermissions:
+            The immutable permissions for access checks
+        """
+        return get_user_permissions(self._cached_credentials())
 
     def get_accessible_datasets(self):
         """Return a dictionary of project:mapset list entries
@@ -126,7 +157,7 @@ class ActiniaUser(ActiniaUserBase):
             Return a dictionary of project:mapset list entries
         """
 
-        self.permissions = self.db.get_credentials(self.user_id)["permissions"]
+        self.permissions = self.get_credentials()["permissions"]
 
         if self.permissions and "accessible_datasets" in self.permissions:
             return self.permissions["accessible_datasets"]
@@ -139,7 +170,7 @@ class ActiniaUser(ActiniaUserBase):
             Return a list of all accessible modules
         """
 
-        self.permissions = self.db.get_credentials(self.user_id)["permissions"]
+        self.permissions = self.get_credentials()["permissions"]
 
         if self.permissions and "accessible_modules" in self.permissions:
             return self.permissions["accessible_modules"]
@@ -152,7 +183,7 @@ class ActiniaUser(ActiniaUserBase):
             The value or None if nothing was found
         """
 
-        self.permissions = self.db.get_credentials(self.user_id)["permissions"]
+        self.permissions = self.get_credentials()["permissions"]
 
         if self.permissions and "cell_limit" in self.permissions:
             return self.permissions["cell_limit"]
@@ -165,7 +196,7 @@ class ActiniaUser(ActiniaUserBase):
             The value or None if nothing was found
         """
 
-        self.permissions = self.db.get_credentials(self.user_id)["permissions"]
+        self.permissions = self.get_credentials()["permissions"]
 
         if self.permissions and "process_num_limit" in self.permissions:
             return self.permissions["process_num_limit"]
@@ -178,7 +209,7 @@ class ActiniaUser(ActiniaUserBase):
             The value or None if nothing was found
         """
 
-        self.permissions = self.db.get_credentials(self.user_id)["permissions"]
+        self.permissions = self.get_credentials()["permissions"]
 
         if self.permissions and "process_time_limit" in self.permissions:
             return self.permissions["process_time_limit"]
@@ -190,7 +221,7 @@ class ActiniaUser(ActiniaUserBase):
             int:
             Return the password hash from the database
         """
-        return self.db.get_password_hash(self.user_id)
+        return self._cached_credentials()["password_hash"]
 
     def generate_api_key(self):
         """Generate an API key based on the user id
@@ -259,6 +290,8 @@ class ActiniaUser(ActiniaUserBase):
             user_role=self.user_role,
             permissions=self.permissions,
         )
+        if ret:
+            user_credential_cache.invalidate(self.user_id, self.db)
         return ret
 
     def update(self):
@@ -291,6 +324,7 @@ class ActiniaUser(ActiniaUserBase):
             user_role=self.user_role,
             permissions=self.permissions,
         )
+        user_credential_cache.invalidate(self.user_id, self.db)
         return ret
 
     def hash_password(self, password):
@@ -321,7 +355,9 @@ class ActiniaUser(ActiniaUserBase):
         """
 
         if self.exists():
-            return self.db.delete(self.user_id)
+            ret = self.db.delete(self.user_id)
+            user_credential_cache.invalidate(self.user_id, self.db)
+            return ret
 
         return False
 
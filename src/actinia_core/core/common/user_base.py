@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -15,9 +15,10 @@ User management base
 """
 
 from actinia_core.core.common.config import global_config
+from actinia_core.core.common.permissions import get_user_permissions
 
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -328,3 +329,12 @@ class ActiniaUserBase(object):
 
     def get_id(self):
         return self.user_id
+
+    def get_permissions(self):
+        """Return the compiled permissions of the user
+
+        Returns:
+            UserPermissions:
+            The immutable permissions for access checks
+        """
+        return get_user_permissions(self.get_credentials())
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+In-process caches of user credentials with kvdb pub/sub invalidation and of
+verified passwords
+"""
+
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core.logging_interface import log
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The pub/sub channel that distributes the ids of modified users
+USER_INVALIDATION_CHANNEL = "USER-INVALIDATION"
+# The message that invalidates all cached users
+INVALIDATE_ALL = "*"
+
+
+class UserCredentialCache(object):
+    """Short-TTL cache of user credentials
+
+    The credentials of a user are cached for USER_CACHE_TTL seconds. Each
+    modification of a user is published on a kvdb channel, all processes
+    that listen on this channel drop the cached credentials of the user.
+    The cache is only used while the process is subscribed to the channel,
+    otherwise all credentials are read from the kvdb server, hence
+    invalidations can never be missed.
+    """
+
+    def __init__(self, config=None):
+        self.config = config
+        self._entries = {}
+        self._lock = Lock()
+        # Incremented on each invalidation, loads that overlap with an
+        # invalidation are not cached
+        self._generation = 0
+        self._subscribed = Event()
+        self._listener = None
+        self._pid = None
+
+    @property
+    def ttl(self):
+        config = self.config if self.config is not None else global_config
+        return config.USER_CACHE_TTL
+
+    def get(self, user_id, db):
+        """Return the credentials of a user from the cache or the kvdb server
+
+        Args:
+            user_id (str): The user id
+            db (KvdbUserInterface): The connected user database interface
+
+        Returns:
+            dict:
+            The user credentials, an empty dict if the user does not exist.
+            The returned dict is shared and must not be modified.
+        """
+        if not self.ttl or self.ttl <= 0:
+            return db.get_credentials(user_id)
+
+        self._start_listener(db)
+        if not self._subscribed.is_set():
+            return db.get_credentials(user_id)
+
+        now = time.monotonic()
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        generation = self._generation
+        creds = db.get_credentials(user_id)
+        if creds:
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[user_id] = (now + self.ttl, creds)
+        return creds
+
+    def invalidate(self, user_id, db=None):
+        """Drop the credentials of a user from the cache and publish the
+        invalidation to all other processes
+
+        Args:
+            user_id (str): The user id, INVALIDATE_ALL to drop all users
+            db (KvdbUserInterface): The connected user database interface,
+                                    nothing is published if None
+        """
+        self._drop(user_id)
+        if db is not None and db.kvdb_server is not None:
+            try:
+                db.kvdb_server.publish(USER_INVALIDATION_CHANNEL, user_id)
+            except Exception as e:
+                log.error(
+                    "Unable to publish the invalidation of user <%s>: %s"
+                    % (user_id, str(e))
+                )
+
+    def clear(self):
+        """Drop all cached credentials of this process"""
+        self._drop(INVALIDATE_ALL)
+
+    def _drop(self, user_id):
+        with self._lock:
+            self._generation += 1
+            if user_id == INVALIDATE_ALL:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def _start_listener(self, db):
+        """Start the listener thread once per process"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            # Entries and subscription state of a parent process are not
+            # valid in a forked child
+            self._entries.clear()
+            self._generation += 1
+            self._subscribed = Event()
+            self._listener = Thread(
+                target=self._run,
+                args=(db, self._subscribed),
+                name="UserCredentialCacheListener",
+                daemon=True,
+            )
+            self._pid = pid
+            self._listener.start()
+
+    def _run(self, db, subscribed):
+        """Receive invalidation messages and reconnect on errors"""
+        while True:
+            pubsub = None
+            try:
+                pubsub = db.kvdb_server.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(USER_INVALIDATION_CHANNEL)
+                # Invalidations may have been missed while not subscribed
+                self.clear()
+                subscribed.set()
+                for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    user_id = message["data"]
+                    if isinstance(user_id, bytes):
+                        user_id = user_id.decode()
+                    self._drop(user_id)
+            except Exception as e:
+                log.warning(
+                    "User credential cache lost its subscription: %s" % str(e)
+                )
+            finally:
+                subscribed.clear()
+                self.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(1)
+
+
+class VerifiedPasswordCache(object):
+    """Bounded cache of successful password verifications
+
+    Verifying a password against its hash is deliberately slow. If enabled
+    with BASIC_AUTH_CACHE, successful verifications are cached for
+    BASIC_AUTH_CACHE_TTL seconds. The key is a HMAC of user id and password
+    with the secret key of the server, hence the cache contains no
+    passwords. An entry is only valid for the password hash it was verified
+    with, a changed password hash invalidates it. At most
+    BASIC_AUTH_CACHE_SIZE entries are kept, the least recently used entries
+    are removed first.
+    """
+
+    def __init__(self, config=None):
+        self.config = config
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def _get_config(self):
+        return self.config if self.config is not None else global_config
+
+    def _digest(self, user_id, password):
+        return hmac.new(
+            str(self._get_config().SECRET_KEY).encode(),
+            ("%s\0%s" % (user_id, password)).encode(),
+            hashlib.sha256,
+        ).digest()
+
+    def verify(self, user_id, password, password_hash, verify_func):
+        """Verify a password, use a cached verification if possible
+
+        Args:
+            user_id (str): The user id
+            password (str): The password to verify
+            password_hash (str): The current password hash of the user
+            verify_func (function): The function that verifies the password
+                                    with the hash, called as
+                                    verify_func(password, password_hash)
+
+        Returns:
+            bool:
+            True if the password is valid, False otherwise
+        """
+        config = self._get_config()
+        if config.BASIC_AUTH_CACHE is not True or password is None:
+            return verify_func(password, password_hash)
+
+        key = self._digest(user_id, password)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now and hmac.compare_digest(
+                    entry[1], password_hash
+                ):
+                    self._entries.move_to_end(key)
+                    return True
+                del self._entries[key]
+
+        if not verify_func(password, password_hash):
+            return False
+
+        with self._lock:
+            self._entries[key] = (
+                now + config.BASIC_AUTH_CACHE_TTL,
+                password_hash,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > config.BASIC_AUTH_CACHE_SIZE:
+                self._entries.popitem(last=False)
+        return True
+
+    def clear(self):
+        """Drop all cached verifications"""
+        with self._lock:
+            self._entries.clear()
+
+
+# The credential cache of this process
+user_credential_cache = UserCredentialCache()
+# The cache of verified passwords of this process
+verified_password_cache = VerifiedPasswordCache()
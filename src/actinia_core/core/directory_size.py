@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Incremental size of directory trees
+
+The size of the files directly in a directory is cached with the
+modification time of the directory. Creating, removing or renaming a file
+changes the modification time of its directory, so only the directories
+that changed are scanned again. GRASS GIS writes new map files through a
+rename, but modifies some files in place, these files are stat'ed on
+every call.
+"""
+
+import os
+from threading import Lock
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The names of files that are modified in place, which does not change the
+# modification time of their directory
+VOLATILE_FILE_NAMES = ("sqlite.db", "WIND", "VAR")
+
+# The maximum number of cached directories
+MAX_CACHED_DIRECTORIES = 200000
+
+
+class _DirectoryEntry(object):
+    """The cached content of a single directory"""
+
+    __slots__ = ("key", "links", "size", "subdirs", "volatile")
+
+    def __init__(self, key, size, subdirs, volatile, links):
+        # The inode and modification time of the directory
+        self.key = key
+        # The size of the files that are not volatile
+        self.size = size
+        # The names of the subdirectories
+        self.subdirs = subdirs
+        # The names of the volatile files
+        self.volatile = volatile
+        # The (inode, size) of the files with several hardlinks
+        self.links = links
+
+
+class DirectorySizeTracker(object):
+    """Compute the size of directory trees with a cache per directory
+
+    The trees are walked iteratively, the stat results of os.scandir() are
+    reused. A directory whose inode and modification time did not change
+    since the last call is not read again. Hardlinks to its files that were
+    created later are noticed when the directory changes.
+    """
+
+    def __init__(
+        self,
+        volatile_names=VOLATILE_FILE_NAMES,
+        max_entries=MAX_CACHED_DIRECTORIES,
+    ):
+        """Init method for DirectorySizeTracker class
+
+        Args:
+            volatile_names (tuple): The names of the files that are stat'ed
+                                    on every call
+            max_entries (int): The maximum number of cached directories
+        """
+        self.volatile_names = frozenset(volatile_names)
+        self.max_entries = max_entries
+        self._cache = {}
+        self._lock = Lock()
+
+    def _scan_directory(self, path, key):
+        """Read a directory and create its cache entry"""
+        size = 0
+        subdirs = []
+        volatile = []
+        links = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name in self.volatile_names:
+                        volatile.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_nlink > 1:
+                            links.append((st.st_ino, st.st_size))
+                        else:
+                            size += st.st_size
+                except OSError:
+                    # The entry was removed while the directory was read
+                    pass
+        return _DirectoryEntry(
+            key, size, tuple(subdirs), tuple(volatile), tuple(links)
+        )
+
+    def get_size(self, path, count_links_once=False):
+        """Return the size of all files in a directory tree
+
+        Symbolic links are not followed.
+
+        Args:
+            path (str): The path of the directory, the size of a file is
+                        returned if it is a file
+            count_links_once (bool): Count files with several hardlinks in
+                                     the tree only once
+
+        Returns:
+            int:
+            The size in bytes, 0 if the path does not exist
+        """
+        path = os.path.normpath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0
+        if not os.path.isdir(path):
+            return st.st_size
+
+        total = 0
+        links = {}
+        visited = set()
+        changed = False
+        with self._lock:
+            dirs = [path]
+            while dirs:
+                current = dirs.pop()
+                try:
+                    st = os.stat(current)
+                    key = (st.st_ino, st.st_mtime_ns)
+                    entry = self._cache.get(current)
+                    if entry is None or entry.key != key:
+                        entry = self._scan_directory(current, key)
+                        self._cache[current] = entry
+                        changed = True
+                except OSError:
+                    # The directory was removed or can not be read
+                    self._cache.pop(current, None)
+                    continue
+                visited.add(current)
+                total += entry.size
+                for name in entry.volatile:
+                    try:
+                        st = os.lstat(os.path.join(current, name))
+                    except OSError:
+                        continue
+                    if count_links_once and st.st_nlink > 1:
+                        links[st.st_ino] = st.st_size
+                    else:
+                        total += st.st_size
+                if count_links_once:
+                    links.update(entry.links)
+                else:
+                    total += sum(size for _, size in entry.links)
+                dirs.extend(
+                    os.path.join(current, name) for name in entry.subdirs
+                )
+            # Removed subdirectories change the directory that contained them
+            if changed:
+                self._prune(path, visited)
+        return total + sum(links.values())
+
+    def _prune(self, path, visited):
+        """Remove the cache entries of removed directories of a tree"""
+        prefix = path + os.sep
+        for cached in [
+            cached
+            for cached in self._cache
+            if cached.startswith(prefix) and cached not in visited
+        ]:
+            del self._cache[cached]
+        if len(self._cache) > self.max_entries:
+            self._cache.clear()
+
+    def invalidate(self, path=None):
+        """Remove the cache entries of a directory tree
+
+        Args:
+            path (str): The path of the directory, all entries if None
+        """
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            path = os.path.normpath(path)
+            prefix = path + os.sep
+            for cached in [
+                cached
+                for cached in self._cache
+                if cached == path or cached.startswith(prefix)
+            ]:
+                del self._cache[cached]
+
+
+# The directory size tracker of this process
+directory_size_tracker = DirectorySizeTracker()
+
+
+def get_directory_size(path, count_links_once=False):
+    """Return the size of all files in a directory tree
+
+    The size is computed incrementally with the directory size tracker of
+    this process.
+
+    Args:
+        path (str): The path of the directory
+        count_links_once (bool): Count files with several hardlinks in the
+                                 tree only once
+
+    Returns:
+        int:
+        The size in bytes, 0 if the directory does not exist
+    """
+    return directory_size_tracker.get_size(path, count_links_once)
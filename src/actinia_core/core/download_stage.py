@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Concurrent and resumable download of the import files of a process chain
+
+The download stage is run as executable of a process chain:
+
+    python -m actinia_core.core.download_stage --parallel 4 URL DEST ...
+
+Each file is downloaded into DEST.part, interrupted downloads are resumed
+with HTTP range requests. The size and, if provided by the server, the MD5
+checksum are verified before the file is moved to DEST. For each file a
+JSON line with its download state is written to stdout, hence the progress
+of all files is part of the process log of the resource.
+"""
+
+import argparse
+import base64
+import fcntl
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The suffix of partially downloaded files
+PART_SUFFIX = ".part"
+# The size of the chunks that are read from the connection
+CHUNK_SIZE = 1024 * 1024
+# Connect and read timeout in seconds
+TIMEOUT = (30, 300)
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)")
+
+
+class DownloadError(Exception):
+    """Raised if a file can not be downloaded or verified"""
+
+
+def get_expected_md5(headers, full_response=True):
+    """Return the MD5 checksum of the complete file from the HTTP headers
+
+    Content-MD5 (only for complete responses) and the md5 entry of
+    x-goog-hash (Google Cloud Storage, always the checksum of the complete
+    object) are supported.
+
+    Args:
+        headers (dict): The HTTP response headers
+        full_response (bool): True if the response contains the complete
+                              file, False for range responses
+
+    Returns:
+        str:
+        The hex encoded MD5 checksum, None if not provided
+    """
+    values = []
+    if full_response:
+        values.append(headers.get("Content-MD5"))
+    for entry in (headers.get("x-goog-hash") or "").split(","):
+        name, _, value = entry.strip().partition("=")
+        if name == "md5":
+            values.append(value)
+    for value in values:
+        if value:
+            try:
+                return base64.b64decode(value).hex()
+            except ValueError:
+                pass
+    return None
+
+
+def get_file_md5(path):
+    """Return the hex encoded MD5 checksum of a file"""
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class DownloadStage(object):
+    """Download a list of files with bounded parallelism
+
+    All downloads share a HTTP session, hence connections to the same host
+    are reused.
+    """
+
+    def __init__(
+        self,
+        download_list,
+        parallel=4,
+        retries=5,
+        session=None,
+        output=None,
+    ):
+        """
+        Args:
+            download_list (list): A list of (url, destination path) tuples
+            parallel (int): The maximum number of concurrent downloads
+            retries (int): The number of attempts to download a file
+            session (requests.Session): The HTTP session to use
+            output: The file object the JSON progress lines are written to,
+                    nothing is written if None
+        """
+        self.download_list = download_list
+        self.parallel = max(1, parallel)
+        self.retries = max(1, retries)
+        self.output = output
+        self._output_lock = Lock()
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.parallel, pool_maxsize=self.parallel
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def run(self):
+        """Download all files
+
+        Raises:
+            DownloadError: If a file can not be downloaded
+
+        Returns:
+            list:
+            The download state of each file as dict
+        """
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            futures = [
+                executor.submit(self._download_file, url, dest)
+                for url, dest in self.download_list
+            ]
+            results = []
+            errors = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except DownloadError as e:
+                    errors.append(str(e))
+        if errors:
+            raise DownloadError("; ".join(errors))
+        return results
+
+    def _report(self, state):
+        if self.output is None:
+            return
+        with self._output_lock:
+            self.output.write(json.dumps(state) + "\n")
+            self.output.flush()
+
+    def _download_file(self, url, dest):
+        """Download a single file, wait if another process downloads the
+        same file into the download cache
+        """
+        state = {
+            "url": url,
+            "file": dest,
+            "status": "cached",
+            "bytes": 0,
+            "size": None,
+            "resumed_bytes": 0,
+            "attempts": 0,
+            "seconds": 0.0,
+        }
+        start = time.time()
+        if os.path.isfile(dest):
+            state["size"] = state["bytes"] = os.path.getsize(dest)
+            self._report(state)
+            return state
+
+        part = dest + PART_SUFFIX
+        with open(part, "ab") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if not os.path.isfile(dest):
+                    self._download_part(url, part, state)
+                    os.replace(part, dest)
+                    state["status"] = "downloaded"
+                else:
+                    # Downloaded by another process while waiting for the
+                    # lock, remove the empty part file created by this one
+                    state["size"] = state["bytes"] = os.path.getsize(dest)
+                    _remove_empty_part(part, lock_file)
+            except DownloadError as e:
+                _remove_empty_part(part, lock_file)
+                state["status"] = "error"
+                state["message"] = str(e)
+                self._report(state)
+                raise
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        state["seconds"] = round(time.time() - start, 3)
+        self._report(state)
+        return state
+
+    def _download_part(self, url, part, state):
+        """Download or resume a file into the part file and verify it"""
+        error = None
+        for attempt in range(1, self.retries + 1):
+            state["attempts"] = attempt
+            if attempt > 1:
+                time.sleep(min(2 ** (attempt - 2), 30))
+            try:
+                size, md5 = self._fetch(url, part, state)
+            except requests.HTTPError as e:
+                status_code = e.response.status_code
+                if 400 <= status_code < 500 and status_code not in (408, 429):
+                    error = e
+                    break
+                error = e
+                continue
+            except (requests.RequestException, OSError) as e:
+                error = e
+                continue
+
+            length = os.path.getsize(part)
+            state["bytes"] = length
+            if size is not None and length != size:
+                error = "size is %i bytes, expected %i bytes" % (length, size)
+                continue
+            if md5 is not None and get_file_md5(part) != md5:
+                # A corrupt part file can not be resumed
+                os.truncate(part, 0)
+                error = "MD5 checksum mismatch"
+                continue
+            return
+        raise DownloadError(
+            "Unable to download <%s> after %i attempts: %s"
+            % (url, state["attempts"], str(error))
+        )
+
+    def _fetch(self, url, part, state):
+        """Run a single (range) request and append the data to the part file
+
+        Returns:
+            tuple:
+            (expected size, expected MD5 checksum) of the complete file,
+            None if unknown
+        """
+        offset = os.path.getsize(part)
+        # The file is stored as provided by the server
+        headers = {"Accept-Encoding": "identity"}
+        if offset > 0:
+            headers["Range"] = "bytes=%i-" % offset
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=TIMEOUT
+        ) as resp:
+            content_range = _CONTENT_RANGE.match(
+                resp.headers.get("Content-Range", "")
+            )
+            total = None
+            if content_range and content_range.group(3) != "*":
+                total = int(content_range.group(3))
+
+            if resp.status_code == 416:
+                # The part file is already complete or invalid
+                if total is not None and offset == total:
+                    return total, get_expected_md5(resp.headers, False)
+                os.truncate(part, 0)
+                raise OSError("Invalid range, restarting download")
+            resp.raise_for_status()
+
+            full_response = resp.status_code != 206
+            if not full_response:
+                if content_range is None or content_range.group(1) != str(
+                    offset
+                ):
+                    os.truncate(part, 0)
+                    raise OSError("Unexpected content range, restarting")
+                state["resumed_bytes"] = offset
+                mode = "ab"
+            else:
+                # The server ignored the range request
+                offset = 0
+                mode = "wb"
+                if resp.headers.get("Content-Length") is not None:
+                    total = int(resp.headers["Content-Length"])
+
+            state["size"] = total
+            md5 = get_expected_md5(resp.headers, full_response)
+            with open(part, mode) as f:
+                for chunk in resp.raw.stream(CHUNK_SIZE, decode_content=False):
+                    f.write(chunk)
+                    state["bytes"] = offset + f.tell()
+            return total, md5
+
+
+def _remove_empty_part(part, lock_file):
+    try:
+        stat = os.fstat(lock_file.fileno())
+        if stat.st_size == 0 and os.stat(part).st_ino == stat.st_ino:
+            os.remove(part)
+    except OSError:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Download files concurrently and resumable into the "
+        "download cache"
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=4,
+        help="The maximum number of concurrent downloads",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=5,
+        help="The number of attempts to download a file",
+    )
+    parser.add_argument(
+        "downloads",
+        nargs="+",
+        help="Pairs of URL and destination path",
+    )
+    args = parser.parse_args(argv)
+    if len(args.downloads) % 2 != 0:
+        parser.error("URL and destination path must be given in pairs")
+
+    download_list = list(zip(args.downloads[::2], args.downloads[1::2]))
+    stage = DownloadStage(
+        download_list,
+        parallel=args.parallel,
+        retries=args.retries,
+        output=sys.stdout,
+    )
+    try:
+        stage.run()
+    except DownloadError as e:
+        sys.stderr.write("%s\n" % str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
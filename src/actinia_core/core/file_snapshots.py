@@ -0,0 +1,597 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Snapshots of directories
+
+A snapshot is a copy of a directory that is never modified. Files that did
+not change since the previous snapshot are hardlinked from it, only changed
+files are written. They are cloned with FICLONE on file systems that
+support reflinks, otherwise they are copied. Copies can be deferred until
+the snapshot is completed, e.g. in a background thread.
+
+Each snapshot has a manifest next to it with the size, the modification
+time and, if it was computed, the hash of each file of the source
+directory. Files are only hashed if their size is unchanged but their
+modification time differs from the manifest of the previous snapshot.
+"""
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The ioctl request of Linux to clone a file (reflink)
+FICLONE = 0x40049409
+
+# The files that are not part of a snapshot
+SNAPSHOT_EXCLUDES = (".gislock",)
+
+# The errors of FICLONE if the file system does not support reflinks
+_NO_REFLINK_ERRORS = (
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+)
+
+# The devices that do not support reflinks
+_no_reflink_devices = set()
+# The devices that support reflinks
+_reflink_devices = set()
+
+# The name of the file that is cloned to check if a file system supports
+# reflinks
+REFLINK_PROBE = ".actinia_reflink_probe"
+
+# The version of the manifest format
+MANIFEST_FORMAT = 1
+
+# The suffix of the manifest file next to a snapshot
+MANIFEST_SUFFIX = ".manifest.json"
+
+# The number of threads that hash files
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# The size of the blocks that are read to hash a file
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class SnapshotStats(object):
+    """The number of files and bytes that were linked and written"""
+
+    def __init__(self):
+        self.linked_files = 0
+        self.linked_bytes = 0
+        self.written_files = 0
+        self.written_bytes = 0
+
+    def __repr__(self):
+        return "%i files (%i bytes) linked, %i files (%i bytes) written" % (
+            self.linked_files,
+            self.linked_bytes,
+            self.written_files,
+            self.written_bytes,
+        )
+
+
+def clone_file(src, dest):
+    """Copy a file with its permissions and times, as reflink if the file
+    system supports it
+
+    Args:
+        src (str): The path of the source file
+        dest (str): The path of the new file
+    """
+    dev = os.stat(os.path.dirname(dest) or ".").st_dev
+    if dev not in _no_reflink_devices:
+        try:
+            with open(src, "rb") as f_src, open(dest, "wb") as f_dest:
+                fcntl.ioctl(f_dest.fileno(), FICLONE, f_src.fileno())
+            shutil.copystat(src, dest)
+            return
+        except OSError as e:
+            if e.errno not in _NO_REFLINK_ERRORS:
+                raise
+            _no_reflink_devices.add(dev)
+    shutil.copy2(src, dest)
+
+
+def supports_reflinks(directory):
+    """Check if the file system of a directory supports reflinks
+
+    A small file is cloned once per device, the result is cached.
+
+    Args:
+        directory (str): An existing directory
+
+    Returns:
+        bool:
+        True if files can be cloned with FICLONE
+    """
+    dev = os.stat(directory).st_dev
+    if dev not in _no_reflink_devices and dev not in _reflink_devices:
+        probe = os.path.join(directory, REFLINK_PROBE)
+        try:
+            with open(probe, "wb") as f:
+                f.write(b"0")
+            clone_file(probe, probe + ".clone")
+        finally:
+            for path in (probe, probe + ".clone"):
+                if os.path.lexists(path):
+                    os.remove(path)
+        if dev not in _no_reflink_devices:
+            _reflink_devices.add(dev)
+    return dev in _reflink_devices
+
+
+def hash_file(path):
+    """Compute the BLAKE2b hash of a file
+
+    Args:
+        path (str): The path of the file
+
+    Returns:
+        str:
+        The hex digest of the file content
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_files(paths, max_workers=HASH_WORKERS):
+    """Compute the hashes of files in a thread pool
+
+    Args:
+        paths (list): The paths of the files
+        max_workers (int): The number of threads
+
+    Returns:
+        dict:
+        The hex digest of each path
+    """
+    if len(paths) < 2 or max_workers < 2:
+        return {path: hash_file(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(hash_file, paths)))
+
+
+def scan_tree(src, excludes=SNAPSHOT_EXCLUDES):
+    """List the directories, symlinks and files of a directory tree
+
+    Args:
+        src (str): The directory
+        excludes (tuple): The names of the files that are skipped
+
+    Returns:
+        dict:
+        The relative paths of the subdirectories as list "dirs", with parents
+        before their children, the targets of the symlinks as dict
+        "symlinks" and the stat results of the files as dict "files"
+    """
+    tree = {"dirs": [], "symlinks": {}, "files": {}}
+    dirs = [""]
+    while dirs:
+        rel_dir = dirs.pop()
+        with os.scandir(os.path.join(src, rel_dir)) as entries:
+            for entry in entries:
+                if entry.name in excludes:
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_symlink():
+                    tree["symlinks"][rel_path] = os.readlink(entry.path)
+                elif entry.is_dir():
+                    tree["dirs"].append(rel_path)
+                    dirs.append(rel_path)
+                else:
+                    tree["files"][rel_path] = entry.stat()
+    return tree
+
+
+def get_manifest_path(snapshot):
+    """Return the path of the manifest of a snapshot"""
+    return os.path.normpath(snapshot) + MANIFEST_SUFFIX
+
+
+def read_manifest(snapshot):
+    """Read the manifest of a snapshot
+
+    Snapshots without a valid manifest are scanned, the hashes of their
+    files are unknown.
+
+    Args:
+        snapshot (str): The directory of the snapshot
+
+    Returns:
+        dict:
+        The manifest with the lists "dirs", the dict "symlinks" and the
+        dict "files" with [size, mtime_ns, hash] of each file
+    """
+    try:
+        with open(get_manifest_path(snapshot)) as f:
+            manifest = json.load(f)
+        if manifest.get("format") == MANIFEST_FORMAT:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    tree = scan_tree(snapshot)
+    return create_manifest(tree, {})
+
+
+def create_manifest(tree, hashes):
+    """Create the manifest of a scanned directory tree
+
+    Args:
+        tree (dict): The result of scan_tree()
+        hashes (dict): The known hashes of the files by relative path
+
+    Returns:
+        dict:
+        The manifest
+    """
+    return {
+        "format": MANIFEST_FORMAT,
+        "dirs": tree["dirs"],
+        "symlinks": tree["symlinks"],
+        "files": {
+            rel_path: [st.st_size, st.st_mtime_ns, hashes.get(rel_path)]
+            for rel_path, st in tree["files"].items()
+        },
+    }
+
+
+def write_manifest(snapshot, manifest):
+    """Write the manifest of a snapshot atomically
+
+    Args:
+        snapshot (str): The directory of the snapshot
+        manifest (dict): The manifest
+    """
+    path = get_manifest_path(snapshot)
+    tmp_path = "%s.%i.tmp" % (path, os.getpid())
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def compare_files(src, tree, previous, manifest):
+    """Find the files of a directory that are unchanged since a snapshot
+
+    A file is unchanged if its size and modification time are the same as in
+    the manifest. If only the modification time differs, the hashes of the
+    file and of the file in the snapshot are compared.
+
+    Args:
+        src (str): The directory
+        tree (dict): The result of scan_tree() for src
+        previous (str): The directory of the snapshot
+        manifest (dict): The manifest of the snapshot
+
+    Returns:
+        tuple:
+        The set of the unchanged relative paths and the known hashes of
+        the files of src by relative path
+    """
+    unchanged = set()
+    hashes = {}
+    to_hash = []
+    for rel_path, st in tree["files"].items():
+        old = manifest["files"].get(rel_path)
+        if old is None or old[0] != st.st_size:
+            continue
+        if old[1] == st.st_mtime_ns:
+            unchanged.add(rel_path)
+            if old[2] is not None:
+                hashes[rel_path] = old[2]
+        else:
+            to_hash.append(rel_path)
+    if not to_hash:
+        return unchanged, hashes
+
+    paths = [os.path.join(src, rel_path) for rel_path in to_hash]
+    paths += [
+        os.path.join(previous, rel_path)
+        for rel_path in to_hash
+        if manifest["files"][rel_path][2] is None
+    ]
+    path_hashes = hash_files(paths)
+    for rel_path in to_hash:
+        new_hash = path_hashes[os.path.join(src, rel_path)]
+        old_hash = manifest["files"][rel_path][2]
+        if old_hash is None:
+            old_hash = path_hashes[os.path.join(previous, rel_path)]
+        hashes[rel_path] = new_hash
+        if new_hash == old_hash:
+            unchanged.add(rel_path)
+    return unchanged, hashes
+
+
+def compare_with_snapshot(src, snapshot, excludes=SNAPSHOT_EXCLUDES):
+    """Check if a directory has the same content as a snapshot
+
+    Args:
+        src (str): The directory
+        snapshot (str): The directory of the snapshot
+        excludes (tuple): The names of the files that are not compared
+
+    Returns:
+        bool:
+        True if the directories, symlinks and file contents are the same,
+        False otherwise or if one of the directories does not exist
+    """
+    if not os.path.isdir(src) or not os.path.isdir(snapshot):
+        return False
+    tree = scan_tree(src, excludes)
+    manifest = read_manifest(snapshot)
+    unchanged, _ = compare_files(src, tree, snapshot, manifest)
+    return _is_unchanged_tree(tree, manifest, unchanged)
+
+
+def _is_unchanged_tree(tree, manifest, unchanged):
+    """Check if all entries of a scanned tree match the manifest"""
+    return (
+        len(unchanged) == len(tree["files"])
+        and len(unchanged) == len(manifest["files"])
+        and set(tree["dirs"]) == set(manifest["dirs"])
+        and tree["symlinks"] == manifest["symlinks"]
+    )
+
+
+def remove_snapshot(snapshot):
+    """Remove a snapshot and its manifest
+
+    Args:
+        snapshot (str): The directory of the snapshot
+
+    Returns:
+        int:
+        The number of bytes that were freed, files that are linked by other
+        snapshots are not counted
+    """
+    freed = 0
+    if os.path.isdir(snapshot):
+        for st in scan_tree(snapshot, excludes=())["files"].values():
+            if st.st_nlink == 1:
+                freed += st.st_size
+        shutil.rmtree(snapshot)
+    manifest_path = get_manifest_path(snapshot)
+    if os.path.isfile(manifest_path):
+        os.remove(manifest_path)
+    return freed
+
+
+class PendingSnapshot(object):
+    """A snapshot of which the files that changed in the source directory
+    are captured
+
+    The files that are read from the source directory are cloned by
+    capture_snapshot(), except the deferred files. complete() copies the
+    deferred files from the source directory, links the unchanged files
+    from the previous snapshot, replaces cloned files with identical
+    content by links and writes the manifest. Hence the source directory
+    can be modified while the snapshot is completed, except the deferred
+    files.
+    """
+
+    def __init__(self, src, dest, previous, tree, manifest, stats):
+        self.src = src
+        self.dest = dest
+        self.previous = previous
+        self.tree = tree
+        self.manifest = manifest
+        self.stats = stats
+        self.dir_stats = []
+        # The relative paths of the changed files that are copied by
+        # complete()
+        self.deferred_files = []
+        self.completed = False
+        self._can_link = True
+
+    def complete(self):
+        """Complete the snapshot
+
+        Returns:
+            SnapshotStats:
+            The number of linked and written files and bytes
+        """
+        if self.completed:
+            return self.stats
+        for rel_path in self.deferred_files:
+            clone_file(
+                os.path.join(self.src, rel_path),
+                os.path.join(self.dest, rel_path),
+            )
+        self.deferred_files = []
+        tree = self.tree
+        unchanged = set()
+        hashes = {}
+        if self.previous is not None:
+            # The cloned files have the content of the source files
+            unchanged, hashes = compare_files(
+                self.dest, tree, self.previous, self.manifest
+            )
+        for rel_path in unchanged:
+            dest_path = os.path.join(self.dest, rel_path)
+            old_path = os.path.join(self.previous, rel_path)
+            size = tree["files"][rel_path].st_size
+            if os.path.lexists(dest_path):
+                # Replace the clone of a file with identical content
+                if self._link(old_path, dest_path + ".link"):
+                    os.replace(dest_path + ".link", dest_path)
+                    self.stats.written_files -= 1
+                    self.stats.written_bytes -= size
+                    self.stats.linked_files += 1
+                    self.stats.linked_bytes += size
+            elif self._link(old_path, dest_path):
+                self.stats.linked_files += 1
+                self.stats.linked_bytes += size
+            else:
+                clone_file(old_path, dest_path)
+                self.stats.written_files += 1
+                self.stats.written_bytes += size
+        # The times of the directories are set after their content was created
+        for rel_dir, st in reversed(self.dir_stats):
+            dest_dir = os.path.join(self.dest, rel_dir)
+            os.chmod(dest_dir, stat.S_IMODE(st.st_mode))
+            os.utime(dest_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        write_manifest(self.dest, create_manifest(tree, hashes))
+        self.completed = True
+        return self.stats
+
+    def _link(self, src, dest):
+        """Create a hardlink, return False if the file system does not
+        support it"""
+        if not self._can_link:
+            return False
+        try:
+            os.link(src, dest)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM):
+                raise
+            self._can_link = False
+            return False
+        return True
+
+
+def capture_snapshot(
+    src,
+    dest,
+    previous=None,
+    excludes=SNAPSHOT_EXCLUDES,
+    move_unchanged=False,
+    defer_copies=False,
+):
+    """Capture the changed files of a directory for a snapshot
+
+    The directories and symlinks of the snapshot are created and the files
+    whose size or modification time differs from the previous snapshot are
+    cloned from src. This is cheap on file systems with reflinks. Without
+    reflinks the files are copied, if defer_copies is set they are only
+    listed in PendingSnapshot.deferred_files. The snapshot is completed
+    with PendingSnapshot.complete(), which reads only the deferred files
+    from src.
+
+    Args:
+        src (str): The directory of which the snapshot is created
+        dest (str): The directory of the snapshot, must not exist
+        previous (str): The directory of the previous snapshot of src,
+                        None or a missing directory to copy all files
+        excludes (tuple): The names of the files that are not saved
+        move_unchanged (bool): Rename the previous snapshot to dest if src
+                               did not change since it was created
+        defer_copies (bool): Copy the changed files in complete() if the
+                             file system of dest does not support reflinks.
+                             The deferred files must not be modified in src
+                             until the snapshot is completed.
+
+    Returns:
+        PendingSnapshot:
+        The snapshot that has to be completed
+    """
+    stats = SnapshotStats()
+    tree = scan_tree(src, excludes)
+    manifest = None
+    unchanged = set()
+    if previous is not None and os.path.isdir(previous):
+        manifest = read_manifest(previous)
+        for rel_path, st in tree["files"].items():
+            old = manifest["files"].get(rel_path)
+            if old is not None and old[:2] == [st.st_size, st.st_mtime_ns]:
+                unchanged.add(rel_path)
+        if move_unchanged and _is_unchanged_tree(tree, manifest, unchanged):
+            os.rename(previous, dest)
+            # Only the manifest of the previous snapshot is left
+            remove_snapshot(previous)
+            hashes = {
+                rel_path: manifest["files"][rel_path][2]
+                for rel_path in unchanged
+                if manifest["files"][rel_path][2] is not None
+            }
+            write_manifest(dest, create_manifest(tree, hashes))
+            stats.linked_files = len(unchanged)
+            stats.linked_bytes = sum(
+                st.st_size for st in tree["files"].values()
+            )
+            pending = PendingSnapshot(src, dest, None, tree, None, stats)
+            pending.completed = True
+            return pending
+    else:
+        previous = None
+
+    pending = PendingSnapshot(src, dest, previous, tree, manifest, stats)
+    os.makedirs(dest)
+    for rel_dir in [""] + tree["dirs"]:
+        if rel_dir:
+            os.mkdir(os.path.join(dest, rel_dir))
+        pending.dir_stats.append(
+            (rel_dir, os.stat(os.path.join(src, rel_dir)))
+        )
+    for rel_path, target in tree["symlinks"].items():
+        os.symlink(target, os.path.join(dest, rel_path))
+    defer_copies = defer_copies is True and not supports_reflinks(dest)
+    for rel_path, st in tree["files"].items():
+        if rel_path in unchanged:
+            continue
+        if defer_copies:
+            pending.deferred_files.append(rel_path)
+        else:
+            clone_file(
+                os.path.join(src, rel_path), os.path.join(dest, rel_path)
+            )
+        stats.written_files += 1
+        stats.written_bytes += st.st_size
+    return pending
+
+
+def create_snapshot(
+    src,
+    dest,
+    previous=None,
+    excludes=SNAPSHOT_EXCLUDES,
+    move_unchanged=False,
+):
+    """Create a snapshot of a directory
+
+    Files that are unchanged since the previous snapshot are hardlinked
+    from the previous snapshot, all other files are cloned from src. The
+    files of src are never linked, since they may be modified in place.
+
+    Args:
+        src (str): The directory of which the snapshot is created
+        dest (str): The directory of the snapshot, must not exist
+        previous (str): The directory of the previous snapshot of src,
+                        None or a missing directory to copy all files
+        excludes (tuple): The names of the files that are not saved
+        move_unchanged (bool): Rename the previous snapshot to dest if src
+                               did not change since it was created
+
+    Returns:
+        SnapshotStats:
+        The number of linked and written files and bytes
+    """
+    return capture_snapshot(
+        src, dest, previous, excludes, move_unchanged
+    ).complete()
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -23,11 +23,11 @@ from urllib.request import urlopen
 from urllib.parse import urlsplit
 from actinia_processing_lib.exceptions import AsyncProcessError
 from actinia_core.core.common.process_object import Process
-from actinia_core.core.utils import get_wget_process, get_mv_process
+from actinia_core.core.utils import get_download_process
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Julia Haas, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -102,6 +102,8 @@ class GeoDataDownloadImportSupport(object):
         self.file_list = []
         self.copy_file_list = []
         self.import_file_info = []
+        # The (url, destination path) tuples of the files to download
+        self.download_list = []
 
     def _setup(self):
         """Setup the download cache.
@@ -179,12 +181,16 @@ class GeoDataDownloadImportSupport(object):
         """Create the process list to download, import and preprocess
         geodata project on a remote project
 
-        The downloaded files will be stored in a temporary directory. After the
-        download of all files completes, the downloaded files will be moved to
-        the download cache. This avoids broken files in case a download was
-        interrupted or stopped by termination.
+        The files are downloaded concurrently into partial files in the
+        download cache. A file is moved to its final name after its size and,
+        if provided by the server, its checksum were verified. This avoids
+        broken files in case a download was interrupted or stopped by
+        termination, interrupted downloads are resumed.
 
-        This method creates wget calls and mv calls.
+        This method creates a single download stage process for all files
+        that are not in the download cache. The files are stored in
+        download_list as well, to merge the downloads of several import
+        definitions into a single download stage.
 
         Returns:
             (download_commands, import_file_info)
@@ -199,7 +205,8 @@ class GeoDataDownloadImportSupport(object):
         if not self.copy_file_list:
             create_copy_list = True
 
-        # Create the download commands and update process chain
+        self.download_list = []
+        # Create the download list and update process chain
         for url in self.url_list:
             # Extract file name from url and create temp and cache path
             # if the copy_file_path list is empty
@@ -214,13 +221,15 @@ class GeoDataDownloadImportSupport(object):
 
             # Download file only if it does not exist in the download cache
             if os.path.isfile(dest) is False:
-                p = get_wget_process(source, url)
-                download_commands.append(p)
-                if source != dest:
-                    p = get_mv_process(source, dest)
-                    download_commands.append(p)
+                if (url, dest) not in self.download_list:
+                    self.download_list.append((url, dest))
             count += 1
 
+        if self.download_list:
+            download_commands.append(
+                get_download_process(self.download_list, self.config)
+            )
+
         # Create the import file info list
         self.import_file_info = []
 
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -19,18 +19,26 @@ import os.path
 import subprocess
 import tempfile
 import shutil
+import time
 import uuid
+from types import MappingProxyType
+from .common.config import global_config
+from .common.python_session import PythonSession, is_python_script
 from .messages_logger import MessageLogger
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
 __copyright__ = (
-    "Copyright 2016-2024, Sören Gebbert, Anika Weinmann and mundialis GmbH & "
+    "Copyright 2016-2026, Sören Gebbert, Anika Weinmann and mundialis GmbH & "
     "Co. KG"
 )
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
+# The number of seconds after which the addon directories are checked for
+# installed or removed addons, before resolved module paths are reused
+MODULE_PATH_CHECK_INTERVAL = 5
+
 
 class GrassInitError(Exception):
     """Exception that is thrown in case of a an
@@ -89,6 +97,8 @@ class GrassEnvironment(ProcessLogging):
             "GRASS_SKIP_MAPSET_OWNER_CHECK": "1",
             "GRASS_TGIS_RAISE_ON_ERROR": "1",
         }
+        # The frozen environment of the GRASS modules
+        self.process_env = None
 
     def set_grass_environment(
         self, gisrc_path, grass_gis_base, grass_addon_path
@@ -141,9 +151,37 @@ class GrassEnvironment(ProcessLogging):
                 + os.path.join(self.env["GISBASE"], "etc", "python")
             )
 
+        self.process_env = MappingProxyType(self._create_process_env())
         self.set()
         self.get()
 
+    def _merged_env(self):
+        """Return the GRASS environment variables, PATH and PYTHONPATH are
+        extended by the values of the environment of this process
+        """
+        env = {}
+        for key in self.env:
+            value = self.env[key]
+            # use self.env and environment variable values
+            if key in ["PATH", "PYTHONPATH"]:
+                origValue = os.getenv(key, None)
+                if origValue:
+                    value += ":" + origValue
+            env[key] = value
+        return env
+
+    def _create_process_env(self):
+        """Create the environment of the GRASS modules
+
+        Returns:
+            dict:
+            The environment of this process with the GRASS environment
+            variables
+        """
+        env = dict(os.environ)
+        env.update(self._merged_env())
+        return env
+
     def get(self):
         for key in self.env:
             try:
@@ -155,13 +193,7 @@ class GrassEnvironment(ProcessLogging):
                 )
 
     def set(self):
-        for key in self.env:
-            value = self.env[key]
-            # use self.env and environment variable values
-            if key in ["PATH", "PYTHONPATH"]:
-                origValue = os.getenv(key, None)
-                if origValue:
-                    value += ":" + origValue
+        for key, value in self._merged_env().items():
             try:
                 os.putenv(key, value)
                 os.environ[key] = value
@@ -286,11 +318,73 @@ class GrassWindFile(ProcessLogging):
 
 
 class GrassModuleRunner(ProcessLogging):
-    def __init__(self, grassbase, grass_addon_path):
+    # The resolved module paths of the GRASS installations and addon paths
+    # of this process
+    _module_path_cache = {}
+
+    def __init__(
+        self, grassbase, grass_addon_path, python_session=None, env=None
+    ):
+        """
+        Args:
+            grassbase (str): The installation directory of GRASS GIS
+            grass_addon_path (str): The path to GRASS GIS addons
+            python_session (PythonSession): The session that runs Python
+                                            based modules, all modules are
+                                            run as subprocess if None
+            env (dict): The environment of the modules, the environment of
+                        this process if None. Variables of the environment
+                        of this process that are set, changed or removed
+                        after the runner was created are applied to it.
+        """
         ProcessLogging.__init__(self)
 
         self.grassbase = grassbase
         self.grass_addon_path = grass_addon_path
+        self.python_session = python_session
+        self.env = env
+        # The environment of this process when the runner was created
+        self._initial_environ = dict(os.environ)
+
+    @classmethod
+    def invalidate_module_paths(cls):
+        """Remove the resolved module paths, e.g. after an addon was
+        installed or removed
+        """
+        cls._module_path_cache.clear()
+
+    def _get_env(self, env=None):
+        """Return the environment of a module
+
+        The variables of the environment of this process that changed since
+        the runner was created, e.g. COMPRESS_OVERVIEW that is set before an
+        export, are applied to the environment of the runner.
+
+        Args:
+            env (dict): The environment of the module that is used unchanged,
+                        the environment of the runner if None
+
+        Returns:
+            dict:
+            The environment of the module, None to use the environment of
+            this process
+        """
+        if env is not None or self.env is None:
+            return env
+        initial = self._initial_environ
+        changed = {
+            key: value
+            for key, value in os.environ.items()
+            if initial.get(key) != value
+        }
+        removed = [key for key in initial if key not in os.environ]
+        if not changed and not removed:
+            return self.env
+        env = dict(self.env)
+        env.update(changed)
+        for key in removed:
+            env.pop(key, None)
+        return env
 
     def _run_process(
         self,
@@ -299,6 +393,7 @@ class GrassModuleRunner(ProcessLogging):
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         stdin=subprocess.PIPE,
+        env=None,
     ):
         """This function runs a process and logs its stdout and stderr output.
         It either returns the subprocess or its error id, stderr and stdout
@@ -311,6 +406,8 @@ class GrassModuleRunner(ProcessLogging):
                            subprocess.PIPE
             stderr (file): A file object that receives stderr, default
                            subprocess.PIPE
+            env (dict): The environment of the process, the environment of
+                        the runner if None
 
         Returns:
             subprocess:
@@ -320,7 +417,11 @@ class GrassModuleRunner(ProcessLogging):
         try:
             self.log_info("Run process: " + str(inputlist))
             proc = subprocess.Popen(
-                args=inputlist, stdout=stdout, stderr=stderr, stdin=stdin
+                args=inputlist,
+                stdout=stdout,
+                stderr=stderr,
+                stdin=stdin,
+                env=self._get_env(env),
             )
             self.runPID = proc.pid
             self.log_debug("Process pid: " + str(self.runPID))
@@ -341,7 +442,122 @@ class GrassModuleRunner(ProcessLogging):
 
         return proc.returncode, stdout_buff, stderr_buff
 
+    def _use_python_session(self, grass_module_path, raw, stdout, stderr):
+        """Check if a module is run by the Python session
+
+        Only Python based modules are run by the session. Raw processes
+        are run by the session if their stdout and stderr are files, since
+        the session does not provide pipes.
+        """
+        if self.python_session is None:
+            return False
+        if raw is True and (
+            isinstance(stdout, int) or isinstance(stderr, int)
+        ):
+            return False
+        return is_python_script(grass_module_path)
+
+    def _run_session_process(
+        self, inputlist, raw, stdout, stderr, stdin, env=None
+    ):
+        """Run a Python based module in the Python session
+
+        Args:
+            inputlist (list): The module path and its arguments
+            raw (bool): If True return the SessionProcess
+            stdout (file): A file object that receives stdout
+            stderr (file): A file object that receives stderr
+            stdin (file): A file object that provides stdin
+            env (dict): The environment of the module, the environment of
+                        the runner if None
+
+        Returns:
+            SessionProcess:
+            The SessionProcess or a tuple of (errorid, stdout_buff,
+            stderr_buff)
+        """
+        env = self._get_env(env)
+        if env is not None:
+            env = dict(env)
+        try:
+            self.log_info("Run process in Python session: " + str(inputlist))
+            if raw is True:
+                if isinstance(stdin, int):
+                    stdin = None
+                proc = self.python_session.run(
+                    inputlist,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    env=env,
+                )
+                self.runPID = proc.pid
+                return proc
+            result = self.python_session.run_with_output(inputlist, env=env)
+            self.log_debug("Return code: " + str(result[0]))
+            self.log_debug(result[2])
+        except Exception:
+            raise GrassInitError(
+                "Unable to execute process: " + str(inputlist)
+            )
+        return result
+
+    def _get_addon_key(self):
+        """Return the modification times of the addon directories, that
+        change if an addon is installed or removed
+        """
+        key = []
+        for path in (
+            self.grass_addon_path,
+            os.path.join(self.grass_addon_path, "bin"),
+            os.path.join(self.grass_addon_path, "scripts"),
+        ):
+            try:
+                key.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def _get_module_paths(self):
+        """Return the resolved module paths of the GRASS installation and
+        addon path of this runner
+
+        The cache is recreated if the addon directories changed, they are
+        checked at most every MODULE_PATH_CHECK_INTERVAL seconds.
+        """
+        cache_key = (self.grassbase, self.grass_addon_path)
+        entry = self._module_path_cache.get(cache_key)
+        now = time.monotonic()
+        if (
+            entry is not None
+            and now - entry["checked"] < MODULE_PATH_CHECK_INTERVAL
+        ):
+            return entry["paths"]
+        addon_key = self._get_addon_key()
+        if entry is None or entry["addon_key"] != addon_key:
+            entry = {"addon_key": addon_key, "paths": {}}
+            self._module_path_cache[cache_key] = entry
+        entry["checked"] = now
+        return entry["paths"]
+
     def _create_grass_module_path(self, grass_module):
+        """Return the path of a grass module
+
+        The module paths are resolved once per process and reused until
+        an addon is installed or removed.
+
+        Args:
+            grass_module: The name of the module
+
+        """
+        module_paths = self._get_module_paths()
+        grass_module_path = module_paths.get(grass_module)
+        if grass_module_path is None:
+            grass_module_path = self._find_grass_module_path(grass_module)
+            module_paths[grass_module] = grass_module_path
+        return grass_module_path
+
+    def _find_grass_module_path(self, grass_module):
         """
         Create the parameter list and start the grass module. Search for grass
         modules in different grass specific directories
@@ -403,6 +619,7 @@ class GrassModuleRunner(ProcessLogging):
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         stdin=subprocess.PIPE,
+        env=None,
     ):
         """Set all input and output options and start the module
 
@@ -424,6 +641,8 @@ class GrassModuleRunner(ProcessLogging):
                            subprocess.PIPE
             stdin (file): A file object that provides stdin, default
                           subprocess.PIPE
+            env (dict): The environment of the module, the environment of
+                        the runner if None
 
         Returns:
             subprocess:
@@ -437,11 +656,25 @@ class GrassModuleRunner(ProcessLogging):
         parameter.append(grass_module_path)
         parameter.extend(args)
 
-        if raw is False:
-            errorid, stdout_buff, stderr_buff = self._run_process(parameter)
+        if self._use_python_session(grass_module_path, raw, stdout, stderr):
+            result = self._run_session_process(
+                parameter, raw, stdout, stderr, stdin, env=env
+            )
+            if raw is True:
+                return result
+            errorid, stdout_buff, stderr_buff = result
+        elif raw is False:
+            errorid, stdout_buff, stderr_buff = self._run_process(
+                parameter, env=env
+            )
         else:
             return self._run_process(
-                parameter, raw=raw, stdout=stdout, stderr=stderr, stdin=stdin
+                parameter,
+                raw=raw,
+                stdout=stdout,
+                stderr=stderr,
+                stdin=stdin,
+                env=env,
             )
 
         if errorid != 0:
@@ -481,6 +714,7 @@ class GrassInitializer(ProcessLogging):
 
         ProcessLogging.__init__(self, config=config, user_id=user_id)
 
+        self.config = config if config is not None else global_config
         self.gisrc_path = None
         self.grass_data_base = grass_data_base
         self.grass_base_dir = grass_base_dir
@@ -488,6 +722,7 @@ class GrassInitializer(ProcessLogging):
         self.mapset_name = mapset_name
         self.grass_addon_path = grass_addon_path
         self.has_temp_region = False
+        self.python_session = None
 
     def initialize(self):
         """
@@ -513,8 +748,14 @@ class GrassInitializer(ProcessLogging):
         )
         self.gisrc.write(self.gisrc_path)
 
+        if self.config.GRASS_PYTHON_SESSION is True:
+            self.python_session = PythonSession()
+
         self.runner = GrassModuleRunner(
-            self.grass_base_dir, self.grass_addon_path
+            self.grass_base_dir,
+            self.grass_addon_path,
+            self.python_session,
+            self.genv.process_env,
         )
 
     def run_module(
@@ -525,6 +766,7 @@ class GrassInitializer(ProcessLogging):
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         stdin=subprocess.PIPE,
+        env=None,
     ):
         """Run a grass module
 
@@ -538,6 +780,9 @@ class GrassInitializer(ProcessLogging):
                            subprocess.PIPE
             stderr (file): A file object that receives stderr, default
                            subprocess.PIPE
+            env (dict): The environment of the module, e.g. the environment
+                        of a process chain step, the GRASS environment of
+                        this session if None
 
         Raises:
             This method raises a GrassInitError Exception in case
@@ -557,11 +802,25 @@ class GrassInitializer(ProcessLogging):
             stdout=stdout,
             stderr=stderr,
             stdin=stdin,
+            env=env,
         )
 
+    def get_env(self):
+        """Return the environment of the GRASS modules of this session
+
+        Returns:
+            dict:
+            The environment, None if the modules use the environment of this
+            process
+        """
+        return self.runner._get_env()
+
     def clean_up(self):
         """Try to remove the temporary gisrc file and the mapset lock"""
         self.delete_tmp_region()
+        if self.python_session is not None:
+            self.python_session.close()
+            self.python_session = None
         if self.gisrc_path is not None and os.path.isdir(self.gisrc_path):
             shutil.rmtree(self.gisrc_path)
         else:
@@ -591,8 +850,12 @@ class GrassInitializer(ProcessLogging):
         if errorid != 0:
             raise GrassInitError("Unable to create a temporary region")
 
-        # Put the region in the process environment
+        # Put the region in the process environment and the environment of
+        # the modules
         os.environ["WIND_OVERRIDE"] = self.tmp_region_name
+        self.runner.env = MappingProxyType(
+            dict(self.runner.env, WIND_OVERRIDE=self.tmp_region_name)
+        )
         self.has_temp_region = True
 
     def delete_tmp_region(self):
@@ -606,6 +869,7 @@ class GrassInitializer(ProcessLogging):
             try:
                 if "WIND_OVERRIDE" in os.environ:
                     os.environ.pop("WIND_OVERRIDE")
+                    self.runner.env = self.genv.process_env
                     self.run_module(
                         "g.remove",
                         [
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Retention and quota management of interim results
+
+The interim results of a user are stored in
+GRASS_RESOURCE_DIR/<user>/interim/<resource_id>/. A size index in this
+directory is updated by the processes that save or delete interim results,
+so that the footprint of a user is known without walking the directory
+trees. A janitor thread removes interim results that are older than the
+maximum age or exceed the quota of the user. Interim results of resources
+whose job is still running are never removed.
+"""
+
+import fcntl
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from threading import Event, Lock, Thread
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core.directory_size import get_directory_size
+from actinia_core.core.logging_interface import log
+from actinia_core.core.resources_logger import ResourceLogger
+from actinia_core.core.usage_accounting import TERMINAL_STATES
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The name of the size index file in the interim directory of a user
+INDEX_FILE_NAME = ".interim_index.json"
+
+# The version of the size index format
+INDEX_FORMAT = 1
+
+# The names of the step folders of a resource
+STEP_FOLDER_PATTERN = re.compile(r"^step(\d+)$")
+
+# The name of the lock file in the resource directory that is held by the
+# janitor that manages the interim results
+JANITOR_LOCK_FILE_NAME = ".interim_result_janitor.lock"
+
+
+def get_interim_storage_path(user_id, config=None):
+    """Return the directory of the interim results of a user"""
+    if config is None:
+        config = global_config
+    return os.path.join(config.GRASS_RESOURCE_DIR, user_id, "interim")
+
+
+class InterimResultIndex(object):
+    """The size index of the interim results of a user
+
+    The index stores the size in bytes, the saved steps and the time of the
+    last update of each resource. It is written atomically, changes are
+    serialized with a lock file, since several job processes can save
+    interim results of the same user.
+    """
+
+    def __init__(self, storage_path):
+        """Init method for InterimResultIndex class
+
+        Args:
+            storage_path (str): The directory of the interim results of the
+                                user
+        """
+        self.storage_path = storage_path
+        self.path = os.path.join(storage_path, INDEX_FILE_NAME)
+
+    @contextmanager
+    def _locked(self):
+        """Lock the index and yield its resources, which are written when
+        the context is left"""
+        os.makedirs(self.storage_path, exist_ok=True)
+        with open(self.path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            resources = self.read()
+            yield resources
+            self._write(resources)
+
+    def _write(self, resources):
+        """Atomically write the index"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.storage_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"format": INDEX_FORMAT, "resources": resources}, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def read(self):
+        """Read the index
+
+        Returns:
+            dict:
+            The entries of the resources by resource id with bytes, steps
+            and updated (seconds since the epoch)
+        """
+        try:
+            with open(self.path) as f:
+                index = json.load(f)
+            if index.get("format") == INDEX_FORMAT:
+                return index["resources"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def update(self, resource_id, size_delta, added_step, removed_steps=()):
+        """Update the entry of a resource after interim results were saved
+
+        Args:
+            resource_id (str): The id of the resource
+            size_delta (int): The number of bytes that were added, negative
+                              if more bytes were removed
+            added_step (int): The step that was saved
+            removed_steps (list): The steps that were removed
+        """
+        with self._locked() as resources:
+            entry = resources.setdefault(
+                resource_id, {"bytes": 0, "steps": [], "updated": 0}
+            )
+            entry["bytes"] = max(entry["bytes"] + size_delta, 0)
+            steps = set(entry["steps"]) - set(removed_steps)
+            steps.add(added_step)
+            entry["steps"] = sorted(steps)
+            entry["updated"] = time.time()
+
+    def remove(self, resource_id):
+        """Remove the entry of a resource"""
+        with self._locked() as resources:
+            resources.pop(resource_id, None)
+
+    def reconcile(self):
+        """Synchronize the index with the resource directories
+
+        Entries of removed directories are dropped. Directories that are
+        not in the index, for example saved by an older version, are
+        measured once.
+
+        Returns:
+            dict:
+            The entries of the resources by resource id
+        """
+        if not os.path.isdir(self.storage_path):
+            return {}
+        with self._locked() as resources:
+            resource_ids = {
+                entry.name
+                for entry in os.scandir(self.storage_path)
+                if entry.is_dir(follow_symlinks=False)
+            }
+            for resource_id in set(resources) - resource_ids:
+                del resources[resource_id]
+            for resource_id in resource_ids - set(resources):
+                path = os.path.join(self.storage_path, resource_id)
+                steps = [
+                    int(match.group(1))
+                    for match in map(
+                        STEP_FOLDER_PATTERN.match, os.listdir(path)
+                    )
+                    if match
+                ]
+                resources[resource_id] = {
+                    "bytes": get_directory_size(path, count_links_once=True),
+                    "steps": sorted(steps),
+                    "updated": os.stat(path).st_mtime,
+                }
+            return dict(resources)
+
+    def get_footprint(self):
+        """Return the footprint of the interim results of the user
+
+        Returns:
+            dict:
+            The size in bytes and the number of resources
+        """
+        resources = self.read()
+        return {
+            "bytes": sum(entry["bytes"] for entry in resources.values()),
+            "resources": len(resources),
+        }
+
+
+def create_running_check(user_id, config=None):
+    """Create a function that checks if the job of a resource of a user is
+    still running
+
+    The status of the latest iteration of the resource is read from the
+    resource database. Resources without status, e.g. expired ones, are not
+    running. If the status can not be read, the resource is assumed to be
+    running.
+
+    Args:
+        user_id (str): The unique user name/id
+        config: The configuration, the global configuration if None
+
+    Returns:
+        function:
+        The function that is called with the resource id and returns True
+        if the job of the resource did not reach a terminal state
+    """
+    if config is None:
+        config = global_config
+    resource_loggers = []
+
+    def is_running(resource_id):
+        try:
+            if not resource_loggers:
+                kwargs = {
+                    "host": config.KVDB_SERVER_URL,
+                    "port": config.KVDB_SERVER_PORT,
+                }
+                if config.KVDB_SERVER_PW:
+                    kwargs["password"] = config.KVDB_SERVER_PW
+                resource_loggers.append(ResourceLogger(**kwargs))
+            _, document = resource_loggers[0].get_latest_iteration(
+                user_id, resource_id
+            )
+        except Exception as e:
+            log.warning(
+                "Unable to read the status of resource <%s>: %s"
+                % (resource_id, str(e))
+            )
+            return True
+        if document is None:
+            return False
+        return pickle.loads(document).get("status") not in TERMINAL_STATES
+
+    return is_running
+
+
+def collect_garbage(
+    storage_path, config=None, exclude=(), now=None, is_running=None
+):
+    """Remove the interim results of a user that exceed the retention policy
+
+    Interim results that were not updated for INTERIM_RESULTS_MAX_AGE
+    seconds are removed. If the interim results exceed
+    INTERIM_RESULTS_QUOTA, the least recently updated resources are removed
+    until the quota is met. Resources whose job is still running are kept.
+
+    Args:
+        storage_path (str): The directory of the interim results of the
+                            user
+        config: The configuration, the global configuration if None
+        exclude (tuple): The ids of resources that are never removed
+        now (float): The current time in seconds since the epoch
+        is_running (function): The function that checks if the job of a
+                               resource is still running, by default the
+                               status in the resource database is checked,
+                               see create_running_check()
+
+    Returns:
+        list:
+        The ids of the removed resources
+    """
+    if config is None:
+        config = global_config
+    if now is None:
+        now = time.time()
+    if is_running is None:
+        # The storage path is GRASS_RESOURCE_DIR/<user_id>/interim
+        user_id = os.path.basename(
+            os.path.dirname(os.path.normpath(storage_path))
+        )
+        is_running = create_running_check(user_id, config)
+    index = InterimResultIndex(storage_path)
+    resources = index.reconcile()
+    candidates = sorted(
+        (
+            (entry["updated"], resource_id)
+            for resource_id, entry in resources.items()
+            if resource_id not in exclude
+        ),
+    )
+    removed = []
+    running = set()
+
+    def is_removable(resource_id):
+        """Check the status of a resource once, when it would be removed"""
+        if resource_id in running:
+            return False
+        if is_running(resource_id):
+            running.add(resource_id)
+            return False
+        return True
+
+    max_age = config.INTERIM_RESULTS_MAX_AGE
+    if max_age > 0:
+        for updated, resource_id in candidates:
+            if updated < now - max_age and is_removable(resource_id):
+                removed.append(resource_id)
+
+    quota = int(config.INTERIM_RESULTS_QUOTA * 1024 * 1024 * 1024)
+    if quota > 0:
+        total = sum(
+            entry["bytes"]
+            for resource_id, entry in resources.items()
+            if resource_id not in removed
+        )
+        for _, resource_id in candidates:
+            if total <= quota:
+                break
+            if resource_id in removed or not is_removable(resource_id):
+                continue
+            removed.append(resource_id)
+            total -= resources[resource_id]["bytes"]
+
+    for resource_id in removed:
+        log.info(
+            "Removing interim results of resource <%s> (%i bytes)"
+            % (resource_id, resources[resource_id]["bytes"])
+        )
+        shutil.rmtree(
+            os.path.join(storage_path, resource_id), ignore_errors=True
+        )
+        index.remove(resource_id)
+    return removed
+
+
+def get_interim_footprint(user_id, config=None):
+    """Return the footprint of the interim results of a user
+
+    Args:
+        user_id (str): The unique user name/id
+        config: The configuration, the global configuration if None
+
+    Returns:
+        dict:
+        The size in bytes and the number of resources
+    """
+    index = InterimResultIndex(get_interim_storage_path(user_id, config))
+    return index.get_footprint()
+
+
+class InterimResultJanitor(object):
+    """Apply the retention policy of the interim results periodically
+
+    A background thread runs collect_garbage() for all users every
+    INTERIM_RESULTS_JANITOR_INTERVAL seconds and logs the footprint of each
+    user. The janitor is started in every server process, but only the one
+    that holds the lock file in GRASS_RESOURCE_DIR manages the interim
+    results. The others try to take over the lock in each interval, e.g.
+    when the process holding it exits.
+    """
+
+    def __init__(self, config=None):
+        if config is None:
+            config = global_config
+        self.config = config
+        self.thread = None
+        self.pid = None
+        self.stop_event = Event()
+        self.lock = Lock()
+        self.lock_file = None
+
+    def start(self):
+        """Start the background thread if a janitor interval is configured
+
+        Returns:
+            bool:
+            True if the thread is running
+        """
+        if self.config.INTERIM_RESULTS_JANITOR_INTERVAL <= 0:
+            return False
+        with self.lock:
+            if self.pid == os.getpid() and self.thread.is_alive():
+                return True
+            self.pid = os.getpid()
+            # A lock file of the parent process is not held by this process
+            self.lock_file = None
+            self.stop_event = Event()
+            self.thread = Thread(
+                target=self._run,
+                args=(self.stop_event,),
+                name="interim_result_janitor",
+                daemon=True,
+            )
+            self.thread.start()
+        return True
+
+    def acquire_lock(self):
+        """Acquire the lock file of the janitor without waiting
+
+        Returns:
+            bool:
+            True if this janitor holds the lock
+        """
+        if self.lock_file is not None:
+            return True
+        resource_dir = self.config.GRASS_RESOURCE_DIR
+        os.makedirs(resource_dir, exist_ok=True)
+        lock_file = open(
+            os.path.join(resource_dir, JANITOR_LOCK_FILE_NAME), "w"
+        )
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self.lock_file = lock_file
+        return True
+
+    def release_lock(self):
+        """Release the lock file of the janitor"""
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
+
+    def run_once(self):
+        """Apply the retention policy to the interim results of all users
+
+        Returns:
+            dict:
+            The footprint of each user with interim results
+        """
+        footprints = {}
+        resource_dir = self.config.GRASS_RESOURCE_DIR
+        if not os.path.isdir(resource_dir):
+            return footprints
+        for user_id in sorted(os.listdir(resource_dir)):
+            storage_path = get_interim_storage_path(user_id, self.config)
+            if not os.path.isdir(storage_path):
+                continue
+            try:
+                collect_garbage(storage_path, self.config)
+                footprint = InterimResultIndex(storage_path).get_footprint()
+            except OSError as e:
+                log.warning(
+                    "Unable to manage the interim results of user <%s>: %s"
+                    % (user_id, str(e))
+                )
+                continue
+            footprints[user_id] = footprint
+            log.info(
+                "Interim results of user <%s>: %i bytes in %i resources"
+                % (user_id, footprint["bytes"], footprint["resources"])
+            )
+        return footprints
+
+    def _run(self, stop_event):
+        """Run the janitor until the stop event is set"""
+        while not stop_event.wait(
+            self.config.INTERIM_RESULTS_JANITOR_INTERVAL
+        ):
+            try:
+                if self.acquire_lock():
+                    self.run_once()
+            except Exception as e:
+                log.error("Interim result janitor failed: %s" % str(e))
+        self.release_lock()
+
+    def stop(self, timeout=5):
+        """Stop the background thread
+
+        Args:
+            timeout (int): The number of seconds to wait for the thread
+        """
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join(timeout)
+
+
+# The interim result janitor of this process
+interim_result_janitor = InterimResultJanitor()
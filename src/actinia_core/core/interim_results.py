@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2021-2023 mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2021-2026 mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -17,21 +17,61 @@ Interim Result class
 import os
 import subprocess
 import shutil
+import threading
 from fnmatch import filter
+from . import directory_size
+from .file_snapshots import capture_snapshot, remove_snapshot
+from .interim_result_retention import InterimResultIndex, collect_garbage
 from .messages_logger import MessageLogger
 from actinia_core.core.common.config import global_config, DEFAULT_CONFIG_PATH
 from actinia_core.core.common.exceptions import RsyncError
+from actinia_core.core.common.process_graph import get_data_flow_keys
 from actinia_core.core.mapset_merge_utils import change_mapsetname
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Anika Weinmann, Lina Krisztian"
-__copyright__ = "Copyright 2021-2023, mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2021-2026, mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
+# The elements of a GRASS mapset that contain a file or directory per map
+MAP_ELEMENTS = (
+    "cats",
+    "cell",
+    "cell_misc",
+    "cellhd",
+    "colr",
+    "fcell",
+    "grid3",
+    "group",
+    "hist",
+    "vector",
+)
+
+
+def get_map_name(rel_path):
+    """Return the name of the map a file of a GRASS mapset belongs to
+
+    Args:
+        rel_path (str): The path of the file relative to the mapset
+
+    Returns:
+        str:
+        The map name, None if the file is shared by all maps of the mapset,
+        e.g. WIND or the sqlite database
+    """
+    parts = rel_path.split(os.sep)
+    if len(parts) >= 2 and parts[0] in MAP_ELEMENTS:
+        return parts[1]
+    return None
+
 
 def get_directory_size(directory):
     """Returns the directory size in bytes.
+
+    The size is tracked incrementally, only the subdirectories that changed
+    since the last call are scanned again.
+
     Args:
         directory (string): The path to a directory
 
@@ -39,18 +79,7 @@ def get_directory_size(directory):
         total: the size of the directory in bytes
 
     """
-    total = 0
-    try:
-        for entry in os.scandir(directory):
-            if entry.is_file():
-                total += os.path.getsize(entry)
-            elif entry.is_dir():
-                total += get_directory_size(entry.path)
-    except NotADirectoryError:
-        return os.path.getsize(directory)
-    except PermissionError:
-        return 0
-    return total
+    return directory_size.get_directory_size(directory)
 
 
 class InterimResult(object):
@@ -66,10 +95,22 @@ class InterimResult(object):
         """
         global_config.read(DEFAULT_CONFIG_PATH)
         self.logger = MessageLogger()
-        self.user_resource_interim_storage_path = os.path.join(
+        self._user_resource_interim_storage_path = os.path.join(
             global_config.GRASS_RESOURCE_DIR, user_id, "interim"
         )
         self.saving_interim_results = global_config.SAVE_INTERIM_RESULTS
+        self.saving_in_background = (
+            global_config.SAVE_INTERIM_RESULTS_IN_BACKGROUND
+        )
+        self._saving_thread = None
+        self._saving_error = None
+        # The snapshots that are completed in the background and if their
+        # source is a mapset
+        self._pending_snapshots = []
+        self.keep_steps = max(global_config.INTERIM_RESULTS_KEEP_STEPS, 1)
+        self.index = InterimResultIndex(
+            self._user_resource_interim_storage_path
+        )
         self.resource_id = resource_id
         self.iteration = iteration if iteration is not None else 1
         self.old_pc_step = None
@@ -78,6 +119,77 @@ class InterimResult(object):
             global_config.INCLUDE_ADDITIONAL_MAPSET_PATTERN
         )
 
+    @property
+    def user_resource_interim_storage_path(self):
+        """The path where the interim results of the user are saved
+
+        The interim results that are saved in the background are completed
+        first, so that the caller can modify or remove them.
+        """
+        self.wait_for_interim_results(raise_error=False)
+        return self._user_resource_interim_storage_path
+
+    def wait_for_interim_results(self, raise_error=True):
+        """Wait until the interim results that are saved in the background
+        are completed
+
+        Args:
+            raise_error (bool): Raise the error of the background saving,
+                                otherwise it is discarded
+
+        Raises:
+            RsyncError: If the interim results could not be saved
+        """
+        if self._saving_thread is not None:
+            self._saving_thread.join()
+            self._saving_thread = None
+            self._pending_snapshots = []
+        error, self._saving_error = self._saving_error, None
+        if error is not None and raise_error is True:
+            raise error
+
+    def wait_for_pending_files(self, outputs):
+        """Wait until the interim results that are saved in the background
+        are completed if the next step may modify files that are not copied
+        yet
+
+        Without reflinks the changed files are copied by the thread that
+        completes the snapshots, see capture_snapshot(). A step must not
+        modify them before they are copied.
+
+        Args:
+            outputs (set): The names of the maps and files the next step
+                           writes, None if they are unknown
+
+        Raises:
+            RsyncError: If the interim results could not be saved
+        """
+        if self._saving_thread is not None and self._may_modify_pending(
+            outputs
+        ):
+            self.wait_for_interim_results()
+
+    def _may_modify_pending(self, outputs):
+        """Check if a step with the given outputs may modify one of the
+        files that are not copied yet"""
+        if outputs is None:
+            return True
+        keys = get_data_flow_keys(outputs)
+        for snapshot, is_mapset in self._pending_snapshots:
+            if not snapshot.deferred_files:
+                continue
+            if not is_mapset:
+                # Steps write files of the temporary directory only by
+                # file identifiers, other temporary files are new
+                if any(name.startswith("$file::") for name in outputs):
+                    return True
+                continue
+            for rel_path in snapshot.deferred_files:
+                name = get_map_name(rel_path)
+                if name is None or keys & get_data_flow_keys({name}):
+                    return True
+        return False
+
     def set_old_pc_step(self, old_pc_step):
         """Set method for the number of the successfully finished steps of
         the process chain in the previous iteration
@@ -156,41 +268,6 @@ class InterimResult(object):
 
         return interim_mapset, interim_file_path
 
-    def _compare_sha512sums_of_folders(self, folder1, folder2):
-        """Compares the sha512sums of two folders.
-        Args:
-            folder1 (str): Path to one folder
-            folder2 (str): Path to another folder
-
-        Returns:
-            (bool): A boolean "True" if the sha512sums of the folder are the
-                    same otherwise "False" (also if one of the folder does not
-                    exist)
-        """
-        for folder in [folder1, folder2]:
-            if not os.path.isdir(folder):
-                self.logger.error(f"<{folder}> is no folder")
-                return False
-
-        # get sha512sum of the folder
-        cur_working_dir = os.getcwd()
-        sha512sum_cmd = (
-            r"find . -type f -exec sha512sum {} \; |" + "sort -k 2 | sha512sum"
-        )
-        sha512sums = list()
-        for folder in [folder1, folder2]:
-            os.chdir(folder)
-            p_sha512sum_prev = os.popen(sha512sum_cmd)
-            sha512sums.append(p_sha512sum_prev.read().strip())
-        os.chdir(cur_working_dir)
-        del cur_working_dir
-
-        # compare sha512sums
-        if sha512sums[0] == sha512sums[1]:
-            return True
-        else:
-            return False
-
     def rsync_additional_mapsets(self, dest_path):
         """Using rsync to update additional mapsets from interim results to
         temporary mapset
@@ -207,6 +284,9 @@ class InterimResult(object):
 
         for mapset in os.listdir(src_path):
             src = os.path.join(src_path, mapset)
+            # skip the manifests of the snapshots
+            if not os.path.isdir(src):
+                continue
             dest = os.path.join(dest_path, mapset)
             rsync_status = self.rsync_mapsets(src, dest)
             if rsync_status != "success":
@@ -252,41 +332,101 @@ class InterimResult(object):
         return "success"
 
     def _saving_folder(self, src, dest, old_dest, progress_step):
-        """Saves the src folder to the dest folder by copying the directory or
-        rsyncing it
+        """Captures the changed files of the src folder for the snapshot in
+        the dest folder
+
+        Files that did not change since the previous step are hardlinked
+        from its snapshot when the snapshot is completed, so only the
+        changed files are written. If the folder did not change at all and
+        only the last step is kept, the previous snapshot is renamed. If the
+        snapshot is completed in the background, the changed files are
+        copied by the background thread on file systems without reflinks.
+
+        Returns:
+            (PendingSnapshot): The snapshot that has to be completed
         """
-        # check if directory has changed
-        same_dir = self._compare_sha512sums_of_folders(old_dest, src)
-        if same_dir is True:
-            self.logger.info(
-                "Sha512sums of maspsets are equal; renaming interim result"
+        self.logger.info("Saving snapshot of %s to interim result" % src)
+        try:
+            return capture_snapshot(
+                src,
+                dest,
+                old_dest,
+                move_unchanged=self.keep_steps == 1,
+                defer_copies=self.saving_in_background,
+            )
+        except OSError as e:
+            shutil.rmtree(dest, ignore_errors=True)
+            raise RsyncError(
+                "Error while saving interim results of step %d: %s"
+                % (progress_step, str(e))
             )
-            os.rename(old_dest, dest)
-            return
 
-        # get folder sizes in bytes
-        size_prev_step = get_directory_size(old_dest)
-        size_curr_step = get_directory_size(src)
-
-        # rsync or copy folder
-        if size_curr_step > size_prev_step * 0.9:
-            self.logger.info("Copy old interim result")
-            shutil.copytree(old_dest, dest)
-        self.logger.info("Rsync mapset %s to interim result" % src)
-        rsync_status = self.rsync_mapsets(src, dest)
-        if rsync_status == "success":
-            shutil.rmtree(old_dest)
-        else:
-            raise RsyncError("Error while rsyncing of step %d" % progress_step)
+    def _complete_snapshots(
+        self, snapshots, old_dests, progress_step, removed_step=None
+    ):
+        """Completes the captured snapshots, removes the snapshots of the
+        step that is not kept anymore and updates the size index
+        """
+        for snapshot in snapshots:
+            try:
+                stats = snapshot.complete()
+            except OSError as e:
+                shutil.rmtree(snapshot.dest, ignore_errors=True)
+                raise RsyncError(
+                    "Error while saving interim results of step %d: %s"
+                    % (progress_step, str(e))
+                )
+            self.logger.info("Snapshot of %s: %s" % (snapshot.src, stats))
+        freed = sum(remove_snapshot(old_dest) for old_dest in old_dests)
+        written = sum(snapshot.stats.written_bytes for snapshot in snapshots)
+        self._update_index(progress_step, written - freed, removed_step)
+
+    def _update_index(self, progress_step, size_delta, removed_step):
+        """Updates the size index and applies the quota of the user"""
+        try:
+            self.index.update(
+                self.resource_id,
+                size_delta,
+                progress_step,
+                [removed_step] if removed_step is not None else [],
+            )
+            if global_config.INTERIM_RESULTS_QUOTA > 0:
+                collect_garbage(
+                    self._user_resource_interim_storage_path,
+                    exclude=(self.resource_id,),
+                )
+        except OSError as e:
+            self.logger.warning(
+                "Unable to update the interim result index: %s" % str(e)
+            )
+
+    def _complete_snapshots_in_background(
+        self, snapshots, old_dests, progress_step, removed_step
+    ):
+        """Target of the thread that completes the snapshots"""
+        try:
+            self._complete_snapshots(
+                snapshots, old_dests, progress_step, removed_step
+            )
+        except Exception as e:
+            self.logger.error(str(e))
+            self._saving_error = e
 
     def delete_interim_results(self):
         """Deletes the temporary mapset and temporary data"""
+        self.wait_for_interim_results(raise_error=False)
         interim_result_path = self._get_interim_path()
 
         if os.path.exists(interim_result_path) and os.path.isdir(
             interim_result_path
         ):
             shutil.rmtree(interim_result_path, ignore_errors=True)
+            try:
+                self.index.remove(self.resource_id)
+            except OSError as e:
+                self.logger.warning(
+                    "Unable to update the interim result index: %s" % str(e)
+                )
 
     def _get_interim_path(self):
         """Returns the path where the interim results are saved"""
@@ -314,6 +454,17 @@ class InterimResult(object):
         else:
             return [], []
 
+    def _get_step_paths(self, temp_mapset_path, progress_step):
+        """Returns the paths of the interim mapset, the interim directory
+        and the additional mapsets of a step"""
+        _, addm_dests = self._get_included_additional_mapset_paths(
+            temp_mapset_path, progress_step
+        )
+        return [
+            self._get_interim_mapset_path(progress_step),
+            self._get_interim_tmpdir_path(progress_step),
+        ] + addm_dests
+
     def _get_interim_mapset_path(self, progress_step):
         """Returns path where the interim mapset is saved"""
         return os.path.join(
@@ -332,9 +483,16 @@ class InterimResult(object):
         self, progress_step, temp_mapset_path, temp_file_path, force_copy=False
     ):
         """Saves the temporary mapset to the
-        `user_resource_interim_storage_path` by copying the directory or
-        rsyncing it
+        `user_resource_interim_storage_path` as snapshot
+
+        The changed files are captured before this method returns. If
+        saving in background is configured, the snapshots are completed in
+        a thread. The next call waits for this thread. On file systems
+        without reflinks the thread also copies the changed files, a step
+        that modifies them must wait for the thread with
+        wait_for_pending_files().
         """
+        self.wait_for_interim_results()
 
         # check if interim results should be saved for current endpoint
         if self.endpoint not in global_config.INTERIM_SAVING_ENDPOINTS:
@@ -363,31 +521,42 @@ class InterimResult(object):
 
         if progress_step == 1 or force_copy is True:
             # copy temp mapset for first step
-            shutil.copytree(temp_mapset_path, dest_mapset)
-            shutil.copytree(temp_file_path, dest_tmpdir)
-            self.logger.info(
-                "Maspset %s and temp_file_path %s are copied"
-                % (temp_mapset_path, temp_file_path)
+            previous = []
+            removed_step = None
+        else:
+            previous = self._get_step_paths(
+                temp_mapset_path, progress_step - 1
             )
-            for m_src, m_dest in zip(addm_src, addm_dest, strict=False):
-                shutil.copytree(m_src, m_dest)
+            removed_step = progress_step - self.keep_steps
+        if removed_step is not None and removed_step >= 1:
+            old_dests = self._get_step_paths(temp_mapset_path, removed_step)
         else:
-            old_dest_mapset = self._get_interim_mapset_path(progress_step - 1)
-            old_dest_tmpdir = self._get_interim_tmpdir_path(progress_step - 1)
+            old_dests = []
+            removed_step = None
+        # saving mapset, temporary file path and additional mapsets
+        srcs = [temp_mapset_path, temp_file_path] + addm_src
+        dests = [dest_mapset, dest_tmpdir] + addm_dest
+        previous += [None] * (len(srcs) - len(previous))
+        snapshots = [
+            self._saving_folder(src, dest, old_dest, progress_step)
+            for src, dest, old_dest in zip(srcs, dests, previous, strict=False)
+        ]
 
-            # saving mapset
-            self._saving_folder(
-                temp_mapset_path, dest_mapset, old_dest_mapset, progress_step
+        if self.saving_in_background is True:
+            # The temporary file path is the only source that is no mapset
+            self._pending_snapshots = [
+                (snapshot, snapshot.src != temp_file_path)
+                for snapshot in snapshots
+            ]
+            self._saving_thread = threading.Thread(
+                target=self._complete_snapshots_in_background,
+                args=(snapshots, old_dests, progress_step, removed_step),
+                name="interim-results-%s" % self.resource_id,
+                # the process waits for the thread before it exits
+                daemon=False,
             )
-            # saving temporary file path
-            self._saving_folder(
-                temp_file_path, dest_tmpdir, old_dest_tmpdir, progress_step
-            )
-            # saving additional mapsets
-            _, old_dests = self._get_included_additional_mapset_paths(
-                temp_mapset_path, progress_step - 1
+            self._saving_thread.start()
+        else:
+            self._complete_snapshots(
+                snapshots, old_dests, progress_step, removed_step
             )
-            for m_src, m_dest, old_dest in zip(
-                addm_src, addm_dest, old_dests, strict=False
-            ):
-                self._saving_folder(m_src, m_dest, old_dest, progress_step)
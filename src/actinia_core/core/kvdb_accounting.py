@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Kvdb server interface for resource usage accounting
+"""
+
+from actinia_core.core.common.kvdb_base import KvdbBaseInterface
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class KvdbAccountingInterface(KvdbBaseInterface):
+    """
+    The Kvdb resource usage accounting interface
+    """
+
+    # Hashes with the aggregated resource usage of a user and day
+    accounting_prefix = "ACCOUNTING::"
+    # Marker keys of resources that were already accounted
+    accounting_done_prefix = "ACCOUNTING-DONE::"
+    # The aggregates that are stored as float, all others are integers
+    float_fields = ("wall_seconds", "cpu_seconds")
+    kvdb_role = "accounting"
+
+    def __init__(self):
+        KvdbBaseInterface.__init__(self)
+
+    """
+    ########################## ACCOUNTING #####################################
+    """
+
+    """
+    The resource usage of each user is aggregated per day in a hash. A
+    resource is accounted exactly once when it reaches a terminal state, a
+    marker key with the resource id protects against double accounting.
+
+    ..code:
+
+    user_id_1 :: 2026-10-19 : resources        : 2
+                              wall_seconds     : 12.5
+                              cpu_seconds      : 10.1
+                              executed_modules : 7
+                              exported_bytes   : 1024
+                              cells_processed  : 500000
+
+    """
+
+    def add(self, user_id, db_resource_id, day, usage, expiration=34560000):
+        """Add the usage of a resource to the aggregates of a user and day
+
+        The usage of a resource is only added once, repeated calls with the
+        same db_resource_id are ignored.
+
+        Args:
+            user_id (str): The user id
+            db_resource_id (str): The unique id of the resource iteration
+            day (str): The day as YYYY-MM-DD
+            usage (dict): The resource usage, the keys are the aggregate names
+            expiration (int): The time in seconds when the aggregates and
+                              the marker should expire
+
+        Returns:
+            bool:
+            True if the usage was added, False if the resource was already
+            accounted
+        """
+        done = self.kvdb_server.set(
+            self.accounting_done_prefix + db_resource_id,
+            day,
+            ex=expiration,
+            nx=True,
+        )
+        if not done:
+            return False
+
+        key = "%s%s::%s" % (self.accounting_prefix, user_id, day)
+        pipe = self.kvdb_server.pipeline(transaction=True)
+        pipe.hincrby(key, "resources", 1)
+        for field, value in usage.items():
+            if field in self.float_fields:
+                pipe.hincrbyfloat(key, field, float(value))
+            else:
+                pipe.hincrby(key, field, int(value))
+        pipe.expire(key, expiration)
+        pipe.execute()
+        return True
+
+    def get(self, user_id, days):
+        """Return the aggregated resource usage of a user for several days
+
+        Args:
+            user_id (str): The user id
+            days (list): A list of days as YYYY-MM-DD
+
+        Returns:
+            list:
+            A list of (day, usage dict) tuples, days without usage have an
+            empty dict
+        """
+        pipe = self.kvdb_server.pipeline(transaction=False)
+        for day in days:
+            pipe.hgetall("%s%s::%s" % (self.accounting_prefix, user_id, day))
+        result = []
+        for day, entry in zip(days, pipe.execute()):
+            usage = {}
+            for field, value in entry.items():
+                field = field.decode()
+                if field in self.float_fields:
+                    usage[field] = float(value)
+                else:
+                    usage[field] = int(value)
+            result.append((day, usage))
+        return result
+
+    def delete(self, user_id, days):
+        """Remove the aggregated resource usage of a user for several days
+
+        Args:
+            user_id (str): The user id
+            days (list): A list of days as YYYY-MM-DD
+
+        Returns:
+            bool:
+            True if at least one entry was removed, False otherwise
+        """
+        keys = [
+            "%s%s::%s" % (self.accounting_prefix, user_id, day) for day in days
+        ]
+        return bool(self.kvdb_server.delete(*keys))
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,11 +14,12 @@
 Kvdb server interface for API logging
 """
 
+import time
 from actinia_core.core.common.kvdb_base import KvdbBaseInterface
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
@@ -28,9 +29,16 @@ class KvdbAPILogInterface(KvdbBaseInterface):
     The Kvdb API log database interface
     """
 
-    # API logging entries are lists in the Kvdb database using LPUSH, LTRIM,
-    # LRANGE for management
-    api_log_prefix = "API-LOG-LIST::"
+    # API logging entries are capped streams in the Kvdb database using XADD,
+    # XREVRANGE and XLEN for management
+    api_log_prefix = "API-LOG-STREAM::"
+    # The API log lists of former versions, only used for deletion
+    api_log_list_prefix = "API-LOG-LIST::"
+    # Hashes with the number of API calls per endpoint and day of a user
+    api_log_user_count_prefix = "API-LOG-USER-COUNT::"
+    # Hashes with the number of API calls per endpoint and day of all users
+    api_log_endpoint_count_prefix = "API-LOG-ENDPOINT-COUNT::"
+    kvdb_role = "api_log"
 
     def __init__(self):
         KvdbBaseInterface.__init__(self)
@@ -40,89 +48,243 @@ class KvdbAPILogInterface(KvdbBaseInterface):
     """
 
     """
-    The API logs are organized by lists that have as key the user id.
-    Each API call from a user_id is logged in its dedicated list with
-    lpush calls. For each user_id exists a dedicated list of API calls.
+    The API logs are organized by streams that have as key the user id.
+    Each API call from a user_id is logged in its dedicated stream with
+    xadd calls. The streams are capped to approximately maxlen entries.
+    The stream ids are millisecond time stamps, hence the log can be
+    paginated by stream id or time.
 
-    Log entries for a user id can be listed trimmed and the log can be
-    completely deleted.
+    In addition the number of API calls per day are counted for each user
+    and endpoint and for each endpoint over all users.
 
     ..code:
 
-    user_id_1 : log entry 1
-                log entry 2
-                log entry 3
+    user_id_1 : id_1 log entry 1
+                id_2 log entry 2
+                id_3 log entry 3
 
-    user_id_2 : log entry 1
-                log entry 2
-                log entry 3
+    user_id_1 :: 2026-10-19 : endpoint_1 : 2
+                              endpoint_2 : 1
+
+    2026-10-19 : endpoint_1 : 2
+                 endpoint_2 : 1
 
     """
 
-    def add(self, user_id, log_entry):
-        """Add a API log entry to a user specific  API log list in the Kvdb
-        server
+    @staticmethod
+    def time_to_stream_id(timestamp):
+        """Convert a POSIX time stamp into a stream id
+
+        Args:
+            timestamp (float): The POSIX time stamp in seconds
+
+        Returns:
+            str:
+            The stream id
+        """
+        return "%d" % int(timestamp * 1000)
+
+    @staticmethod
+    def _today():
+        return time.strftime("%Y-%m-%d", time.gmtime())
+
+    def _add_to_pipe(
+        self, pipe, user_id, log_entry, endpoint, maxlen, counter_expiration
+    ):
+        pipe.xadd(
+            self.api_log_prefix + user_id,
+            {"entry": log_entry},
+            maxlen=maxlen,
+            approximate=True,
+        )
+        if endpoint is not None:
+            day = self._today()
+            user_count_key = "%s%s::%s" % (
+                self.api_log_user_count_prefix,
+                user_id,
+                day,
+            )
+            endpoint_count_key = self.api_log_endpoint_count_prefix + day
+            pipe.hincrby(user_count_key, endpoint, 1)
+            pipe.hincrby(endpoint_count_key, endpoint, 1)
+            pipe.expire(user_count_key, counter_expiration)
+            pipe.expire(endpoint_count_key, counter_expiration)
+
+    def add(
+        self,
+        user_id,
+        log_entry,
+        endpoint=None,
+        maxlen=10000,
+        counter_expiration=34560000,
+    ):
+        """Add a API log entry to a user specific API log stream in the Kvdb
+        server and count the API call
 
         Args:
             user_id (str): The user id of the API log
             log_entry (str): A string
+            endpoint (str): The endpoint that should be counted, no counter
+                            is increased if None
+            maxlen (int): The approximate maximum number of entries in the
+                          stream
+            counter_expiration (int): The time in seconds when the daily
+                                      counters should expire
 
         Returns:
-            int:
-            The index of the new entry in the api log list
+            str:
+            The stream id of the new entry in the api log stream
+        """
+        pipe = self.kvdb_server.pipeline(transaction=False)
+        self._add_to_pipe(
+            pipe, user_id, log_entry, endpoint, maxlen, counter_expiration
+        )
+        return pipe.execute()[0]
+
+    def add_many(self, entries, maxlen=10000, counter_expiration=34560000):
+        """Add several API log entries with a single pipelined request
+
+        Args:
+            entries (list): A list of (user_id, log_entry, endpoint) tuples
+            maxlen (int): The approximate maximum number of entries in the
+                          streams
+            counter_expiration (int): The time in seconds when the daily
+                                      counters should expire
 
+        Returns:
+            list:
+            The stream ids of the new entries
         """
-        return self.kvdb_server.lpush(self.api_log_prefix + user_id, log_entry)
+        pipe = self.kvdb_server.pipeline(transaction=False)
+        for user_id, log_entry, endpoint in entries:
+            self._add_to_pipe(
+                pipe, user_id, log_entry, endpoint, maxlen, counter_expiration
+            )
+        ret = pipe.execute()
+        # Each counted entry uses five commands in the pipeline
+        ids = []
+        index = 0
+        for _, _, endpoint in entries:
+            ids.append(ret[index])
+            index += 1 if endpoint is None else 5
+        return ids
 
     def list(self, user_id, start, end):
         """Return all API log entries between start and end indices
 
+        The newest entry has the index 0.
+
         Args:
             user_id (str): The user id of the API log
             start (int): Integer start index
-            end (int): Integer end index
+            end (int): Integer end index, -1 for the last entry
 
         Returns:
             list:
             A list of user specific API log entries
+        """
+        count = end + 1 if end >= 0 else None
+        entries = self.kvdb_server.xrevrange(
+            self.api_log_prefix + user_id, "+", "-", count=count
+        )
+        return [fields[b"entry"] for _, fields in entries[start:count]]
 
+    def range(self, user_id, max_id="+", min_id="-", count=None):
+        """Return the API log entries between two stream ids, newest first
+
+        Args:
+            user_id (str): The user id of the API log
+            max_id (str): The newest stream id, prefix it with "(" to exclude
+                          the id itself
+            min_id (str): The oldest stream id
+            count (int): The maximum number of entries
+
+        Returns:
+            list:
+            A list of (stream id, API log entry) tuples
         """
-        return self.kvdb_server.lrange(
-            self.api_log_prefix + user_id, start, end
+        entries = self.kvdb_server.xrevrange(
+            self.api_log_prefix + user_id, max_id, min_id, count=count
         )
+        return [
+            (stream_id.decode(), fields[b"entry"])
+            for stream_id, fields in entries
+        ]
 
     def trim(self, user_id, start, end):
         """Remove all API log entries outside start and end indices
 
+        The newest entry has the index 0.
+
         Args:
             user_id (str): The user id of the API log
             start (int): Integer start index
-            end (int): Integer end index
+            end (int): Integer end index, -1 for the last entry
 
         Returns:
             bool:
             True in any case
-
         """
-        return self.kvdb_server.ltrim(
-            self.api_log_prefix + user_id, start, end
-        )
+        key = self.api_log_prefix + user_id
+        stream_ids = [
+            stream_id
+            for stream_id, _ in self.kvdb_server.xrevrange(key, "+", "-")
+        ]
+        keep = stream_ids[start : end + 1 if end >= 0 else None]
+        remove = set(stream_ids) - set(keep)
+        if remove:
+            self.kvdb_server.xdel(key, *remove)
+        return True
 
     def size(self, user_id):
-        """Return the number of entries in the api log list
+        """Return the number of entries in the api log stream
 
         Args:
             user_id (str): The user id of the API log
 
         Returns:
             int:
-            The number of entries in the api log list
+            The number of entries in the api log stream
+        """
+        return self.kvdb_server.xlen(self.api_log_prefix + user_id)
+
+    def count(self, user_id, day=None):
+        """Return the number of API calls per endpoint of a user and day
+
+        Args:
+            user_id (str): The user id of the API log
+            day (str): The day as YYYY-MM-DD, today (UTC) if None
 
+        Returns:
+            dict:
+            The number of API calls per endpoint
         """
-        return self.kvdb_server.llen(self.api_log_prefix + user_id)
+        if day is None:
+            day = self._today()
+        counts = self.kvdb_server.hgetall(
+            "%s%s::%s" % (self.api_log_user_count_prefix, user_id, day)
+        )
+        return {key.decode(): int(value) for key, value in counts.items()}
+
+    def count_endpoints(self, day=None):
+        """Return the number of API calls per endpoint of all users and day
+
+        Args:
+            day (str): The day as YYYY-MM-DD, today (UTC) if None
+
+        Returns:
+            dict:
+            The number of API calls per endpoint
+        """
+        if day is None:
+            day = self._today()
+        counts = self.kvdb_server.hgetall(
+            self.api_log_endpoint_count_prefix + day
+        )
+        return {key.decode(): int(value) for key, value in counts.items()}
 
     def delete(self, user_id):
-        """Remove the log list
+        """Remove the log stream
 
         Args:
             user_id (str): The user id of the API log
@@ -130,9 +292,13 @@ class KvdbAPILogInterface(KvdbBaseInterface):
         Returns:
             bool:
             True in case of success, False otherwise
-
         """
-        return bool(self.kvdb_server.delete(self.api_log_prefix + user_id))
+        return bool(
+            self.kvdb_server.delete(
+                self.api_log_prefix + user_id,
+                self.api_log_list_prefix + user_id,
+            )
+        )
 
 
 # Create the Kvdb interface instance
@@ -145,20 +311,26 @@ def test_api_logging(r):
     # Remove the loglist
     r.delete(user_id)
 
-    ret = r.add(user_id, "API-log entry 1")
-    if ret != 1:
+    ret = r.add(user_id, "API-log entry 1", endpoint="endpoint")
+    if not ret:
         raise Exception("add does not work")
 
-    ret = r.add(user_id, "API-log entry 2")
-    if ret != 2:
+    ret = r.add(user_id, "API-log entry 2", endpoint="endpoint")
+    if not ret:
         raise Exception("add does not work")
 
     ret = r.add(user_id, "API-log entry 3")
-    if ret != 3:
+    if not ret:
         raise Exception("add does not work")
 
     print(r.list(user_id, 0, -1))
 
+    if r.list(user_id, 0, 0) != [b"API-log entry 3"]:
+        raise Exception("list does not work")
+
+    if r.count(user_id)["endpoint"] < 2:
+        raise Exception("count does not work")
+
     ret = r.size(user_id)
     if ret != 3:
         raise Exception("size does not work")
@@ -178,7 +350,6 @@ def test_api_logging(r):
 if __name__ == "__main__":
     import os
     import signal
-    import time
 
     pid = os.spawnl(
         os.P_NOWAIT, "/usr/bin/valkey-server", "./valkey.conf", "--port 7000"
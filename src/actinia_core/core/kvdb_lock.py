@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,11 +14,11 @@
 Kvdb server lock interface
 """
 
-import valkey
+from actinia_core.core.common.kvdb_base import get_kvdb_client
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -84,36 +84,37 @@ class KvdbLockingInterface(object):
     def connect(self, host, port, password=None):
         """Connect to a specific kvdb server
 
+        The process-wide pooled client of the "locks" role is used and the
+        LUA scripts are registered only once per process.
+
         Args:
             host (str): The host name or IP address
             port (int): The port
             password (str): The password
 
         """
-        kwargs = dict()
-        kwargs["host"] = host
-        kwargs["port"] = port
-        if password and password is not None:
-            kwargs["password"] = password
-        self.connection_pool = valkey.ConnectionPool(**kwargs)
-        del kwargs
-        self.kvdb_server = valkey.StrictValkey(
-            connection_pool=self.connection_pool
-        )
+        kvdb_client = get_kvdb_client("locks", host, port, password)
+        self.connection_pool = kvdb_client.connection_pool
+        self.kvdb_server = kvdb_client.kvdb_server
 
         # Register the resource lock scripts in Kvdb
-        self.call_lock_resource = self.kvdb_server.register_script(
+        self.call_lock_resource = kvdb_client.register_script(
             self.lua_lock_resource
         )
-        self.call_extend_resource_lock = self.kvdb_server.register_script(
+        self.call_extend_resource_lock = kvdb_client.register_script(
             self.lua_extend_resource_lock
         )
-        self.call_unlock_resource = self.kvdb_server.register_script(
+        self.call_unlock_resource = kvdb_client.register_script(
             self.lua_unlock_resource
         )
 
     def disconnect(self):
-        self.connection_pool.disconnect()
+        """Disconnect from the kvdb server
+
+        The pooled client is shared with other interfaces and is kept open,
+        use close_kvdb_clients("locks") to close it.
+        """
+        pass
 
     """
     LOCK
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Kvdb server interface for prepared process chain templates
+"""
+
+import json
+import uuid
+
+from actinia_core.core.common.kvdb_base import KvdbBaseInterface
+from actinia_core.core.common.process_chain_template import (
+    process_chain_template_cache,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class KvdbProcessChainTemplateInterface(KvdbBaseInterface):
+    """
+    The Kvdb process chain template database interface
+
+    Each template is stored as hash with the JSON template definition and a
+    version that changes with each update. Compiled templates are cached in
+    the server process, a submission only reads the version of the stored
+    template to validate the cached entry.
+    """
+
+    template_prefix = "PROCESS-CHAIN-TEMPLATE::"
+    kvdb_role = "users"
+
+    def __init__(self):
+        KvdbBaseInterface.__init__(self)
+
+    def _key(self, user_id, template_id):
+        return "%s%s::%s" % (self.template_prefix, user_id, template_id)
+
+    def add(self, user_id, template):
+        """Store a compiled template, an existing template is replaced
+
+        Args:
+            user_id (str): The id of the template owner
+            template (ProcessChainTemplate): The compiled template
+
+        Returns:
+            str:
+            The version of the stored template
+        """
+        version = uuid.uuid4().hex
+        self.kvdb_server.hset(
+            self._key(user_id, template.template_id),
+            mapping={
+                "template": json.dumps(template.to_dict()),
+                "version": version,
+            },
+        )
+        process_chain_template_cache.invalidate(user_id, template.template_id)
+        return version
+
+    def read(self, user_id, template_id):
+        """Return the stored template definition
+
+        Args:
+            user_id (str): The id of the template owner
+            template_id (str): The template id
+
+        Returns:
+            dict:
+            The template definition, None if the template does not exist
+        """
+        template = self.kvdb_server.hget(
+            self._key(user_id, template_id), "template"
+        )
+        if template is None:
+            return None
+        return json.loads(template)
+
+    def get_compiled(self, user_id, template_id):
+        """Return the compiled template
+
+        Args:
+            user_id (str): The id of the template owner
+            template_id (str): The template id
+
+        Returns:
+            ProcessChainTemplate:
+            The compiled template, None if the template does not exist
+        """
+        version = self.kvdb_server.hget(
+            self._key(user_id, template_id), "version"
+        )
+        if version is None:
+            return None
+
+        def load():
+            definition = self.read(user_id, template_id)
+            if definition is None:
+                raise KeyError(template_id)
+            return definition
+
+        try:
+            return process_chain_template_cache.get(
+                user_id, template_id, version, load
+            )
+        except KeyError:
+            # Deleted while reading
+            return None
+
+    def list(self, user_id):
+        """Return the ids of all templates of a user
+
+        Args:
+            user_id (str): The id of the template owner
+
+        Returns:
+            list:
+            The sorted template ids
+        """
+        prefix = self._key(user_id, "")
+        return sorted(
+            key.decode()[len(prefix) :]
+            for key in self.kvdb_server.scan_iter(match=prefix + "*")
+        )
+
+    def delete(self, user_id, template_id):
+        """Remove a template
+
+        Args:
+            user_id (str): The id of the template owner
+            template_id (str): The template id
+
+        Returns:
+            bool:
+            True if the template was removed, False if it does not exist
+        """
+        process_chain_template_cache.invalidate(user_id, template_id)
+        return bool(self.kvdb_server.delete(self._key(user_id, template_id)))
+
+
+# Create the Kvdb interface instance
+kvdb_process_chain_template_interface = KvdbProcessChainTemplateInterface()
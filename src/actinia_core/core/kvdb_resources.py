@@ -31,6 +31,7 @@ class KvdbResourceInterface(KvdbBaseInterface):
     # The database to store the long pending resource status and results
     resource_id_prefix = "RESOURCE-ID::"
     resource_id_termination_prefix = "RESOURCE-ID-TERMINATION::"
+    kvdb_role = "resources"
 
     def __init__(self):
         """
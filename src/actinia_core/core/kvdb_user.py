@@ -41,6 +41,7 @@ class KvdbUserInterface(KvdbBaseInterface):
     # The user ID and user name databases are hashes
     user_id_hash_prefix = "USER-ID-HASH-PREFIX::"
     user_id_db = "USER-ID-DATABASE"
+    kvdb_role = "users"
 
     def __init__(self):
         KvdbBaseInterface.__init__(self)
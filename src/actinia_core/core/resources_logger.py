@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2025 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,13 +14,25 @@
 Resource logger and management interface
 """
 
+import os
 import pickle
+from actinia_core.core.common.config import global_config
+from .kvdb_accounting import KvdbAccountingInterface
 from .kvdb_resources import KvdbResourceInterface
 from .kvdb_fluentd_logger_base import KvdbFluentLoggerBase
+from .logging_interface import log
+from .directory_size import get_directory_size
+from .usage_accounting import (
+    TERMINAL_STATES,
+    create_usage_entry,
+    get_job_cpu_seconds,
+    get_usage_day,
+    is_job_process,
+)
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Carmen Tawalika, Anika Weinmann"
-__copyright__ = "Copyright 2016-2025, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 
 
 class ResourceLogger(KvdbFluentLoggerBase):
@@ -34,16 +46,42 @@ class ResourceLogger(KvdbFluentLoggerBase):
         config=None,
         user_id=None,
         fluent_sender=None,
+        measure_process_usage=False,
     ):
+        """
+        Args:
+            host (str): The hostname of the kvdb server
+            port (str): The port of the kvdb server
+            password (str): The password of the kvdb server
+            config: The configuration of Actinia Core
+            user_id (str): The user id
+            fluent_sender: The fluentd sender
+            measure_process_usage (bool): Account the CPU time of the job of
+                                          the current process when a
+                                          resource reaches a terminal state.
+                                          It is always enabled in job
+                                          processes that were started by
+                                          run_job().
+        """
         KvdbFluentLoggerBase.__init__(
             self, config=config, user_id=user_id, fluent_sender=fluent_sender
         )
+        if config is None:
+            config = global_config
+        self.config = config
+        self.measure_process_usage = (
+            measure_process_usage is True or is_job_process()
+        )
         # Connect to a kvdb database
         self.db = KvdbResourceInterface()
+        self.accounting_db = None
         kvdb_args = (host, port)
         if password is not None:
             kvdb_args = (*kvdb_args, password)
         self.db.connect(*kvdb_args)
+        if self.config.KVDB_ACCOUNTING is True:
+            self.accounting_db = KvdbAccountingInterface()
+            self.accounting_db.connect(*kvdb_args)
         del kvdb_args
 
     @staticmethod
@@ -99,10 +137,71 @@ class ResourceLogger(KvdbFluentLoggerBase):
         )
         kvdb_return = bool(self.db.set(db_resource_id, document, expiration))
         _, data = pickle.loads(document)
+        if (
+            self.accounting_db is not None
+            and isinstance(data, dict)
+            and data.get("status") in TERMINAL_STATES
+        ):
+            self._account_usage(user_id, resource_id, db_resource_id, data)
         data["logger"] = "resources_logger"
         self.send_to_logger("RESOURCE_LOG", data)
         return kvdb_return
 
+    def _account_usage(self, user_id, resource_id, db_resource_id, data):
+        """Add the resource usage of a resource in a terminal state to the
+        daily usage aggregates of the user
+
+        Errors are logged and never stop the commit of the resource.
+
+        Args:
+            user_id (str): The user id
+            resource_id (str): The resource id
+            db_resource_id (str): The DB resource id
+            data (dict): The resource response document
+        """
+        try:
+            cpu_seconds = None
+            if self.measure_process_usage is True:
+                cpu_seconds = get_job_cpu_seconds()
+            exported_bytes = 0
+            urls = data.get("urls") or {}
+            if urls.get("resources"):
+                exported_bytes = get_directory_size(
+                    os.path.join(
+                        self.config.GRASS_RESOURCE_DIR, user_id, resource_id
+                    )
+                )
+            usage = create_usage_entry(
+                data, cpu_seconds=cpu_seconds, exported_bytes=exported_bytes
+            )
+            self.accounting_db.add(
+                user_id,
+                db_resource_id,
+                get_usage_day(data),
+                usage,
+                self.config.KVDB_ACCOUNTING_EXPIRE_TIME,
+            )
+        except Exception as e:
+            log.error(
+                "Unable to account the usage of resource <%s>: %s"
+                % (db_resource_id, str(e))
+            )
+
+    def get_usage(self, user_id, days):
+        """Get the daily resource usage aggregates of a user
+
+        Args:
+            user_id (str): The user id
+            days (list): A list of days as YYYY-MM-DD
+
+        Returns:
+            list:
+            A list of (day, usage dict) tuples
+        """
+        if self.accounting_db is None:
+            return [(day, {}) for day in days]
+        return self.accounting_db.get(user_id, days)
+
     def commit_termination(
         self, user_id, resource_id, iteration=None, expiration=3600
     ):
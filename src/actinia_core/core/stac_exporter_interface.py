@@ -23,14 +23,9 @@ __maintainer__ = "__mundialis__"
 __email__ = "info@mundialis.de"
 
 from datetime import datetime
-import numpy as np
-import pyproj
-from pystac import Item, read_dict, Catalog, Asset
-
-from shapely.ops import transform
-import rasterio
-from shapely.geometry import Polygon, mapping
 
+# numpy, pyproj, pystac, rasterio and shapely are imported on first use,
+# they are slow to import and only needed for STAC exports
 from actinia_processing_lib.exceptions import AsyncProcessTermination
 from actinia_core.core.common.app import API_VERSION
 from actinia_core.version import G_VERSION
@@ -62,6 +57,8 @@ class STACExporter:
                 - output_type =  type of object (raster, vector)
         """
 
+        from pystac import Asset, Item, read_dict
+
         output_path = self._get_source_file(resource_url)
 
         self._stac_collection_initializer()
@@ -145,6 +142,8 @@ class STACExporter:
 
         Code uses pystac as base for the creation of stac catalogs
         """
+        from pystac import Catalog
+
         connectKvdb()
 
         result_catalog_validation = kvdb_actinia_interface.exists(
@@ -184,6 +183,9 @@ class STACExporter:
 
     @staticmethod
     def _get_raster_parameters(raster_path):
+        import rasterio
+        from shapely.geometry import Polygon, mapping
+
         with rasterio.open(raster_path) as raster:
             gds = raster.transform[:]
             bounds = raster.bounds
@@ -213,6 +215,10 @@ class STACExporter:
     @staticmethod
     def _get_wgs84_parameters(extra_values):
         if extra_values["crs"] != 4326:
+            import pyproj
+            from shapely.geometry import Polygon, mapping
+            from shapely.ops import transform
+
             wgs84 = pyproj.CRS("EPSG:4326")
             raster_proj = pyproj.CRS("EPSG:" + str(extra_values["crs"]))
             project = pyproj.Transformer.from_crs(
@@ -246,6 +252,8 @@ class STACExporter:
 
     @staticmethod
     def _set_processing_extention(item):
+        from pystac import read_dict
+
         input_item = item.to_dict()
 
         input_item["processing:facility"] = (f"Actinia Core {API_VERSION}",)
@@ -264,6 +272,10 @@ class STACExporter:
 
     @staticmethod
     def _set_raster_extention(raster_path, item):
+        import numpy as np
+        import rasterio
+        from pystac import read_dict
+
         with rasterio.open(raster_path) as raster:
             band = raster.read(1)
             pixelSizeX, _ = raster.res
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Startup profile
+
+The module of the application is imported in a new Python interpreter with
+-X importtime, the import time of each module and the maximum resident set
+size of the interpreter are reported.
+"""
+
+import resource
+import subprocess
+import sys
+import time
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The code that is run to measure the resident set size after the import
+_IMPORT_SCRIPT = """
+import resource, sys
+__import__(sys.argv[1])
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def parse_importtime(output):
+    """Parse the output of python -X importtime
+
+    Args:
+        output (str): The stderr of the interpreter
+
+    Returns:
+        list:
+        The imported modules as dicts with name, level, self_us and
+        cumulative_us, in import order
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        modules.append(
+            {
+                "name": stripped,
+                "level": (len(name) - len(stripped) - 1) // 2,
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return modules
+
+
+def profile_startup(module="actinia_core.main", python=None):
+    """Import a module in a new interpreter and measure the import times
+
+    Args:
+        module (str): The module that is imported
+        python (str): The Python interpreter, the current interpreter if None
+
+    Raises:
+        RuntimeError: If the module can not be imported
+
+    Returns:
+        dict:
+        The module, the total import time in seconds, the maximum resident
+        set size in KiB and the imported modules
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", _IMPORT_SCRIPT]
+        + [module],
+        capture_output=True,
+        text=True,
+    )
+    total = time.perf_counter() - start
+    if proc.returncode != 0:
+        errors = [
+            line
+            for line in proc.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(
+            "Unable to import <%s>: %s" % (module, "\n".join(errors[-20:]))
+        )
+    return {
+        "module": module,
+        "total_s": total,
+        "max_rss_kib": int(proc.stdout.split()[-1]),
+        "modules": parse_importtime(proc.stderr),
+    }
+
+
+def format_startup_profile(profile, limit=30):
+    """Format the startup profile as report
+
+    Args:
+        profile (dict): The result of profile_startup()
+        limit (int): The number of modules with the largest self time that
+                     are listed
+
+    Returns:
+        str:
+        The report
+    """
+    modules = profile["modules"]
+    top_level = sum(m["cumulative_us"] for m in modules if m["level"] == 0)
+    lines = [
+        "Startup profile of <%s>" % profile["module"],
+        "Interpreter run time: %.3f s" % profile["total_s"],
+        "Import time: %.3f s" % (top_level / 1e6),
+        "Imported modules: %i" % len(modules),
+        "Maximum resident set size: %.1f MiB"
+        % (profile["max_rss_kib"] / 1024.0),
+        "",
+        "%10s %10s  %s" % ("self [ms]", "cum [ms]", "module"),
+    ]
+    slowest = sorted(modules, key=lambda m: m["self_us"], reverse=True)
+    for m in slowest[:limit]:
+        lines.append(
+            "%10.1f %10.1f  %s"
+            % (m["self_us"] / 1e3, m["cumulative_us"] / 1e3, m["name"])
+        )
+    return "\n".join(lines)
+
+
+def get_max_rss_kib():
+    """Return the maximum resident set size of this process in KiB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
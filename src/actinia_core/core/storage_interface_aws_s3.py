@@ -15,7 +15,6 @@ Storage base class
 """
 
 import os
-import boto3
 from .storage_interface_base import ResourceStorageBase
 
 __license__ = "GPL-3.0-or-later"
@@ -44,6 +43,8 @@ class ResourceStorageS3(ResourceStorageBase):
 
     def setup(self):
         """Setup the AWS S3 botot3 client and the AWS login credentials"""
+        # boto3 is imported on first use, it is slow to import
+        import boto3
 
         self.session = boto3.Session(
             region_name=self.config.S3_AWS_DEFAULT_REGION,
@@ -16,7 +16,6 @@ Storage base class
 
 import os
 import datetime
-from google.cloud import storage
 from .storage_interface_base import ResourceStorageBase
 
 __license__ = "GPL-3.0-or-later"
@@ -51,6 +50,9 @@ class ResourceStorageGCS(ResourceStorageBase):
         """
         Setup the Google Cloud Storage (GCS) client and the GCS credentials
         """
+        # google.cloud is imported on first use, it is slow to import
+        from google.cloud import storage
+
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = (
             self.config.GOOGLE_APPLICATION_CREDENTIALS
         )
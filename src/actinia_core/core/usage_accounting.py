@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Per-user and per-day accounting of the resource usage of finished resources
+"""
+
+import resource
+import time
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The states in which a resource will not be updated by its process anymore
+TERMINAL_STATES = ("finished", "error", "terminated", "timeout")
+
+# The aggregates that are accounted for each resource
+USAGE_FIELDS = (
+    "wall_seconds",
+    "cpu_seconds",
+    "executed_modules",
+    "exported_bytes",
+    "cells_processed",
+)
+
+# The GRASS modules that process the cells of the computational region
+RASTER_MODULE_PREFIXES = ("r.", "i.")
+
+# The CPU time of the current process when it started its job, None if the
+# current process does not run a job
+_job_start_cpu_seconds = None
+
+
+def get_process_cpu_seconds():
+    """Return the CPU time of the current process and all its terminated
+    child processes, hence the CPU time of a processing job including the
+    GRASS modules it has run
+
+    Returns:
+        float:
+        The user and system CPU time in seconds
+    """
+    cpu_seconds = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        cpu_seconds += usage.ru_utime + usage.ru_stime
+    return cpu_seconds
+
+
+def run_job(func, *args):
+    """Run a processing job in the current process
+
+    The current process is marked as job process, the CPU time that is
+    accounted for its resource is measured from the start of the job.
+
+    Args:
+        func: The function that runs the job
+        *args: The function arguments
+    """
+    global _job_start_cpu_seconds
+    _job_start_cpu_seconds = get_process_cpu_seconds()
+    return func(*args)
+
+
+def is_job_process():
+    """Check if the current process runs a job that was started by run_job()
+
+    Returns:
+        bool:
+        True if the current process runs a job
+    """
+    return _job_start_cpu_seconds is not None
+
+
+def get_job_cpu_seconds():
+    """Return the CPU time of the job of the current process including the
+    GRASS modules it has run
+
+    Returns:
+        float:
+        The user and system CPU time in seconds since the job was started,
+        since the start of the process if it does not run a job
+    """
+    return get_process_cpu_seconds() - (_job_start_cpu_seconds or 0.0)
+
+
+def is_raster_module(module_name):
+    """Check if a GRASS module processes the cells of the computational
+    region
+
+    Args:
+        module_name (str): The name of the module
+
+    Returns:
+        bool:
+        True if the module is a raster or imagery module
+    """
+    return module_name.startswith(RASTER_MODULE_PREFIXES)
+
+
+def get_region_cells(region_path):
+    """Return the number of cells of a GRASS region file, e.g. the WIND file
+    of a mapset
+
+    Args:
+        region_path (str): The path of the region file
+
+    Returns:
+        int:
+        The number of rows times the number of columns, 0 if the region file
+        can not be read
+    """
+    region = {}
+    try:
+        with open(region_path) as region_file:
+            for line in region_file:
+                key, _, value = line.partition(":")
+                region[key.strip()] = value.strip()
+        return int(region["rows"]) * int(region["cols"])
+    except (OSError, KeyError, ValueError):
+        return 0
+
+
+def get_usage_day(data):
+    """Return the day (UTC) a resource is accounted for
+
+    Args:
+        data (dict): The resource response document
+
+    Returns:
+        str:
+        The day as YYYY-MM-DD
+    """
+    timestamp = data.get("timestamp")
+    if timestamp is None:
+        timestamp = time.time()
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def create_usage_entry(data, cpu_seconds=None, exported_bytes=0):
+    """Compute the resource usage of a resource from its response document
+
+    The wall time is the processing time of the resource. The number of
+    executed modules is the length of the process log. The processed cells
+    are the sum of the cells entries of the process log, the cells of the
+    computational region of each raster module.
+
+    Args:
+        data (dict): The resource response document
+        cpu_seconds (float): The measured CPU time of the processing job
+        exported_bytes (int): The size of the exported resources in bytes
+
+    Returns:
+        dict:
+        The resource usage with the keys of USAGE_FIELDS
+    """
+    process_log = data.get("process_log")
+    if not isinstance(process_log, list):
+        process_log = []
+
+    return {
+        "wall_seconds": float(data.get("process_time_delta") or 0.0),
+        "cpu_seconds": float(cpu_seconds or 0.0),
+        "executed_modules": len(process_log),
+        "exported_bytes": int(exported_bytes),
+        "cells_processed": sum(
+            int(entry.get("cells") or 0)
+            for entry in process_log
+            if isinstance(entry, dict)
+        ),
+    }
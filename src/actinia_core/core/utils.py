@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2025 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -15,13 +15,14 @@ Utils file with common util functions
 """
 
 import os
+import sys
 from actinia_core.core.common.process_object import Process
 from actinia_core.core.common.exceptions import SecurityError
 from actinia_core.core.common.config import global_config
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2025, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -148,6 +149,43 @@ def get_wget_process(source, url):
     return p
 
 
+def get_download_process(download_list, config=None):
+    """The function returns a Process that downloads a list of files
+    concurrently and resumable into the download cache, see
+    actinia_core.core.download_stage
+
+    Args:
+        download_list (list): A list of (url, destination path) tuples
+        config: The actinia configuration object
+
+    Returns:
+        p (Process): process for the download stage
+    """
+    if config is None:
+        config = global_config
+
+    download_params = [
+        "-m",
+        "actinia_core.core.download_stage",
+        "--parallel",
+        str(config.DOWNLOAD_PARALLEL),
+        "--retries",
+        str(config.DOWNLOAD_RETRIES),
+    ]
+    for url, dest in download_list:
+        download_params.extend([url, dest])
+
+    p = Process(
+        exec_type="exec",
+        executable=sys.executable,
+        executable_params=download_params,
+        id="importer_download_%s"
+        % os.path.basename(download_list[0][1] if download_list else ""),
+        skip_permission_check=True,
+    )
+    return p
+
+
 def get_mv_process(source, dest):
     """The function returns a move Process for the given source and dest
 
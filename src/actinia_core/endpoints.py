@@ -5,7 +5,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -15,8 +15,10 @@
 Actinia core Endpoint definitions
 """
 
+import importlib
 import traceback
 import sys
+import time
 from pprint import pprint
 from flask_restful import Resource
 
@@ -60,13 +62,27 @@ from actinia_core.rest.persistent_processing import AsyncPersistentResource
 from actinia_core.rest.ephemeral_custom_processing import (
     AsyncEphemeralCustomResource,
 )
+from actinia_core.rest.grass_module_catalog import (
+    GrassModuleCatalogEntryResource,
+    GrassModuleCatalogResource,
+)
+from actinia_core.rest.process_chain_templates import (
+    AsyncEphemeralTemplateResource,
+    ProcessChainTemplateResource,
+    ProcessChainTemplatesResource,
+)
 from actinia_core.rest.process_validation import AsyncProcessValidationResource
 from actinia_core.rest.process_validation import SyncProcessValidationResource
 from actinia_core.rest.user_management import (
     UserListResource,
     UserManagementResource,
 )
-from actinia_core.rest.api_log_management import APILogResource
+from actinia_core.rest.api_log_management import (
+    APILogResource,
+    APILogCountResource,
+    APILogEndpointCountResource,
+)
+from actinia_core.rest.usage_accounting import UsageAccountingResource
 from actinia_core.rest.user_api_key import (
     TokenCreationResource,
     APIKeyCreationResource,
@@ -93,7 +109,7 @@ from actinia_core.rest.process_chain_monitoring import (
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -202,6 +218,14 @@ def create_project_endpoints(projects_url_part="projects"):
             AsyncEphemeralResource, projects_url_part
         ),
     )
+    flask_api.add_resource(
+        AsyncEphemeralTemplateResource,
+        f"/{projects_url_part}/<string:project_name>/"
+        "processing_async_template",
+        endpoint=get_endpoint_class_name(
+            AsyncEphemeralTemplateResource, projects_url_part
+        ),
+    )
     flask_api.add_resource(
         AsyncEphemeralExportResource,
         f"/{projects_url_part}/<string:project_name>/processing_async_export",
@@ -273,12 +297,31 @@ def create_core_endpoints():
         AsyncEphemeralCustomResource, "/custom_process/<string:executable>"
     )
 
+    # Prepared process chain templates
+    flask_api.add_resource(
+        ProcessChainTemplatesResource, "/process_chain_templates"
+    )
+    flask_api.add_resource(
+        ProcessChainTemplateResource,
+        "/process_chain_templates/<string:template_id>",
+    )
+
+    # GRASS module catalog
+    flask_api.add_resource(GrassModuleCatalogResource, "/module_catalog")
+    flask_api.add_resource(
+        GrassModuleCatalogEntryResource,
+        "/module_catalog/<string:module_name>",
+    )
+
     # all mapsets across all projects listing
     flask_api.add_resource(AllMapsetsListingResourceAdmin, "/mapsets")
 
     # User management
     flask_api.add_resource(UserListResource, "/users")
     flask_api.add_resource(UserManagementResource, "/users/<string:user_id>")
+    flask_api.add_resource(
+        UsageAccountingResource, "/users/<string:user_id>/usage"
+    )
     flask_api.add_resource(
         TokenCreationResource,
         "/token",
@@ -288,6 +331,10 @@ def create_core_endpoints():
         "/api_key",
     )
     flask_api.add_resource(APILogResource, "/api_log/<string:user_id>")
+    flask_api.add_resource(
+        APILogCountResource, "/api_log/<string:user_id>/count"
+    )
+    flask_api.add_resource(APILogEndpointCountResource, "/api_log_count")
 
     # Resource management
     """
@@ -339,14 +386,14 @@ def create_core_endpoints():
 
 
 def check_import_plugins():
-    import_str = (
-        "from {}.endpoints import create_endpoints as create_plugin_endpoints"
-        "\ncreate_plugin_endpoints(flask_api=flask_api)\n"
-    )
     for plugin in global_config.PLUGINS:
-        import_run_str = import_str.format(plugin)
         log.info("Loading plugin %s", plugin)
-        exec(import_run_str)
+        start = time.perf_counter()
+        plugin_endpoints = importlib.import_module("%s.endpoints" % plugin)
+        plugin_endpoints.create_endpoints(flask_api=flask_api)
+        log.info(
+            "Loaded plugin %s in %.3f s", plugin, time.perf_counter() - start
+        )
 
 
 def create_endpoints():
@@ -5,7 +5,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -19,14 +19,20 @@ import os
 from .endpoints import create_endpoints
 from .health_check import health_check
 from .version import init_versions
+from actinia_core.core.common.grass_module_catalog import (
+    grass_module_catalog,
+)
 from actinia_core.core.common.app import flask_app
 from actinia_core.core.common.config import global_config, DEFAULT_CONFIG_PATH
 from actinia_core.core.common.kvdb_interface import connect
 from actinia_core.core.common.process_queue import create_process_queue
+from actinia_core.core.interim_result_retention import interim_result_janitor
+from actinia_core.core.logging_interface import log
+from actinia_core.core.startup_profile import get_max_rss_kib
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
@@ -40,6 +46,8 @@ if os.path.exists(DEFAULT_CONFIG_PATH) is True and os.path.isfile(
 # Create the endpoints based on the global config
 create_endpoints()
 init_versions()
+# Build the GRASS module catalog if it does not exist for this GRASS build
+grass_module_catalog.build_in_background()
 
 # TODO: Implement a better error handler
 # @flask_app.errorhandler(InvalidUsage)
@@ -59,6 +67,16 @@ del kvdb_args
 # Create the process queue
 create_process_queue(global_config)
 
+# Apply the retention policy of the interim results, the janitor of only one
+# worker process manages them
+if global_config.SAVE_INTERIM_RESULTS is not False:
+    interim_result_janitor.start()
+
+# The memory budget of a worker, see actinia-server --profile-startup
+log.info(
+    "Startup finished, maximum resident set size: %i KiB", get_max_rss_kib()
+)
+
 # use import to make linter happy (needed to create endpoint)
 health_check = health_check
 
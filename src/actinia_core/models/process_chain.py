@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -20,7 +20,7 @@ from actinia_api import URL_PREFIX
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Carmen Tawalika, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -460,6 +460,19 @@ class GrassModule(Schema):
             "description": "Set True to print interface "
             "description and exit.",
         },
+        "depends_on": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "The ids of modules or executables of the process "
+            "chain that must finish before this module starts. "
+            "Use it to order side-effecting steps if independent steps of the "
+            "process chain are run concurrently.",
+        },
+        "barrier": {
+            "type": "boolean",
+            "description": "Set True to run this module after all previous "
+            "and before all following steps of the process chain.",
+        },
     }
     required = ["id", "module"]
     description = (
@@ -530,6 +543,21 @@ class Executable(Schema):
             'or id::stdout, the "id" is the unique identifier '
             "of a GRASS GIS module.",
         },
+        "depends_on": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "The ids of modules or executables of the process "
+            "chain that must finish before this executable starts. "
+            "Use it to order side-effecting steps if independent steps of the "
+            "process chain are run concurrently.",
+        },
+        "barrier": {
+            "type": "boolean",
+            "description": "Executables run after all previous and before "
+            "all following steps of the process chain. Set False to run "
+            "this executable concurrently with steps that do not use the "
+            "same $file identifiers.",
+        },
     }
     required = ["id", "exe"]
     description = (
@@ -741,3 +769,95 @@ class ProcessChainModel(Schema):
         },
         "version": "1",
     }
+
+
+class TemplateParameter(Schema):
+    """This schema defines a parameter of a process chain template"""
+
+    type = "object"
+    properties = {
+        "type": {
+            "type": "string",
+            "description": "The type of the bound value",
+            "enum": ["string", "number", "integer"],
+            "default": "string",
+        },
+        "default": {
+            "description": "The value that is used if the parameter is not "
+            "bound"
+        },
+        "description": {
+            "type": "string",
+            "description": "The description of the parameter",
+        },
+    }
+    example = {"type": "string", "description": "The elevation map"}
+
+
+class ProcessChainTemplateModel(Schema):
+    """This schema defines a prepared process chain template
+
+    The process chain contains {{name}} placeholders in parameter values,
+    flags, export options or webhooks. Placeholders are not allowed in
+    ids, module and executable names, stdin references and keys. The
+    template is validated and compiled when it is registered.
+    """
+
+    type = "object"
+    properties = {
+        "id": {
+            "type": "string",
+            "description": "The unique id of the template, 1 to 64 letters, "
+            "digits, underscores or hyphens",
+        },
+        "process_chain": ProcessChainModel,
+        "parameters": {
+            "type": "object",
+            "additionalProperties": TemplateParameter,
+            "description": "The parameter definitions, all placeholders are "
+            "required strings if not provided",
+        },
+    }
+    required = ["id", "process_chain"]
+    example = {
+        "id": "slope",
+        "process_chain": {
+            "version": "1",
+            "list": [
+                {
+                    "id": "slope_1",
+                    "module": "r.slope.aspect",
+                    "inputs": [
+                        {"param": "elevation", "value": "{{elevation}}"}
+                    ],
+                    "outputs": [{"param": "slope", "value": "slope"}],
+                    "flags": "{{flags}}",
+                }
+            ],
+        },
+        "parameters": {
+            "elevation": {"type": "string"},
+            "flags": {"type": "string", "default": ""},
+        },
+    }
+
+
+class ProcessChainTemplateBindingModel(Schema):
+    """This schema defines the submission of a process chain template"""
+
+    type = "object"
+    properties = {
+        "template_id": {
+            "type": "string",
+            "description": "The id of a registered template",
+        },
+        "bindings": {
+            "type": "object",
+            "description": "The values of the template parameters",
+        },
+    }
+    required = ["template_id"]
+    example = {
+        "template_id": "slope",
+        "bindings": {"elevation": "elevation@PERMANENT"},
+    }
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -21,12 +21,15 @@ from flask import jsonify
 from flask_restful_swagger_2 import Schema
 from copy import deepcopy
 from actinia_api import URL_PREFIX
+from actinia_api.swagger2.actinia_core.schemas.api_log_management import (
+    ApiLogEntryModel,
+)
 
 from actinia_core.core.common.process_chain import GrassModule
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Julia Haas, Guido Riembauer, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -118,6 +121,12 @@ class ProcessLogModel(Schema):
             "format": "float",
             "description": "The size of the mapset in bytes",
         },
+        "cells": {
+            "type": "number",
+            "format": "int64",
+            "description": "The number of cells of the computational region "
+            "that was processed by a raster module",
+        },
     }
     required = ["executable", "parameter", "stdout", "stderr", "return_code"]
 
@@ -1442,3 +1451,246 @@ class LinkResponseModel(Schema):
         "links": {"type": "list", "description": "A list of related links"},
     }
     required = ["status", "message"]
+
+
+class ApiLogPageModel(Schema):
+    """Response schema that represents a page of API log entries, newest
+    first.
+    """
+
+    type = "object"
+    properties = {
+        "api_log_list": {
+            "type": "array",
+            "items": ApiLogEntryModel,
+            "description": "A list of ApiLogEntryModel objects, each entry "
+            "contains its id as api_log_id",
+        },
+        "next_id": {
+            "type": "string",
+            "description": "The api_log_id that must be used as 'before' "
+            "parameter to request the next page, missing on the last page",
+        },
+    }
+    required = ["api_log_list"]
+    example = {
+        "api_log_list": [
+            {
+                "api_info": {
+                    "endpoint": "asyncephemeralresource",
+                    "method": "POST",
+                    "path": "/api/v3/projects/nc_spm_08/processing_async",
+                    "request_url": "http://localhost/api/v3/projects/"
+                    "nc_spm_08/processing_async",
+                },
+                "api_log_id": "1760870400000-0",
+                "logger": "api_logger",
+                "node": "actinia-core",
+                "request_str": "<Request 'http://localhost/api/v3/projects/"
+                "nc_spm_08/processing_async' [POST]>",
+                "status": "api_call",
+                "time_stamp": "Sun, 19 Oct 2026 10:40:00 GMT",
+                "user_id": "user",
+            }
+        ],
+        "next_id": "1760870400000-0",
+    }
+
+
+class ApiLogCountModel(Schema):
+    """Response schema that contains the number of API calls per endpoint
+    of a single day.
+    """
+
+    type = "object"
+    properties = {
+        "day": {
+            "type": "string",
+            "description": "The day (UTC) of the API calls as YYYY-MM-DD",
+        },
+        "api_call_count": {
+            "type": "object",
+            "description": "The number of API calls per endpoint",
+        },
+    }
+    required = ["day", "api_call_count"]
+    example = {
+        "day": "2026-10-19",
+        "api_call_count": {
+            "asyncephemeralresource": 12,
+            "resourcemanager": 140,
+        },
+    }
+
+
+class UsageEntryModel(Schema):
+    """Schema that contains the aggregated resource usage of a user for a
+    single day.
+    """
+
+    type = "object"
+    properties = {
+        "day": {
+            "type": "string",
+            "description": "The day (UTC) as YYYY-MM-DD",
+        },
+        "resources": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The number of resources that reached a terminal "
+            "state",
+        },
+        "wall_seconds": {
+            "type": "number",
+            "format": "double",
+            "description": "The processing time of the resources in seconds",
+        },
+        "cpu_seconds": {
+            "type": "number",
+            "format": "double",
+            "description": "The CPU time of the resources in seconds",
+        },
+        "executed_modules": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The number of executed modules",
+        },
+        "exported_bytes": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The size of the exported resources in bytes",
+        },
+        "cells_processed": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The number of cells of the computational region "
+            "processed by the raster modules",
+        },
+    }
+    required = ["day"]
+    example = {
+        "day": "2026-10-19",
+        "resources": 2,
+        "wall_seconds": 12.5,
+        "cpu_seconds": 10.1,
+        "executed_modules": 7,
+        "exported_bytes": 1024,
+        "cells_processed": 500000,
+    }
+
+
+class InterimResultFootprintModel(Schema):
+    """Schema that contains the storage footprint of the interim results of
+    a user.
+    """
+
+    type = "object"
+    properties = {
+        "bytes": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The size of the interim results in bytes",
+        },
+        "resources": {
+            "type": "integer",
+            "format": "int64",
+            "description": "The number of resources with interim results",
+        },
+    }
+    required = ["bytes", "resources"]
+    example = {"bytes": 1073741824, "resources": 2}
+
+
+class UsageResponseModel(Schema):
+    """Response schema that contains the daily resource usage of a user."""
+
+    type = "object"
+    properties = {
+        "user_id": {"type": "string", "description": "The user id"},
+        "usage": {
+            "type": "array",
+            "items": UsageEntryModel,
+            "description": "The resource usage for each day, oldest first",
+        },
+        "total": UsageEntryModel,
+        "interim_results": InterimResultFootprintModel,
+    }
+    required = ["user_id", "usage", "total"]
+    example = {
+        "user_id": "user",
+        "usage": [UsageEntryModel.example],
+        "total": UsageEntryModel.example,
+        "interim_results": InterimResultFootprintModel.example,
+    }
+
+
+class ProcessChainTemplateListResponseModel(Schema):
+    """Response schema that contains the ids of the process chain templates
+    of a user.
+    """
+
+    type = "object"
+    properties = {
+        "status": {
+            "type": "string",
+            "description": "The status of the request",
+        },
+        "template_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "The sorted ids of the process chain templates",
+        },
+    }
+    required = ["status", "template_ids"]
+    example = {"status": "success", "template_ids": ["ndvi", "slope"]}
+
+
+class GrassModuleSummaryModel(Schema):
+    """Schema that contains the name, description and keywords of a GRASS
+    module of the module catalog.
+    """
+
+    type = "object"
+    properties = {
+        "id": {"type": "string", "description": "The name of the module"},
+        "description": {
+            "type": "string",
+            "description": "The description of the module",
+        },
+        "keywords": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "The keywords of the module",
+        },
+    }
+    required = ["id", "description", "keywords"]
+    example = {
+        "id": "r.univar",
+        "description": "Calculates univariate statistics from the non-null "
+        "cells of a raster map.",
+        "keywords": ["raster", "statistics", "univariate statistics"],
+    }
+
+
+class GrassModuleCatalogListResponseModel(Schema):
+    """Response schema that contains the GRASS modules of the module catalog
+    that the user is allowed to use.
+    """
+
+    type = "object"
+    properties = {
+        "status": {
+            "type": "string",
+            "description": "The status of the request",
+        },
+        "modules": {
+            "type": "array",
+            "items": GrassModuleSummaryModel,
+            "description": "The modules sorted by name",
+        },
+    }
+    required = ["status", "modules"]
+    example = {
+        "status": "success",
+        "modules": [GrassModuleSummaryModel.example],
+    }
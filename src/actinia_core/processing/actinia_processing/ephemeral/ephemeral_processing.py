@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Processing of a process chain in an ephemeral mapset
+"""
+
+from actinia_processing_lib.ephemeral_processing import (
+    EphemeralProcessing as BaseEphemeralProcessing,
+)
+
+from ..process_chain_execution import ProcessChainExecution
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class EphemeralProcessing(ProcessChainExecution, BaseEphemeralProcessing):
+    """Run a process chain in an ephemeral mapset, independent steps run
+    concurrently
+    """
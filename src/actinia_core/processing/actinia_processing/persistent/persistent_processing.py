@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Processing of a process chain in a persistent mapset
+"""
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+from actinia_processing_lib.persistent_processing import (
+    PersistentProcessing as BasePersistentProcessing,
+)
+
+from ..process_chain_execution import ProcessChainExecution
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class PersistentProcessing(ProcessChainExecution, BasePersistentProcessing):
+    """Run a process chain in a persistent mapset, independent steps run
+    concurrently
+    """
+
+    def _extend_mapset_locks(self):
+        """Extend the locks of the target and temporary mapsets by the
+        maximum processing time * 2
+        """
+        if self.target_mapset_lock_set is True:
+            ret = self.lock_interface.extend(
+                resource_id=self.target_mapset_lock_id,
+                expiration=self.process_time_limit * 2,
+            )
+            if ret == 0:
+                raise AsyncProcessError(
+                    "Unable to extend lock for mapset <%s>"
+                    % self.target_mapset_name
+                )
+
+        if self.temp_mapset_lock_set is True:
+            ret = self.lock_interface.extend(
+                resource_id=self.temp_mapset_lock_id,
+                expiration=self.process_time_limit * 2,
+            )
+            if ret == 0:
+                raise AsyncProcessError(
+                    "Unable to extend lock for temporary mapset <%s>"
+                    % self.temp_mapset_name
+                )
+
+    def _execute_step(self, process):
+        """Extend the mapset locks and run a single step of the process list
+
+        Args:
+            process: The step of the process list
+        """
+        self._extend_mapset_locks()
+        ProcessChainExecution._execute_step(self, process)
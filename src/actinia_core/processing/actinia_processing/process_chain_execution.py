@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Execution of the steps of a process chain
+
+The step loop of the processing classes of actinia-processing-lib runs the
+steps one by one. The processing classes of actinia-core that run process
+chains use this class as first base class to run the steps with the
+dependency graph of the process list.
+"""
+
+import io
+import os
+import signal
+import subprocess
+
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.process_chain import get_param_stdin_part
+from actinia_core.core.common.process_graph import (
+    ProcessGraph,
+    get_max_parallel_steps,
+    get_stream_pipelines,
+)
+from actinia_core.core.common.process_object import Process
+from actinia_core.core.common.process_stream import (
+    OutputReader,
+    PipelineProcess,
+    SpooledOutput,
+    StdoutParser,
+    create_pipe,
+)
+from actinia_core.core.directory_size import get_directory_size
+from actinia_core.core.usage_accounting import (
+    get_region_cells,
+    is_raster_module,
+)
+from actinia_core.models.response_models import ProcessLogModel
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class ProcessChainExecution(object):
+    """Run the process list of a process chain
+
+    Independent steps run concurrently up to PROCESS_CHAIN_PARALLEL_STEPS
+    steps, see ProcessGraph. If PROCESS_CHAIN_STREAMING is set, steps that
+    are linked only through stdin run concurrently connected by OS pipes,
+    see get_stream_pipelines. This class must be the first base class of a
+    subclass of EphemeralProcessing.
+    """
+
+    # True if the steps of the process list run concurrently
+    parallel_steps = False
+    # The pipelines of the process list by the id of their first step
+    stream_pipelines = None
+    # The ids of the steps that are run by the first step of their pipeline
+    streamed_steps = None
+
+    def _get_max_parallel_steps(self):
+        """Return the number of steps that are allowed to run concurrently
+
+        The steps run one by one if interim results are saved after each
+        step, since a snapshot must contain all previous steps and no
+        running step.
+
+        Returns:
+            int:
+            The maximum number of concurrent steps
+        """
+        if self.interim_result.saving_interim_results is True:
+            return 1
+        return get_max_parallel_steps(self.config)
+
+    def _execute_process_list(self, process_list):
+        """Run all modules or executables that are specified in the process
+        list
+
+        Args:
+            process_list: The process list that was generated by
+                          _validate_process_chain()
+
+        Raises:
+            This method will raise an AsyncProcessError, AsyncProcessTimeLimit
+            or AsyncProcessTermination
+
+        """
+        max_parallel = self._get_max_parallel_steps()
+        self.parallel_steps = max_parallel > 1
+        graph = ProcessGraph(process_list)
+        self.stream_pipelines = {}
+        self.streamed_steps = set()
+        if self.config.PROCESS_CHAIN_STREAMING is True:
+            for pipeline in get_stream_pipelines(process_list):
+                if len(pipeline) > 1:
+                    graph.add_pipeline(pipeline)
+                    self.stream_pipelines[id(pipeline[0])] = pipeline
+                    self.streamed_steps.update(map(id, pipeline[1:]))
+        env = None
+        if self.parallel_steps:
+            env = self.ginit.get_env()
+            # The steps use copies of the region, hence it is checked
+            # before they are scheduled
+            if self.last_module == "g.region":
+                self._check_reset_region()
+                self.last_module = None
+        graph.run(
+            self._execute_step,
+            max_parallel,
+            mapset_path=self.temp_mapset_path,
+            env=env,
+        )
+
+    def _execute_step(self, process):
+        """Run a single step of the process list
+
+        Args:
+            process: The step of the process list
+        """
+        if self.streamed_steps and id(process) in self.streamed_steps:
+            # The step ran in the pipeline of a previous step
+            return
+        if self.interim_result.saving_interim_results is True:
+            # The files of the previous step may still be copied
+            self.interim_result.wait_for_pending_files(
+                self._get_step_outputs(process)
+            )
+        if process.exec_type == "grass":
+            self._run_module(process)
+            # Barriers run alone, the region must be checked before the
+            # following steps copy it
+            if (
+                self.parallel_steps
+                and self.last_module == "g.region"
+                and process.skip_permission_check is False
+            ):
+                self._check_reset_region()
+                self.last_module = None
+        elif process.exec_type == "exec":
+            self._run_process(process)
+        elif process.exec_type == "python":
+            eval(process.executable)
+
+    def _get_step_outputs(self, process):
+        """Return the names of the maps and files a step writes, including
+        the steps of its pipeline, None if they are unknown
+        """
+        outputs = set()
+        for step in self.stream_pipelines.get(id(process), [process]):
+            if ProcessGraph.is_barrier(step):
+                return None
+            outputs.update(step.outputs)
+        return outputs
+
+    def _set_process_parameters(self, process):
+        """Replace the stdout and stderr references in the parameters of a
+        process with the outputs of the referenced processes
+        """
+        for num, func in process.param_stdin_sources.items():
+            func_name = f"PARAM_STDIN_FUNC_{num}"
+            for i, param in enumerate(process.executable_params):
+                if func_name not in param:
+                    continue
+                _, val = param.split("=", 1)
+                par_val = func().strip()
+                val_splitted = val.split(func_name)
+                for j in range(1, len(val_splitted)):
+                    filtered_par_value = par_val
+                    filtered_func_name = func_name
+                    # filter stdout/stderr
+                    if "::" in val_splitted[j]:
+                        filter = get_param_stdin_part(val_splitted[j][2:])
+                        if "=" not in par_val:
+                            raise AsyncProcessError(
+                                "Error while running executable "
+                                f"<{process.executable}>: <{filter}> "
+                                "cannot be selected. Maybe you have to "
+                                "set the '-g' flag for the stdout/stderr "
+                                "module."
+                            )
+                        filtered_par_value = {
+                            x.split("=")[0]: x.split("=")[1]
+                            for x in par_val.split()
+                        }[filter]
+                        filtered_func_name += f"::{filter}"
+                    process.executable_params[i] = process.executable_params[
+                        i
+                    ].replace(filtered_func_name, filtered_par_value)
+
+    def _open_stdin(self, process):
+        """Open the stdin of a process
+
+        The spilled stdout of a previous process is read from its temporary
+        file, other sources are written to a temporary file.
+
+        Args:
+            process (Process): The process object that should be executed
+
+        Returns:
+            file:
+            The file object that provides stdin, None if the process has no
+            stdin
+        """
+        source = process.stdin_source
+        if source is None:
+            return None
+        if getattr(source, "__func__", None) is Process.get_stdout:
+            stdin_file = source.__self__.open_stdout()
+            try:
+                stdin_file.fileno()
+                return stdin_file
+            except io.UnsupportedOperation:
+                # The output is kept in memory
+                stdin_file.close()
+        tmp_file = self.proc_chain_converter.generate_temp_file_path()
+        with open(tmp_file, "w") as f:
+            f.write(source())
+        return open(tmp_file)
+
+    def _start_process(self, process, stdin, stdout, stderr):
+        """Start a GRASS module or executable with the environment of its
+        step
+
+        Returns:
+            The started process
+        """
+        if process.exec_type == "grass":
+            return self.ginit.run_module(
+                process.executable,
+                process.executable_params,
+                raw=True,
+                stdout=stdout,
+                stderr=stderr,
+                stdin=stdin,
+                env=process.env,
+            )
+        return subprocess.Popen(
+            args=[process.executable, *process.executable_params],
+            stdout=stdout,
+            stderr=stderr,
+            stdin=stdin,
+            env=process.env,
+        )
+
+    def _get_pipeline(self, process):
+        """Return the steps that are started with a process
+
+        Returns:
+            list:
+            The pipeline of the process if it is its first step, otherwise
+            a list with the process
+        """
+        if self.stream_pipelines:
+            return self.stream_pipelines.get(id(process), [process])
+        return [process]
+
+    def _run_executable(self, process, poll_time=0.005):
+        """Run a GRASS module or executable with the environment of its step,
+        create the process log model and return stdout, stderr and the
+        return code
+
+        Stdout and stderr are read from pipes while the process is running,
+        outputs larger than STDOUT_MEMORY_LIMIT are spilled to temporary
+        files. The stdout definition of the process is parsed incrementally.
+        If the process is the first step of a pipeline all steps of the
+        pipeline are started, the stdout of a step is the stdin of the next
+        step and is not stored.
+
+        Args:
+            process (Process): The process object that should be executed
+            poll_time (float): The time to check the process status and to
+                               send updates to the resource db
+
+        Raises:
+            AsyncProcessError:
+            AsyncProcessTermination:
+            AsyncProcessTimeLimit:
+
+        Returns:
+            tuple:
+            (returncode, stdout, stderr), stdout and stderr of the last step
+            as SpooledOutput objects
+        """
+        processes = self._get_pipeline(process)
+        last = processes[-1]
+        if process.param_stdin_sources:
+            self._set_process_parameters(process)
+
+        memory_limit = self.config.STDOUT_MEMORY_LIMIT
+        stdout = SpooledOutput(memory_limit, self.temp_file_path)
+        stderrs = [
+            SpooledOutput(memory_limit, self.temp_file_path) for _ in processes
+        ]
+        parser = None
+        if last.stdout_parser is not None:
+            parser = StdoutParser.from_definition(last.stdout_parser)
+        stdin_file = self._open_stdin(process)
+
+        self._increment_progress(num=len(processes))
+
+        procs = []
+        readers = []
+        stdin = stdin_file
+        stdout_pipe = None
+        try:
+            for step, stderr in zip(processes, stderrs):
+                stderr_pipe, stderr_write = create_pipe()
+                readers.append(OutputReader(stderr_pipe, stderr))
+                stdout_pipe, stdout_write = create_pipe()
+                # The write ends are only kept open by the process
+                with stdout_write, stderr_write:
+                    procs.append(
+                        self._start_process(
+                            step, stdin, stdout_write, stderr_write
+                        )
+                    )
+                if stdin is not stdin_file:
+                    # Only the started process reads the pipe
+                    stdin.close()
+                stdin, stdout_pipe = stdout_pipe, None
+        except Exception:
+            for pipe in (stdin, stdout_pipe):
+                if pipe is not None and pipe is not stdin_file:
+                    pipe.close()
+            for reader in readers:
+                reader.pipe.close()
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+            if stdin_file:
+                stdin_file.close()
+            raise
+
+        readers.append(OutputReader(stdin, stdout, parser))
+        for reader in readers:
+            reader.start()
+        proc = PipelineProcess(procs)
+        try:
+            run_time = self._wait_for_process(
+                process.executable,
+                process.executable_params,
+                proc,
+                poll_time,
+            )
+            proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            for reader in readers:
+                reader.join()
+            if stdin_file:
+                stdin_file.close()
+
+        for step, step_proc, stderr in zip(processes, procs, stderrs):
+            step.set_stdouts(
+                stdout=stdout if step is last else "", stderr=stderr
+            )
+            self._log_process(step, step_proc.returncode, run_time)
+
+        if proc.returncode != 0:
+            for step, step_proc in zip(processes, procs):
+                if step_proc.returncode not in (0, -signal.SIGPIPE):
+                    break
+            raise AsyncProcessError(
+                "Error while running executable <%s>" % step.executable
+            )
+        for reader in readers:
+            if reader.error is not None:
+                raise reader.error
+        if parser is not None:
+            self.module_results[last.stdout_parser["id"]] = parser.close()
+
+        self._save_interim_results()
+        return proc.returncode, stdout, stderrs[-1]
+
+    def _parse_module_outputs(self):
+        """Parse the stdout of the processes whose stdout was not parsed
+        while they were running
+        """
+        output_parser_list = self.output_parser_list
+        self.output_parser_list = [
+            entry
+            for entry in output_parser_list
+            if any(
+                stdout_def["id"] not in self.module_results
+                for stdout_def in entry.values()
+            )
+        ]
+        try:
+            super()._parse_module_outputs()
+        finally:
+            self.output_parser_list = output_parser_list
+
+    def _log_process(self, process, returncode, run_time):
+        """Add the process log model of a finished process
+
+        Only the part of stdout and stderr that is kept in memory is logged.
+        The cells of the region a raster module ran with are logged for the
+        usage accounting.
+        """
+        kwargs = {
+            "id": process.id,
+            "executable": process.executable,
+            "parameter": process.executable_params,
+            "return_code": returncode,
+            "stdout": _get_log_output(process.stdout),
+            "stderr": _get_log_output(process.stderr).split("\n"),
+            "run_time": run_time,
+        }
+        if self.temp_mapset_path:
+            kwargs["mapset_size"] = get_directory_size(self.temp_mapset_path)
+            if process.exec_type == "grass" and is_raster_module(
+                process.executable
+            ):
+                kwargs["cells"] = get_region_cells(
+                    self._get_region_path(process)
+                )
+
+        plm = ProcessLogModel(**kwargs)
+        self.module_output_log.append(plm)
+        # Store the log in an additional dictionary for automated output
+        # generation
+        if process.id is not None:
+            self.module_output_dict[process.id] = plm
+
+    def _get_region_path(self, process):
+        """Return the path of the region file a process runs with, the copy
+        of the region of a concurrent step or the region of the mapset
+        """
+        region = (process.env or {}).get("WIND_OVERRIDE")
+        if region:
+            return os.path.join(self.temp_mapset_path, "windows", region)
+        return os.path.join(self.temp_mapset_path, "WIND")
+
+    def _save_interim_results(self):
+        """Save the interim results after a step finished"""
+        if (
+            self.interim_result.saving_interim_results is True
+            and self.temp_mapset_path is not None
+        ):
+            self.interim_result.save_interim_results(
+                self.progress_steps,
+                self.temp_mapset_path,
+                self.temp_file_path,
+            )
+        elif self.temp_mapset_path is None:
+            self.message_logger.debug(
+                "No temp mapset path set. Because of that no interim results"
+                " can be saved!"
+            )
+
+    def _final_cleanup(self):
+        """Wait for the interim results that are saved in the background
+        before the temporary database is removed and the final status is
+        sent
+
+        An error of the background saving was logged by the saving thread,
+        it does not change the final status.
+        """
+        self.interim_result.wait_for_interim_results(raise_error=False)
+        super()._final_cleanup()
+
+
+def _get_log_output(output):
+    """Return the output of a process for the process log, the first
+    STDOUT_MEMORY_LIMIT bytes of spilled outputs
+    """
+    if isinstance(output, SpooledOutput):
+        return output.getvalue(output.memory_limit)
+    return output
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2022 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -19,13 +19,16 @@ from actinia_processing_lib.utils import try_import
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Guido Riembauer, Anika Weinmann, Carmen Tawalika"
-__copyright__ = "Copyright 2016-2022, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
 
 PersistentProcessing = try_import(
-    "actinia_processing_lib.persistent_processing",
+    (
+        "actinia_core.processing.actinia_processing.persistent"
+        + ".persistent_processing"
+    ),
     "PersistentProcessing",
 )
 
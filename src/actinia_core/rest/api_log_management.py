@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,14 +14,14 @@
 This module is designed to deliver the API calls of a specific user
 """
 
-from flask import g
+import re
+from copy import deepcopy
+from datetime import datetime, timezone
+from flask import g, request
 from flask import jsonify, make_response
 from flask_restful import Resource
 from flask_restful_swagger_2 import swagger
 from actinia_api.swagger2.actinia_core.apidocs import api_log_management
-from actinia_api.swagger2.actinia_core.schemas.api_log_management import (
-    ApiLogListModel,
-)
 
 from actinia_core.core.common.app import auth
 from actinia_core.core.common.api_logger import ApiLogger
@@ -30,15 +30,160 @@ from actinia_rest_lib.endpoint_config import (
     check_endpoint,
     endpoint_decorator,
 )
-from actinia_core.models.response_models import SimpleResponseModel
+from actinia_core.models.response_models import (
+    ApiLogCountModel,
+    ApiLogPageModel,
+    SimpleResponseModel,
+)
+from actinia_core.rest.base.user_auth import check_admin_role
 from actinia_core.rest.base.user_auth import check_user_permissions
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
+# The default and maximum number of API log entries of a page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+get_doc = deepcopy(api_log_management.get_doc)
+get_doc["description"] = (
+    "Get a page of the API calls that have been called by the provided "
+    "user, newest first. Admin and superadmin roles can list API calls from "
+    "any user. A user role can only list API calls from itself. "
+    "Minimum required user role: user."
+)
+get_doc["parameters"].extend(
+    [
+        {
+            "name": "count",
+            "description": "The maximum number of API log entries of the "
+            "page, default %i, maximum %i"
+            % (DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE),
+            "required": False,
+            "in": "query",
+            "type": "integer",
+        },
+        {
+            "name": "before",
+            "description": "Only list API calls older than this api_log_id, "
+            "use the next_id of the previous page",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+        {
+            "name": "start_time",
+            "description": "Only list API calls after this ISO 8601 time, "
+            "UTC if no time zone is given",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+        {
+            "name": "end_time",
+            "description": "Only list API calls before this ISO 8601 time, "
+            "UTC if no time zone is given",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+    ]
+)
+get_doc["responses"]["200"]["schema"] = ApiLogPageModel
+
+count_get_doc = {
+    "tags": ["API Log"],
+    "description": "Get the number of API calls per endpoint of the "
+    "provided user for a single day. Admin and superadmin roles can count "
+    "API calls from any user. A user role can only count API calls from "
+    "itself. Minimum required user role: user.",
+    "parameters": [
+        {
+            "name": "user_id",
+            "description": "The unique user name/id",
+            "required": True,
+            "in": "path",
+            "type": "string",
+        },
+        {
+            "name": "day",
+            "description": "The day (UTC) as YYYY-MM-DD, default is today",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": "The number of API calls per endpoint",
+            "schema": ApiLogCountModel,
+        },
+        "400": {
+            "description": "The error message why API call counting did not "
+            "succeeded",
+            "schema": SimpleResponseModel,
+        },
+    },
+}
+
+endpoint_count_get_doc = {
+    "tags": ["API Log"],
+    "description": "Get the number of API calls per endpoint of all users "
+    "for a single day. Minimum required user role: admin.",
+    "parameters": [
+        {
+            "name": "day",
+            "description": "The day (UTC) as YYYY-MM-DD, default is today",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": "The number of API calls per endpoint",
+            "schema": ApiLogCountModel,
+        },
+        "400": {
+            "description": "The error message why API call counting did not "
+            "succeeded",
+            "schema": SimpleResponseModel,
+        },
+    },
+}
+
+
+def _error_response(message, http_code):
+    return make_response(
+        jsonify(SimpleResponseModel(status="error", message=message)),
+        http_code,
+    )
+
+
+def _get_timestamp(value):
+    """Return the POSIX time stamp of an ISO 8601 time, a time without time
+    zone is UTC
+    """
+    time = datetime.fromisoformat(value)
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return time.timestamp()
+
+
+def _get_day():
+    """Return the day query parameter as YYYY-MM-DD, today (UTC) if it is
+    not set and None if it is invalid
+    """
+    day = request.args.get(
+        "day", datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    )
+    if not re.match(r"^\d{4}-\d{2}-\d{2}$", day):
+        return None
+    return day
+
 
 class APILogResource(Resource):
     """API logg management"""
@@ -55,29 +200,122 @@ class APILogResource(Resource):
         self.user_id = g.user.get_id()
         self.user_role = g.user.get_role()
 
-    @endpoint_decorator()
-    @swagger.doc(check_endpoint("get", api_log_management.get_doc))
-    def get(self, user_id):
-        """
-        Get a list of all API calls that have been called by the provided user.
+    def _check_permission(self, user_id):
+        """Return an error response if the user is not allowed to access the
+        API log of user_id, None otherwise
         """
-
         if (
             self.user_role not in ["admin", "superadmin"]
             and user_id != self.user_id
         ):
-            return make_response(
-                jsonify(
-                    SimpleResponseModel(
-                        status="error",
-                        message="You do not have the permission "
-                        "to list the API calls of the user",
-                    )
-                ),
+            return _error_response(
+                "You do not have the permission "
+                "to list the API calls of the user",
                 401,
             )
+        return None
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", get_doc))
+    def get(self, user_id):
+        """
+        Get a page of the API calls that have been called by the provided
+        user.
+        """
+        error = self._check_permission(user_id)
+        if error is not None:
+            return error
+
+        try:
+            count = int(request.args.get("count", DEFAULT_PAGE_SIZE))
+            start_time = request.args.get("start_time")
+            if start_time is not None:
+                start_time = _get_timestamp(start_time)
+            end_time = request.args.get("end_time")
+            if end_time is not None:
+                end_time = _get_timestamp(end_time)
+        except ValueError as e:
+            return _error_response("Invalid parameter: %s" % str(e), 400)
+        if count < 1 or count > MAX_PAGE_SIZE:
+            return _error_response(
+                "The count parameter must be between 1 and %i" % MAX_PAGE_SIZE,
+                400,
+            )
+        before = request.args.get("before")
+        if before is not None and not re.match(r"^\d+(-\d+)?$", before):
+            return _error_response("Invalid api_log_id <%s>" % before, 400)
+
+        api_log_list, next_id = self.api_logger.list_page(
+            user_id,
+            count,
+            before=before,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        kwargs = {"api_log_list": api_log_list}
+        if next_id is not None:
+            kwargs["next_id"] = next_id
+        return make_response(jsonify(ApiLogPageModel(**kwargs)), 200)
+
+
+class APILogCountResource(APILogResource):
+    """API call counting"""
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", count_get_doc))
+    def get(self, user_id):
+        """
+        Get the number of API calls per endpoint of the provided user.
+        """
+        error = self._check_permission(user_id)
+        if error is not None:
+            return error
+
+        day = _get_day()
+        if day is None:
+            return _error_response(
+                "Invalid day <%s>" % request.args["day"], 400
+            )
+
+        return make_response(
+            jsonify(
+                ApiLogCountModel(
+                    day=day,
+                    api_call_count=self.api_logger.count(user_id, day),
+                )
+            ),
+            200,
+        )
+
+
+class APILogEndpointCountResource(Resource):
+    """API call counting of all users"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    def __init__(self):
+        Resource.__init__(self)
+        self.api_logger = ApiLogger()
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", endpoint_count_get_doc))
+    @check_admin_role
+    def get(self):
+        """
+        Get the number of API calls per endpoint of all users.
+        """
+        day = _get_day()
+        if day is None:
+            return _error_response(
+                "Invalid day <%s>" % request.args["day"], 400
+            )
 
-        api_log_list = self.api_logger.list(user_id, 0, -1)
         return make_response(
-            jsonify(ApiLogListModel(api_log_list=api_log_list)), 200
+            jsonify(
+                ApiLogCountModel(
+                    day=day,
+                    api_call_count=self.api_logger.count_endpoints(day),
+                )
+            ),
+            200,
         )
@@ -5,7 +5,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -22,13 +22,17 @@ from flask import g, abort
 from actinia_core.core.common.config import global_config
 from actinia_core.core.common.app import auth
 from actinia_core.core.common.keycloak_user import ActiniaKeycloakUser
+from actinia_core.core.common.permissions import (
+    UserPermissions,
+    get_user_permissions,
+)
 from actinia_core.core.common.user import ActiniaUser
 from actinia_core.core.common.user_noauth import ActiniaUserNoAuth
 from actinia_core.core.messages_logger import MessageLogger
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Julia Haas, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -286,7 +290,7 @@ def check_user_permissions(f):
             module_name = kwargs["module_name"]
 
         ret = check_project_mapset_module_access(
-            user_credentials=g.user.get_credentials(),
+            user_credentials=g.user.get_permissions(),
             config=global_config,
             project_name=project_name,
             mapset_name=mapset_name,
@@ -313,8 +317,14 @@ def check_project_mapset_module_access(
 
     If the user has an admin or superadmin role, the tests are skipped.
 
+    The credentials are compiled into a UserPermissions object once, hence
+    repeated calls with the same credentials, e.g. for each module of a
+    process chain, are constant time lookups.
+
     Args:
-        user_credentials (dict): The user credentials dictionary
+        user_credentials (dict, UserPermissions): The user credentials
+                                                  dictionary or the compiled
+                                                  user permissions
         config (actinia_core.core.common.config.Configuration): The actinia
                                                                 configuration
         project_name (str): Name of the project to access
@@ -329,11 +339,13 @@ def check_project_mapset_module_access(
 
     """
 
+    if isinstance(user_credentials, UserPermissions):
+        permissions = user_credentials
+    else:
+        permissions = get_user_permissions(user_credentials)
+
     # Admin is allowed to do anything
-    if (
-        user_credentials["user_role"] == "admin"
-        or user_credentials["user_role"] == "superadmin"
-    ):
+    if permissions.is_admin:
         return None
 
     # Mapset without project results in error
@@ -367,11 +379,7 @@ def check_project_mapset_module_access(
                 return None
 
         # Check permissions to the global database projects and mapsets
-        accessible_datasets = user_credentials["permissions"][
-            "accessible_datasets"
-        ]
-
-        if project_name not in accessible_datasets:
+        if not permissions.can_access_project(project_name):
             resp = {
                 "Status": "error",
                 "Messages": "Unauthorized access to project <%s>"
@@ -382,10 +390,7 @@ def check_project_mapset_module_access(
         # Check if the mapset is allowed to be accessed
         if mapset_name:
             # Check if the mapset exists in the global database
-            if (
-                not accessible_datasets[project_name]
-                or mapset_name not in accessible_datasets[project_name]
-            ):
+            if not permissions.can_access_mapset(project_name, mapset_name):
                 resp = {
                     "Status": "error",
                     "Messages": "Unauthorized access to mapset "
@@ -395,10 +400,7 @@ def check_project_mapset_module_access(
 
     # Check if the module name is in the access list
     if module_name:
-        accessible_modules = user_credentials["permissions"][
-            "accessible_modules"
-        ]
-        if module_name not in accessible_modules:
+        if not permissions.can_use_module(module_name):
             resp = {
                 "Status": "error",
                 "Messages": "Module <%s> is not supported" % module_name,
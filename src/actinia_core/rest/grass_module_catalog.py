@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+GRASS module catalog
+
+The modules and their interface descriptions are listed from the module
+catalog of the GRASS build, no GRASS module is executed.
+"""
+
+from flask import g, jsonify, make_response
+from flask_restful import Resource
+from flask_restful_swagger_2 import swagger
+
+from actinia_core.core.common.api_logger import log_api_call
+from actinia_core.core.common.app import auth
+from actinia_core.core.common.grass_module_catalog import (
+    grass_module_catalog,
+)
+from actinia_core.core.common.permissions import get_user_permissions
+from actinia_core.models.response_models import (
+    GrassModuleCatalogListResponseModel,
+    SimpleResponseModel,
+)
+from actinia_rest_lib.endpoint_config import (
+    check_endpoint,
+    endpoint_decorator,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+list_get_doc = {
+    "tags": ["Module Management"],
+    "description": "List the GRASS modules of the module catalog that the "
+    "user is allowed to use. Minimum required user role: user.",
+    "responses": {
+        "200": {
+            "description": "The modules sorted by name",
+            "schema": GrassModuleCatalogListResponseModel,
+        },
+    },
+}
+
+module_get_doc = {
+    "tags": ["Module Management"],
+    "description": "Get the parameters, flags and the nprocs and memory "
+    "support of a GRASS module from the module catalog. Minimum required "
+    "user role: user.",
+    "parameters": [
+        {
+            "name": "module_name",
+            "description": "The name of the GRASS module",
+            "required": True,
+            "in": "path",
+            "type": "string",
+        }
+    ],
+    "responses": {
+        "200": {"description": "The interface description of the module"},
+        "400": {
+            "description": "The error message",
+            "schema": SimpleResponseModel,
+        },
+    },
+}
+
+
+class GrassModuleCatalogResource(Resource):
+    """List the modules of the GRASS module catalog"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", list_get_doc))
+    def get(self):
+        """Return the modules the user is allowed to use"""
+        permissions = get_user_permissions(g.user.get_credentials())
+        modules = grass_module_catalog.list_modules()
+        if not permissions.is_admin:
+            modules = [
+                module
+                for module in modules
+                if permissions.can_use_module(module["id"])
+            ]
+        return make_response(
+            jsonify(
+                GrassModuleCatalogListResponseModel(
+                    status="success", modules=modules
+                )
+            ),
+            200,
+        )
+
+
+class GrassModuleCatalogEntryResource(Resource):
+    """Get a module of the GRASS module catalog"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", module_get_doc))
+    def get(self, module_name):
+        """Return the catalog entry of a module
+
+        Args:
+            module_name (str): The name of the module
+        """
+        permissions = get_user_permissions(g.user.get_credentials())
+        entry = grass_module_catalog.get(module_name)
+        if entry is None or not permissions.can_use_module(module_name):
+            return make_response(
+                jsonify(
+                    SimpleResponseModel(
+                        status="error",
+                        message="Module <%s> is not available" % module_name,
+                    )
+                ),
+                400,
+            )
+        return make_response(jsonify(entry), 200)
@@ -14,8 +14,6 @@
 Process Chain Monitoring
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
 import os
 import pickle
 from tempfile import NamedTemporaryFile
@@ -42,6 +40,10 @@ __email__ = "info@mundialis.de"
 
 
 def create_scatter_plot(x, y, xlabel, ylabel, title):
+    # matplotlib is imported on first use, it is slow to import
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     plt.clf()
     plt.scatter(x, y, s=(np.pi * 5), c=(1, 0, 0))
     plt.title(title, fontsize=14)
@@ -298,6 +300,8 @@ class MapsetSizeRenderResource(ResourceManager):
                 for proc in pc_response_model["process_log"]
             ]
 
+            import numpy as np
+
             y = np.array(mapset_sizes)
             x = np.array(list(range(1, len(mapset_sizes) + 1)))
             unit = "bytes"
@@ -380,6 +384,8 @@ class MapsetSizeDiffRenderResource(ResourceManager):
             ]
             diffs = compute_mapset_size_diffs(mapset_sizes)
 
+            import numpy as np
+
             y = np.array(diffs)
             x = np.array(list(range(1, len(mapset_sizes) + 1)))
             unit = "bytes"
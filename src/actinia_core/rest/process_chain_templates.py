@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Prepared process chain templates
+
+A process chain template is registered once, it is validated and compiled
+at registration. Processing requests only send the template id and the
+values of the template parameters.
+"""
+
+import pickle
+from flask import g, jsonify, make_response, request
+from flask_restful import Resource
+from flask_restful_swagger_2 import swagger
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.api_logger import log_api_call
+from actinia_core.core.common.app import auth
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.kvdb_interface import enqueue_job
+from actinia_core.core.common.process_chain_template import (
+    ProcessChainTemplate,
+)
+from actinia_core.core.kvdb_process_chain_template import (
+    kvdb_process_chain_template_interface,
+)
+from actinia_core.models.process_chain import (
+    ProcessChainTemplateBindingModel,
+    ProcessChainTemplateModel,
+)
+from actinia_core.models.response_models import (
+    ProcessChainTemplateListResponseModel,
+    ProcessingResponseModel,
+    SimpleResponseModel,
+)
+from actinia_core.processing.common.ephemeral_processing import start_job
+from actinia_core.rest.base.user_auth import (
+    check_project_mapset_module_access,
+)
+from actinia_rest_lib.endpoint_config import (
+    check_endpoint,
+    endpoint_decorator,
+)
+from actinia_rest_lib.resource_base import ResourceBase
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+TEMPLATE_ID_PARAMETER = {
+    "name": "template_id",
+    "description": "The id of the process chain template",
+    "required": True,
+    "in": "path",
+    "type": "string",
+}
+
+ERROR_RESPONSE = {
+    "description": "The error message",
+    "schema": SimpleResponseModel,
+}
+
+list_get_doc = {
+    "tags": ["Process Chain Templates"],
+    "description": "List the ids of all process chain templates of the "
+    "user. Minimum required user role: user.",
+    "responses": {
+        "200": {
+            "description": "The ids of the process chain templates",
+            "schema": ProcessChainTemplateListResponseModel,
+        },
+    },
+}
+
+list_post_doc = {
+    "tags": ["Process Chain Templates"],
+    "description": "Register a process chain template. The process chain "
+    "contains {{name}} placeholders, it is validated and compiled once. An "
+    "existing template with the same id is replaced. The user must be "
+    "allowed to use all modules of the template. Minimum required user "
+    "role: user.",
+    "parameters": [
+        {
+            "name": "template",
+            "description": "The process chain template",
+            "required": True,
+            "in": "body",
+            "schema": ProcessChainTemplateModel,
+        }
+    ],
+    "responses": {
+        "200": {
+            "description": "The registered template",
+            "schema": ProcessChainTemplateModel,
+        },
+        "400": ERROR_RESPONSE,
+    },
+}
+
+template_get_doc = {
+    "tags": ["Process Chain Templates"],
+    "description": "Get a process chain template. Minimum required user "
+    "role: user.",
+    "parameters": [TEMPLATE_ID_PARAMETER],
+    "responses": {
+        "200": {
+            "description": "The process chain template",
+            "schema": ProcessChainTemplateModel,
+        },
+        "400": ERROR_RESPONSE,
+    },
+}
+
+template_delete_doc = {
+    "tags": ["Process Chain Templates"],
+    "description": "Delete a process chain template. Minimum required user "
+    "role: user.",
+    "parameters": [TEMPLATE_ID_PARAMETER],
+    "responses": {
+        "200": {
+            "description": "The template was deleted",
+            "schema": SimpleResponseModel,
+        },
+        "400": ERROR_RESPONSE,
+    },
+}
+
+processing_post_doc = {
+    "tags": ["Processing"],
+    "description": "Execute a registered process chain template with the "
+    "provided parameter values asynchronously in an ephemeral mapset. The "
+    "template was validated at registration, only the values are checked. "
+    "Minimum required user role: user.",
+    "parameters": [
+        {
+            "name": "project_name",
+            "description": "The project name",
+            "required": True,
+            "in": "path",
+            "type": "string",
+        },
+        {
+            "name": "binding",
+            "description": "The template id and the parameter values",
+            "required": True,
+            "in": "body",
+            "schema": ProcessChainTemplateBindingModel,
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": "The result of the process chain execution",
+            "schema": ProcessingResponseModel,
+        },
+        "400": {
+            "description": "The error message and a detailed log why the "
+            "process chain execution did not succeed",
+            "schema": ProcessingResponseModel,
+        },
+    },
+}
+
+
+def _error(message, http_code=400):
+    return make_response(
+        jsonify(SimpleResponseModel(status="error", message=message)),
+        http_code,
+    )
+
+
+def _check_module_access(user_credentials, template):
+    """Check that the user is allowed to use all modules of a template
+
+    Returns:
+        str:
+        The error message, None if access is allowed
+    """
+    for module_name in template.modules:
+        ret = check_project_mapset_module_access(
+            user_credentials, global_config, module_name=module_name
+        )
+        if ret is not None:
+            return ret[1]["Messages"]
+    return None
+
+
+class ProcessChainTemplatesResource(Resource):
+    """List and register process chain templates"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", list_get_doc))
+    def get(self):
+        """Return the ids of all process chain templates of the user"""
+        return make_response(
+            jsonify(
+                ProcessChainTemplateListResponseModel(
+                    status="success",
+                    template_ids=kvdb_process_chain_template_interface.list(
+                        g.user.get_id()
+                    ),
+                )
+            ),
+            200,
+        )
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("post", list_post_doc))
+    def post(self):
+        """Validate, compile and store a process chain template"""
+        definition = request.get_json(silent=True)
+        if not isinstance(definition, dict):
+            return _error("Missing JSON template definition")
+        try:
+            template = ProcessChainTemplate(
+                definition.get("id"),
+                definition.get("process_chain"),
+                definition.get("parameters"),
+            )
+        except AsyncProcessError as e:
+            return _error(str(e))
+
+        message = _check_module_access(g.user.get_credentials(), template)
+        if message is not None:
+            return _error(message)
+
+        kvdb_process_chain_template_interface.add(g.user.get_id(), template)
+        return make_response(jsonify(template.to_dict()), 200)
+
+
+class ProcessChainTemplateResource(Resource):
+    """Get and delete a process chain template"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", template_get_doc))
+    def get(self, template_id):
+        """Return a process chain template
+
+        Args:
+            template_id (str): The id of the template
+        """
+        definition = kvdb_process_chain_template_interface.read(
+            g.user.get_id(), template_id
+        )
+        if definition is None:
+            return _error("Template <%s> does not exist" % template_id)
+        return make_response(jsonify(definition), 200)
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("delete", template_delete_doc))
+    def delete(self, template_id):
+        """Delete a process chain template
+
+        Args:
+            template_id (str): The id of the template
+        """
+        if not kvdb_process_chain_template_interface.delete(
+            g.user.get_id(), template_id
+        ):
+            return _error("Template <%s> does not exist" % template_id)
+        return make_response(
+            jsonify(
+                SimpleResponseModel(
+                    status="success",
+                    message="Template <%s> deleted" % template_id,
+                )
+            ),
+            200,
+        )
+
+
+class AsyncEphemeralTemplateResource(ResourceBase):
+    """Run a process chain template in an ephemeral mapset"""
+
+    def __init__(self, resource_id=None, iteration=None, post_url=None):
+        ResourceBase.__init__(self, resource_id, iteration, post_url)
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("post", processing_post_doc))
+    def post(self, project_name):
+        """Bind the values to a registered template and start the
+        asynchronous processing of the resulting process chain
+
+        Args:
+            project_name (str): The name of the project
+
+        Returns:
+            flask.Response:
+            The HTTP status and a JSON document that includes the
+            status URL of the task that must be polled for updates.
+        """
+        binding = request.get_json(silent=True)
+        if not isinstance(binding, dict) or "template_id" not in binding:
+            return _error("Missing template_id in the JSON request")
+
+        template_id = binding["template_id"]
+        template = kvdb_process_chain_template_interface.get_compiled(
+            self.user_id, str(template_id)
+        )
+        if template is None:
+            return _error("Template <%s> does not exist" % template_id)
+        # The permissions may have changed since the registration
+        message = _check_module_access(self.user_credentials, template)
+        if message is not None:
+            return _error(message)
+        try:
+            process_chain = template.bind(binding.get("bindings"))
+        except AsyncProcessError as e:
+            return _error(str(e))
+
+        rdc = self.preprocess(
+            has_json=False,
+            project_name=project_name,
+            process_chain_list=process_chain,
+        )
+        if rdc:
+            enqueue_job(self.job_timeout, start_job, rdc)
+        html_code, response_model = pickle.loads(self.response_data)
+        return make_response(jsonify(response_model), html_code)
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -16,12 +16,23 @@ polygon.
 """
 
 import pickle
+import sys
+import traceback
 from flask_restful_swagger_2 import swagger
 from flask import jsonify, make_response
 from actinia_api.swagger2.actinia_core.apidocs import process_validation
+from actinia_processing_lib.exceptions import AsyncProcessError
 
 from actinia_core.core.common.app import auth
 from actinia_core.core.common.api_logger import log_api_call
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.process_chain_validation import (
+    ProcessChainValidator,
+)
+from actinia_core.models.response_models import (
+    ExceptionTracebackModel,
+    create_response_from_model,
+)
 from actinia_rest_lib.endpoint_config import (
     check_endpoint,
     endpoint_decorator,
@@ -32,11 +43,83 @@ from actinia_core.processing.common.process_validation import start_job
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
 
+def validate_in_process(resource, rdc):
+    """Validate the process chain of a request in the API process
+
+    The final status of the resource is sent to the resource database, the
+    accepted response of the resource is not changed. Validations that
+    require a worker are not performed.
+
+    Args:
+        resource (ResourceBase): The validation resource
+        rdc (ResourceDataContainer): The data of the request
+
+    Returns:
+        The pickled final response document, None if the validation must be
+        enqueued
+    """
+    if global_config.PROCESS_VALIDATION_IN_PROCESS is False:
+        return None
+    validator = ProcessChainValidator(
+        user_credentials=rdc.user_credentials,
+        user_group=rdc.user_group,
+        project_name=rdc.project_name,
+        config=rdc.config,
+    )
+    if validator.requires_worker(rdc.request_data):
+        return None
+
+    kwargs = {}
+    try:
+        process_list = validator.validate(rdc.request_data)
+        status, http_code = "finished", 200
+        message = "Validation successful"
+        results = [str(process) for process in process_list]
+    except AsyncProcessError as e:
+        e_type, e_value, e_tb = sys.exc_info()
+        status, http_code, message, results = "error", 400, str(e), None
+        kwargs["exception"] = ExceptionTracebackModel(
+            message=str(e_value),
+            traceback=traceback.format_tb(e_tb),
+            type=str(e_type),
+        )
+
+    document = create_response_from_model(
+        resource.response_model_class,
+        status=status,
+        user_id=resource.user_id,
+        resource_id=resource.resource_id,
+        queue=resource.queue,
+        iteration=resource.iteration,
+        process_log=[],
+        results=results,
+        message=message,
+        http_code=http_code,
+        orig_time=resource.orig_time,
+        orig_datetime=resource.orig_datetime,
+        status_url=resource.status_url,
+        api_info=resource.api_info,
+        process_chain_list=[rdc.request_data],
+        **kwargs,
+    )
+    # The validation runs in the API process, whose CPU time must not be
+    # accounted for the user
+    resource.resource_logger.measure_process_usage = False
+    resource.resource_logger.commit(
+        user_id=resource.user_id,
+        resource_id=resource.resource_id,
+        iteration=resource.iteration,
+        document=document,
+        expiration=rdc.config.KVDB_RESOURCE_EXPIRE_TIME,
+    )
+    return document
+
+
 class AsyncProcessValidationResource(ResourceBase):
     decorators = [log_api_call, auth.login_required]
 
@@ -50,7 +133,7 @@ class AsyncProcessValidationResource(ResourceBase):
             has_json=True, has_xml=True, project_name=project_name
         )
 
-        if rdc:
+        if rdc and validate_in_process(self, rdc) is None:
             rdc.set_storage_model_to_file()
             enqueue_job(self.job_timeout, start_job, rdc)
 
@@ -71,7 +154,12 @@ class SyncProcessValidationResource(ResourceBase):
             has_json=True, has_xml=True, project_name=project_name
         )
 
+        document = None
         if rdc:
+            document = validate_in_process(self, rdc)
+        if document is not None:
+            http_code, response_model = pickle.loads(document)
+        elif rdc:
             rdc.set_storage_model_to_file()
             enqueue_job(self.job_timeout, start_job, rdc)
             http_code, response_model = self.wait_until_finish()
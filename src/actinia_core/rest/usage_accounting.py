@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+This module delivers the daily resource usage of a specific user
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from flask import jsonify, make_response, request
+from flask_restful import Resource
+from flask_restful_swagger_2 import swagger
+
+from actinia_core.core.common.api_logger import log_api_call
+from actinia_core.core.common.app import auth
+from actinia_core.core.common.config import global_config
+from actinia_core.core.interim_result_retention import get_interim_footprint
+from actinia_core.core.resources_logger import ResourceLogger
+from actinia_core.core.usage_accounting import USAGE_FIELDS
+from actinia_rest_lib.endpoint_config import (
+    check_endpoint,
+    endpoint_decorator,
+)
+from actinia_core.models.response_models import (
+    SimpleResponseModel,
+    UsageResponseModel,
+)
+from actinia_core.rest.base.user_auth import check_admin_role
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# The maximum number of days that can be requested at once
+MAX_DAYS = 366
+
+get_doc = {
+    "tags": ["User Management"],
+    "description": "Get the daily resource usage of the provided user. The "
+    "usage of a resource is accounted when it reaches a terminal state. "
+    "The current size of the interim results of the user is included. "
+    "Minimum required user role: admin.",
+    "parameters": [
+        {
+            "name": "user_id",
+            "description": "The unique user name/id",
+            "required": True,
+            "in": "path",
+            "type": "string",
+        },
+        {
+            "name": "start_day",
+            "description": "The first day (UTC) as YYYY-MM-DD, default is "
+            "end_day",
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+        {
+            "name": "end_day",
+            "description": "The last day (UTC) as YYYY-MM-DD, default is "
+            "today. At most %i days can be requested." % MAX_DAYS,
+            "required": False,
+            "in": "query",
+            "type": "string",
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": "The daily resource usage of the user",
+            "schema": UsageResponseModel,
+        },
+        "400": {
+            "description": "The error message why the resource usage could "
+            "not be delivered",
+            "schema": SimpleResponseModel,
+        },
+    },
+}
+
+
+class UsageAccountingResource(Resource):
+    """Daily resource usage of a user"""
+
+    decorators = [log_api_call, auth.login_required]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("get", get_doc))
+    @check_admin_role
+    def get(self, user_id):
+        """Return the daily resource usage of a single user
+
+        Args:
+            user_id (str): The unique name of the user
+
+        Returns:
+            flask.Response: A HTTP response with JSON payload containing
+                            the resource usage of the user for each day
+        """
+        try:
+            end_day = request.args.get("end_day")
+            if end_day is None:
+                end_day = datetime.now(timezone.utc).date()
+            else:
+                end_day = date.fromisoformat(end_day)
+            start_day = request.args.get("start_day")
+            if start_day is None:
+                start_day = end_day
+            else:
+                start_day = date.fromisoformat(start_day)
+        except ValueError as e:
+            return make_response(
+                jsonify(
+                    SimpleResponseModel(
+                        status="error", message="Invalid day: %s" % str(e)
+                    )
+                ),
+                400,
+            )
+        num_days = (end_day - start_day).days + 1
+        if num_days < 1 or num_days > MAX_DAYS:
+            return make_response(
+                jsonify(
+                    SimpleResponseModel(
+                        status="error",
+                        message="The start_day must be before the end_day "
+                        "and at most %i days can be requested" % MAX_DAYS,
+                    )
+                ),
+                400,
+            )
+
+        kwargs = {
+            "host": global_config.KVDB_SERVER_URL,
+            "port": global_config.KVDB_SERVER_PORT,
+        }
+        if global_config.KVDB_SERVER_PW:
+            kwargs["password"] = global_config.KVDB_SERVER_PW
+        resource_logger = ResourceLogger(**kwargs)
+
+        days = [
+            (start_day + timedelta(days=i)).isoformat()
+            for i in range(num_days)
+        ]
+        usage = []
+        total = {"day": "%s/%s" % (days[0], days[-1]), "resources": 0}
+        total.update({field: 0 for field in USAGE_FIELDS})
+        for day, entry in resource_logger.get_usage(user_id, days):
+            usage.append({"day": day, **entry})
+            for field, value in entry.items():
+                total[field] = total.get(field, 0) + value
+
+        return make_response(
+            jsonify(
+                UsageResponseModel(
+                    user_id=user_id,
+                    usage=usage,
+                    total=total,
+                    interim_results=get_interim_footprint(user_id),
+                )
+            ),
+            200,
+        )
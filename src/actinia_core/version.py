@@ -5,7 +5,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2024 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -17,16 +17,21 @@ Returns the version information and the roles that are activated
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert, Anika Weinmann"
-__copyright__ = "Copyright 2016-2024, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
 from flask import make_response, jsonify, request
 from importlib import metadata
+import fcntl
+import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from threading import Lock, Thread
 from actinia_api import URL_PREFIX
 
 from actinia_core.core.common.app import flask_app
@@ -40,11 +45,20 @@ PLUGIN_VERSIONS = {}
 PYTHON_VERSION = ""
 API_VERSION = ""
 
+# The version of the GRASS GIS version cache file format
+GRASS_VERSION_CACHE_FORMAT = 1
 
-def init_versions():
-    global PYTHON_VERSION
-    global API_VERSION
+_refresh_lock = Lock()
+_refresh_thread = None
 
+
+def _probe_grass_version():
+    """Run g.version in a temporary GRASS GIS project
+
+    Returns:
+        dict:
+        The GRASS GIS version information
+    """
     g_version = subprocess.run(
         [
             "grass",
@@ -69,12 +83,145 @@ def init_versions():
             ],
             capture_output=True,
         ).stdout
-    log.debug("Detecting GRASS GIS version")
+    grass_version = {}
     for i in g_version.decode("utf-8").strip("\n").split("\n"):
         try:
-            G_VERSION[i.split("=")[0]] = i.split("=")[1]
+            grass_version[i.split("=")[0]] = i.split("=")[1]
         except IndexError:
             pass
+    return grass_version
+
+
+def get_grass_version_cache_key():
+    """Return the key of the GRASS GIS version cache
+
+    The key consists of the path of the GRASS GIS start script and its
+    inode, modification time and size, that change if GRASS GIS is
+    updated.
+
+    Returns:
+        str:
+        The key or None if GRASS GIS is not installed
+    """
+    path = shutil.which("grass")
+    if path is None:
+        return None
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    return "%s:%i:%i:%i" % (
+        path,
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def _read_grass_version_cache():
+    """Return the key and the GRASS GIS version information of the cache
+    file, (None, {}) if no valid cache file exists
+    """
+    try:
+        with open(global_config.GRASS_VERSION_CACHE_FILE) as f:
+            cache = json.load(f)
+        if cache.get("format") == GRASS_VERSION_CACHE_FORMAT:
+            return cache["key"], cache["grass_version"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None, {}
+
+
+def _write_grass_version_cache(key, grass_version):
+    """Atomically write the GRASS GIS version cache file"""
+    path = global_config.GRASS_VERSION_CACHE_FILE
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "format": GRASS_VERSION_CACHE_FORMAT,
+                    "key": key,
+                    "grass_version": grass_version,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+def refresh_grass_version():
+    """Detect the GRASS GIS version and update the cache file
+
+    The cache file is locked, so that only one of the processes that share
+    the cache file runs the probe. The others use its result.
+    """
+    key = get_grass_version_cache_key()
+    if key is None:
+        log.warning("Unable to detect GRASS GIS version, grass not found")
+        return
+    lock_path = global_config.GRASS_VERSION_CACHE_FILE + ".lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        cached_key, grass_version = _read_grass_version_cache()
+        if cached_key != key or not grass_version:
+            log.debug("Detecting GRASS GIS version")
+            grass_version = _probe_grass_version()
+            if grass_version:
+                _write_grass_version_cache(key, grass_version)
+    G_VERSION.clear()
+    G_VERSION.update(grass_version)
+
+
+def _refresh_grass_version():
+    try:
+        refresh_grass_version()
+    except Exception as e:
+        log.warning("Unable to detect GRASS GIS version: %s" % str(e))
+
+
+def start_grass_version_refresh():
+    """Refresh the GRASS GIS version in a background thread, if no refresh
+    is running in this process
+    """
+    global _refresh_thread
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        _refresh_thread = Thread(target=_refresh_grass_version, daemon=True)
+        _refresh_thread.start()
+
+
+def init_grass_version():
+    """Set the GRASS GIS version from the cache file
+
+    No temporary GRASS GIS project is created on startup if the cache file
+    exists. If it was created for another GRASS GIS installation, the
+    version is detected in the background and the cached version is used
+    until then. Without cache file the version is detected immediately,
+    since the API models require the GRASS GIS version on import.
+    """
+    try:
+        key = get_grass_version_cache_key()
+    except OSError:
+        key = None
+    cached_key, grass_version = _read_grass_version_cache()
+    if not grass_version:
+        _refresh_grass_version()
+        return
+    G_VERSION.update(grass_version)
+    if cached_key != key:
+        start_grass_version_refresh()
+
+
+def init_versions():
+    global PYTHON_VERSION
+    global API_VERSION
+
+    init_grass_version()
 
     log.debug("Detecting Plugin versions")
     for i in global_config.PLUGINS:
@@ -15,13 +15,15 @@ Tests: API logging test case
 """
 
 import unittest
+from datetime import datetime, timedelta, timezone
+from flask.json import loads as json_loads
 from actinia_core.core.common.api_logger import ApiLogger
 from actinia_core.core.common.app import flask_app
 
 try:
-    from .test_resource_base import ActiniaResourceTestCaseBase
+    from .test_resource_base import ActiniaResourceTestCaseBase, URL_PREFIX
 except ModuleNotFoundError:
-    from test_resource_base import ActiniaResourceTestCaseBase
+    from test_resource_base import ActiniaResourceTestCaseBase, URL_PREFIX
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
@@ -99,6 +101,100 @@ class ApiLoggingTestCase(ActiniaResourceTestCaseBase):
 
         self.assertTrue(self.log.delete(self.user_id))
 
+    def test_logging_pages_and_counts(self):
+        for _ in range(5):
+            ret = self.log.add_entry(
+                user_id=self.user_id, http_request=self.request_object
+            )
+            self.assertTrue(ret, "add_entry does not work")
+
+        page, next_id = self.log.list_page(self.user_id, count=3)
+        self.assertEqual(len(page), 3)
+        self.assertEqual(next_id, page[-1]["api_log_id"])
+
+        page, next_id = self.log.list_page(
+            self.user_id, count=3, before=next_id
+        )
+        self.assertEqual(len(page), 2)
+        self.assertIsNone(next_id)
+
+        counts = self.log.count(self.user_id)
+        self.assertGreaterEqual(counts["endpoint"], 5)
+
+        self.assertTrue(self.log.delete(self.user_id))
+
+    def test_logging_page_time_range(self):
+        """Test that times without time zone are UTC"""
+        for _ in range(2):
+            ret = self.log.add_entry(
+                user_id=self.user_id, http_request=self.request_object
+            )
+            self.assertTrue(ret, "add_entry does not work")
+
+        # A window around the current UTC time, which excludes all entries
+        # if it is shifted by the offset of the local time zone
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        start_time = (now - timedelta(minutes=5)).isoformat()
+        end_time = (now + timedelta(minutes=5)).isoformat()
+        rv = self.server.get(
+            URL_PREFIX
+            + "/api_log/%s?start_time=%s&end_time=%s"
+            % (self.user_id, start_time, end_time),
+            headers=self.admin_auth_header,
+        )
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        resp_data = json_loads(rv.data)
+        self.assertEqual(len(resp_data["api_log_list"]), 2)
+
+        self.assertTrue(self.log.delete(self.user_id))
+
+    def test_logging_endpoint_count(self):
+        """Test the API call count of all users"""
+        for _ in range(2):
+            ret = self.log.add_entry(
+                user_id=self.user_id, http_request=self.request_object
+            )
+            self.assertTrue(ret, "add_entry does not work")
+
+        rv = self.server.get(
+            URL_PREFIX + "/api_log_count", headers=self.admin_auth_header
+        )
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        resp_data = json_loads(rv.data)
+        self.assertGreaterEqual(resp_data["api_call_count"]["endpoint"], 2)
+        self.assertEqual(
+            resp_data["api_call_count"], self.log.count_endpoints()
+        )
+
+        # Only admins can count the API calls of all users
+        rv = self.server.get(
+            URL_PREFIX + "/api_log_count", headers=self.user_auth_header
+        )
+        self.assertEqual(
+            rv.status_code,
+            401,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        rv = self.server.get(
+            URL_PREFIX + "/api_log_count?day=today",
+            headers=self.admin_auth_header,
+        )
+        self.assertEqual(
+            rv.status_code,
+            400,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+
+        self.assertTrue(self.log.delete(self.user_id))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2016-2023 Sören Gebbert & mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2016-2026 Sören Gebbert & mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -34,7 +34,7 @@ except ModuleNotFoundError:
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Sören Gebbert"
-__copyright__ = "Copyright 2016-2023, Sören Gebbert & mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2016-2026, Sören Gebbert & mundialis GmbH & Co. KG"
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
@@ -110,7 +110,7 @@ class GeoDataDownloadImportSupportTestCase(unittest.TestCase):
 
         pl, import_file_info = gddl.get_download_process_list()
         self.assertTrue("xml" in import_file_info[0][0])
-        self.assertTrue(len(pl) == 2)
+        self.assertTrue(len(pl) == 1)
 
         for p in pl:
             self._run_process(p)
@@ -147,7 +147,7 @@ class GeoDataDownloadImportSupportTestCase(unittest.TestCase):
 
         pl, import_file_info = gddl.get_download_process_list()
         self.assertEqual("application/zip", import_file_info[0][0])
-        self.assertTrue(len(pl) == 8)
+        self.assertTrue(len(pl) == 1)
 
         for p in pl:
             self._run_process(p)
@@ -179,7 +179,7 @@ class GeoDataDownloadImportSupportTestCase(unittest.TestCase):
         self.assertEqual("image/tiff", import_file_info[2][0])
         self.assertEqual("image/tiff", import_file_info[3][0])
         self.assertEqual("image/tiff", import_file_info[4][0])
-        self.assertTrue(len(pl) == 12)
+        self.assertTrue(len(pl) == 1)
 
         for p in pl:
             self._run_process(p)
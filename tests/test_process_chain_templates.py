@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process chain template resources test case
+"""
+
+import unittest
+from flask.json import dumps as json_dumps
+from flask.json import loads as json_loads
+
+try:
+    from .test_resource_base import ActiniaResourceTestCaseBase, URL_PREFIX
+except ModuleNotFoundError:
+    from test_resource_base import ActiniaResourceTestCaseBase, URL_PREFIX
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+UNAUTHORIZED_TEMPLATE = {
+    "id": "unauthorized_ps",
+    "process_chain": {
+        "version": "1",
+        "list": [
+            {"id": "ps", "exe": "ps", "params": ["{{option}}"]},
+        ],
+    },
+    "parameters": {"option": {"type": "string", "default": "-ef"}},
+}
+
+
+class ProcessChainTemplateTestCase(ActiniaResourceTestCaseBase):
+    def test_register_unauthorized_module(self):
+        """Test that a template with a module that is not in the access list
+        of the user is rejected with the error message of the access check
+        """
+        rv = self.server.post(
+            URL_PREFIX + "/process_chain_templates",
+            headers=self.user_auth_header,
+            data=json_dumps(UNAUTHORIZED_TEMPLATE),
+            content_type="application/json",
+        )
+        self.assertEqual(
+            rv.status_code,
+            400,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        resp_data = json_loads(rv.data)
+        self.assertEqual(resp_data["status"], "error")
+        self.assertIn("Module <ps> is not supported", resp_data["message"])
+
+        rv = self.server.get(
+            URL_PREFIX + "/process_chain_templates/unauthorized_ps",
+            headers=self.user_auth_header,
+        )
+        self.assertNotEqual(rv.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
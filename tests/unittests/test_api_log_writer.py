@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Asynchronous API log writer unittest case
+"""
+
+from copy import copy
+from threading import Event
+
+import pytest
+
+from actinia_core.core.common.api_logger import ApiLogger, ApiLogWriter
+from actinia_core.core.common.config import global_config
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+def create_config(queue_size=10, policy="drop", batch_size=100):
+    config = copy(global_config)
+    config.LOG_API_CALL_QUEUE_SIZE = queue_size
+    config.LOG_API_CALL_QUEUE_POLICY = policy
+    config.LOG_API_CALL_BATCH_SIZE = batch_size
+    return config
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Collect the written batches instead of writing them to the kvdb"""
+    batches = []
+    release = Event()
+    release.set()
+
+    def add_entries(self, entries):
+        release.wait()
+        batches.append(entries)
+        return True
+
+    monkeypatch.setattr(ApiLogger, "add_entries", add_entries)
+    return batches, release
+
+
+@pytest.mark.unittest
+def test_entries_are_written_in_batches(written):
+    batches, release = written
+    release.clear()
+    writer = ApiLogWriter(create_config(batch_size=3))
+    for i in range(7):
+        assert writer.put({"user_id": "user", "num": i}) is True
+    release.set()
+    writer.stop()
+    entries = [entry["num"] for batch in batches for entry in batch]
+    assert entries == list(range(7)), "Not all entries were written"
+    assert max(len(batch) for batch in batches) <= 3, "Batch size exceeded"
+
+
+@pytest.mark.unittest
+def test_entries_are_dropped_if_queue_is_full(written):
+    batches, release = written
+    release.clear()
+    writer = ApiLogWriter(create_config(queue_size=2, batch_size=1))
+    results = [writer.put({"user_id": "user", "num": i}) for i in range(10)]
+    assert results.count(False) == writer.get_dropped()
+    assert writer.get_dropped() >= 7, "Entries were not dropped"
+    release.set()
+    writer.stop()
+    written_num = sum(len(batch) for batch in batches)
+    assert written_num == results.count(True)
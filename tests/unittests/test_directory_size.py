@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Directory size tracker unittest case
+"""
+
+import os
+import shutil
+
+import pytest
+
+from actinia_core.core.directory_size import DirectorySizeTracker
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+@pytest.fixture
+def mapset(tmp_path):
+    path = tmp_path / "mapset"
+    os.makedirs(path / "cell")
+    os.makedirs(path / "sqlite")
+    (path / "cell" / "elevation").write_bytes(b"x" * 100)
+    (path / "sqlite" / "sqlite.db").write_bytes(b"x" * 10)
+    (path / "WIND").write_bytes(b"x" * 5)
+    return path
+
+
+@pytest.mark.unittest
+def test_incremental_size(mapset, monkeypatch):
+    tracker = DirectorySizeTracker()
+    assert tracker.get_size(str(mapset)) == 115
+    assert tracker.get_size(str(mapset / "WIND")) == 5
+    assert tracker.get_size(str(mapset / "missing")) == 0
+
+    # Unchanged directories are not read again
+    scanned = []
+    scan_directory = tracker._scan_directory
+    monkeypatch.setattr(
+        tracker,
+        "_scan_directory",
+        lambda path, key: scanned.append(path) or scan_directory(path, key),
+    )
+    (mapset / "sqlite" / "sqlite.db").write_bytes(b"x" * 20)
+    assert tracker.get_size(str(mapset)) == 125
+    assert scanned == []
+
+    (mapset / "cell" / "slope").write_bytes(b"x" * 50)
+    assert tracker.get_size(str(mapset)) == 175
+    assert scanned == [str(mapset / "cell")]
+
+    shutil.rmtree(mapset / "cell")
+    assert tracker.get_size(str(mapset)) == 25
+    assert str(mapset / "cell") not in tracker._cache
+    tracker.invalidate(str(mapset))
+    assert tracker._cache == {}
+
+
+@pytest.mark.unittest
+def test_hardlinks(mapset):
+    tracker = DirectorySizeTracker()
+    os.makedirs(mapset / "copy")
+    os.link(mapset / "cell" / "elevation", mapset / "copy" / "elevation")
+    assert tracker.get_size(str(mapset)) == 215
+    assert tracker.get_size(str(mapset), count_links_once=True) == 115
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Download stage unittest case
+"""
+
+import base64
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from actinia_core.core.download_stage import (
+    PART_SUFFIX,
+    DownloadError,
+    DownloadStage,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+FILES = {
+    "/a.tif": os.urandom(300000),
+    "/b.tif": os.urandom(200000),
+    "/c.tif": os.urandom(100000),
+    "/corrupt.tif": os.urandom(1000),
+}
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves FILES with range support, announces a wrong checksum for
+    corrupt.tif"""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        data = FILES.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        RangeHandler.requests.append((self.path, self.headers.get("Range")))
+        md5 = hashlib.md5(data).digest()
+        if self.path == "/corrupt.tif":
+            md5 = hashlib.md5(b"other").digest()
+        match = re.match(r"bytes=(\d+)-", self.headers.get("Range") or "")
+        if match:
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                "bytes %i-%i/%i" % (start, len(data) - 1, len(data)),
+            )
+        else:
+            start = 0
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.send_header(
+            "x-goog-hash", "crc32c=AAAA, md5=" + base64.b64encode(md5).decode()
+        )
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%i" % httpd.server_address[1]
+    httpd.shutdown()
+
+
+@pytest.mark.unittest
+def test_download_stage_parallel(server, tmp_path):
+    download_list = [
+        (server + name, str(tmp_path / name[1:]))
+        for name in ("/a.tif", "/b.tif", "/c.tif")
+    ]
+    results = DownloadStage(download_list, parallel=3).run()
+    for (url, dest), state in zip(download_list, results):
+        assert state["status"] == "downloaded"
+        with open(dest, "rb") as f:
+            assert f.read() == FILES[url[len(server) :]]
+    assert not any(name.endswith(PART_SUFFIX) for name in os.listdir(tmp_path))
+
+    # Files in the download cache are not downloaded again
+    results = DownloadStage(download_list, parallel=3).run()
+    assert {state["status"] for state in results} == {"cached"}
+
+
+@pytest.mark.unittest
+def test_download_stage_resume(server, tmp_path):
+    dest = str(tmp_path / "a.tif")
+    with open(dest + PART_SUFFIX, "wb") as f:
+        f.write(FILES["/a.tif"][:1000])
+    RangeHandler.requests = []
+
+    (state,) = DownloadStage([(server + "/a.tif", dest)]).run()
+    assert state["resumed_bytes"] == 1000
+    assert RangeHandler.requests == [("/a.tif", "bytes=1000-")]
+    with open(dest, "rb") as f:
+        assert f.read() == FILES["/a.tif"]
+
+
+@pytest.mark.unittest
+def test_download_stage_verification(server, tmp_path):
+    download_list = [
+        (server + "/corrupt.tif", str(tmp_path / "corrupt.tif")),
+        (server + "/missing.tif", str(tmp_path / "missing.tif")),
+    ]
+    with pytest.raises(DownloadError) as excinfo:
+        DownloadStage(download_list, retries=2).run()
+    assert "MD5 checksum mismatch" in str(excinfo.value)
+    assert "404" in str(excinfo.value)
+    assert not os.path.exists(tmp_path / "corrupt.tif")
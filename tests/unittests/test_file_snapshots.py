@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Directory snapshot unittest case
+"""
+
+import os
+
+import pytest
+
+from actinia_core.core import file_snapshots
+from actinia_core.core.file_snapshots import (
+    capture_snapshot,
+    compare_with_snapshot,
+    create_snapshot,
+    get_manifest_path,
+    read_manifest,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+@pytest.fixture
+def mapset(tmp_path):
+    path = tmp_path / "mapset"
+    os.makedirs(path / "cell")
+    (path / "cell" / "elevation").write_bytes(b"raster")
+    (path / "WIND").write_text("region")
+    (path / ".gislock").write_text("1234")
+    os.symlink("cell/elevation", path / "link")
+    return path
+
+
+@pytest.mark.unittest
+def test_first_snapshot(mapset, tmp_path):
+    dest = tmp_path / "step1"
+    stats = create_snapshot(str(mapset), str(dest))
+    assert stats.linked_files == 0
+    assert stats.written_files == 2
+    assert (dest / "cell" / "elevation").read_bytes() == b"raster"
+    assert not (dest / ".gislock").exists()
+    assert os.readlink(dest / "link") == "cell/elevation"
+
+    # The files of the source are never linked
+    src_stat = os.stat(mapset / "WIND")
+    assert os.stat(dest / "WIND").st_ino != src_stat.st_ino
+    assert os.stat(dest / "WIND").st_mtime_ns == src_stat.st_mtime_ns
+
+
+@pytest.mark.unittest
+def test_incremental_snapshot(mapset, tmp_path):
+    step1 = tmp_path / "step1"
+    step2 = tmp_path / "step2"
+    create_snapshot(str(mapset), str(step1))
+    (mapset / "WIND").write_text("changed region")
+    (mapset / "cell" / "slope").write_bytes(b"new")
+    stats = create_snapshot(str(mapset), str(step2), str(step1))
+    assert stats.linked_files == 1
+    assert stats.written_files == 2
+
+    elevation = os.stat(step2 / "cell" / "elevation")
+    assert elevation.st_ino == os.stat(step1 / "cell" / "elevation").st_ino
+    assert os.stat(step2 / "WIND").st_ino != os.stat(step1 / "WIND").st_ino
+    assert (step1 / "WIND").read_text() == "region"
+    assert (step2 / "WIND").read_text() == "changed region"
+    assert (step2 / "cell" / "slope").read_bytes() == b"new"
+
+
+@pytest.mark.unittest
+def test_manifest_comparison(mapset, tmp_path, monkeypatch):
+    step1 = tmp_path / "step1"
+    create_snapshot(str(mapset), str(step1))
+    manifest = read_manifest(str(step1))
+    assert sorted(manifest["files"]) == ["WIND", "cell/elevation"]
+    assert manifest["symlinks"] == {"link": "cell/elevation"}
+    assert os.path.isfile(get_manifest_path(str(step1)))
+
+    # Files with unchanged metadata are not hashed
+    hashed = []
+    hash_file = file_snapshots.hash_file
+    monkeypatch.setattr(
+        file_snapshots,
+        "hash_file",
+        lambda path: hashed.append(path) or hash_file(path),
+    )
+    assert compare_with_snapshot(str(mapset), str(step1)) is True
+    assert hashed == []
+
+    # A rewritten file with the same content is linked after hashing
+    (mapset / "WIND").write_text("region")
+    os.utime(mapset / "WIND", ns=(0, 0))
+    assert compare_with_snapshot(str(mapset), str(step1)) is True
+    assert len(hashed) == 2
+    (mapset / "WIND").write_text("REGION")
+    os.utime(mapset / "WIND", ns=(0, 0))
+    assert compare_with_snapshot(str(mapset), str(step1)) is False
+    (mapset / "WIND").write_text("region")
+    os.remove(mapset / "link")
+    assert compare_with_snapshot(str(mapset), str(step1)) is False
+    assert compare_with_snapshot(str(mapset), str(tmp_path / "no")) is False
+
+
+@pytest.mark.unittest
+def test_move_unchanged_snapshot(mapset, tmp_path):
+    step1 = tmp_path / "step1"
+    step2 = tmp_path / "step2"
+    create_snapshot(str(mapset), str(step1))
+    inode = os.stat(step1 / "WIND").st_ino
+    stats = create_snapshot(
+        str(mapset), str(step2), str(step1), move_unchanged=True
+    )
+    assert stats.linked_files == 2
+    assert not step1.exists()
+    assert not os.path.exists(get_manifest_path(str(step1)))
+    assert os.stat(step2 / "WIND").st_ino == inode
+    assert compare_with_snapshot(str(mapset), str(step2)) is True
+
+
+@pytest.mark.unittest
+def test_capture_snapshot(mapset, tmp_path):
+    step1 = tmp_path / "step1"
+    step2 = tmp_path / "step2"
+    create_snapshot(str(mapset), str(step1))
+    (mapset / "WIND").write_text("changed region")
+    pending = capture_snapshot(str(mapset), str(step2), str(step1))
+    assert not os.path.exists(step2 / "cell" / "elevation")
+
+    # The source can be modified before the snapshot is completed
+    (mapset / "WIND").write_text("next step")
+    os.remove(mapset / "cell" / "elevation")
+    stats = pending.complete()
+    assert stats.linked_files == 1
+    assert stats.written_files == 1
+    assert (step2 / "WIND").read_text() == "changed region"
+    assert (step2 / "cell" / "elevation").read_bytes() == b"raster"
+    assert os.path.isfile(get_manifest_path(str(step2)))
+
+
+@pytest.mark.unittest
+def test_capture_snapshot_deferred(mapset, tmp_path, monkeypatch):
+    step1 = tmp_path / "step1"
+    step2 = tmp_path / "step2"
+    create_snapshot(str(mapset), str(step1))
+    (mapset / "WIND").write_text("changed region")
+    monkeypatch.setattr(file_snapshots, "supports_reflinks", lambda d: False)
+    pending = capture_snapshot(
+        str(mapset), str(step2), str(step1), defer_copies=True
+    )
+    # Without reflinks the changed files are copied by complete()
+    assert pending.deferred_files == ["WIND"]
+    assert not os.path.exists(step2 / "WIND")
+    stats = pending.complete()
+    assert pending.deferred_files == []
+    assert stats.linked_files == 1
+    assert stats.written_files == 1
+    assert (step2 / "WIND").read_text() == "changed region"
+
+
+@pytest.mark.unittest
+def test_supports_reflinks(tmp_path):
+    assert file_snapshots.supports_reflinks(str(tmp_path)) in (True, False)
+    assert os.listdir(tmp_path) == []
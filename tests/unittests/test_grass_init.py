@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: GRASS module runner unittest case
+"""
+
+import os
+
+import pytest
+
+from actinia_core.core import grass_init
+from actinia_core.core.grass_init import (
+    GrassEnvironment,
+    GrassInitError,
+    GrassModuleRunner,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+def create_module(path, content="#!/bin/sh\necho $MODULE_VAR\n"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    os.chmod(path, 0o755)
+    return path
+
+
+@pytest.fixture
+def runner(tmp_path):
+    GrassModuleRunner.invalidate_module_paths()
+    create_module(str(tmp_path / "grass" / "bin" / "r.test"))
+    os.makedirs(tmp_path / "addons")
+    yield GrassModuleRunner(
+        str(tmp_path / "grass"),
+        str(tmp_path / "addons"),
+        env={"PATH": os.environ["PATH"], "MODULE_VAR": "frozen"},
+    )
+    GrassModuleRunner.invalidate_module_paths()
+
+
+@pytest.mark.unittest
+def test_module_path_cache(runner, tmp_path, monkeypatch):
+    path = runner._create_grass_module_path("r.test")
+    assert path == str(tmp_path / "grass" / "bin" / "r.test")
+
+    # Resolved paths are reused without a search
+    monkeypatch.setattr(
+        runner, "_find_grass_module_path", pytest.fail, raising=True
+    )
+    assert runner._create_grass_module_path("r.test") == path
+    monkeypatch.undo()
+
+    with pytest.raises(GrassInitError):
+        runner._create_grass_module_path("r.addon")
+
+    # An installed addon is found, the cache of a changed addon path is
+    # recreated after the check interval
+    addon = create_module(str(tmp_path / "addons" / "bin" / "r.addon"))
+    assert runner._create_grass_module_path("r.addon") == addon
+    os.remove(addon)
+    addon = create_module(str(tmp_path / "addons" / "scripts" / "r.addon"))
+    monkeypatch.setattr(grass_init, "MODULE_PATH_CHECK_INTERVAL", 0)
+    assert runner._create_grass_module_path("r.addon") == addon
+
+    os.remove(addon)
+    create_module(str(tmp_path / "addons" / "bin" / "r.addon"))
+    monkeypatch.setattr(grass_init, "MODULE_PATH_CHECK_INTERVAL", 60)
+    assert runner._create_grass_module_path("r.addon") == addon
+    GrassModuleRunner.invalidate_module_paths()
+    assert runner._create_grass_module_path("r.addon") != addon
+
+
+@pytest.mark.unittest
+def test_runner_env(runner):
+    assert runner.run_module("r.test", []) == (0, "frozen\n", "")
+    env = {"PATH": os.environ["PATH"], "MODULE_VAR": "step"}
+    assert runner.run_module("r.test", [], env=env) == (0, "step\n", "")
+
+    proc = runner.run_module("r.test", [], raw=True)
+    stdout, _ = proc.communicate()
+    assert stdout == b"frozen\n"
+
+
+@pytest.mark.unittest
+def test_runner_env_process_changes(runner, monkeypatch):
+    """Variables that are set in the process environment after the runner
+    was created, e.g. COMPRESS_OVERVIEW before r.out.gdal, are applied to
+    the environment of the modules"""
+    create_module(
+        os.path.join(runner.grassbase, "bin", "r.export"),
+        "#!/bin/sh\necho $MODULE_VAR $COMPRESS_OVERVIEW\n",
+    )
+    monkeypatch.setenv("COMPRESS_OVERVIEW", "LZW")
+    assert runner.run_module("r.export", []) == (0, "frozen LZW\n", "")
+    proc = runner.run_module("r.export", [], raw=True)
+    stdout, _ = proc.communicate()
+    assert stdout == b"frozen LZW\n"
+    # The environment of a step is used unchanged
+    env = {"PATH": os.environ["PATH"], "MODULE_VAR": "step"}
+    assert runner.run_module("r.export", [], env=env) == (0, "step\n", "")
+
+    monkeypatch.setenv("MODULE_VAR", "process")
+    assert runner.run_module("r.test", []) == (0, "process\n", "")
+    monkeypatch.delenv("MODULE_VAR")
+    monkeypatch.delenv("COMPRESS_OVERVIEW")
+    assert runner.run_module("r.export", []) == (0, "frozen\n", "")
+
+
+@pytest.mark.unittest
+def test_grass_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", "/usr/bin")
+    # Do not change the environment of the test process
+    monkeypatch.setattr(GrassEnvironment, "set", lambda self: None)
+    genv = GrassEnvironment()
+    genv.set_grass_environment(str(tmp_path), "/grass", "/addons")
+    env = genv.process_env
+    assert env["GISRC"] == os.path.join(str(tmp_path), "gisrc")
+    assert env["PATH"] == "/grass/bin:/grass/scripts:/usr/bin"
+    assert env["GRASS_ADDON_BASE"] == "/addons"
+    with pytest.raises(TypeError):
+        env["GISRC"] = "changed"
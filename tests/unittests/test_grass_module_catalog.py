@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: GRASS module catalog unittest case
+"""
+
+import os
+from copy import copy
+
+import pytest
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common import process_chain
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.grass_module_catalog import (
+    GrassModuleCatalog,
+    parse_interface_description,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+R_UNIVAR = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE task SYSTEM "grass-interface.dtd">
+<task name="r.univar">
+    <description>Calculates univariate statistics.</description>
+    <keywords>raster, statistics</keywords>
+    <parameter name="map" type="string" required="yes" multiple="yes">
+        <description>Name of raster map(s)</description>
+        <gisprompt age="old" element="cell" prompt="raster" />
+        <keydesc><item order="1">name</item></keydesc>
+    </parameter>
+    <parameter name="percentile" type="double" required="no" multiple="yes">
+        <description>Percentile to calculate</description>
+        <default>90</default>
+    </parameter>
+    <parameter name="nprocs" type="integer" required="no" multiple="no">
+        <description>Number of threads</description>
+        <default>1</default>
+    </parameter>
+    <parameter name="separator" type="string" required="yes" multiple="no">
+        <description>Field separator</description>
+        <default>pipe</default>
+    </parameter>
+    <parameter name="format" type="string" required="no" multiple="no">
+        <description>Output format</description>
+        <values>
+            <value><name>plain</name></value>
+            <value><name>shell</name></value>
+            <value><name>json</name></value>
+        </values>
+    </parameter>
+    <flag name="g"><description>Print in shell script style</description>
+    </flag>
+    <flag name="e"><description>Calculate extended statistics</description>
+    </flag>
+    <flag name="l"><description>List formats</description>
+        <suppress_required/>
+    </flag>
+</task>
+"""
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    config = copy(global_config)
+    config.GRASS_GIS_BASE = str(tmp_path / "grass")
+    config.GRASS_ADDON_PATH = str(tmp_path / "addons")
+    config.GRASS_MODULE_CATALOG_DIR = str(tmp_path / "catalog")
+    os.makedirs(tmp_path / "grass" / "bin")
+    os.makedirs(tmp_path / "grass" / "etc")
+    (tmp_path / "grass" / "etc" / "VERSIONNUMBER").write_text("8.4.0")
+    for name in ("r.univar", "g.region", "README"):
+        (tmp_path / "grass" / "bin" / name).touch()
+
+    catalog = GrassModuleCatalog(config)
+    catalog.build(
+        lambda names: {
+            name: R_UNIVAR if name == "r.univar" else None for name in names
+        }
+    )
+    return catalog
+
+
+@pytest.mark.unittest
+def test_parse_interface_description():
+    entry = parse_interface_description(R_UNIVAR)
+    assert entry["name"] == "r.univar"
+    assert entry["keywords"] == ["raster", "statistics"]
+    assert entry["nprocs"] is True and entry["memory"] is False
+    assert entry["parameters"]["map"]["required"] is True
+    assert entry["parameters"]["map"]["gisprompt"]["prompt"] == "raster"
+    assert entry["parameters"]["format"]["values"] == [
+        "plain",
+        "shell",
+        "json",
+    ]
+    assert entry["flags"]["l"]["suppress_required"] is True
+
+
+@pytest.mark.unittest
+def test_catalog_build_and_load(catalog):
+    assert os.path.isfile(catalog.path)
+    assert [m["id"] for m in catalog.list_modules()] == ["r.univar"]
+    assert catalog.get_resource_hints("r.univar") == {
+        "nprocs": True,
+        "memory": False,
+    }
+    assert catalog.get("g.region") is None
+
+    # A new catalog object loads the catalog file of the same GRASS build
+    loaded = GrassModuleCatalog(catalog.config)
+    assert loaded.build_key == catalog.build_key
+    assert loaded.get("r.univar") == catalog.get("r.univar")
+
+    # An installed addon changes the build key
+    os.makedirs(os.path.join(catalog.config.GRASS_ADDON_PATH, "bin"))
+    loaded.invalidate()
+    assert loaded.build_key != catalog.build_key
+    assert loaded.get("r.univar") is None
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "inputs,flags",
+    [
+        ([{"param": "map", "value": "elev"}], "ge"),
+        ([{"param": "map", "value": "a,b"}], ""),
+        (
+            [
+                {"param": "map", "value": "a"},
+                {"param": "nprocs", "value": "4"},
+            ],
+            "",
+        ),
+        ([{"param": "percentile", "value": "5,95.5"}], "l"),
+        ([{"param": "format", "value": "sh"}], "l"),
+        (
+            [
+                {"param": "map", "value": "a"},
+                {"param": "nprocs", "value": "x::stdout::n"},
+            ],
+            "",
+        ),
+    ],
+)
+def test_catalog_validate(catalog, inputs, flags):
+    catalog.validate({"module": "r.univar", "inputs": inputs, "flags": flags})
+
+
+@pytest.mark.unittest
+def test_catalog_validate_required_default(catalog):
+    entry = catalog.get("r.univar")
+    assert entry["parameters"]["separator"]["required"] is True
+    assert entry["parameters"]["separator"]["default"] == "pipe"
+    # The required parameter with a default can be omitted
+    catalog.validate(
+        {"module": "r.univar", "inputs": [{"param": "map", "value": "a"}]}
+    )
+    catalog.validate(
+        {
+            "module": "r.univar",
+            "inputs": [
+                {"param": "map", "value": "a"},
+                {"param": "separator", "value": "comma"},
+            ],
+        }
+    )
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "inputs,flags,message",
+    [
+        ([{"param": "map", "value": "elev"}], "x", "Unknown flag"),
+        ([{"param": "raster", "value": "elev"}], "", "Unknown parameter"),
+        ([], "g", "Required parameter <map>"),
+        (
+            [
+                {"param": "map", "value": "a"},
+                {"param": "nprocs", "value": "1,2"},
+            ],
+            "",
+            "single value",
+        ),
+        (
+            [
+                {"param": "map", "value": "a"},
+                {"param": "nprocs", "value": "two"},
+            ],
+            "",
+            "integer values",
+        ),
+        ([{"param": "format", "value": "xml"}], "l", "is not one of"),
+    ],
+)
+def test_catalog_validate_errors(catalog, inputs, flags, message):
+    with pytest.raises(AsyncProcessError, match=message):
+        catalog.validate(
+            {"module": "r.univar", "inputs": inputs, "flags": flags}
+        )
+
+
+@pytest.mark.unittest
+def test_process_chain_validation(catalog, monkeypatch):
+    monkeypatch.setattr(process_chain, "grass_module_catalog", catalog)
+    converter = process_chain.ProcessChainConverter()
+    with pytest.raises(AsyncProcessError, match="Unknown parameter"):
+        converter.process_chain_to_process_list(
+            {
+                "version": "1",
+                "list": [
+                    {
+                        "id": "univar",
+                        "module": "r.univar",
+                        "inputs": [{"param": "input", "value": "elev"}],
+                    }
+                ],
+            }
+        )
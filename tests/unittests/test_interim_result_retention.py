@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Interim result retention unittest case
+"""
+
+import os
+import pickle
+import time
+from copy import copy
+
+import pytest
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core import interim_result_retention
+from actinia_core.core.interim_result_retention import (
+    InterimResultIndex,
+    InterimResultJanitor,
+    collect_garbage,
+    create_running_check,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+GIB = 1024 * 1024 * 1024
+
+
+def create_resource(storage_path, resource_id, size):
+    path = os.path.join(storage_path, resource_id, "step1")
+    os.makedirs(path)
+    with open(os.path.join(path, "WIND"), "wb") as f:
+        f.write(b"x" * size)
+    os.link(os.path.join(path, "WIND"), os.path.join(path, "WIND2"))
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = copy(global_config)
+    config.GRASS_RESOURCE_DIR = str(tmp_path)
+    config.INTERIM_RESULTS_QUOTA = 0
+    config.INTERIM_RESULTS_MAX_AGE = 0
+    config.INTERIM_RESULTS_JANITOR_INTERVAL = 600
+    return config
+
+
+@pytest.mark.unittest
+def test_index(tmp_path):
+    storage_path = str(tmp_path / "user" / "interim")
+    create_resource(storage_path, "resource_1", 100)
+
+    index = InterimResultIndex(storage_path)
+    index.update("resource_2", 50, 1)
+    index.update("resource_2", 20, 2, [1])
+    assert index.read()["resource_2"]["steps"] == [2]
+    assert index.get_footprint() == {"bytes": 70, "resources": 1}
+
+    # Unknown directories are measured, removed ones are dropped
+    resources = index.reconcile()
+    assert resources["resource_1"]["bytes"] == 100
+    assert resources["resource_1"]["steps"] == [1]
+    assert "resource_2" not in resources
+    index.remove("resource_1")
+    assert index.get_footprint() == {"bytes": 0, "resources": 0}
+
+
+@pytest.mark.unittest
+def test_collect_garbage(tmp_path, config):
+    storage_path = str(tmp_path / "user" / "interim")
+    index = InterimResultIndex(storage_path)
+    now = time.time()
+    for num, (age, size) in enumerate([(7200, 10), (3600, GIB), (0, GIB)]):
+        resource_id = "resource_%i" % num
+        os.makedirs(os.path.join(storage_path, resource_id))
+        index.update(resource_id, size, 1)
+        resources = index.read()
+        resources[resource_id]["updated"] = now - age
+        index._write(resources)
+
+    def is_running(resource_id):
+        return resource_id == "resource_2"
+
+    def collect(**kwargs):
+        return collect_garbage(
+            storage_path, config, now=now, is_running=is_running, **kwargs
+        )
+
+    assert collect() == []
+    config.INTERIM_RESULTS_MAX_AGE = 5000
+    assert collect() == ["resource_0"]
+    assert not os.path.exists(os.path.join(storage_path, "resource_0"))
+
+    # The resource of the running job is kept even if the quota is exceeded
+    config.INTERIM_RESULTS_QUOTA = 0.5
+    assert collect(exclude=("resource_1",)) == []
+    assert collect() == ["resource_1"]
+    assert collect() == []
+    assert index.get_footprint() == {"bytes": GIB, "resources": 1}
+
+
+@pytest.mark.unittest
+def test_collect_garbage_old_running_resource(tmp_path, config):
+    storage_path = str(tmp_path / "user" / "interim")
+    create_resource(storage_path, "resource_1", 100)
+    InterimResultIndex(storage_path).reconcile()
+    config.INTERIM_RESULTS_MAX_AGE = 1
+    now = time.time() + 3600
+    # Resources are kept based on the job status, not on their age
+    assert (
+        collect_garbage(
+            storage_path, config, now=now, is_running=lambda _: True
+        )
+        == []
+    )
+    assert collect_garbage(
+        storage_path, config, now=now, is_running=lambda _: False
+    ) == ["resource_1"]
+
+
+@pytest.mark.unittest
+def test_create_running_check(config, monkeypatch):
+    documents = {
+        "finished": pickle.dumps({"status": "finished"}),
+        "running": pickle.dumps({"status": "running"}),
+        "accepted": pickle.dumps({"status": "accepted"}),
+    }
+
+    class ResourceLogger(object):
+        def __init__(self, **kwargs):
+            pass
+
+        def get_latest_iteration(self, user_id, resource_id):
+            assert user_id == "user"
+            if resource_id == "error":
+                raise ConnectionError("kvdb is not available")
+            return 1, documents.get(resource_id)
+
+    monkeypatch.setattr(
+        interim_result_retention, "ResourceLogger", ResourceLogger
+    )
+    is_running = create_running_check("user", config)
+    assert is_running("finished") is False
+    assert is_running("expired") is False
+    assert is_running("running") is True
+    assert is_running("accepted") is True
+    # Resources with unknown status are kept
+    assert is_running("error") is True
+
+
+@pytest.mark.unittest
+def test_janitor(tmp_path, config):
+    create_resource(str(tmp_path / "user" / "interim"), "resource_1", 100)
+    os.makedirs(tmp_path / "other_user")
+    janitor = InterimResultJanitor(config)
+    assert janitor.run_once() == {"user": {"bytes": 100, "resources": 1}}
+    config.INTERIM_RESULTS_JANITOR_INTERVAL = 0
+    assert janitor.start() is False
+
+
+@pytest.mark.unittest
+def test_janitor_lock(config):
+    janitor = InterimResultJanitor(config)
+    other_janitor = InterimResultJanitor(config)
+    assert janitor.acquire_lock() is True
+    assert janitor.acquire_lock() is True
+    # Only one janitor manages the interim results of a node
+    assert other_janitor.acquire_lock() is False
+    janitor.release_lock()
+    assert other_janitor.acquire_lock() is True
+    other_janitor.release_lock()
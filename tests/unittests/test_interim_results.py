@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Interim result unittest case
+"""
+
+import os
+import threading
+
+import pytest
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.exceptions import RsyncError
+from actinia_core.core.interim_results import InterimResult, get_map_name
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+@pytest.fixture
+def interim_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(global_config, "read", lambda path: None)
+    monkeypatch.setattr(
+        global_config, "GRASS_RESOURCE_DIR", str(tmp_path / "resources")
+    )
+    monkeypatch.setattr(global_config, "SAVE_INTERIM_RESULTS", True)
+    monkeypatch.setattr(
+        global_config, "SAVE_INTERIM_RESULTS_IN_BACKGROUND", True
+    )
+    monkeypatch.setattr(global_config, "INCLUDE_ADDITIONAL_MAPSET_PATTERN", "")
+    monkeypatch.setattr(global_config, "INTERIM_RESULTS_KEEP_STEPS", 1)
+    endpoint = "asyncephemeralresource"
+    interim_result = InterimResult("user", "resource_id", None, endpoint)
+    yield interim_result
+    interim_result.wait_for_interim_results(raise_error=False)
+
+
+@pytest.mark.unittest
+def test_background_saving(interim_result, tmp_path):
+    mapset = tmp_path / "mapset"
+    tmpdir = tmp_path / "tmpdir"
+    os.makedirs(mapset / "cell")
+    os.makedirs(tmpdir)
+    (mapset / "cell" / "elevation").write_bytes(b"raster")
+    (mapset / "WIND").write_text("region")
+    interim_result.save_interim_results(1, str(mapset), str(tmpdir))
+
+    (mapset / "WIND").write_text("changed region")
+    interim_result.save_interim_results(2, str(mapset), str(tmpdir))
+    # The next step waits for the snapshot if it may modify a changed file
+    interim_result.wait_for_pending_files(None)
+    (mapset / "WIND").write_text("next step")
+    interim_path = os.path.join(
+        interim_result.user_resource_interim_storage_path, "resource_id"
+    )
+    assert interim_result._saving_thread is None
+    assert sorted(os.listdir(interim_path)) == [
+        "step2",
+        "step2.manifest.json",
+        "tmpdir2",
+        "tmpdir2.manifest.json",
+    ]
+    step2 = os.path.join(interim_path, "step2")
+    with open(os.path.join(step2, "WIND")) as f:
+        assert f.read() == "changed region"
+    assert os.stat(os.path.join(step2, "cell", "elevation")).st_nlink == 1
+
+    interim_result.delete_interim_results()
+    assert not os.path.exists(interim_path)
+
+
+@pytest.mark.unittest
+def test_wait_for_pending_files(interim_result, tmp_path, monkeypatch):
+    mapset = tmp_path / "mapset"
+    tmpdir = tmp_path / "tmpdir"
+    os.makedirs(mapset / "cell")
+    os.makedirs(tmpdir)
+    (mapset / "WIND").write_text("region")
+    interim_result.save_interim_results(1, str(mapset), str(tmpdir))
+    interim_result.wait_for_interim_results()
+
+    # The snapshot is completed after the checks
+    completing = threading.Event()
+    complete_snapshots = interim_result._complete_snapshots
+
+    def wait_and_complete(*args):
+        completing.wait(10)
+        complete_snapshots(*args)
+
+    monkeypatch.setattr(
+        interim_result, "_complete_snapshots", wait_and_complete
+    )
+    (mapset / "cell" / "slope.1").write_bytes(b"raster")
+    interim_result.save_interim_results(2, str(mapset), str(tmpdir))
+    snapshot = interim_result._pending_snapshots[0][0]
+    if not snapshot.deferred_files:
+        pytest.skip("The file system supports reflinks")
+    assert snapshot.deferred_files == [os.path.join("cell", "slope.1")]
+
+    # Steps that write other maps do not wait
+    interim_result.wait_for_pending_files({"aspect"})
+    interim_result.wait_for_pending_files({"$file::out"})
+    assert interim_result._saving_thread is not None
+    # Steps that may write the changed maps wait
+    assert interim_result._may_modify_pending({"slope"}) is True
+    assert interim_result._may_modify_pending({"slope.1"}) is True
+    assert interim_result._may_modify_pending(None) is True
+    completing.set()
+    interim_result.wait_for_pending_files({"slope"})
+    assert interim_result._saving_thread is None
+    step2 = os.path.join(interim_result._get_interim_path(), "step2")
+    with open(os.path.join(step2, "cell", "slope.1"), "rb") as f:
+        assert f.read() == b"raster"
+
+
+@pytest.mark.unittest
+def test_background_saving_error(interim_result, tmp_path):
+    mapset = tmp_path / "mapset"
+    tmpdir = tmp_path / "tmpdir"
+    os.makedirs(mapset)
+    os.makedirs(tmpdir)
+    (mapset / "WIND").write_text("region")
+    interim_result.save_interim_results(1, str(mapset), str(tmpdir))
+    interim_path = os.path.join(
+        interim_result.user_resource_interim_storage_path, "resource_id"
+    )
+    os.remove(os.path.join(interim_path, "step1", "WIND"))
+
+    # The error of the background saving is raised by the next step
+    (mapset / "cell").write_text("raster")
+    interim_result.save_interim_results(2, str(mapset), str(tmpdir))
+    with pytest.raises(RsyncError):
+        interim_result.save_interim_results(3, str(mapset), str(tmpdir))
+    assert os.path.isdir(os.path.join(interim_path, "step1"))
+    assert not os.path.exists(os.path.join(interim_path, "step2"))
+
+
+@pytest.mark.unittest
+def test_keep_steps(interim_result, tmp_path):
+    mapset = tmp_path / "mapset"
+    tmpdir = tmp_path / "tmpdir"
+    os.makedirs(mapset)
+    os.makedirs(tmpdir)
+    interim_result.keep_steps = 2
+    for step in range(1, 4):
+        (mapset / ("map%i" % step)).write_bytes(b"x" * 10)
+        interim_result.save_interim_results(step, str(mapset), str(tmpdir))
+    interim_result.wait_for_interim_results()
+
+    interim_path = interim_result._get_interim_path()
+    assert sorted(
+        name for name in os.listdir(interim_path) if name.startswith("step")
+    ) == ["step2", "step2.manifest.json", "step3", "step3.manifest.json"]
+    entry = interim_result.index.read()["resource_id"]
+    assert entry["steps"] == [2, 3]
+    assert entry["bytes"] == 30
+
+    interim_result.delete_interim_results()
+    assert interim_result.index.read() == {}
+
+
+@pytest.mark.unittest
+def test_get_map_name():
+    assert get_map_name(os.path.join("cell", "slope")) == "slope"
+    assert get_map_name(os.path.join("vector", "roads", "coor")) == "roads"
+    assert get_map_name("WIND") is None
+    assert get_map_name(os.path.join("sqlite", "sqlite.db")) is None
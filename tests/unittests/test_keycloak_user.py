@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2022 mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2022-2026 mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -14,19 +14,25 @@
 Tests: Version unittest case
 """
 
+import json
 import os
+import time as time_module
+import jwt
 import pytest
+from copy import copy
+from cryptography.hazmat.primitives.asymmetric import rsa
 from datetime import datetime, timedelta
 
 from actinia_core.core.common.config import global_config
 from actinia_core.core.common.keycloak_user import (
     ActiniaKeycloakUser,
+    KeycloakTokenVerifier,
     create_user_from_tokeninfo,
 )
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Anika Weinmann"
-__copyright__ = "Copyright 2022, mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2022-2026, mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -117,3 +123,70 @@ def test_keycloak_superadmin():
     assert user.has_user_role() is False, "Role is wrong"
     assert user.has_admin_role() is False, "Role is wrong"
     assert user.has_superadmin_role() is True, "Role is wrong"
+
+
+class LocalKeycloakTokenVerifier(KeycloakTokenVerifier):
+    """Token verifier that serves the signing keys of the test"""
+
+    def __init__(self, config, jwks):
+        KeycloakTokenVerifier.__init__(self, config=config)
+        self.jwks = jwks
+        self.fetches = 0
+
+    def _fetch_keys(self):
+        self.fetches += 1
+        return self.jwks
+
+
+def create_signing_key(kid):
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048
+    )
+    jwk = json.loads(
+        jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key())
+    )
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, jwk
+
+
+def create_token(private_key, kid, aud="actinia-client", exp=300):
+    payload = {
+        "exp": int(time_module.time()) + exp,
+        "aud": aud,
+        "preferred_username": "actinia-user",
+    }
+    return jwt.encode(
+        payload, private_key, algorithm="RS256", headers={"kid": kid}
+    )
+
+
+@pytest.mark.unittest
+def test_keycloak_token_verifier():
+    config = copy(global_config)
+    config.KEYCLOAK_CLIENT_ID = "actinia-client"
+    config.KEYCLOAK_TOKEN_CACHE_SIZE = 10
+    config.KEYCLOAK_KEYS_REFRESH_INTERVAL = 3600
+    key_1, jwk_1 = create_signing_key("key-1")
+    verifier = LocalKeycloakTokenVerifier(config, {"keys": [jwk_1]})
+    verifier.min_fetch_interval = 0
+
+    token = create_token(key_1, "key-1")
+    info = verifier.decode(token)
+    assert info["preferred_username"] == "actinia-user"
+    assert verifier.fetches == 1
+    # Verified tokens and the keys are cached
+    assert verifier.decode(token) == info
+    assert verifier.decode(create_token(key_1, "key-1", exp=200)) is not None
+    assert verifier.fetches == 1
+
+    # Key rotation: an unknown key id triggers a refresh
+    key_2, jwk_2 = create_signing_key("key-2")
+    verifier.jwks = {"keys": [jwk_1, jwk_2]}
+    assert verifier.decode(create_token(key_2, "key-2")) is not None
+    assert verifier.fetches == 2
+
+    # Invalid tokens
+    assert verifier.decode(create_token(key_2, "key-1")) is None
+    assert verifier.decode(create_token(key_1, "key-1", aud="other")) is None
+    assert verifier.decode(create_token(key_1, "key-1", exp=-60)) is None
+    assert verifier.decode("no-token") is None
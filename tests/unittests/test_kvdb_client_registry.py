@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Pooled kvdb client registry unittest case
+"""
+
+import pytest
+
+from actinia_core.core.common import kvdb_base
+from actinia_core.core.common.kvdb_base import (
+    close_kvdb_clients,
+    get_kvdb_client,
+)
+from actinia_core.core.kvdb_lock import KvdbLockingInterface
+from actinia_core.core.kvdb_resources import KvdbResourceInterface
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+# Nothing listens on this port, the registry only logs the failing ping
+HOST = "127.0.0.1"
+PORT = 1
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    close_kvdb_clients()
+    yield
+    close_kvdb_clients()
+
+
+@pytest.mark.unittest
+def test_client_is_reused_per_role():
+    resources_1 = get_kvdb_client("resources", HOST, PORT)
+    resources_2 = get_kvdb_client("resources", HOST, PORT)
+    locks = get_kvdb_client("locks", HOST, PORT)
+    assert resources_1 is resources_2, "Client of a role is not reused"
+    assert resources_1 is not locks, "Roles share the same client"
+
+
+@pytest.mark.unittest
+def test_interfaces_share_the_pool():
+    interface_1 = KvdbResourceInterface()
+    interface_1.connect(HOST, PORT)
+    interface_2 = KvdbResourceInterface()
+    interface_2.connect(HOST, PORT)
+    assert interface_1.connection_pool is interface_2.connection_pool
+    interface_1.disconnect()
+    assert get_kvdb_client("resources", HOST, PORT) is interface_2.kvdb_client
+
+
+@pytest.mark.unittest
+def test_lock_scripts_are_cached():
+    lock_1 = KvdbLockingInterface()
+    lock_1.connect(HOST, PORT)
+    lock_2 = KvdbLockingInterface()
+    lock_2.connect(HOST, PORT)
+    assert lock_1.call_lock_resource is lock_2.call_lock_resource
+    assert lock_1.call_unlock_resource.sha == lock_2.call_unlock_resource.sha
+
+
+@pytest.mark.unittest
+def test_registry_is_reset_in_forked_process(monkeypatch):
+    client = get_kvdb_client("api_log", HOST, PORT)
+    monkeypatch.setattr(kvdb_base, "_kvdb_clients_pid", -1)
+    assert get_kvdb_client("api_log", HOST, PORT) is not client
+
+
+@pytest.mark.unittest
+def test_close_clients_of_role():
+    users = get_kvdb_client("users", HOST, PORT)
+    queue = get_kvdb_client("queue", HOST, PORT)
+    close_kvdb_clients("users")
+    assert get_kvdb_client("users", HOST, PORT) is not users
+    assert get_kvdb_client("queue", HOST, PORT) is queue
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Compiled user permissions unittest case
+"""
+
+import pytest
+
+from actinia_core.core.common.permissions import (
+    UserPermissions,
+    get_user_permissions,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+def create_credentials(user_role="user"):
+    return {
+        "user_id": "user",
+        "user_role": user_role,
+        "permissions": {
+            "accessible_datasets": {
+                "nc_spm_08": ["PERMANENT", "user1"],
+                "ECAD": [],
+                "utm32n": [None],
+            },
+            "accessible_modules": ["r.slope.aspect", "g.region"],
+        },
+    }
+
+
+@pytest.mark.unittest
+def test_user_permissions():
+    permissions = UserPermissions.from_credentials(create_credentials())
+    assert permissions.is_admin is False
+    assert permissions.can_access_project("nc_spm_08")
+    assert permissions.can_access_project("ECAD")
+    assert not permissions.can_access_project("latlong_wgs84")
+    assert permissions.can_access_mapset("nc_spm_08", "user1")
+    assert not permissions.can_access_mapset("nc_spm_08", "landsat")
+    assert not permissions.can_access_mapset("ECAD", "PERMANENT")
+    assert not permissions.can_access_mapset("utm32n", "PERMANENT")
+    assert not permissions.can_access_mapset("latlong_wgs84", "PERMANENT")
+    assert permissions.can_use_module("g.region")
+    assert not permissions.can_use_module("r.mapcalc")
+    with pytest.raises(AttributeError):
+        permissions.is_admin = True
+
+
+@pytest.mark.unittest
+def test_admin_permissions():
+    for role in ("admin", "superadmin"):
+        permissions = UserPermissions.from_credentials(
+            create_credentials(role)
+        )
+        assert permissions.can_access_project("latlong_wgs84")
+        assert permissions.can_access_mapset("ECAD", "PERMANENT")
+        assert permissions.can_use_module("r.mapcalc")
+
+
+@pytest.mark.unittest
+def test_user_permissions_cache():
+    credentials = create_credentials()
+    permissions = get_user_permissions(credentials)
+    assert get_user_permissions(credentials) is permissions
+    # New permission dictionaries are compiled again
+    credentials["permissions"] = dict(credentials["permissions"])
+    credentials["permissions"]["accessible_modules"] = ["r.mapcalc"]
+    permissions = get_user_permissions(credentials)
+    assert permissions.can_use_module("r.mapcalc")
+    assert not permissions.can_use_module("g.region")
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process chain execution unittest case
+"""
+
+import os
+import subprocess
+import time
+from itertools import count
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+from actinia_processing_lib.ephemeral_processing import EphemeralProcessing
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.config import Configuration
+from actinia_core.core.common.exceptions import RsyncError
+from actinia_core.core.common.process_object import Process
+from actinia_core.core.interim_results import InterimResult
+from actinia_core.processing.actinia_processing import (
+    process_chain_execution,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+# Waits until the flag file of the other step exists, hence the step only
+# succeeds if both steps run concurrently
+WAIT_FOR_FLAG = (
+    'touch "$FLAG_DIR/$1"; i=0; '
+    'while [ ! -f "$FLAG_DIR/$2" ]; do '
+    "i=$((i+1)); [ $i -gt 500 ] && exit 1; sleep 0.01; done; "
+    "echo $1 $MODULE_VAR"
+)
+
+# Writes a row and waits until the consumer read it
+WAIT_FOR_READ = (
+    'echo a; i=0; while [ ! -f "$FLAG_DIR/read" ]; do '
+    "i=$((i+1)); [ $i -gt 500 ] && exit 1; sleep 0.01; done; "
+    "echo b"
+)
+
+
+class FakeGrassInitializer(object):
+    """Runs the GRASS modules of the tests as shell scripts"""
+
+    def __init__(self, env):
+        self.env = env
+        self.calls = []
+
+    def get_env(self):
+        return self.env
+
+    def run_module(self, module, args, raw, stdout, stderr, stdin, env=None):
+        self.calls.append((module, env))
+        return subprocess.Popen(
+            ["sh", "-c", args[0], module, *args[1:]],
+            stdout=stdout,
+            stderr=stderr,
+            stdin=stdin,
+            env=env if env is not None else self.env,
+        )
+
+
+class Processing(
+    process_chain_execution.ProcessChainExecution, EphemeralProcessing
+):
+    def __init__(self):
+        self.resource_updates = []
+
+    def _send_resource_update(self, message, results=None):
+        self.resource_updates.append(message)
+
+
+@pytest.fixture
+def processing(tmp_path, monkeypatch):
+    # The steps run concurrently independent of the cores of the host
+    monkeypatch.setattr(
+        os, "sched_getaffinity", lambda pid: set(range(4)), raising=False
+    )
+    config = Configuration()
+    config.PROCESS_CHAIN_PARALLEL_STEPS = 4
+    env = dict(os.environ, FLAG_DIR=str(tmp_path), MODULE_VAR="session")
+    processing = Processing()
+    processing.config = config
+    processing.ginit = FakeGrassInitializer(env)
+    processing.interim_result = SimpleNamespace(saving_interim_results=False)
+    processing.resource_logger = SimpleNamespace(
+        get_termination=lambda *args: False
+    )
+    processing.message_logger = SimpleNamespace(debug=lambda message: None)
+    processing.user_id = "user"
+    processing.resource_id = "resource"
+    processing.iteration = None
+    processing.temp_file_path = str(tmp_path)
+    processing.temp_mapset_path = None
+    processing.process_time_limit = 60
+    processing.process_count = 0
+    processing.progress_steps = 0
+    processing.progress = {}
+    processing.last_module = None
+    processing.module_output_log = []
+    processing.module_output_dict = {}
+    processing.module_results = {}
+    processing.output_parser_list = []
+    temp_files = (str(tmp_path / ("stdin_%i" % i)) for i in count())
+    processing.proc_chain_converter = SimpleNamespace(
+        generate_temp_file_path=lambda: next(temp_files)
+    )
+    return processing
+
+
+def create_step(step_id, args, inputs=(), outputs=()):
+    return Process(
+        exec_type="grass",
+        executable="r.step",
+        executable_params=args,
+        id=step_id,
+        inputs=set(inputs),
+        outputs=set(outputs),
+    )
+
+
+@pytest.mark.unittest
+def test_execute_process_list_parallel(processing):
+    process_list = [
+        create_step("a", [WAIT_FOR_FLAG, "a", "b"], outputs=["x"]),
+        create_step("b", [WAIT_FOR_FLAG, "b", "a"], outputs=["y"]),
+        create_step("c", ["echo c $MODULE_VAR"], inputs=["x", "y"]),
+    ]
+    processing._execute_process_list(process_list)
+
+    assert processing.parallel_steps is True
+    assert processing.progress_steps == 3
+    assert [plm["id"] for plm in processing.module_output_log][2] == "c"
+    for step_id in ("a", "b", "c"):
+        plm = processing.module_output_dict[step_id]
+        assert plm["stdout"] == "%s session\n" % step_id
+        assert plm["return_code"] == 0
+    # Each step gets its own environment derived from the session
+    envs = [env for _, env in processing.ginit.calls]
+    assert all(env["MODULE_VAR"] == "session" for env in envs)
+    assert len({id(env) for env in envs}) == 3
+
+
+@pytest.mark.unittest
+def test_execute_process_list_sequential(processing):
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = 1
+    process_list = [
+        create_step("a", ["echo a"], outputs=["x"]),
+        create_step("b", ["echo b"], outputs=["y"]),
+    ]
+    processing._execute_process_list(process_list)
+    assert processing.parallel_steps is False
+    assert [plm["stdout"] for plm in processing.module_output_log] == [
+        "a\n",
+        "b\n",
+    ]
+    # The steps run with the environment of the session
+    assert [env for _, env in processing.ginit.calls] == [None, None]
+
+    # Steps that save interim results run one by one
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = 4
+    processing.interim_result.saving_interim_results = True
+    assert processing._get_max_parallel_steps() == 1
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("parallel_steps", [1, 4])
+def test_execute_process_list_cells(processing, tmp_path, parallel_steps):
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = parallel_steps
+    mapset_path = tmp_path / "mapset"
+    mapset_path.mkdir()
+    (mapset_path / "WIND").write_text("rows:       20\ncols:       30\n")
+    processing.temp_mapset_path = str(mapset_path)
+    vector = create_step("vector", ["echo v"], outputs=["y"])
+    vector.executable = "v.step"
+    process_list = [create_step("raster", ["echo r"], outputs=["x"]), vector]
+    processing._execute_process_list(process_list)
+
+    # The cells of the region of raster modules are logged
+    assert processing.module_output_dict["raster"]["cells"] == 600
+    assert "cells" not in processing.module_output_dict["vector"]
+
+
+@pytest.mark.unittest
+def test_execute_process_list_error(processing):
+    process_list = [
+        create_step("a", ["echo failed >&2; exit 1"], outputs=["x"]),
+        create_step("b", ["echo b"], inputs=["x"]),
+    ]
+    with pytest.raises(AsyncProcessError):
+        processing._execute_process_list(process_list)
+    plm = processing.module_output_dict["a"]
+    assert plm["return_code"] == 1
+    assert plm["stderr"] == ["failed", ""]
+    assert "b" not in processing.module_output_dict
+
+
+@pytest.mark.unittest
+def test_execute_process_list_streaming(processing):
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = 1
+    processing.config.STDOUT_MEMORY_LIMIT = 1024
+    stdout_def = {"id": "rows", "format": "table", "delimiter": "|"}
+    producer = create_step("producer", ["seq 100000 | sed 's/$/|x/'"])
+    producer.stdout_parser = stdout_def
+    counter = create_step("counter", ["wc -l"])
+    counter.stdin_source = producer.get_stdout
+    cat = create_step("cat", ["cat"])
+    cat.stdin_source = counter.get_stdout
+    processing.output_parser_list = [{"producer": stdout_def}]
+    processing._execute_process_list([producer, counter, cat])
+
+    # The stdout is spilled, only the part kept in memory is logged
+    assert producer.stdout.spilled is True
+    assert len(processing.module_output_dict["producer"]["stdout"]) == 1024
+    # The following step reads the spilled stdout
+    assert processing.module_output_dict["cat"]["stdout"].strip() == "100000"
+    # The stdout was parsed while the process was running
+    rows = processing.module_results["rows"]
+    assert len(rows) == 100000
+    assert rows[-1] == ["100000", "x"]
+    processing._parse_module_outputs()
+    assert processing.module_results["rows"] is rows
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("parallel_steps", [1, 4])
+def test_execute_process_list_pipeline(processing, parallel_steps):
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = parallel_steps
+    processing.config.PROCESS_CHAIN_STREAMING = True
+    # The producer only finishes if the consumer reads its first row while
+    # it is running
+    producer = create_step("producer", [WAIT_FOR_READ])
+    consumer = create_step(
+        "consumer", ['read row; touch "$FLAG_DIR/read"; echo $row; cat']
+    )
+    consumer.stdin_source = producer.get_stdout
+    consumer.depends_on = {"producer"}
+    stdout_def = {"id": "rows", "format": "list", "delimiter": "|"}
+    sort = create_step("sort", ["sort -r"])
+    sort.stdin_source = consumer.get_stdout
+    sort.depends_on = {"consumer"}
+    sort.stdout_parser = stdout_def
+    processing.output_parser_list = [{"sort": stdout_def}]
+    processing._execute_process_list([producer, consumer, sort])
+
+    assert processing.progress_steps == 3
+    assert len(processing.ginit.calls) == 3
+    assert [plm["id"] for plm in processing.module_output_log] == [
+        "producer",
+        "consumer",
+        "sort",
+    ]
+    # The intermediate outputs are not stored
+    assert processing.module_output_dict["producer"]["stdout"] == ""
+    assert processing.module_output_dict["consumer"]["stdout"] == ""
+    assert processing.module_output_dict["sort"]["stdout"] == "b\na\n"
+    assert processing.module_results["rows"] == ["b", "a"]
+
+
+@pytest.mark.unittest
+def test_execute_process_list_pipeline_error(processing):
+    processing.config.PROCESS_CHAIN_STREAMING = True
+    producer = create_step("producer", ["exec yes"])
+    consumer = create_step("consumer", ["read row; exit 2"])
+    consumer.executable = "r.consumer"
+    consumer.stdin_source = producer.get_stdout
+    consumer.depends_on = {"producer"}
+    with pytest.raises(AsyncProcessError, match="r.consumer"):
+        processing._execute_process_list([producer, consumer])
+    assert processing.module_output_dict["consumer"]["return_code"] == 2
+
+
+@pytest.mark.unittest
+def test_execute_step_pending_files(processing):
+    processing.config.PROCESS_CHAIN_PARALLEL_STEPS = 1
+    processing.config.PROCESS_CHAIN_STREAMING = True
+    checked = []
+    processing.interim_result = SimpleNamespace(
+        saving_interim_results=True,
+        wait_for_pending_files=checked.append,
+    )
+    processing._save_interim_results = lambda: None
+    producer = create_step("producer", ["echo a"], outputs=["x"])
+    consumer = create_step("consumer", ["cat"], outputs=["y"])
+    consumer.stdin_source = producer.get_stdout
+    barrier = create_step("barrier", ["echo b"])
+    barrier.barrier = True
+    processing._execute_process_list([producer, consumer, barrier])
+
+    # The steps wait for the files of the previous step that may not be
+    # copied yet if they write them
+    assert checked == [{"x", "y"}, None]
+
+
+@pytest.mark.unittest
+def test_final_cleanup(processing):
+    calls = []
+
+    def complete_snapshots():
+        time.sleep(0.05)
+        calls.append("saved")
+
+    interim_result = InterimResult.__new__(InterimResult)
+    interim_result._saving_thread = Thread(target=complete_snapshots)
+    interim_result._saving_thread.start()
+    interim_result._saving_error = RsyncError("Unable to copy")
+    processing.interim_result = interim_result
+    processing._cleanup = lambda: calls.append("cleanup")
+    # The temporary database is removed after the interim results that are
+    # saved in the background are completed, errors are not raised
+    processing._final_cleanup()
+    assert calls == ["saved", "cleanup"]
+    assert interim_result._saving_thread is None
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Scaling of the process chain conversion
+
+The conversion of generated process chains with many steps and stdout
+references must scale linearly with the number of steps. The accesses of
+the converter to its process dictionary are counted, hence the test does
+not depend on the speed of the host.
+"""
+
+import pytest
+
+from actinia_core.core.common.process_chain import ProcessChainConverter
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+def create_process_chain(num_steps):
+    """Create a process chain of r.univar and r.mapcalc pairs, each
+    r.mapcalc expression references the stdout of the r.univar before it
+    """
+    process_list = []
+    for i in range(num_steps // 2):
+        process_list.append(
+            {
+                "id": "univar-%i" % i,
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev@PERMANENT"}],
+                "flags": "g",
+            }
+        )
+        process_list.append(
+            {
+                "id": "mapcalc-%i" % i,
+                "module": "r.mapcalc",
+                "inputs": [
+                    {
+                        "param": "expression",
+                        "value": "out_%i = (elev@PERMANENT - univar-%i::"
+                        "stdout::min) / (univar-%i::stdout::max - "
+                        "univar-%i::stdout::min)" % (i, i, i, i),
+                    }
+                ],
+            }
+        )
+    return {"version": "1", "list": process_list}
+
+
+class CountingDict(dict):
+    """A dictionary that counts the lookups and the iterated keys"""
+
+    def __init__(self):
+        dict.__init__(self)
+        self.accesses = 0
+
+    def __contains__(self, key):
+        self.accesses += 1
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        self.accesses += 1
+        return dict.__getitem__(self, key)
+
+    def __iter__(self):
+        for key in dict.__iter__(self):
+            self.accesses += 1
+            yield key
+
+
+def convert(num_steps):
+    """Return the process list and the number of accesses to the process
+    dictionary
+    """
+    process_dict = CountingDict()
+    converter = ProcessChainConverter(process_dict=process_dict)
+    process_list = converter.process_chain_to_process_list(
+        create_process_chain(num_steps)
+    )
+    return process_list, process_dict.accesses
+
+
+@pytest.mark.unittest
+def test_stdout_reference_resolution():
+    process_list, _ = convert(4)
+    expression = (
+        "out_1 = (elev@PERMANENT - PARAM_STDIN_FUNC_1::min) / "
+        "(PARAM_STDIN_FUNC_1::max - PARAM_STDIN_FUNC_1::min)"
+    )
+    assert process_list[3].executable_params == ["expression=" + expression]
+    assert list(process_list[3].param_stdin_sources) == [1]
+
+
+@pytest.mark.unittest
+def test_process_chain_conversion_scaling():
+    _, quarter = convert(2500)
+    process_list, full = convert(10000)
+    assert len(process_list) == 10000
+    # Four times the steps must need about four times the accesses,
+    # quadratic behaviour would need sixteen times the accesses
+    assert quarter > 0
+    assert full <= quarter * 5
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process chain template unittest case
+"""
+
+import os
+import pickle
+
+import pytest
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.process_chain import ProcessChainConverter
+from actinia_core.core.common.process_chain_template import (
+    BoundProcessChain,
+    ProcessChainTemplate,
+    ProcessChainTemplateCache,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+PROCESS_CHAIN = {
+    "version": "1",
+    "list": [
+        {
+            "id": "region",
+            "module": "g.region",
+            "inputs": [{"param": "raster", "value": "{{elevation}}"}],
+            "flags": "p",
+        },
+        {
+            "id": "slope",
+            "module": "r.slope.aspect",
+            "inputs": [
+                {"param": "elevation", "value": "{{elevation}}"},
+                {"param": "zscale", "value": "{{ zscale }}"},
+            ],
+            "outputs": [{"param": "slope", "value": "{{prefix}}_slope"}],
+        },
+        {
+            "id": "univar",
+            "module": "r.univar",
+            "inputs": [{"param": "map", "value": "{{prefix}}_slope"}],
+            "flags": "g",
+        },
+    ],
+}
+
+PARAMETERS = {
+    "elevation": {"type": "string"},
+    "zscale": {"type": "number", "default": 1.0},
+    "prefix": {"type": "string"},
+}
+
+
+@pytest.mark.unittest
+def test_template_bind():
+    template = ProcessChainTemplate("slope", PROCESS_CHAIN, PARAMETERS)
+    assert template.modules == ["g.region", "r.slope.aspect", "r.univar"]
+
+    process_chain = template.bind(
+        {"elevation": "elev@PERMANENT", "prefix": "my"}
+    )
+    inputs = process_chain["list"][1]["inputs"]
+    assert inputs[0]["value"] == "elev@PERMANENT"
+    # The default value is used and converted to a string
+    assert inputs[1]["value"] == "1.0"
+    assert process_chain["list"][1]["outputs"][0]["value"] == "my_slope"
+    # Parts without placeholders are shared, the template is unchanged
+    assert process_chain["list"][2]["flags"] == "g"
+    assert (
+        process_chain["list"][0]["flags"] is PROCESS_CHAIN["list"][0]["flags"]
+    )
+    assert PROCESS_CHAIN["list"][1]["inputs"][0]["value"] == "{{elevation}}"
+
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    assert "elevation=elev@PERMANENT" in process_list[1].executable_params
+
+
+@pytest.mark.unittest
+def test_template_compiled_process_list(tmp_path, monkeypatch):
+    template = ProcessChainTemplate("slope", PROCESS_CHAIN, PARAMETERS)
+    process_chain = template.bind(
+        {"elevation": "elev@PERMANENT", "prefix": "my", "zscale": 2}
+    )
+    assert isinstance(process_chain, BoundProcessChain)
+    # The compiled process list is sent to the worker
+    process_chain = pickle.loads(pickle.dumps(process_chain))
+
+    def convert(*args):
+        raise AssertionError("The process chain is converted again")
+
+    monkeypatch.setattr(ProcessChainConverter, "_create_process_list", convert)
+    converter = ProcessChainConverter(temp_file_path=str(tmp_path))
+    process_list = converter.process_chain_to_process_list(process_chain)
+    assert process_chain.compiled_process_list is None
+    assert [process.id for process in process_list] == [
+        "region",
+        "slope",
+        "univar",
+    ]
+    assert process_list[1].executable_params == [
+        "elevation=elev@PERMANENT",
+        "zscale=2",
+        "slope=my_slope",
+    ]
+    assert process_list[1].inputs == {"elev"}
+    assert process_list[1].outputs == {"my_slope"}
+    assert process_list[2].inputs == {"my_slope"}
+    assert converter.required_mapsets == ["PERMANENT"]
+    assert converter.process_dict["univar"] is process_list[2]
+    # The compiled process list of the template keeps the slots
+    compiled = template.compiled_process_list.process_list
+    assert compiled[1].executable_params[0] == "elevation=__actinia_slot_0__"
+
+
+@pytest.mark.unittest
+def test_template_compiled_files_and_expressions(tmp_path):
+    template = ProcessChainTemplate(
+        "files",
+        {
+            "version": "1",
+            "list": [
+                {
+                    "id": "mapcalc",
+                    "module": "r.mapcalc",
+                    "inputs": [{"param": "expression", "value": "{{expr}}"}],
+                },
+                {
+                    "id": "univar",
+                    "module": "r.univar",
+                    "inputs": [{"param": "map", "value": "{{map}}"}],
+                    "outputs": [{"param": "output", "value": "$file::stats"}],
+                },
+                {"id": "cat", "exe": "/bin/cat", "params": ["$file::stats"]},
+            ],
+        },
+    )
+    process_chain = template.bind({"expr": "out = a & b", "map": "out"})
+    converter = ProcessChainConverter(temp_file_path=str(tmp_path))
+    converter.temp_file_count = 3
+    process_list = converter.process_chain_to_process_list(process_chain)
+    assert process_list[0].inputs == {"out", "a", "b"}
+    assert process_list[0].outputs == {"out", "a", "b"}
+    assert process_list[1].inputs == {"out"}
+    # The temporary files are created by the converter of the processing
+    stats_file = os.path.join(str(tmp_path), "temp_file_4")
+    assert converter.temporary_pc_files == {"stats": stats_file}
+    assert process_list[1].executable_params[1] == "output=%s" % stats_file
+    assert process_list[2].executable_params == [stats_file]
+
+    # Only r.mapcalc like modules accept the character &
+    with pytest.raises(AsyncProcessError):
+        template.bind({"expr": "out = a", "map": "a&b"})
+
+
+@pytest.mark.unittest
+def test_template_default_parameters():
+    template = ProcessChainTemplate("slope", PROCESS_CHAIN)
+    assert template.parameters["zscale"] == {"type": "string"}
+    with pytest.raises(AsyncProcessError):
+        template.bind({"elevation": "elev", "prefix": "my"})
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "bindings",
+    [
+        {"elevation": "elev"},
+        {"elevation": "elev", "prefix": "my", "unknown": "x"},
+        {"elevation": 1, "prefix": "my"},
+        {"elevation": "elev", "prefix": "my", "zscale": True},
+        {"elevation": "{{prefix}}", "prefix": "my"},
+        {"elevation": "a::stdout", "prefix": "my"},
+        {"elevation": "$file::a", "prefix": "my"},
+        {"elevation": "a&b", "prefix": "my"},
+        ["elev"],
+    ],
+)
+def test_template_bind_errors(bindings):
+    template = ProcessChainTemplate("slope", PROCESS_CHAIN, PARAMETERS)
+    with pytest.raises(AsyncProcessError):
+        template.bind(bindings)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "template_id,process_chain,parameters",
+    [
+        ("invalid id", PROCESS_CHAIN, PARAMETERS),
+        ("t", {"version": "1", "list": []}, None),
+        ("t", {"version": "1", "list": [{"id": "a"}]}, None),
+        (
+            "t",
+            {"version": "1", "list": [{"id": "a", "module": "{{m}}"}]},
+            None,
+        ),
+        (
+            "t",
+            {
+                "version": "1",
+                "list": [
+                    {"id": "a", "module": "r.univar", "stdin": "b::stdout"},
+                    {"id": "b", "module": "r.univar"},
+                ],
+            },
+            None,
+        ),
+        (
+            "t",
+            {
+                "version": "1",
+                "list": [{"id": "a", "module": "r.univar", "{{k}}": "v"}],
+            },
+            None,
+        ),
+        # The template is converted when it is registered
+        (
+            "t",
+            {
+                "version": "1",
+                "list": [
+                    {"id": "a", "exe": "/bin/echo", "params": ["{{p}} & x"]}
+                ],
+            },
+            None,
+        ),
+        (
+            "t",
+            {
+                "version": "1",
+                "list": [
+                    {
+                        "id": "a",
+                        "module": "r.univar",
+                        "inputs": [{"param": "map", "value": "{{map}}"}],
+                        "stdout": {"id": "stats"},
+                    }
+                ],
+            },
+            None,
+        ),
+        ("t", PROCESS_CHAIN, {"elevation": {}}),
+        ("t", PROCESS_CHAIN, dict(PARAMETERS, other={})),
+        ("t", PROCESS_CHAIN, dict(PARAMETERS, zscale={"type": "bool"})),
+    ],
+)
+def test_template_errors(template_id, process_chain, parameters):
+    with pytest.raises(AsyncProcessError):
+        ProcessChainTemplate(template_id, process_chain, parameters)
+
+
+@pytest.mark.unittest
+def test_template_cache():
+    cache = ProcessChainTemplateCache(size=1)
+    loaded = []
+
+    def load():
+        loaded.append(1)
+        return {
+            "id": "slope",
+            "process_chain": PROCESS_CHAIN,
+            "parameters": PARAMETERS,
+        }
+
+    template = cache.get("user", "slope", "1", load)
+    assert cache.get("user", "slope", "1", load) is template
+    assert len(loaded) == 1
+    # A new version is compiled again
+    assert cache.get("user", "slope", "2", load) is not template
+    assert len(loaded) == 2
+    cache.invalidate("user", "slope")
+    cache.get("user", "slope", "2", load)
+    assert len(loaded) == 3
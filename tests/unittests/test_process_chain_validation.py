@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process chain validation without GRASS session unittest case
+"""
+
+import os
+from copy import copy
+
+import pytest
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.process_chain_validation import (
+    ProcessChainValidator,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+CREDENTIALS = {
+    "user_role": "user",
+    "permissions": {
+        "process_num_limit": 3,
+        "accessible_datasets": {"nc": ["PERMANENT", "landsat"]},
+        "accessible_modules": ["r.univar", "g.region"],
+    },
+}
+
+
+def create_process_chain(*maps):
+    return {
+        "version": "1",
+        "list": [
+            {
+                "id": "univar_%i" % i,
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": name}],
+            }
+            for i, name in enumerate(maps)
+        ],
+    }
+
+
+@pytest.fixture
+def validator(tmp_path):
+    config = copy(global_config)
+    config.GRASS_DATABASE = str(tmp_path / "grassdb")
+    config.GRASS_USER_DATABASE = str(tmp_path / "userdb")
+    for mapset in ("PERMANENT", "landsat", "secret"):
+        os.makedirs(tmp_path / "grassdb" / "nc" / mapset)
+        (tmp_path / "grassdb" / "nc" / mapset / "WIND").touch()
+    os.makedirs(tmp_path / "userdb" / "group" / "nc" / "user_mapset")
+    (tmp_path / "userdb" / "group" / "nc" / "user_mapset" / "WIND").touch()
+    os.makedirs(tmp_path / "grassdb" / "nc" / "no_mapset")
+    return ProcessChainValidator(CREDENTIALS, "group", "nc", config)
+
+
+@pytest.mark.unittest
+def test_validate(validator):
+    process_chain = create_process_chain(
+        "elev@PERMANENT", "lsat@landsat", "x@user_mapset"
+    )
+    assert validator.requires_worker(process_chain) is False
+    process_list = validator.validate(process_chain)
+    assert [process.executable for process in process_list] == ["r.univar"] * 3
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "process_chain,message",
+    [
+        (create_process_chain("a", "b", "c", "d"), "Process limit exceeded"),
+        (create_process_chain("x@secret"), "mapset <secret>"),
+        (create_process_chain("x@missing"), "mapset <missing>"),
+        (create_process_chain("x@no_mapset"), "Invalid mapset <no_mapset>"),
+        (
+            {"version": "1", "list": [{"id": "a", "module": "r.slope"}]},
+            "<r.slope> is not supported",
+        ),
+        ({"version": "1", "list": [{"id": "a"}]}, "Unknown process"),
+    ],
+)
+def test_validate_errors(validator, process_chain, message):
+    with pytest.raises(AsyncProcessError, match=message):
+        validator.validate(process_chain)
+
+
+@pytest.mark.unittest
+def test_requires_worker(validator):
+    process_chain = create_process_chain("elev")
+    assert validator.requires_worker(b"<xml/>") is True
+    webhooks = dict(process_chain, webhooks={"finished": "http://x"})
+    assert validator.requires_worker(webhooks) is True
+
+    validator.config.GRASS_DATABASE = "/nonexistent"
+    assert validator.requires_worker(process_chain) is True
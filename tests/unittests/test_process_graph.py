@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process graph unittest case
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from actinia_core.core.common.process_chain import ProcessChainConverter
+from actinia_core.core.common.process_graph import (
+    STEP_REGION_PREFIX,
+    ProcessGraph,
+    get_map_names,
+    get_stream_pipelines,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+PROCESS_CHAIN = {
+    "version": "1",
+    "list": [
+        {
+            "id": "region",
+            "module": "g.region",
+            "inputs": [{"param": "raster", "value": "elev@PERMANENT"}],
+        },
+        {
+            "id": "slope",
+            "module": "r.slope.aspect",
+            "inputs": [{"param": "elevation", "value": "elev@PERMANENT"}],
+            "outputs": [{"param": "slope", "value": "slope"}],
+        },
+        {
+            "id": "univar",
+            "module": "r.univar",
+            "inputs": [{"param": "map", "value": "elev@PERMANENT"}],
+            "flags": "g",
+        },
+        {
+            "id": "mapcalc",
+            "module": "r.mapcalc",
+            "inputs": [{"param": "expression", "value": "double = slope * 2"}],
+        },
+        {
+            "id": "rescale",
+            "module": "r.rescale",
+            "inputs": [
+                {"param": "input", "value": "double"},
+                {"param": "to", "value": "0,univar::stdout::max"},
+            ],
+            "outputs": [{"param": "output", "value": "rescaled"}],
+        },
+        {
+            "id": "buffer",
+            "module": "r.buffer",
+            "inputs": [{"param": "input", "value": "elev@PERMANENT"}],
+            "outputs": [{"param": "output", "value": "buffered"}],
+            "depends_on": ["slope"],
+        },
+        {
+            "id": "colors",
+            "module": "r.colors",
+            "inputs": [{"param": "map", "value": "buffered"}],
+        },
+    ],
+}
+
+
+@pytest.mark.unittest
+def test_get_map_names():
+    assert get_map_names("elev@PERMANENT") == {"elev"}
+    assert get_map_names("out = if(a > 2, b@m, 1.5) + c") == {
+        "out",
+        "if",
+        "a",
+        "b",
+        "c",
+    }
+
+
+@pytest.mark.unittest
+def test_process_graph_dependencies():
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        PROCESS_CHAIN
+    )
+    deps = ProcessGraph(process_list).dependencies
+    # g.region is a barrier
+    assert deps[0] == set()
+    # Independent readers of the same map
+    assert deps[1] == {0}
+    assert deps[2] == {0}
+    # Map names in expressions
+    assert deps[3] == {0, 1}
+    # stdout parameter reference
+    assert deps[4] == {0, 2, 3}
+    # Explicit ordering hint
+    assert deps[5] == {0, 1}
+    # In-place modification of an input
+    assert deps[6] == {0, 5}
+
+
+@pytest.mark.unittest
+def test_process_graph_exec_barrier():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {
+                "id": "a",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev"}],
+            },
+            {"id": "cat", "exe": "/bin/cat", "params": ["$file::x"]},
+            {
+                "id": "b",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev"}],
+            },
+            {
+                "id": "echo",
+                "exe": "/bin/echo",
+                "params": ["$file::y"],
+                "barrier": False,
+            },
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    assert ProcessGraph(process_list).dependencies == [
+        set(),
+        {0},
+        {1},
+        {1},
+    ]
+
+
+@pytest.mark.unittest
+def test_process_graph_run_parallel(tmp_path):
+    mapset_path = str(tmp_path)
+    with open(os.path.join(mapset_path, "WIND"), "w") as wind:
+        wind.write("north: 1\n")
+
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        PROCESS_CHAIN
+    )
+    graph = ProcessGraph(process_list)
+
+    lock = threading.Lock()
+    finished = []
+    running = [0, 0]
+
+    def run(process):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            index = process_list.index(process)
+            assert graph.dependencies[index].issubset(finished)
+        if graph.is_barrier(process):
+            assert "WIND_OVERRIDE" not in process.env
+        else:
+            region = process.env["WIND_OVERRIDE"]
+            assert region.startswith(STEP_REGION_PREFIX)
+            assert os.path.isfile(os.path.join(mapset_path, "windows", region))
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+            finished.append(index)
+        return process.id
+
+    results = graph.run(run, max_parallel=4, mapset_path=mapset_path)
+    assert results == [entry["id"] for entry in PROCESS_CHAIN["list"]]
+    assert running[1] > 1
+    # The step regions are removed
+    assert os.listdir(os.path.join(mapset_path, "windows")) == []
+
+
+@pytest.mark.unittest
+def test_process_graph_run_error():
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        PROCESS_CHAIN
+    )
+    started = []
+
+    def run(process):
+        started.append(process.id)
+        if process.id == "slope":
+            raise RuntimeError("failed")
+        time.sleep(0.05)
+
+    with pytest.raises(RuntimeError):
+        ProcessGraph(process_list).run(run, max_parallel=2)
+    # Steps that depend on the failed step are not started
+    assert "mapcalc" not in started
+    assert "buffer" not in started
+
+
+@pytest.mark.unittest
+def test_get_stream_pipelines():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {"id": "a", "exe": "/bin/cat", "params": ["in.txt"]},
+            {"id": "b", "exe": "/usr/bin/sort", "stdin": "a::stdout"},
+            {"id": "c", "exe": "/usr/bin/uniq", "stdin": "b::stdout"},
+            {
+                "id": "d",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev"}],
+                "flags": "g",
+            },
+            {"id": "e", "exe": "/bin/cat", "stdin": "d::stdout"},
+            {
+                "id": "f",
+                "module": "r.mapcalc",
+                "inputs": [
+                    {"param": "expression", "value": "x = d::stdout::max"}
+                ],
+            },
+            {
+                "id": "g",
+                "module": "r.stats",
+                "inputs": [{"param": "input", "value": "x"}],
+                "stdout": {"id": "stats", "format": "table", "delimiter": " "},
+            },
+            {"id": "h", "exe": "/bin/cat", "stdin": "g::stdout"},
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    pipelines = get_stream_pipelines(process_list)
+    assert [[step.id for step in steps] for steps in pipelines] == [
+        # Only used as stdin of the next step
+        ["a", "b", "c"],
+        # The stdout is also referenced by a parameter
+        ["d"],
+        ["e"],
+        ["f"],
+        # The stdout is parsed
+        ["g"],
+        ["h"],
+    ]
+
+
+@pytest.mark.unittest
+def test_add_pipeline():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {
+                "id": "slope",
+                "module": "r.slope.aspect",
+                "inputs": [{"param": "elevation", "value": "elev"}],
+                "outputs": [{"param": "slope", "value": "slope"}],
+            },
+            {
+                "id": "stats",
+                "module": "r.stats",
+                "inputs": [{"param": "input", "value": "elev"}],
+            },
+            {
+                "id": "import",
+                "module": "v.in.ascii",
+                "inputs": [{"param": "input", "value": "-"}],
+                "outputs": [{"param": "output", "value": "slope"}],
+                "stdin": "stats::stdout",
+            },
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    graph = ProcessGraph(process_list)
+    assert graph.dependencies == [set(), set(), {0, 1}]
+    graph.add_pipeline(process_list[1:])
+    # The pipeline starts when the dependencies of all its steps finished
+    assert graph.dependencies == [set(), {0}, {0, 1}]
+
+
+@pytest.mark.unittest
+def test_process_graph_hyphenated_ids():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {
+                "id": "uni-var",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev"}],
+                "flags": "g",
+            },
+            {
+                "id": "b",
+                "module": "r.mapcalc",
+                "inputs": [
+                    {
+                        "param": "expression",
+                        "value": "out = a - uni-var::stdout::max",
+                    }
+                ],
+            },
+            {
+                "id": "c",
+                "module": "r.rescale",
+                "inputs": [
+                    {"param": "input", "value": "elev"},
+                    {"param": "to", "value": "0,uni-var::stdout::max"},
+                ],
+                "outputs": [{"param": "output", "value": "rescaled"}],
+            },
+            {"id": "d", "exe": "/bin/cat", "stdin": "uni-var::stdout"},
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    assert process_list[1].depends_on == {"uni-var"}
+    assert process_list[2].depends_on == {"uni-var"}
+    deps = ProcessGraph(process_list).dependencies
+    assert deps[1] == {0}
+    assert deps[2] == {0}
+    assert 0 in deps[3]
+
+
+@pytest.mark.unittest
+def test_process_graph_output_references():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {
+                "id": "a",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "elev"}],
+                "flags": "g",
+            },
+            {
+                "id": "b",
+                "module": "r.rescale",
+                "inputs": [
+                    {"param": "input", "value": "elev"},
+                    {"param": "to", "value": "0,a::stdout::max"},
+                ],
+                "outputs": [{"param": "output", "value": "rescaled"}],
+            },
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    # The edge does not depend on the recorded process ids
+    process_list[1].depends_on = set()
+    assert ProcessGraph(process_list).dependencies == [set(), {0}]
+
+
+@pytest.mark.unittest
+def test_process_graph_basename_outputs():
+    process_chain = {
+        "version": "1",
+        "list": [
+            {
+                "id": "pca",
+                "module": "i.pca",
+                "inputs": [{"param": "input", "value": "b1,b2"}],
+                "outputs": [{"param": "output", "value": "pca"}],
+            },
+            {
+                "id": "texture",
+                "module": "r.texture",
+                "inputs": [{"param": "input", "value": "b1"}],
+                "outputs": [{"param": "output", "value": "tex"}],
+            },
+            {
+                "id": "univar",
+                "module": "r.univar",
+                "inputs": [{"param": "map", "value": "pca.1"}],
+            },
+            {
+                "id": "mapcalc",
+                "module": "r.mapcalc",
+                "inputs": [
+                    {"param": "expression", "value": "out = tex_ASM * 2"}
+                ],
+            },
+            {
+                "id": "overwrite",
+                "module": "i.pca",
+                "inputs": [{"param": "input", "value": "b1,b2"}],
+                "outputs": [{"param": "output", "value": "pca"}],
+            },
+        ],
+    }
+    process_list = ProcessChainConverter().process_chain_to_process_list(
+        process_chain
+    )
+    assert ProcessGraph(process_list).dependencies == [
+        set(),
+        set(),
+        {0},
+        {1},
+        # Readers of the derived maps finish before they are overwritten
+        {0, 2},
+    ]
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Process output streaming unittest case
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from actinia_processing_lib.exceptions import AsyncProcessError
+
+from actinia_core.core.common.process_object import Process
+from actinia_core.core.common.process_stream import (
+    OutputReader,
+    PipelineProcess,
+    SpooledOutput,
+    StdoutParser,
+    create_pipe,
+    is_pipeline_success,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+STDOUT = "\n  \nn=10|x\nmin = 1|y\n\n  max=5 |z \n\n"
+
+
+def parse_complete(stdout, format, delimiter):
+    """Parse the complete stdout like the process chain executor"""
+    rows = stdout.strip().split("\n")
+    if format == "table":
+        return [[v.strip() for v in r.strip().split(delimiter)] for r in rows]
+    elif format == "list":
+        return [row.strip() for row in rows]
+    result = {}
+    for row in rows:
+        key, value = row.strip().split(delimiter, 1)
+        result[key.strip()] = value.strip()
+    return result
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "format,delimiter,stdout",
+    [
+        ("table", "|", STDOUT),
+        ("list", "|", STDOUT),
+        ("kv", "=", STDOUT.replace("\n\n  max", "\n  max")),
+        ("table", "|", ""),
+        ("list", "|", "single"),
+    ],
+)
+def test_stdout_parser_chunks(format, delimiter, stdout):
+    expected = parse_complete(stdout, format, delimiter)
+    for chunk_size in (1, 2, 3, 7, len(stdout) or 1):
+        parser = StdoutParser(format, delimiter)
+        for i in range(0, len(stdout), chunk_size):
+            parser.feed(stdout[i : i + chunk_size])
+        assert parser.close() == expected
+
+
+@pytest.mark.unittest
+def test_stdout_parser_json():
+    parser = StdoutParser("json", "=")
+    parser.feed('{"a": ')
+    parser.feed("1}")
+    assert parser.close() == {"a": 1}
+    with pytest.raises(AsyncProcessError):
+        StdoutParser("xml", "=")
+
+
+@pytest.mark.unittest
+def test_spooled_output(tmp_path):
+    output = SpooledOutput(memory_limit=10, directory=str(tmp_path))
+    output.write(b"0123456789")
+    assert output.spilled is False
+    output.write(b"abc")
+    assert output.spilled is True
+    assert os.path.dirname(output.path) == str(tmp_path)
+    assert output.size == 13
+    assert output.getvalue() == "0123456789abc"
+
+    process = Process("exec", "/bin/cat", [])
+    process.set_stdouts(output, "")
+    assert process.get_stdout() == "0123456789abc"
+    with process.open_stdout() as f:
+        assert f.read() == b"0123456789abc"
+
+    path = output.path
+    output.close()
+    assert not os.path.exists(path)
+
+
+def run_streaming(args, stdin=None, parser=None, memory_limit=1024):
+    """Run a process and read its stdout and stderr with OutputReaders"""
+    stdout = SpooledOutput(memory_limit)
+    stderr = SpooledOutput(memory_limit)
+    stdout_pipe, stdout_write = create_pipe()
+    stderr_pipe, stderr_write = create_pipe()
+    with stdout_write, stderr_write:
+        proc = subprocess.Popen(
+            args, stdin=stdin, stdout=stdout_write, stderr=stderr_write
+        )
+    readers = [
+        OutputReader(stdout_pipe, stdout, parser),
+        OutputReader(stderr_pipe, stderr),
+    ]
+    for reader in readers:
+        reader.start()
+    proc.wait()
+    for reader in readers:
+        reader.join()
+    return proc.returncode, stdout, stderr, readers[0].error
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("memory_limit", [1024, 10 * 1024 * 1024])
+def test_output_reader(memory_limit):
+    script = (
+        "import sys\n"
+        "for i in range(100000):\n"
+        "    sys.stdout.write('%i|%i\\n' % (i, i * 2))\n"
+        "sys.stderr.write('done')\n"
+    )
+    parser = StdoutParser("table", "|")
+    returncode, stdout, stderr, error = run_streaming(
+        [sys.executable, "-c", script],
+        parser=parser,
+        memory_limit=memory_limit,
+    )
+    assert returncode == 0
+    assert error is None
+    assert stdout.spilled is (memory_limit == 1024)
+    assert stderr.getvalue() == "done"
+    assert stdout.getvalue(10) == "0|0\n1|2\n2|"
+    parser.close()
+    assert len(parser.result) == 100000
+    assert parser.result[-1] == ["99999", "199998"]
+
+    # The spilled stdout is the stdin of the next process
+    if stdout.spilled:
+        with stdout.open() as stdin:
+            returncode, count, _, _ = run_streaming(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys; print(len(sys.stdin.read()))",
+                ],
+                stdin=stdin,
+            )
+        assert returncode == 0
+        assert int(count.getvalue()) == stdout.size
+    stdout.close()
+
+
+@pytest.mark.unittest
+def test_output_reader_parser_error():
+    script = "print('x' * 1000000)\nprint('a=b')"
+    returncode, stdout, _, error = run_streaming(
+        [sys.executable, "-c", script], parser=StdoutParser("kv", "=")
+    )
+    # The pipe is read to the end
+    assert returncode == 0
+    assert stdout.size == 1000005
+    assert isinstance(error, AsyncProcessError)
+
+
+@pytest.mark.unittest
+def test_pipeline_process():
+    producer = subprocess.Popen(
+        ["yes"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    consumer = subprocess.Popen(
+        ["head", "-n", "1"],
+        stdin=producer.stdout,
+        stdout=subprocess.PIPE,
+    )
+    producer.stdout.close()
+    pipeline = PipelineProcess([producer, consumer])
+    assert consumer.stdout.read() == b"y\n"
+    consumer.stdout.close()
+    # The consumer stops reading, the producer is terminated by SIGPIPE
+    assert pipeline.wait() == 0
+    assert pipeline.returncodes[0] != 0
+    assert is_pipeline_success(pipeline.returncodes)
+
+    pipeline = PipelineProcess(
+        [subprocess.Popen(["true"]), subprocess.Popen(["false"])]
+    )
+    assert pipeline.wait() == 1
+    assert not is_pipeline_success(pipeline.returncodes)
+
+    pipeline = PipelineProcess([subprocess.Popen(["sleep", "10"])])
+    assert pipeline.poll() is None
+    pipeline.kill()
+    assert pipeline.wait() == -9
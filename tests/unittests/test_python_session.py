@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Persistent Python session unittest case
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from actinia_core.core.common.python_session import (
+    WORKER_DIED_RETURNCODE,
+    PythonSession,
+    is_python_script,
+)
+from actinia_core.core.grass_init import GrassModuleRunner
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+MODULE = """#!/usr/bin/env python3
+import os
+import sys
+
+
+def main():
+    if sys.argv[1] == "fail":
+        sys.exit("failed")
+    if sys.argv[1] == "raise":
+        raise ValueError("broken")
+    if sys.argv[1] == "sleep":
+        import time
+
+        time.sleep(60)
+    print(" ".join(sys.argv[1:]), os.environ.get("MODULE_VAR"))
+    print(sys.stdin.read().upper(), end="")
+    os.environ["MODULE_VAR"] = "changed"
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+"""
+
+
+@pytest.fixture
+def module(tmp_path):
+    os.makedirs(tmp_path / "scripts")
+    os.makedirs(tmp_path / "bin")
+    path = tmp_path / "scripts" / "t.test"
+    path.write_text(MODULE)
+    path.chmod(0o755)
+    binary = tmp_path / "bin" / "r.test"
+    binary.write_text("#!/bin/sh\necho compiled $$\n")
+    binary.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def session():
+    session = PythonSession()
+    yield session
+    session.close()
+
+
+@pytest.mark.unittest
+def test_is_python_script(module, tmp_path):
+    assert is_python_script(module) is True
+    assert is_python_script(str(tmp_path / "bin" / "r.test")) is False
+    assert is_python_script(str(tmp_path / "missing")) is False
+
+
+@pytest.mark.unittest
+def test_session_isolation(module, session, tmp_path):
+    env = dict(os.environ, MODULE_VAR="first")
+    stdin = tmp_path / "stdin"
+    stdin.write_text("abc")
+    with open(stdin, "rb") as f_in, open(tmp_path / "out", "w+b") as f_out:
+        proc = session.run(
+            [module, "a", "b"], stdin=f_in, stdout=f_out, env=env
+        )
+        assert proc.wait() == 0
+        f_out.seek(0)
+        assert f_out.read() == b"a b first\nABC"
+    worker = session._worker.pid
+
+    # The environment change of the first module is not visible
+    assert session.run_with_output([module, "c"]) == (0, "c None\n", "")
+    assert session._worker.pid == worker
+    assert os.environ.get("MODULE_VAR") is None
+
+
+@pytest.mark.unittest
+def test_session_errors(module, session):
+    assert session.run_with_output([module, "fail"]) == (1, "", "failed\n")
+    returncode, _, stderr = session.run_with_output([module, "raise"])
+    assert returncode == 1
+    assert "ValueError: broken" in stderr
+
+
+@pytest.mark.unittest
+def test_session_kill(module, session, tmp_path):
+    with open(tmp_path / "out", "wb") as f_out:
+        proc = session.run([module, "sleep"], stdout=f_out, stderr=f_out)
+    assert proc.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired):
+        proc.wait(timeout=0.1)
+    proc.kill()
+    assert proc.wait() == -9
+
+    # A new worker is started if the worker died
+    with open(tmp_path / "out", "wb") as f_out:
+        proc = session.run([module, "sleep"], stdout=f_out, stderr=f_out)
+    session._worker.kill()
+    assert proc.wait(timeout=10) == WORKER_DIED_RETURNCODE
+    proc.kill()
+    assert session.run_with_output([module, "d"]) == (0, "d None\n", "")
+
+
+@pytest.mark.unittest
+def test_grass_module_runner_session(module, session, tmp_path):
+    runner = GrassModuleRunner(str(tmp_path), "/nonexistent", session)
+    assert runner.run_module("t.test", ["e"]) == (0, "e None\n", "")
+    assert session._worker is not None
+
+    # Compiled modules are run as subprocess
+    errorid, stdout_buff, _ = runner.run_module("r.test", [])
+    assert errorid == 0
+    assert stdout_buff.startswith("compiled")
+
+    with open(tmp_path / "out", "w+b") as f_out:
+        proc = runner.run_module(
+            "t.test", ["f"], raw=True, stdout=f_out, stderr=f_out, stdin=None
+        )
+        assert proc.wait() == 0
+        f_out.seek(0)
+        assert f_out.read() == b"f None\n"
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Startup profile and lazy imports unittest case
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from actinia_core.core.startup_profile import (
+    format_startup_profile,
+    parse_importtime,
+    profile_startup,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       243 |        243 |   _io
+import time:       651 |       1486 | _frozen_importlib_external
+import time:      1200 |       5000 | json
+"""
+
+
+@pytest.mark.unittest
+def test_parse_importtime():
+    modules = parse_importtime(IMPORTTIME)
+    assert [m["name"] for m in modules] == [
+        "_io",
+        "_frozen_importlib_external",
+        "json",
+    ]
+    assert [m["level"] for m in modules] == [1, 0, 0]
+    assert modules[2]["self_us"] == 1200
+    assert modules[2]["cumulative_us"] == 5000
+
+
+@pytest.mark.unittest
+def test_profile_startup():
+    profile = profile_startup("json")
+    assert profile["max_rss_kib"] > 0
+    assert "json" in [m["name"] for m in profile["modules"]]
+    report = format_startup_profile(profile, limit=2)
+    assert report.startswith("Startup profile of <json>")
+    assert len(report.splitlines()) == 9
+
+    with pytest.raises(RuntimeError, match="Unable to import"):
+        profile_startup("actinia_core.missing_module")
+
+
+@pytest.mark.unittest
+def test_lazy_imports():
+    """The optional heavy dependencies are not imported with the modules
+    that use them
+    """
+    code = (
+        "import sys\n"
+        "import actinia_core.core.common.google_satellite_bigquery_interface\n"
+        "import actinia_core.core.storage_interface_aws_s3\n"
+        "import actinia_core.core.storage_interface_gcs\n"
+        "import actinia_core.core.stac_exporter_interface\n"
+        "heavy = ('google.cloud.bigquery', 'google.cloud.storage', 'boto3',"
+        " 'rasterio', 'matplotlib')\n"
+        "print([name for name in heavy if name in sys.modules])\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]"
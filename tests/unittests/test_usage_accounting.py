@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: Resource usage accounting unittest case
+"""
+
+import pytest
+
+from actinia_core.core.directory_size import get_directory_size
+from actinia_core.core import usage_accounting
+from actinia_core.core.usage_accounting import (
+    create_usage_entry,
+    get_job_cpu_seconds,
+    get_process_cpu_seconds,
+    get_region_cells,
+    get_usage_day,
+    is_job_process,
+    is_raster_module,
+    run_job,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+@pytest.mark.unittest
+def test_usage_entry_from_process_log():
+    data = {
+        "status": "finished",
+        "process_time_delta": 3.5,
+        "process_log": [
+            {"executable": "g.region", "run_time": 0.1},
+            {"executable": "r.slope.aspect", "run_time": 2.0, "cells": 100},
+            {"executable": "r.univar", "run_time": 0.5, "cells": 50},
+        ],
+    }
+    usage = create_usage_entry(data, cpu_seconds=10.0, exported_bytes=42)
+    assert usage == {
+        "wall_seconds": 3.5,
+        "cpu_seconds": 10.0,
+        "executed_modules": 3,
+        "exported_bytes": 42,
+        "cells_processed": 150,
+    }
+
+
+@pytest.mark.unittest
+def test_usage_entry_fallbacks():
+    usage = create_usage_entry(
+        {"status": "error", "process_log": "error"}, cpu_seconds=1.5
+    )
+    assert usage["wall_seconds"] == 0.0
+    assert usage["cpu_seconds"] == 1.5
+    assert usage["executed_modules"] == 0
+    assert usage["cells_processed"] == 0
+    assert create_usage_entry({"status": "error"})["cpu_seconds"] == 0.0
+    assert get_process_cpu_seconds() > 0.0
+
+
+@pytest.mark.unittest
+def test_job_cpu_seconds(monkeypatch):
+    """The CPU time of a job is measured from the start of the job, not
+    from the start of the process that runs it"""
+    monkeypatch.setattr(usage_accounting, "_job_start_cpu_seconds", None)
+    assert is_job_process() is False
+
+    def job(factor):
+        # Spend some CPU time in the job
+        sum(i * factor for i in range(500000))
+        return is_job_process(), get_job_cpu_seconds()
+
+    process_cpu_seconds = get_process_cpu_seconds()
+    job_process, job_cpu_seconds = run_job(job, 2)
+    assert job_process is True
+    assert 0.0 < job_cpu_seconds < get_process_cpu_seconds()
+    assert job_cpu_seconds < process_cpu_seconds
+
+
+@pytest.mark.unittest
+def test_usage_day_and_directory_size(tmp_path):
+    assert get_usage_day({"timestamp": 0}) == "1970-01-01"
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.tif").write_bytes(b"x" * 10)
+    (tmp_path / "sub" / "b.tif").write_bytes(b"x" * 5)
+    assert get_directory_size(str(tmp_path)) == 15
+    assert get_directory_size(str(tmp_path / "missing")) == 0
+
+
+@pytest.mark.unittest
+def test_region_cells(tmp_path):
+    region = tmp_path / "WIND"
+    region.write_text(
+        "proj:       99\nnorth:      20\nsouth:      0\n"
+        "rows:       20\ncols:       30\n"
+    )
+    assert get_region_cells(str(region)) == 600
+    assert get_region_cells(str(tmp_path / "missing")) == 0
+    region.write_text("north:      20\n")
+    assert get_region_cells(str(region)) == 0
+    assert is_raster_module("r.univar") is True
+    assert is_raster_module("i.pca") is True
+    assert is_raster_module("v.buffer") is False
+    assert is_raster_module("r3.univar") is False
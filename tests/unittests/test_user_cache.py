@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# SPDX-FileCopyrightText: (c) 2026 mundialis GmbH & Co. KG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+#######
+
+"""
+Tests: User credential cache unittest case
+"""
+
+import queue
+import time
+from copy import copy
+
+import pytest
+
+from actinia_core.core.common.config import global_config
+from actinia_core.core.common.user_cache import (
+    USER_INVALIDATION_CHANNEL,
+    UserCredentialCache,
+    VerifiedPasswordCache,
+)
+
+__license__ = "GPL-3.0-or-later"
+__author__ = "mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2026, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis GmbH & Co. KG"
+__email__ = "info@mundialis.de"
+
+
+class PubSub(object):
+    def __init__(self, channel):
+        self.channel = channel
+
+    def subscribe(self, name):
+        assert name == USER_INVALIDATION_CHANNEL
+
+    def listen(self):
+        while True:
+            yield {"type": "message", "data": self.channel.get()}
+
+    def close(self):
+        pass
+
+
+class KvdbServer(object):
+    def __init__(self):
+        self.channel = queue.Queue()
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        return PubSub(self.channel)
+
+    def publish(self, name, message):
+        self.channel.put(message.encode())
+
+
+class UserDB(object):
+    """Counts the credential requests that reach the database"""
+
+    def __init__(self):
+        self.kvdb_server = KvdbServer()
+        self.calls = 0
+        self.role = "user"
+
+    def get_credentials(self, user_id):
+        self.calls += 1
+        if user_id == "unknown":
+            return {}
+        return {"user_id": user_id, "user_role": self.role}
+
+
+def wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def cache():
+    config = copy(global_config)
+    config.USER_CACHE_TTL = 30
+    return UserCredentialCache(config=config)
+
+
+@pytest.mark.unittest
+def test_user_cache_hits(cache):
+    db = UserDB()
+    cache.get("user", db)
+    assert wait_for(cache._subscribed.is_set)
+    cache.get("user", db)
+    calls = db.calls
+    for _ in range(10):
+        assert cache.get("user", db)["user_role"] == "user"
+    assert db.calls == calls
+    # Unknown users are never cached
+    cache.get("unknown", db)
+    cache.get("unknown", db)
+    assert db.calls == calls + 2
+
+
+@pytest.mark.unittest
+def test_user_cache_pubsub_invalidation(cache):
+    db = UserDB()
+    cache.get("user", db)
+    assert wait_for(cache._subscribed.is_set)
+    cache.get("user", db)
+    db.role = "admin"
+    # An invalidation published by another process
+    db.kvdb_server.publish(USER_INVALIDATION_CHANNEL, "user")
+    assert wait_for(lambda: "user" not in cache._entries)
+    assert cache.get("user", db)["user_role"] == "admin"
+    db.role = "guest"
+    cache.invalidate("user", db)
+    assert cache.get("user", db)["user_role"] == "guest"
+
+
+@pytest.mark.unittest
+def test_user_cache_disabled(cache):
+    db = UserDB()
+    cache.config.USER_CACHE_TTL = 0
+    cache.get("user", db)
+    cache.get("user", db)
+    assert db.calls == 2
+    assert cache._listener is None
+
+
+class Verifier(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, password, password_hash):
+        self.calls += 1
+        return password_hash == "hash-" + password
+
+
+@pytest.mark.unittest
+def test_verified_password_cache():
+    config = copy(global_config)
+    config.BASIC_AUTH_CACHE = True
+    config.BASIC_AUTH_CACHE_TTL = 60
+    config.BASIC_AUTH_CACHE_SIZE = 2
+    cache = VerifiedPasswordCache(config=config)
+    verify = Verifier()
+
+    assert cache.verify("user", "pw", "hash-pw", verify) is True
+    assert cache.verify("user", "pw", "hash-pw", verify) is True
+    assert verify.calls == 1
+    # Failed verifications are not cached
+    assert cache.verify("user", "wrong", "hash-pw", verify) is False
+    assert cache.verify("user", "wrong", "hash-pw", verify) is False
+    assert verify.calls == 3
+    # A changed password hash invalidates the entry
+    assert cache.verify("user", "pw", "hash-new", verify) is False
+    assert verify.calls == 4
+    # The cache is bounded
+    for user in ("a", "b", "c"):
+        cache.verify(user, "pw", "hash-pw", verify)
+    assert len(cache._entries) == 2
+
+
+@pytest.mark.unittest
+def test_verified_password_cache_disabled():
+    config = copy(global_config)
+    config.BASIC_AUTH_CACHE = False
+    cache = VerifiedPasswordCache(config=config)
+    verify = Verifier()
+    cache.verify("user", "pw", "hash-pw", verify)
+    cache.verify("user", "pw", "hash-pw", verify)
+    assert verify.calls == 2
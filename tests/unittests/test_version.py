@@ -4,7 +4,7 @@
 # performance processing of geographical data that uses GRASS GIS for
 # computational tasks. For details, see https://actinia.mundialis.de/
 #
-# SPDX-FileCopyrightText: (c) 2021 mundialis GmbH & Co. KG
+# SPDX-FileCopyrightText: (c) 2021-2026 mundialis GmbH & Co. KG
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
@@ -17,6 +17,7 @@ Tests: Version unittest case
 import os
 import pytest
 
+from actinia_core import version
 from actinia_core.version import (
     find_running_since_info,
     find_additional_version_info,
@@ -26,7 +27,7 @@ from actinia_core.version import (
 
 __license__ = "GPL-3.0-or-later"
 __author__ = "Anika Weinmann"
-__copyright__ = "Copyright 2021, mundialis GmbH & Co. KG"
+__copyright__ = "Copyright 2021-2026, mundialis GmbH & Co. KG"
 __maintainer__ = "mundialis GmbH & Co. KG"
 __email__ = "info@mundialis.de"
 
@@ -125,3 +126,52 @@ def test_find_additional_version_info(env_value, expected):
             del os.environ["ACTINIA_ADDITIONAL_VERSION_INFO"]
     test = find_additional_version_info()
     assert test == expected, "Additional version is not right"
+
+
+@pytest.fixture
+def grass_script(tmp_path, monkeypatch):
+    path = tmp_path / "bin" / "grass"
+    os.makedirs(path.parent)
+    path.write_text("#!/bin/sh\necho version=8.4.0\necho revision=abc\n")
+    path.chmod(0o755)
+    monkeypatch.setenv("PATH", str(path.parent), prepend=os.pathsep)
+    monkeypatch.setattr(
+        version.global_config,
+        "GRASS_VERSION_CACHE_FILE",
+        str(tmp_path / "cache" / "grass_version.json"),
+    )
+    monkeypatch.setattr(version, "G_VERSION", {})
+    return path
+
+
+@pytest.mark.unittest
+def test_grass_version_cache(grass_script, monkeypatch):
+    expected = {"version": "8.4.0", "revision": "abc"}
+
+    # Without cache file the version is detected on startup
+    version.init_grass_version()
+    assert version.G_VERSION == expected
+    assert os.path.isfile(version.global_config.GRASS_VERSION_CACHE_FILE)
+
+    # The cache file is used without running GRASS GIS
+    monkeypatch.setattr(version, "_probe_grass_version", pytest.fail)
+    monkeypatch.setattr(version, "_refresh_thread", None)
+    version.G_VERSION.clear()
+    version.init_grass_version()
+    assert version.G_VERSION == expected
+    assert version._refresh_thread is None
+    monkeypatch.undo()
+
+
+@pytest.mark.unittest
+def test_grass_version_cache_update(grass_script):
+    version.refresh_grass_version()
+    assert version.G_VERSION["version"] == "8.4.0"
+
+    # An updated GRASS GIS is detected, the outdated version is used
+    # until the refresh finished
+    grass_script.write_text("#!/bin/sh\necho version=8.5.0\n")
+    version.init_grass_version()
+    assert version.G_VERSION["version"] in ("8.4.0", "8.5.0")
+    version._refresh_thread.join()
+    assert version.G_VERSION == {"version": "8.5.0"}